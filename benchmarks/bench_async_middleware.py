@@ -0,0 +1,87 @@
+"""
+Event-loop latency benchmark for AsyncQWEDTaxMiddleware.
+
+Runs N concurrent payroll payloads while a probe coroutine measures how late
+the loop wakes it up (scheduling lag). The sync middleware called directly
+from a coroutine is shown for comparison: it blocks the loop for the whole run.
+
+    python benchmarks/bench_async_middleware.py [--payloads N] [--processes]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from qwed_tax.middleware.async_interceptor import AsyncQWEDTaxMiddleware
+from qwed_tax.middleware.gusto_interceptor import QWEDTaxMiddleware
+
+PROBE_INTERVAL_S = 0.001
+
+
+def _payload(index: int) -> dict:
+    return {
+        "payroll_entry": {
+            "employee_id": f"E{index:06d}",
+            "gross_pay": "5000.00",
+            "taxes": [
+                {"name": "Federal Income Tax", "amount": "800.00"},
+                {"name": "Social Security", "amount": "310.00"},
+            ],
+            "deductions": [{"name": "401k", "amount": "500.00", "type": "PRE_TAX"}],
+            "net_pay_claimed": "3390.00" if index % 10 else "3391.00",
+        }
+    }
+
+
+async def _probe(lags: list, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL_S)
+        lags.append(time.perf_counter() - started - PROBE_INTERVAL_S)
+
+
+async def _measure(label: str, work) -> None:
+    lags: list = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(
+        f"{label:28s} wall {elapsed * 1000:8.1f} ms | probe wakeups {len(lags):5d} | "
+        f"lag median {statistics.median(lags_ms):6.2f} ms p99 {p99:6.2f} ms max {lags_ms[-1]:7.2f} ms"
+    )
+
+
+async def main(payload_count: int, use_processes: bool) -> None:
+    payloads = [_payload(i) for i in range(payload_count)]
+    sync = QWEDTaxMiddleware()
+
+    async def blocking():
+        for payload in payloads:
+            sync.process_ai_payroll_request(payload)
+
+    await _measure("sync (in event loop)", blocking)
+
+    amw = AsyncQWEDTaxMiddleware(max_concurrency=64)
+    await _measure("async (thread pool)", lambda: amw.process_many(payloads))
+
+    if use_processes:
+        with ProcessPoolExecutor() as pool:
+            amw = AsyncQWEDTaxMiddleware(executor=pool, max_concurrency=64)
+            await _measure("async (process pool)", lambda: amw.process_many(payloads))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--payloads", type=int, default=1000)
+    parser.add_argument("--processes", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.payloads, args.processes))
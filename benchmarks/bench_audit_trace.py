@@ -0,0 +1,95 @@
+"""
+audit_trace construction cost per guard call: immutable build_trace() vs the
+previous deep-copying implementation.
+
+"legacy" swaps each guard module's build_trace (and GSTGuard's precomputed
+RCM response copy) back to the plain-dict, copy.deepcopy() version; "frozen"
+runs the code as shipped. Both call the same guard methods with the same
+inputs and keep their results, as a caller would.
+
+    python benchmarks/bench_audit_trace.py [--calls N]
+"""
+
+import argparse
+import copy
+import time
+from contextlib import contextmanager
+
+import qwed_tax.audit as audit_module
+import qwed_tax.guards.indirect_tax_guard as itc_module
+import qwed_tax.guards.remittance_guard as lrs_module
+import qwed_tax.guards.tds_guard as tds_module
+import qwed_tax.jurisdictions.india.guards.gst_guard as gst_module
+from qwed_tax.audit import ITC_BLOCKED_17_5
+from qwed_tax.guards.indirect_tax_guard import InputCreditGuard
+from qwed_tax.guards.remittance_guard import RemittanceGuard
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.jurisdictions.india.guards.gst_guard import GSTGuard
+
+
+def legacy_build_trace(rule, outcome, inputs=None):
+    return {
+        "rule_id": rule.rule_id,
+        "statute": rule.statute,
+        "jurisdiction": rule.jurisdiction,
+        "outcome": outcome,
+        "inputs": copy.deepcopy(inputs) if inputs else {},
+    }
+
+
+def legacy_materialize(template):
+    response = dict(template)
+    trace = template["audit_trace"]
+    response["audit_trace"] = {**trace, "inputs": dict(trace["inputs"])}
+    return response
+
+
+@contextmanager
+def legacy():
+    modules = (audit_module, itc_module, lrs_module, tds_module, gst_module)
+    saved = [(module, "build_trace", module.build_trace) for module in modules]
+    saved.append((gst_module, "_materialize", gst_module._materialize))
+    for module, name, _ in saved:
+        setattr(module, name, legacy_materialize if name == "_materialize" else legacy_build_trace)
+    try:
+        yield
+    finally:
+        for module, name, original in saved:
+            setattr(module, name, original)
+
+
+def scenarios():
+    itc, lrs, tds, gst = InputCreditGuard(), RemittanceGuard(), TDSGuard(), GSTGuard()
+    inputs = {"expense_category": "CATERING", "amount": "5000", "tax_paid": "900"}
+    return {
+        "build_trace": lambda: audit_module.build_trace(ITC_BLOCKED_17_5, "BLOCKED", inputs),
+        "itc": lambda: itc.verify_itc_eligibility("food and beverage", "5000", "900"),
+        "lrs": lambda: lrs.verify_lrs_limit("25000", "education", "100000"),
+        "tds": lambda: tds.calculate_deduction("PROFESSIONAL_FEES", "50000", "0"),
+        "gst_rcm": lambda: gst.verify_rcm_applicability("GTA", "INDIVIDUAL", "BODY_CORPORATE", True),
+    }
+
+
+def timed(call, calls):
+    start = time.perf_counter()
+    results = [call() for _ in range(calls)]
+    elapsed = time.perf_counter() - start
+    del results
+    return elapsed / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<12} {'legacy us':>10} {'frozen us':>10} {'speedup':>8}")
+    for name, call in scenarios().items():
+        with legacy():
+            old = timed(call, args.calls)
+        new = timed(call, args.calls)
+        print(f"{name:<12} {old:>10.2f} {new:>10.2f} {old / new:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
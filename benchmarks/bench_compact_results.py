@@ -0,0 +1,77 @@
+"""
+Per-verdict memory and allocations: legacy dict results vs compact ones.
+
+For each guard, N verdicts are produced and kept alive; tracemalloc reports
+the bytes and the number of memory blocks they hold, per verdict, plus the
+time per call. "dict" is the legacy return, "compact" passes compact=True,
+and the diagnostic rows compare to_diagnostic(dict) with diagnose_*().
+
+    python benchmarks/bench_compact_results.py [--verdicts N]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from qwed_tax.guards.poem_guard import PoEMGuard
+from qwed_tax.guards.remittance_guard import RemittanceGuard
+from qwed_tax.guards.tds_guard import TDSGuard
+
+POEM_ARGS = dict(
+    company_name="Mauritius Shell", is_foreign_incorp=True,
+    turnover_total=1000, turnover_outside_india=100, assets_total=1000, assets_outside_india=10,
+    employees_total=10, employees_outside_india=1, payroll_total=100, payroll_outside_india=10,
+    key_management_location="INDIA",
+)
+
+
+def scenarios():
+    tds, lrs, poem = TDSGuard(), RemittanceGuard(), PoEMGuard()
+    tds_args = ("PROFESSIONAL_FEES", "50000", "0")
+    lrs_args = ("25000", "education", "100000")
+    return {
+        "tds dict": lambda: tds.calculate_deduction(*tds_args),
+        "tds compact": lambda: tds.calculate_deduction(*tds_args, compact=True),
+        "tds to_diagnostic": lambda: TDSGuard.to_diagnostic(tds.calculate_deduction(*tds_args)),
+        "tds diagnose": lambda: tds.diagnose_deduction(*tds_args),
+        "lrs dict": lambda: lrs.verify_lrs_limit(*lrs_args),
+        "lrs compact": lambda: lrs.verify_lrs_limit(*lrs_args, compact=True),
+        "poem dict": lambda: poem.determine_residency(**POEM_ARGS),
+        "poem compact": lambda: poem.determine_residency(**POEM_ARGS, compact=True),
+        "poem to_diagnostic": lambda: PoEMGuard.to_diagnostic(poem.determine_residency(**POEM_ARGS)),
+        "poem diagnose": lambda: poem.diagnose_residency(**POEM_ARGS),
+    }
+
+
+def measure(call, count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [call() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del kept
+
+    start = time.perf_counter()
+    kept = [call() for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    return size / count, blocks / count, elapsed / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--verdicts", type=int, default=50_000)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<20} {'bytes/verdict':>14} {'blocks/verdict':>15} {'us/verdict':>11}")
+    for name, call in scenarios().items():
+        size, blocks, micros = measure(call, args.verdicts)
+        print(f"{name:<20} {size:>14.0f} {blocks:>15.1f} {micros:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+FicaLedger throughput: 26 bi-weekly pay periods x N employees.
+
+Applies every period through FicaLedger.apply_period() (O(1) per paycheck),
+then compares a sample against the stateless pattern of re-aggregating YTD
+wages from the paycheck history before each verify_fica_tax() call. Also
+reports snapshot size and snapshot/restore time.
+
+    python benchmarks/bench_fica_ledger.py [--employees N] [--periods N]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from decimal import Decimal
+
+from qwed_tax.jurisdictions.us.fica_ledger import FicaLedger, _expected_ss_cents, _social_security_rule
+from qwed_tax.jurisdictions.us.payroll_guard import PayrollGuard
+
+
+def build_periods(employees, periods, seed=7):
+    rng = random.Random(seed)
+    rule = _social_security_rule(FicaLedger().as_of)
+    salaries = [rng.randint(1_500_000, 900_000_00) // 26 for _ in range(employees)]  # cents per period
+    ytd = [0] * employees
+    out = []
+    for _ in range(periods):
+        period = []
+        for e, gross in enumerate(salaries):
+            tax = _expected_ss_cents(ytd[e], gross, rule) + (1 if rng.random() < 0.001 else 0)
+            ytd[e] += gross
+            period.append((f"E{e:06d}", Decimal(gross).scaleb(-2), Decimal(tax).scaleb(-2)))
+        out.append(period)
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--employees", type=int, default=100_000)
+    parser.add_argument("--periods", type=int, default=26)
+    parser.add_argument("--sample", type=int, default=2_000, help="employees in the re-aggregation baseline")
+    args = parser.parse_args()
+
+    periods = build_periods(args.employees, args.periods)
+    checks = args.employees * args.periods
+
+    ledger = FicaLedger()
+    start = time.perf_counter()
+    mismatches = sum(len(ledger.apply_period(p)) for p in periods)
+    ledger_s = time.perf_counter() - start
+
+    guard = PayrollGuard()
+    sample = [p[: args.sample] for p in periods]
+    history = {}
+    start = time.perf_counter()
+    for period in sample:
+        for employee_id, gross, claimed in period:
+            paid = history.setdefault(employee_id, [])
+            paid.append(gross)
+            guard.verify_fica_tax(sum(paid, Decimal("0.00")), gross, claimed)
+    baseline_s = time.perf_counter() - start
+    baseline_checks = args.sample * args.periods
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "fica.snap")
+        start = time.perf_counter()
+        ledger.snapshot(path)
+        snapshot_s = time.perf_counter() - start
+        size = os.path.getsize(path)
+        start = time.perf_counter()
+        restored = FicaLedger.restore(path)
+        restore_s = time.perf_counter() - start
+        assert len(restored) == len(ledger)
+
+    print(f"{args.periods} periods x {args.employees} employees = {checks} paychecks, {mismatches} mismatches")
+    print(f"ledger apply_period        {ledger_s:8.2f}s  {ledger_s / checks * 1e6:6.2f} us/check")
+    print(f"re-aggregate + verify ({args.sample} emp) {baseline_s:6.2f}s  {baseline_s / baseline_checks * 1e6:6.2f} us/check")
+    print(f"snapshot  {snapshot_s * 1e3:8.1f} ms  ({size / 1e6:.1f} MB)")
+    print(f"restore   {restore_s * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+GST register throughput: GSTGuard.verify_gst_split_register() vs a loop of
+verify_gst_split() calls.
+
+Builds a month-end register of N invoices as float64 NumPy columns (about
+1% with a wrong leg) and times the register call on all of it; the scalar
+loop is timed on a sample and extrapolated.
+
+    python benchmarks/bench_gst_register.py [--invoices N] [--sample N]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from qwed_tax.jurisdictions.india.guards.gst_guard import GSTGuard
+from qwed_tax.jurisdictions.india.guards.gst_register import COLUMNS
+
+
+def build_register(invoices, seed=5):
+    rng = np.random.default_rng(seed)
+    states = np.array(["KA", "MH", "TN", "DL", "GJ", "UP"])
+    supplier = states[rng.integers(0, len(states), invoices)]
+    place = np.where(rng.random(invoices) < 0.6, supplier, states[rng.integers(0, len(states), invoices)])
+    taxable_paise = rng.integers(100, 10_000_000, invoices)
+    rate = np.array([0, 5, 12, 18, 28])[rng.integers(0, 5, invoices)]
+    half_paise = np.rint(taxable_paise * rate / 200)
+    interstate = supplier != place
+    cgst = np.where(interstate, 0, half_paise)
+    igst = np.where(interstate, 2 * half_paise, 0)
+    igst = igst + np.where(rng.random(invoices) < 0.01, 500, 0)
+    return {
+        "supplier_state": supplier,
+        "place_of_supply": place,
+        "taxable_value": taxable_paise / 100,
+        "gst_rate": rate.astype(np.float64),
+        "claimed_cgst": cgst / 100,
+        "claimed_sgst": cgst / 100,
+        "claimed_igst": igst / 100,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--invoices", type=int, default=2_000_000)
+    parser.add_argument("--sample", type=int, default=50_000)
+    args = parser.parse_args()
+
+    table = build_register(args.invoices)
+    guard = GSTGuard()
+
+    start = time.perf_counter()
+    mismatched = guard.verify_gst_split_register(table)
+    register_seconds = time.perf_counter() - start
+
+    sample = min(args.sample, args.invoices)
+    rows = list(zip(*(table[name][:sample].tolist() for name in COLUMNS)))
+    start = time.perf_counter()
+    for row in rows:
+        guard.verify_gst_split(*row)
+    scalar_seconds = (time.perf_counter() - start) * args.invoices / sample
+
+    print(f"invoices: {args.invoices:,}  mismatched: {len(mismatched):,}")
+    print(f"register: {register_seconds:8.2f} s  {args.invoices / register_seconds:>12,.0f} invoices/s")
+    print(f"scalar:   {scalar_seconds:8.2f} s  {args.invoices / scalar_seconds:>12,.0f} invoices/s (extrapolated)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+GSTIN validation: the per-call regex and str.index checksum versus the
+precompiled pattern, translate() tables and verify_gstin_batch().
+
+    python benchmarks/bench_gstin.py [--rows N]
+"""
+
+import argparse
+import random
+import re
+import timeit
+
+from qwed_tax.guards.indirect_tax_guard import InputCreditGuard
+
+CODES = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _legacy_verify(gstin):
+    if not re.match(r"^\d{2}[A-Z]{5}\d{4}[A-Z][1-9A-Z]Z[0-9A-Z]$", gstin):
+        return {"verified": False, "error": "Invalid GSTIN format."}
+    total = 0
+    for index, char in enumerate(gstin[:14]):
+        product = CODES.index(char) * (1 if index % 2 == 0 else 2)
+        total += product // 36 + product % 36
+    if gstin[14] != CODES[(36 - total % 36) % 36]:
+        return {"verified": False, "error": "Invalid GSTIN checksum."}
+    return {"verified": True}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    letters = CODES[10:]
+    gstins = [
+        f"{rng.randint(1, 38):02d}" + "".join(rng.choice(letters) for _ in range(5)) + f"{rng.randint(0, 9999):04d}"
+        + rng.choice(letters) + rng.choice(CODES[1:]) + "Z" + rng.choice(CODES)
+        for _ in range(args.rows)
+    ]
+    guard = InputCreditGuard()
+    cases = [
+        ("legacy verify_gstin_format", lambda: [_legacy_verify(g) for g in gstins]),
+        ("verify_gstin_format", lambda: [guard.verify_gstin_format(g) for g in gstins]),
+        ("verify_gstin_batch", lambda: guard.verify_gstin_batch(gstins)),
+    ]
+    print(f"{'case':30s} {'ns/GSTIN':>9s}")
+    for name, call in cases:
+        best = min(timeit.repeat(call, number=1, repeat=5)) / args.rows
+        print(f"{name:30s} {best * 1e9:9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Cold-start import cost, measured from `python -X importtime`.
+
+Each scenario runs in a fresh interpreter; the reported time is the largest
+cumulative figure in the importtime log (the outermost import), best of
+--repeat runs. Scenarios also list which heavy dependencies got loaded.
+
+With --check the script is a regression gate: it exits 1 if a scenario
+exceeds its budget or imports a dependency it must not.
+
+    python benchmarks/bench_import.py [--repeat N] [--check]
+"""
+
+import argparse
+import subprocess
+import sys
+
+HEAVY = ("z3", "pydantic", "numpy", "colorama")
+
+# statement, budget (ms), dependencies that must stay unloaded
+SCENARIOS = [
+    ("import qwed_tax", 30, HEAVY),
+    ("from qwed_tax import GSTGuard", 60, HEAVY),
+    ("from qwed_tax import TDSGuard", 60, HEAVY),
+    ("from qwed_tax import TaxPreFlight; TaxPreFlight()", 60, HEAVY),
+    ("from qwed_tax import WithholdingGuard", 400, ("z3", "numpy")),
+    ("from qwed_tax import QWEDTaxMiddleware", 400, ("z3", "numpy")),
+]
+
+_PROBE = "import sys\n{stmt}\nprint(','.join(m for m in {heavy!r} if m in sys.modules))"
+
+
+def measure(stmt):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(stmt=stmt, heavy=HEAVY)],
+        capture_output=True, text=True, check=True,
+    )
+    cumulative = [
+        int(line.split("|")[1])
+        for line in proc.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[1].strip().isdigit()
+    ]
+    loaded = [m for m in proc.stdout.strip().split(",") if m]
+    return max(cumulative) / 1000, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--check", action="store_true", help="exit 1 on a budget or dependency regression")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'scenario':<52} {'ms':>8} {'budget':>7}  loaded")
+    for stmt, budget, forbidden in SCENARIOS:
+        runs = [measure(stmt) for _ in range(args.repeat)]
+        best = min(ms for ms, _ in runs)
+        loaded = runs[0][1]
+        print(f"{stmt:<52} {best:>8.1f} {budget:>7}  {', '.join(loaded) or '-'}")
+        if best > budget:
+            failures.append(f"{stmt}: {best:.1f} ms > {budget} ms")
+        failures += [f"{stmt}: imported {m}" for m in loaded if m in forbidden]
+
+    if failures:
+        print("\n".join(["", "REGRESSIONS:"] + failures), file=sys.stderr)
+        return 1 if args.check else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
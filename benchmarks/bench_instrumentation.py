@@ -0,0 +1,54 @@
+"""
+Cost of the instrumentation hooks on TaxPreFlight.audit_transaction.
+
+Times the same mixed intent stream with no hook installed (the default), with
+a no-op hook (event construction and dispatch only) and with a
+HistogramCollector, then prints the collector's breakdown. To check the
+disabled path against an older tree, use bench_suite.py --save / --compare.
+
+    python benchmarks/bench_instrumentation.py [--intents N]
+"""
+
+import argparse
+import random
+import timeit
+
+from bench_suite import _mixed_intent
+
+from qwed_tax.instrumentation import HistogramCollector, instrumented
+from qwed_tax.verifier import TaxPreFlight
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--intents", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    intents = [_mixed_intent(rng) for _ in range(args.intents)]
+    preflight = TaxPreFlight()
+
+    def run():
+        for intent in intents:
+            preflight.audit_transaction(intent)
+
+    def per_intent():
+        return min(timeit.repeat(run, number=1, repeat=5)) / len(intents) * 1e6
+
+    run()
+    disabled = per_intent()
+    with instrumented(lambda event: None):
+        noop = per_intent()
+    collector = HistogramCollector()
+    with instrumented(collector):
+        collected = per_intent()
+
+    print(f"{'hooks':20s} {'us/intent':>10s} {'vs disabled':>12s}")
+    for name, micros in (("none (disabled)", disabled), ("no-op hook", noop), ("HistogramCollector", collected)):
+        print(f"{name:20s} {micros:10.2f} {micros / disabled - 1:+12.1%}")
+    print()
+    print(collector.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+ITC category index: lookups by match kind, index size, and whole expense reports.
+
+The index-size rows classify the same strings against mapping files with 10
+to 10,000 synthetic categories; lookup cost should not grow with the file.
+
+    python benchmarks/bench_itc.py [--number N] [--rows N]
+"""
+
+import argparse
+import random
+import timeit
+
+from qwed_tax.guards.indirect_tax_guard import InputCreditGuard
+from qwed_tax.guards.itc_categories import CategoryIndex
+
+SAMPLES = ["CATERING", "Food & Beverage", "Team lunch with the client in Bengaluru", "office supplies"]
+
+
+def _synthetic_index(size):
+    categories = [
+        {"code": f"CODE_{i}", "rule": "blocked", "aliases": [f"ALIAS_{i}"], "keywords": [f"WORD{i}", f"TWO_WORD{i}"]}
+        for i in range(size)
+    ]
+    categories[0]["keywords"].append("LUNCH")
+    return CategoryIndex.from_dict({"categories": categories})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    guard = InputCreditGuard()
+    print(f"{'case':44s} {'us/call':>9s}")
+    for category in SAMPLES:
+        best = min(timeit.repeat(lambda: guard.verify_itc_eligibility(category, "1000", "180"),
+                                 number=args.number, repeat=5)) / args.number
+        print(f"{'verify ' + category[:37]:44s} {best * 1e6:9.3f}")
+
+    for size in (10, 1000, 10000):
+        index = _synthetic_index(size)
+        best = min(timeit.repeat(lambda: [index.classify(c) for c in SAMPLES],
+                                 number=args.number // 4, repeat=5)) / (args.number // 4) / len(SAMPLES)
+        print(f"{f'classify, {size} categories':44s} {best * 1e6:9.3f}")
+
+    rng = random.Random(0)
+    report = [(rng.choice(SAMPLES), str(rng.randint(1, 10**6)), "180") for _ in range(args.rows)]
+    timings = [
+        min(timeit.repeat(call, number=1, repeat=5)) / args.rows
+        for call in (lambda: [guard.verify_itc_eligibility(*row) for row in report],
+                     lambda: guard.verify_itc_batch(report))
+    ]
+    print(f"{'report, per-row calls':44s} {timings[0] * 1e6:9.3f}")
+    print(f"{'report, verify_itc_batch':44s} {timings[1] * 1e6:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
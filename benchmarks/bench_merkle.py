@@ -0,0 +1,55 @@
+"""
+Merkle-batched proof references for a bulk TDS run.
+
+Builds one batch root over N VERIFIED results with merkle_batch(), then
+compares what the audit store keeps (N refs vs one root) and the cost of
+re-checking a single verdict: its inclusion proof against the root versus
+rebuilding the root from every item.
+
+    python benchmarks/bench_merkle.py [--items N]
+"""
+
+import argparse
+import time
+
+from qwed_tax.diagnostics import merkle_batch
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.merkle import MerkleBatch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=100_000)
+    args = parser.parse_args()
+
+    guard = TDSGuard()
+    results = [
+        TDSGuard.to_diagnostic(guard.calculate_deduction("PROFESSIONAL_FEES", str(30000 + i), "0"))
+        for i in range(args.items)
+    ]
+    refs = [result.proof_ref for result in results]
+
+    start = time.perf_counter()
+    root, batched = merkle_batch(results)
+    batch_seconds = time.perf_counter() - start
+
+    item = batched[args.items // 2]
+    start = time.perf_counter()
+    assert item.verify_evidence(item.audit_trace)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert MerkleBatch(refs).root_ref == root
+    rebuild = time.perf_counter() - start
+
+    print(f"items                   {args.items:>12,}")
+    print(f"merkle_batch            {batch_seconds:>11.2f}s  ({batch_seconds / args.items * 1e6:.1f} us/item)")
+    print(f"store: per-item refs    {sum(map(len, refs)):>12,} bytes")
+    print(f"store: batch root       {len(root):>12,} bytes")
+    print(f"inclusion proof         {len(item.inclusion_proof.path):>12} siblings")
+    print(f"check one verdict       {single * 1e6:>11.1f}us")
+    print(f"rebuild whole root      {rebuild * 1e6:>11.1f}us")
+
+
+if __name__ == "__main__":
+    main()
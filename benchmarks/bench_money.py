@@ -0,0 +1,67 @@
+"""
+Money kernel: input parsing, cents conversion, context operations and columns.
+
+Each case is timed against the pre-kernel equivalent (Decimal(str(value)),
+decimal_to_cents(Decimal(...)), Decimal operators, a list of parsed cents).
+
+    python benchmarks/bench_money.py [--number N] [--rows N]
+"""
+
+import argparse
+import random
+import timeit
+from decimal import Decimal
+
+from qwed_tax import money
+from qwed_tax.money import parse_decimal_input, parse_units, units_array
+
+
+def _legacy_parse(value, field_name):
+    if isinstance(value, bool):
+        raise ValueError(f"{field_name} must be a numeric value.")
+    parsed = Decimal(str(value))
+    if not parsed.is_finite():
+        raise ValueError(f"{field_name} must be a finite numeric value.")
+    return parsed
+
+
+def _legacy_cents(value):
+    scaled = _legacy_parse(value, "amount").scaleb(2)
+    cents = int(scaled)
+    return cents if scaled == cents else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=100000)
+    parser.add_argument("--rows", type=int, default=10000)
+    args = parser.parse_args()
+
+    a, b, rate = Decimal("123456.78"), Decimal("98765.43"), Decimal("0.062")
+    rng = random.Random(0)
+    column = [f"{rng.randint(0, 10**9) / 100:.2f}" for _ in range(args.rows)]
+    cases = [
+        ("parse str", lambda: _legacy_parse("12345.67", "x"), lambda: parse_decimal_input("12345.67", "x")),
+        ("parse int", lambda: _legacy_parse(150000, "x"), lambda: parse_decimal_input(150000, "x")),
+        ("parse Decimal", lambda: _legacy_parse(a, "x"), lambda: parse_decimal_input(a, "x")),
+        ("cents from str", lambda: _legacy_cents("12345.67"), lambda: parse_units("12345.67", -2, "x")),
+        ("cents from int", lambda: _legacy_cents(150000), lambda: parse_units(150000, -2, "x")),
+        ("a * rate", lambda: a * rate, lambda: money.multiply(a, rate)),
+        ("(a - b).quantize", lambda: (a - b).quantize(Decimal("0.01")),
+         lambda: money.quantize(money.subtract(a, b), Decimal("0.01"))),
+    ]
+    print(f"{'case':22s} {'legacy ns':>10s} {'kernel ns':>10s} {'change':>8s}")
+    for name, legacy, kernel in cases:
+        timings = [min(timeit.repeat(call, number=args.number, repeat=7)) / args.number * 1e9
+                   for call in (legacy, kernel)]
+        print(f"{name:22s} {timings[0]:10.0f} {timings[1]:10.0f} {timings[1] / timings[0] - 1:+8.1%}")
+
+    rows = [
+        min(timeit.repeat(call, number=1, repeat=7)) / args.rows * 1e9
+        for call in (lambda: [_legacy_cents(value) for value in column], lambda: units_array(column))
+    ]
+    print(f"{'column -> cents':22s} {rows[0]:10.0f} {rows[1]:10.0f} {rows[1] / rows[0] - 1:+8.1%}  (per row)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Scaling benchmark for PayrollGuard.verify_payroll_run.
+
+Verifies one synthetic payroll run (1% of entries carry a net-pay error) at
+1/2/4/8 workers and reports wall time, entries/sec and speedup over the
+serial run. Summaries are checked to be identical across worker counts.
+
+    python benchmarks/bench_payroll_run.py [--entries N] [--chunk-size N]
+"""
+
+import argparse
+import os
+import time
+from decimal import Decimal
+
+from qwed_tax.jurisdictions.us.payroll_guard import DEFAULT_CHUNK_SIZE, PayrollGuard
+from qwed_tax.models import DeductionEntry, DeductionType, PayrollEntry, TaxEntry
+
+
+def build_run(n):
+    entries = []
+    for i in range(n):
+        gross = Decimal("3000.00") + Decimal(i % 5000) / 100
+        taxes = [
+            TaxEntry(name="Federal Income Tax", amount=Decimal("412.50")),
+            TaxEntry(name="Social Security", amount=(gross * Decimal("0.062")).quantize(Decimal("0.01"))),
+            TaxEntry(name="Medicare", amount=(gross * Decimal("0.0145")).quantize(Decimal("0.01"))),
+        ]
+        deductions = [
+            DeductionEntry(name="401k", amount=Decimal("150.00"), type=DeductionType.PRE_TAX),
+            DeductionEntry(name="Health", amount=Decimal("85.25"), type=DeductionType.PRE_TAX),
+        ]
+        net = gross - sum(t.amount for t in taxes) - sum(d.amount for d in deductions)
+        if i % 100 == 42:
+            net += Decimal("0.01") * (i % 17 + 1)
+        entries.append(
+            PayrollEntry(
+                employee_id=f"E{i:06d}", gross_pay=gross, taxes=taxes,
+                deductions=deductions, net_pay_claimed=net,
+            )
+        )
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    run = build_run(args.entries)
+    guard = PayrollGuard()
+    print(f"{args.entries} entries, chunk size {args.chunk_size}, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'seconds':>9} {'entries/s':>11} {'speedup':>8}")
+
+    baseline = None
+    reference = None
+    for workers in (1, 2, 4, 8):
+        start = time.perf_counter()
+        summary = guard.verify_payroll_run(run, workers=workers, chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - start
+        if reference is None:
+            baseline, reference = elapsed, summary
+        assert summary == reference, "summary differs across worker counts"
+        print(f"{workers:>8} {elapsed:>9.3f} {args.entries / elapsed:>11.0f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Vectorized cent engine vs the Decimal gross-to-net path.
+
+Times PayrollGuard.verify_gross_to_net over a whole run, then the
+PayrollRunArrays engine on the same run: verify() on columnar cents alone,
+and from_entries() + verify() including conversion from PayrollEntry.
+Mismatch sets are checked to agree.
+
+    python benchmarks/bench_payroll_vector.py [--entries N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_payroll_run import build_run  # noqa: E402
+
+from qwed_tax.jurisdictions.us.payroll_guard import PayrollGuard  # noqa: E402
+from qwed_tax.jurisdictions.us.payroll_vector import PayrollRunArrays  # noqa: E402
+
+
+def best_of(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=100_000)
+    args = parser.parse_args()
+
+    run = build_run(args.entries)
+    guard = PayrollGuard()
+    arrays = PayrollRunArrays.from_entries(run)
+
+    decimal_s, results = best_of(lambda: [guard.verify_gross_to_net(e) for e in run])
+    vector_s, outcome = best_of(lambda: arrays.verify())
+    convert_s, _ = best_of(lambda: PayrollRunArrays.from_entries(run).verify())
+    failures_s, _ = best_of(lambda: list(outcome.failures()))
+
+    expected = [i for i, r in enumerate(results) if not r.verified]
+    assert list(outcome.failed_indices) == expected, "engines disagree"
+
+    print(f"{args.entries} entries, {len(expected)} mismatches")
+    print(f"{'path':<36} {'seconds':>9} {'speedup':>8}")
+    for label, seconds in (
+        ("Decimal verify_gross_to_net", decimal_s),
+        ("vector verify() on cent arrays", vector_s),
+        ("vector from_entries() + verify()", convert_s),
+        ("materialize mismatch results", failures_s),
+    ):
+        print(f"{label:<36} {seconds:>9.4f} {decimal_s / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Microbenchmark for TaxPreFlight.audit_transaction check bookkeeping.
+
+Measures per-intent latency for one complete claim per action, plus intents
+that are blocked on missing fields (pure bookkeeping, no guard math). The
+"dispatch" column times intent validation and check selection alone
+(TaxPreFlight._prepare_report), without running any guard.
+
+    python benchmarks/bench_preflight.py [--number N]
+"""
+
+import argparse
+import timeit
+
+from qwed_tax.verifier import TaxPreFlight
+
+INTENTS = {
+    "hire": {
+        "action": "hire",
+        "worker_type": "W2",
+        "worker_facts": {
+            "provides_tools": True,
+            "reimburses_expenses": True,
+            "indefinite_relationship": True,
+        },
+    },
+    "economic_nexus": {
+        "action": "economic_nexus",
+        "state": "NY",
+        "sales_data": {"amount": 500001, "transactions": 10},
+        "tax_decision": "collect",
+    },
+    "trade_tax": {
+        "action": "trade_tax",
+        "asset_type": "equity",
+        "dates": {"buy": "2022-01-01", "sell": "2024-02-01"},
+        "claimed_rate": "12.5%",
+    },
+    "corporate_action": {
+        "action": "corporate_action",
+        "lender_type": "company",
+        "borrower_role": "vendor",
+        "interest_rate": "10",
+        "market_rate": "8",
+    },
+    "remit_money": {
+        "action": "remit_money",
+        "remittance_amount_usd": "10000",
+        "purpose": "education",
+        "fy_usage": "5000",
+    },
+    "expense_claim": {
+        "action": "expense_claim",
+        "expense_category": "office_supplies",
+        "amount": "1000",
+        "tax_paid": "180",
+    },
+    "pay_invoice": {
+        "action": "pay_invoice",
+        "service_type": "professional_fees",
+        "amount": "1000",
+        "ytd_payment": "0",
+    },
+    "bookkeeping_only (missing nested field)": {
+        "action": "trade_tax",
+        "asset_type": "equity",
+        "dates": {"buy": "2022-01-01"},
+        "claimed_rate": "12.5%",
+    },
+    "bookkeeping_only (no claim shape)": {
+        "action": "corporate_action",
+        "investment_round": "series_a",
+    },
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    preflight = TaxPreFlight()
+    print(f"{'case':45s} {'us/call':>10s} {'dispatch':>10s}")
+    for name, intent in INTENTS.items():
+        full = _best_of(lambda: preflight.audit_transaction(intent), args.number)
+        dispatch = _best_of(lambda: preflight._prepare_report(intent), args.number)
+        print(f"{name:45s} {full:10.2f} {dispatch:10.2f}")
+
+
+def _best_of(fn, number: int) -> float:
+    """Best-of-5 microseconds per call."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+proof_ref hashing cost per verdict, and peak memory when hashing a large run.
+
+Per verdict, a VERIFIED TDS result is hashed twice, as when to_diagnostic()
+issues the ref and an auditor re-checks it with trace_proof_ref():
+
+    legacy   json.dumps(sort_keys=True) + SHA-256 each time (the "sha256:" refs)
+    qc1      canonical encoding + SHA-256 each time, no cache
+    cached   compute_proof_ref() / trace_proof_ref(): hashed once per trace
+
+The run section hashes a payroll-run-sized list of result rows in one
+json.dumps payload versus item by item with ProofHasher.
+
+    python benchmarks/bench_proof_ref.py [--verdicts N] [--rows N]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from qwed_tax.audit import trace_proof_ref
+from qwed_tax.diagnostics import compute_proof_ref
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.proof import ProofHasher, legacy_proof_ref, proof_ref
+
+
+def traces(count):
+    guard = TDSGuard()
+    return [guard.calculate_deduction("PROFESSIONAL_FEES", str(50000 + i), "0")["audit_trace"] for i in range(count)]
+
+
+def per_verdict(count):
+    paths = {
+        "legacy": lambda trace: (legacy_proof_ref(trace), legacy_proof_ref(trace)),
+        "qc1": lambda trace: (proof_ref(trace), proof_ref(trace)),
+        "cached": lambda trace: (compute_proof_ref(trace), trace_proof_ref(trace)),
+    }
+    timings = {}
+    for name, path in paths.items():
+        batch = traces(count)  # fresh traces: nothing cached yet
+        start = time.perf_counter()
+        for trace in batch:
+            path(trace)
+        timings[name] = (time.perf_counter() - start) / count * 1e6
+    return timings
+
+
+def run_rows(count):
+    for i in range(count):
+        yield {"employee_id": f"E{i:07d}", "gross": f"{5000 + i % 997}.00", "verified": i % 11 != 0}
+
+
+def measured(work):
+    tracemalloc.start()
+    start = time.perf_counter()
+    ref = work()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return ref, elapsed, peak / 2**20
+
+
+def streamed(count):
+    hasher = ProofHasher()
+    for row in run_rows(count):
+        hasher.update(row)
+    return hasher.proof_ref()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--verdicts", type=int, default=100_000)
+    parser.add_argument("--rows", type=int, default=500_000)
+    args = parser.parse_args()
+
+    print(f"{'per verdict':<12} {'us':>8}")
+    for name, micros in per_verdict(args.verdicts).items():
+        print(f"{name:<12} {micros:>8.2f}")
+
+    print(f"\n{'run of ' + format(args.rows, ','):<20} {'s':>7} {'peak MiB':>9}")
+    _, seconds, peak = measured(lambda: legacy_proof_ref(list(run_rows(args.rows))))
+    print(f"{'json.dumps':<20} {seconds:>7.2f} {peak:>9.1f}")
+    _, seconds, peak = measured(lambda: streamed(args.rows))
+    print(f"{'ProofHasher':<20} {seconds:>7.2f} {peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+GSTGuard RCM throughput: precomputed decision matrix vs rule evaluation.
+
+"rules" re-evaluates the _RCM_RULES predicate and builds the audit trace
+with build_trace() on every call, as verify_rcm_applicability() did before
+the matrix. "single" and "batch" time the public APIs over the same ledger
+of raw string invoices. Every path keeps its results, as a caller would.
+
+    python benchmarks/bench_rcm.py [--invoices N]
+"""
+
+import argparse
+import itertools
+import random
+import time
+
+from qwed_tax.audit import RCM_NOT_APPLICABLE, build_trace
+from qwed_tax.jurisdictions.india.guards.gst_guard import EntityType, GSTGuard, ServiceType
+
+
+def rules_path(guard, service, provider, recipient, claimed):
+    service, provider, recipient = ServiceType(service), EntityType(provider), EntityType(recipient)
+    rule = guard._RCM_RULES.get(service)
+    is_rcm = bool(rule and rule.applies(provider, recipient))
+    rule_ref = rule.rule_ref if is_rcm else RCM_NOT_APPLICABLE
+    inputs = {"service": service.value, "provider": provider.value, "recipient": recipient.value,
+              "claimed_is_rcm": claimed}
+    return {"verified": claimed is is_rcm, "is_rcm": is_rcm,
+            "audit_trace": build_trace(rule_ref, "REVERSE_CHARGE" if is_rcm else "FORWARD_CHARGE", inputs)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--invoices", type=int, default=500_000)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    cells = list(itertools.product(
+        [m.value for m in ServiceType], [m.value for m in EntityType], [m.value for m in EntityType], (False, True)
+    ))
+    ledger = [rng.choice(cells) for _ in range(args.invoices)]
+    guard = GSTGuard()
+
+    timings = {}
+    start = time.perf_counter()
+    results = [rules_path(guard, *invoice) for invoice in ledger]
+    timings["rules"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [guard.verify_rcm_applicability(*invoice) for invoice in ledger]
+    timings["single"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = guard.verify_rcm_batch(ledger)
+    timings["batch"] = time.perf_counter() - start
+
+    print(f"{'path':<8} {'invoices/s':>12} {'us/invoice':>11}")
+    for name, seconds in timings.items():
+        print(f"{name:<8} {args.invoices / seconds:>12,.0f} {seconds / args.invoices * 1e6:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
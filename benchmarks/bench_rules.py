@@ -0,0 +1,41 @@
+"""
+Rule-table lookups: today's table, dated tables, and guards called with as_of.
+
+    python benchmarks/bench_rules.py [--number N]
+"""
+
+import argparse
+import timeit
+from datetime import date
+
+from qwed_tax import rules
+from qwed_tax.guards.capital_gains_guard import CapitalGainsGuard
+from qwed_tax.guards.remittance_guard import RemittanceGuard
+from qwed_tax.guards.tds_guard import TDSGuard
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    tds, cg, remittance = TDSGuard(), CapitalGainsGuard(), RemittanceGuard()
+    dated = date(2023, 9, 30)
+    cases = [
+        ("table tds (today)", lambda: rules.table("tds")),
+        ("table us_fica (date)", lambda: rules.table("us_fica", dated)),
+        ("table us_fica (ISO str)", lambda: rules.table("us_fica", "2023-09-30")),
+        ("TDS calculate_deduction", lambda: tds.calculate_deduction("COMMISSION", "20000", "0")),
+        ("TDS calculate_deduction as_of", lambda: tds.calculate_deduction("COMMISSION", "20000", "0", as_of=dated)),
+        ("CG verify_tax_rate", lambda: cg.verify_tax_rate("equity", "LTCG", "12.5%")),
+        ("CG verify_tax_rate as_of", lambda: cg.verify_tax_rate("equity", "LTCG", "10%", as_of=dated)),
+        ("calculate_tcs as_of", lambda: remittance.calculate_tcs("800000", "tour", as_of=dated)),
+    ]
+    print(f"{'case':34s} {'us/call':>9s}")
+    for name, call in cases:
+        best = min(timeit.repeat(call, number=args.number, repeat=5)) / args.number
+        print(f"{name:34s} {best * 1e6:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
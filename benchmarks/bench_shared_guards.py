@@ -0,0 +1,80 @@
+"""
+One shared TaxPreFlight versus one per worker thread: memory and throughput.
+
+Memory is the tracemalloc growth of building the instances with every guard
+warmed; throughput is intents per second across the worker threads.
+
+    python benchmarks/bench_shared_guards.py [--threads N] [--intents N]
+"""
+
+import argparse
+import threading
+import time
+import tracemalloc
+
+from qwed_tax.verifier import TaxPreFlight
+
+INTENTS = [
+    {"action": "pay_invoice", "service_type": "PROFESSIONAL_FEES", "amount": "50000", "ytd_payment": "0"},
+    {"action": "expense_claim", "expense_category": "catering", "amount": "1000", "tax_paid": "180"},
+    {"action": "trade_tax", "loss_head": "intraday", "loss_amount": "2500", "offset_head": "futures"},
+    {"action": "economic_nexus", "state": "NY", "sales_data": {"amount": 500001, "transactions": 10},
+     "tax_decision": "no_tax"},
+    {"action": "remit_money", "remittance_amount_usd": "300000", "purpose": "education", "fy_usage": "0"},
+    {"action": "hire", "worker_type": "W2"},
+]
+
+
+def _warm(preflight):
+    for intent in INTENTS:
+        preflight.audit_transaction(intent)
+    return preflight
+
+
+def _footprint(count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [_warm(TaxPreFlight()) for _ in range(count)]
+    grown = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del instances
+    return grown
+
+
+def _throughput(preflights, per_thread):
+    barrier = threading.Barrier(len(preflights) + 1)
+
+    def run(preflight):
+        barrier.wait()
+        for index in range(per_thread):
+            preflight.audit_transaction(INTENTS[index % len(INTENTS)])
+
+    threads = [threading.Thread(target=run, args=(preflight,)) for preflight in preflights]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return len(preflights) * per_thread / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--intents", type=int, default=20000, help="intents per thread")
+    args = parser.parse_args()
+
+    _warm(TaxPreFlight())  # import every guard module before measuring
+    shared_bytes, per_thread_bytes = _footprint(1), _footprint(args.threads)
+    shared = _warm(TaxPreFlight())
+    shared_rate = _throughput([shared] * args.threads, args.intents)
+    own_rate = _throughput([_warm(TaxPreFlight()) for _ in range(args.threads)], args.intents)
+
+    print(f"{'layout':24s} {'KiB':>9s} {'intents/s':>11s}")
+    print(f"{'shared (1 instance)':24s} {shared_bytes / 1024:9.1f} {shared_rate:11.0f}")
+    print(f"{f'per thread ({args.threads})':24s} {per_thread_bytes / 1024:9.1f} {own_rate:11.0f}")
+
+
+if __name__ == "__main__":
+    main()
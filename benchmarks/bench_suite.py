@@ -0,0 +1,347 @@
+"""
+Benchmark suite: every TaxPreFlight action, the middleware, every guard's
+to_diagnostic() and compute_proof_ref(), over seeded generated workloads.
+
+Workloads mix the shapes a real run sees: amounts on both sides of each
+threshold, mixed categories and casing, wrong claims and a share of invalid
+inputs. to_diagnostic cases time the conversion alone, over fresh guard
+results. See harness.py for what each column means.
+
+    python benchmarks/bench_suite.py [--calls N] [-k preflight] [--save NAME] [--compare NAME]
+"""
+
+import random
+import sys
+from decimal import Decimal
+from typing import Any, Callable, List
+
+from harness import Case, main
+
+from qwed_tax.diagnostics import compute_proof_ref
+from qwed_tax.guards.capital_gains_guard import CapitalGainsGuard
+from qwed_tax.guards.classification_guard import ClassificationGuard
+from qwed_tax.guards.dtaa_guard import DTAAGuard
+from qwed_tax.guards.indirect_tax_guard import InputCreditGuard
+from qwed_tax.guards.poem_guard import PoEMGuard
+from qwed_tax.guards.remittance_guard import RemittanceGuard
+from qwed_tax.guards.speculation_guard import SpeculationGuard
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.guards.transfer_pricing_guard import TransferPricingGuard
+from qwed_tax.guards.valuation_guard import ValuationGuard
+from qwed_tax.jurisdictions.india.guards.crypto_guard import CryptoTaxGuard
+from qwed_tax.jurisdictions.india.guards.gst_guard import EntityType, GSTGuard, ServiceType
+from qwed_tax.jurisdictions.india.guards.setoff_guard import InterHeadAdjustmentGuard, TaxHead
+from qwed_tax.jurisdictions.us.payroll_guard import PayrollGuard
+from qwed_tax.jurisdictions.us.withholding_guard import W4Form, WithholdingGuard
+from qwed_tax.middleware.gusto_interceptor import QWEDTaxMiddleware
+from qwed_tax.models import PayrollEntry
+from qwed_tax.verifier import TaxPreFlight
+
+BATCH_SIZE = 100
+
+TDS_SERVICES = ["PROFESSIONAL_FEES", "professional fees", "CONTRACTOR_INDIVIDUAL", "CONTRACTOR_FIRM",
+                "COMMISSION", "RENT_LAND", "CONSULTING_RETAINER"]
+LRS_PURPOSES = ["education", "EDUCATION", "medical", "travel", "investment", "gift", "gambling"]
+ITC_CATEGORIES = ["office_supplies", "IT_SERVICES", "food_and_beverage", "motor vehicle", "catering",
+                  "gift_to_employee", "club_membership", "raw_materials"]
+CG_ASSETS = ["equity", "real_estate", "debt", "debt_fund", "gold_etf"]
+CG_RATES = ["12.5%", "20%", "10%", "15%", "30%", "slab"]
+SPECULATION_SOURCES = ["intraday", "f&o", "futures", "options", "delivery", "business", "capital_gains", "lottery"]
+STATES = ["NY", "CA", "TX", "FL", "WA", "IL", "NJ", "PA", "GA", "OH"]
+
+
+def _amount(rng: random.Random, low: float, high: float) -> str:
+    return f"{rng.uniform(low, high):.2f}"
+
+
+def _maybe_invalid(rng: random.Random, value: Any, rate: float = 0.03) -> Any:
+    return rng.choice(["", "n/a", "1,00,000", "12.5.0"]) if rng.random() < rate else value
+
+
+def _claim(rng: random.Random, correct: Any, wrong: Any, error_rate: float = 0.15) -> Any:
+    return wrong if rng.random() < error_rate else correct
+
+
+# --- workload generators: one fresh argument tuple per call ----------------
+
+def _tds_args(rng):
+    return (rng.choice(TDS_SERVICES), _maybe_invalid(rng, _amount(rng, 1_000, 300_000)),
+            _amount(rng, 0, 400_000) if rng.random() < 0.6 else "0")
+
+
+def _lrs_args(rng):
+    return (_maybe_invalid(rng, _amount(rng, 500, 300_000)), rng.choice(LRS_PURPOSES),
+            _amount(rng, 0, 250_000))
+
+
+def _poem_kwargs(rng):
+    def split(total):
+        return total, round(total * rng.random(), 2)
+
+    turnover, turnover_out = split(rng.uniform(1e6, 1e9))
+    assets, assets_out = split(rng.uniform(1e6, 1e9))
+    employees = rng.randint(5, 5_000)
+    payroll, payroll_out = split(rng.uniform(1e5, 1e8))
+    return dict(
+        company_name=f"Holdco {rng.randint(1, 99_999)}",
+        is_foreign_incorp=rng.random() < 0.9,
+        turnover_total=turnover, turnover_outside_india=turnover_out,
+        assets_total=_maybe_invalid(rng, assets), assets_outside_india=assets_out,
+        employees_total=employees, employees_outside_india=rng.randint(0, employees),
+        payroll_total=payroll, payroll_outside_india=payroll_out,
+        key_management_location=rng.choice(["INDIA", "INDIA", "OUTSIDE", "SINGAPORE"]),
+    )
+
+
+def _itc_args(rng):
+    amount = rng.uniform(1_000, 200_000)
+    return (rng.choice(ITC_CATEGORIES), _maybe_invalid(rng, f"{amount:.2f}"), f"{amount * 0.18:.2f}")
+
+
+def _cg_args(rng):
+    return (rng.choice(CG_ASSETS), rng.choice(["LTCG", "STCG"]), rng.choice(CG_RATES))
+
+
+def _worker_facts(rng):
+    return {
+        "provides_tools": rng.random() < 0.5,
+        "reimburses_expenses": rng.random() < 0.5,
+        "indefinite_relationship": rng.random() < 0.5,
+    }
+
+
+def _classification_args(rng):
+    return (rng.choice(["1099", "W2", "contractor", "employee"]), _worker_facts(rng))
+
+
+def _speculation_args(rng):
+    return (rng.choice(SPECULATION_SOURCES), _maybe_invalid(rng, _amount(rng, 1_000, 500_000)),
+            rng.choice(SPECULATION_SOURCES))
+
+
+def _valuation_args(rng):
+    return (_maybe_invalid(rng, _amount(rng, 10_000, 5_000_000)), _amount(rng, 1, 20),
+            _claim(rng, f"{rng.uniform(0.05, 0.30):.2f}", "1.5", 0.03), _amount(rng, 1, 40))
+
+
+def _setoff_args(rng):
+    return (rng.choice(list(TaxHead)), rng.choice(list(TaxHead)))
+
+
+def _crypto_result(guard, rng):
+    if rng.random() < 0.5:
+        income = Decimal(_amount(rng, -10_000, 2_000_000))
+        return guard.verify_flat_tax_rate(income, _claim(rng, income * Decimal("0.30"), income * Decimal("0.20")))
+    losses = {rng.choice(["VDA", "EQUITY", "BUSINESS"]): -Decimal(_amount(rng, 100, 50_000))}
+    gains = {"BUSINESS": Decimal(_amount(rng, 100, 50_000))} if rng.random() < 0.1 else None
+    return guard.verify_set_off(losses, gains)
+
+
+def _w4_form(rng):
+    return W4Form(
+        employee_id=f"E{rng.randint(1, 999_999):06d}",
+        claim_exempt=rng.random() < 0.3,
+        tax_liability_last_year=rng.choice(["0", "0", _amount(rng, 1, 20_000)]),
+        expect_refund_this_year=rng.random() < 0.5,
+    )
+
+
+def _rcm_args(rng):
+    claimed = rng.choice([None, True, False])
+    return (rng.choice(list(ServiceType)).value, rng.choice(list(EntityType)).value,
+            rng.choice(list(EntityType)).value, claimed)
+
+
+def _payroll_entry(rng, index):
+    gross = Decimal(_amount(rng, 1_500, 15_000))
+    federal = (gross * Decimal("0.16")).quantize(Decimal("0.01"))
+    social = (gross * Decimal("0.062")).quantize(Decimal("0.01"))
+    medicare = (gross * Decimal("0.0145")).quantize(Decimal("0.01"))
+    pre_tax = Decimal(rng.choice(["0", "250.00", "500.00"]))
+    net = gross - federal - social - medicare - pre_tax
+    return {
+        "employee_id": f"E{index:06d}",
+        "gross_pay": str(gross),
+        "taxes": [
+            {"name": "Federal Income Tax", "amount": str(federal)},
+            {"name": "Social Security", "amount": str(social)},
+            {"name": "Medicare", "amount": str(medicare)},
+        ],
+        "deductions": [{"name": "401k", "amount": str(pre_tax), "type": "PRE_TAX"}],
+        "net_pay_claimed": str(_claim(rng, net, net + Decimal("0.01"), 0.1)),
+    }
+
+
+def _middleware_payload(rng):
+    roll = rng.random()
+    if roll < 0.02:
+        return {"payroll_entry": {}}
+    entry = _payroll_entry(rng, rng.randint(1, 999_999))
+    if roll < 0.04:
+        entry["gross_pay"] = "five thousand"
+    return {"payroll_entry": entry}
+
+
+def _evidence(rng, lines):
+    return {
+        "rule_id": rng.choice(["TDS_194J", "GST_RCM_9_3", "LRS_FEMA"]),
+        "outcome": rng.choice(["DEDUCT", "NO_DEDUCTION", "BLOCKED"]),
+        "inputs": {
+            "invoice_id": f"INV-{rng.randint(1, 10**9)}",
+            "amount": _amount(rng, 1, 10**6),
+            "lines": [
+                {"sku": f"SKU{rng.randint(1, 9999)}", "qty": rng.randint(1, 50),
+                 "price": _amount(rng, 1, 5_000), "taxable": rng.random() < 0.9}
+                for _ in range(lines)
+            ],
+        },
+        "rules": [{"id": "194J", "source": "Income Tax Act, 1961", "version": "FY2025-26"}],
+    }
+
+
+# --- TaxPreFlight intents, one generator per action -------------------------
+
+def _intent_hire(rng):
+    return {"action": rng.choice(["hire", "hire_worker", "worker_classification"]),
+            "worker_type": rng.choice(["W2", "1099"]), "worker_facts": _worker_facts(rng)}
+
+
+def _intent_nexus(rng):
+    return {"action": rng.choice(["economic_nexus", "sales_tax_check"]), "state": rng.choice(STATES),
+            "sales_data": {"amount": rng.randint(10_000, 1_000_000), "transactions": rng.randint(1, 400)},
+            "tax_decision": rng.choice(["collect", "no_collect"])}
+
+
+def _intent_trade(rng):
+    if rng.random() < 0.5:
+        buy = f"20{rng.randint(15, 23)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        sell = f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        return {"action": "trade_tax", "asset_type": rng.choice(CG_ASSETS[:4]),
+                "dates": {"buy": buy, "sell": sell}, "claimed_rate": rng.choice(CG_RATES)}
+    return {"action": "trade_tax", "loss_head": rng.choice(SPECULATION_SOURCES[:6]),
+            "offset_head": rng.choice(SPECULATION_SOURCES[:6]), "loss_amount": _amount(rng, 1_000, 200_000)}
+
+
+def _intent_corporate(rng):
+    if rng.random() < 0.5:
+        return {"action": "corporate_action", "lender_type": rng.choice(["company", "individual"]),
+                "borrower_role": rng.choice(["director", "vendor", "shareholder"]),
+                "interest_rate": _amount(rng, 0, 15), "market_rate": _amount(rng, 6, 12)}
+    investment, cap, discount, next_price = _valuation_args(rng)
+    return {"action": "corporate_action", "investment_round": rng.choice(["seed", "series_a"]),
+            "investment_amount": investment, "cap_price": cap, "discount": discount,
+            "next_round_price": next_price}
+
+
+def _intent_remit(rng):
+    amount, purpose, usage = _lrs_args(rng)
+    return {"action": "remit_money", "remittance_amount_usd": amount, "purpose": purpose, "fy_usage": usage}
+
+
+def _intent_expense(rng):
+    category, amount, tax = _itc_args(rng)
+    return {"action": "expense_claim", "expense_category": category, "amount": amount, "tax_paid": tax}
+
+
+def _intent_invoice(rng):
+    service, amount, ytd = _tds_args(rng)
+    return {"action": "pay_invoice", "service_type": service, "amount": amount, "ytd_payment": ytd}
+
+
+INTENTS = {
+    "hire": _intent_hire,
+    "economic_nexus": _intent_nexus,
+    "trade_tax": _intent_trade,
+    "corporate_action": _intent_corporate,
+    "remit_money": _intent_remit,
+    "expense_claim": _intent_expense,
+    "pay_invoice": _intent_invoice,
+}
+
+
+def _mixed_intent(rng):
+    if rng.random() < 0.03:
+        return {"action": "trade_tax", "asset_type": "equity"}  # incomplete claim
+    return rng.choice(list(INTENTS.values()))(rng)
+
+
+def _each(produce: Callable[[random.Random], Any]) -> Callable[[random.Random, int], List[tuple]]:
+    """make() for a call taking one argument."""
+    return lambda rng, n: [(produce(rng),) for _ in range(n)]
+
+
+def _each_args(produce: Callable[[random.Random], tuple]) -> Callable[[random.Random, int], List[tuple]]:
+    return lambda rng, n: [produce(rng) for _ in range(n)]
+
+
+def cases() -> List[Case]:
+    preflight = TaxPreFlight()
+    middleware = QWEDTaxMiddleware()
+    tds, lrs, poem, itc = TDSGuard(), RemittanceGuard(), PoEMGuard(), InputCreditGuard()
+    cg, classifier, speculation = CapitalGainsGuard(), ClassificationGuard(), SpeculationGuard()
+    valuation, setoff, crypto = ValuationGuard(), InterHeadAdjustmentGuard(), CryptoTaxGuard()
+    withholding, gst, payroll = WithholdingGuard(), GSTGuard(), PayrollGuard()
+    dtaa, transfer_pricing = DTAAGuard(), TransferPricingGuard()
+
+    suite = [
+        Case("preflight", f"audit_transaction[{action}]", _each(make), preflight.audit_transaction)
+        for action, make in INTENTS.items()
+    ]
+    suite += [
+        Case("preflight", "audit_transaction[mixed]", _each(_mixed_intent), preflight.audit_transaction),
+        Case("preflight", f"audit_batch[{BATCH_SIZE}]",
+             _each(lambda rng: [_mixed_intent(rng) for _ in range(BATCH_SIZE)]), preflight.audit_batch),
+        Case("middleware", "process_ai_payroll_request", _each(_middleware_payload),
+             middleware.process_ai_payroll_request),
+    ]
+
+    converters = [
+        (TDSGuard, lambda rng: tds.calculate_deduction(*_tds_args(rng))),
+        (RemittanceGuard, lambda rng: lrs.verify_lrs_limit(*_lrs_args(rng))),
+        (PoEMGuard, lambda rng: poem.determine_residency(**_poem_kwargs(rng))),
+        (InputCreditGuard, lambda rng: itc.verify_itc_eligibility(*_itc_args(rng))),
+        (CapitalGainsGuard, lambda rng: cg.verify_tax_rate(*_cg_args(rng))),
+        (ClassificationGuard, lambda rng: classifier.verify_classification_claim(*_classification_args(rng))),
+        (SpeculationGuard, lambda rng: speculation.verify_setoff(*_speculation_args(rng))),
+        (ValuationGuard, lambda rng: valuation.verify_conversion(*_valuation_args(rng))),
+        (InterHeadAdjustmentGuard, lambda rng: setoff.verify_setoff(*_setoff_args(rng))),
+        (CryptoTaxGuard, lambda rng: _crypto_result(crypto, rng)),
+        (WithholdingGuard, lambda rng: withholding.verify_exempt_status(_w4_form(rng))),
+        (GSTGuard, lambda rng: gst.verify_rcm_applicability(*_rcm_args(rng))),
+    ]
+    suite += [
+        Case("to_diagnostic", guard.__name__, _each(produce), guard.to_diagnostic)
+        for guard, produce in converters
+    ]
+
+    suite += [
+        Case("proof_ref", "compute_proof_ref[flat]",
+             _each(lambda rng: {"rule_id": "TDS_194J", "amount": _amount(rng, 1, 10**6),
+                                "rate": "0.10", "verified": rng.random() < 0.8}),
+             compute_proof_ref),
+        Case("proof_ref", "compute_proof_ref[invoice-5]", _each(lambda rng: _evidence(rng, 5)), compute_proof_ref),
+        Case("proof_ref", "compute_proof_ref[invoice-100]", _each(lambda rng: _evidence(rng, 100)), compute_proof_ref),
+    ]
+
+    # Guards with no preflight action of their own.
+    suite += [
+        Case("guard", "GSTGuard.verify_gst_split", _each_args(lambda rng: (
+            rng.choice(["MH", "KA", "DL"]), rng.choice(["MH", "KA", "TN"]), _amount(rng, 100, 10**6),
+            rng.choice(["5", "12", "18", "28"]), _amount(rng, 0, 9e4), _amount(rng, 0, 9e4), _amount(rng, 0, 1.8e5),
+        )), gst.verify_gst_split),
+        Case("guard", "DTAAGuard.verify_foreign_tax_credit", _each_args(lambda rng: (
+            _amount(rng, 1_000, 10**6), _amount(rng, 0, 2e5), rng.choice(["0.30", "0.25", "0.15"]),
+            rng.choice([None, "0.10", "0.15"]),
+        )), dtaa.verify_foreign_tax_credit),
+        Case("guard", "TransferPricingGuard.verify_arms_length_price", _each_args(lambda rng: (
+            _amount(rng, 90, 110), "100", rng.choice(["CUP", "TNMM", "RPM"]),
+        )), transfer_pricing.verify_arms_length_price),
+        Case("guard", "PayrollGuard.verify_gross_to_net",
+             lambda rng, n: [(PayrollEntry.model_validate(_payroll_entry(rng, i)),) for i in range(n)],
+             payroll.verify_gross_to_net),
+    ]
+    return suite
+
+
+if __name__ == "__main__":
+    sys.exit(main(cases(), __doc__.splitlines()[1]))
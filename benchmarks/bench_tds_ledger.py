@@ -0,0 +1,105 @@
+"""
+TDSLedger throughput: a financial year of AP invoices across N vendors.
+
+Ingests the year in daily chunks through TDSLedger.ingest() (O(1) per
+invoice, with a snapshot at each month end), then times record() per invoice.
+It compares both with the stateless pattern for a sample of vendors over the
+whole year: summing the vendor's earlier invoices before each
+TDSGuard.calculate_deduction() call. Reports the extrapolated time for 10M
+invoices and the snapshot size.
+
+    python benchmarks/bench_tds_ledger.py [--invoices N] [--vendors N] [--sample N]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.guards.tds_ledger import TDSLedger
+
+SERVICE_TYPES = ["PROFESSIONAL_FEES", "CONTRACTOR_INDIVIDUAL", "CONTRACTOR_FIRM", "COMMISSION", "RENT_LAND"]
+
+
+def build_days(invoices, vendors, seed=7):
+    rng = random.Random(seed)
+    services = [rng.choice(SERVICE_TYPES) for _ in range(vendors)]
+    per_day = invoices // 365
+    days = []
+    for offset in range(365):
+        day = (date(2024, 4, 1) + timedelta(days=offset)).isoformat()
+        chunk = []
+        for _ in range(per_day):
+            v = rng.randrange(vendors)
+            chunk.append((f"V{v:06d}", services[v], f"{rng.randint(100, 2_000_000) / 100:.2f}", day))
+        days.append(chunk)
+    return days
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--invoices", type=int, default=1_000_000)
+    parser.add_argument("--vendors", type=int, default=50_000)
+    parser.add_argument("--sample", type=int, default=1_000, help="vendors in the re-aggregation baseline")
+    args = parser.parse_args()
+
+    days = build_days(args.invoices, args.vendors)
+    count = sum(len(chunk) for chunk in days)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tds.snap")
+        ledger = TDSLedger()
+        crossings = snapshots = 0
+        snapshot_s = 0.0
+        start = time.perf_counter()
+        for chunk in days:
+            crossings += len(ledger.ingest(chunk))
+            if (date.fromisoformat(chunk[0][3]) + timedelta(days=1)).day == 1:
+                started = time.perf_counter()
+                ledger.snapshot(path)
+                snapshot_s += time.perf_counter() - started
+                snapshots += 1
+        ingest_s = time.perf_counter() - start - snapshot_s
+        ledger.snapshot(path)
+        size = os.path.getsize(path)
+        start = time.perf_counter()
+        restored = TDSLedger.restore(path)
+        restore_s = time.perf_counter() - start
+        assert len(restored) == len(ledger)
+
+    invoices = [invoice for chunk in days for invoice in chunk]
+    ledger = TDSLedger()
+    start = time.perf_counter()
+    for invoice in invoices:
+        ledger.record(*invoice)
+    record_s = time.perf_counter() - start
+
+    guard = TDSGuard()
+    history = {}
+    sampled = {f"V{v:06d}" for v in range(args.sample)}
+    sample = [invoice for invoice in invoices if invoice[0] in sampled]
+    start = time.perf_counter()
+    for vendor, service_type, amount, day in sample:
+        paid = history.setdefault((vendor, service_type), [])
+        guard.calculate_deduction(service_type, amount, sum(paid, Decimal(0)), as_of=day)
+        paid.append(Decimal(amount))
+    baseline_s = time.perf_counter() - start
+
+    rows = [
+        ("ledger ingest (daily chunks)", ingest_s, count),
+        ("ledger record", record_s, count),
+        (f"re-aggregate + guard ({args.sample} vendors)", baseline_s, len(sample)),
+    ]
+    print(f"{count} invoices, {len(ledger)} vendor aggregates, {crossings} threshold crossings")
+    print(f"{'case':34s} {'us/invoice':>10s} {'10M invoices':>13s}")
+    for name, seconds, n in rows:
+        print(f"{name:34s} {seconds / n * 1e6:10.2f} {seconds / n * 1e7 / 60:10.1f} min")
+    print(f"{snapshots} snapshots {snapshot_s * 1e3:8.1f} ms  (last {size / 1e6:.1f} MB), restore {restore_s * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+TaxPreFlight.audit_transaction with and without a VerdictCache.
+
+Replays a retry-heavy stream: each intent is a repeat of one of the last
+--window intents with probability --repeat-rate, otherwise a fresh generated
+one (a new dict either way, as an agent would send). Prints per-intent cost
+uncached, cached, and the cache's hit rate.
+
+    python benchmarks/bench_verdict_cache.py [--intents N] [--repeat-rate P]
+"""
+
+import argparse
+import random
+import timeit
+
+from bench_suite import _mixed_intent
+
+from qwed_tax.cache import VerdictCache
+from qwed_tax.verifier import TaxPreFlight
+
+
+def _stream(rng, count, repeat_rate, window):
+    intents = []
+    for _ in range(count):
+        if intents and rng.random() < repeat_rate:
+            intents.append(dict(rng.choice(intents[-window:])))
+        else:
+            intents.append(_mixed_intent(rng))
+    return intents
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--intents", type=int, default=5000)
+    parser.add_argument("--repeat-rate", type=float, default=0.8)
+    parser.add_argument("--window", type=int, default=50)
+    parser.add_argument("--maxsize", type=int, default=1024)
+    args = parser.parse_args()
+
+    intents = _stream(random.Random(0), args.intents, args.repeat_rate, args.window)
+    uncached = TaxPreFlight()
+    cache = VerdictCache(maxsize=args.maxsize)
+    cached = TaxPreFlight(verdict_cache=cache)
+
+    def per_intent(preflight, fresh_cache):
+        def run():
+            if fresh_cache:
+                cache.invalidate()
+            for intent in intents:
+                preflight.audit_transaction(intent)
+
+        run()
+        return min(timeit.repeat(run, number=1, repeat=5)) / len(intents) * 1e6
+
+    plain = per_intent(uncached, False)
+    cache.reset_stats()
+    cold = per_intent(cached, True)
+    stats = cache.stats()
+
+    print(f"{'preflight':24s} {'us/intent':>10s} {'vs uncached':>12s}")
+    for name, micros in (("uncached", plain), ("VerdictCache", cold)):
+        print(f"{name:24s} {micros:10.2f} {micros / plain - 1:+12.1%}")
+    print(f"\nhit rate {stats.hit_rate:.1%} ({stats.hits} hits, {stats.misses} misses, "
+          f"{stats.evictions} evictions, size {stats.size}/{stats.maxsize})")
+
+
+if __name__ == "__main__":
+    main()
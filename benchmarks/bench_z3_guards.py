@@ -0,0 +1,83 @@
+"""
+Calls per second for the Z3-backed guards.
+
+Cycles each guard through its representative inputs (valid and violating):
+WithholdingGuard.verify_exempt_status, ABCClassificationGuard.
+verify_classification and InvestmentGuard.verify_classification. With
+--threads N the same workload also runs on an N-thread pool.
+
+    python benchmarks/bench_z3_guards.py [--seconds S] [--threads N]
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from qwed_tax.jurisdictions.india.guards.investment_guard import InvestmentGuard, TransactionType
+from qwed_tax.jurisdictions.us.classification_guard import ABCClassificationGuard
+from qwed_tax.jurisdictions.us.withholding_guard import W4Form, WithholdingGuard
+from qwed_tax.models import State, WorkerClassificationParams
+
+W4_FORMS = [
+    W4Form(employee_id="E1", claim_exempt=True, tax_liability_last_year=Decimal("0"), expect_refund_this_year=True),
+    W4Form(employee_id="E2", claim_exempt=True, tax_liability_last_year=Decimal("500"), expect_refund_this_year=True),
+    W4Form(employee_id="E3", claim_exempt=False, tax_liability_last_year=Decimal("500"), expect_refund_this_year=False),
+]
+ABC_CASES = [
+    (WorkerClassificationParams(worker_id="W1", freedom_from_control=True, work_outside_usual_business=True,
+                                customarily_engaged_independently=True, state=State.CA), True),
+    (WorkerClassificationParams(worker_id="W2", freedom_from_control=False, work_outside_usual_business=True,
+                                customarily_engaged_independently=True, state=State.CA), True),
+    (WorkerClassificationParams(worker_id="W3", freedom_from_control=False, work_outside_usual_business=False,
+                                customarily_engaged_independently=False, state=State.NJ), False),
+]
+INVESTMENT_CASES = [
+    (TransactionType.INTRADAY, 0),
+    (TransactionType.DELIVERY, 400),
+    (TransactionType.F_O, 30),
+]
+
+
+def workloads():
+    w4, abc, inv = WithholdingGuard(), ABCClassificationGuard(), InvestmentGuard()
+    return {
+        "W-4 exempt status": lambda i: w4.verify_exempt_status(W4_FORMS[i % 3]),
+        "ABC classification": lambda i: abc.verify_classification(*ABC_CASES[i % 3]),
+        "Investment head": lambda i: inv.verify_classification(*INVESTMENT_CASES[i % 3]),
+    }
+
+
+def rate(fn, seconds):
+    calls = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for i in range(30):
+            fn(i)
+        calls += 30
+    return calls / (time.perf_counter() - start)
+
+
+def threaded_rate(fn, seconds, threads):
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return sum(pool.map(lambda _: rate(fn, seconds), range(threads)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--threads", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'guard':<22} {'calls/s':>10}" + (f" {f'{args.threads} threads':>12}" if args.threads else ""))
+    for name, fn in workloads().items():
+        fn(0)  # warm up (first call per thread builds the rule set)
+        line = f"{name:<22} {rate(fn, args.seconds):>10.0f}"
+        if args.threads:
+            line += f" {threaded_rate(fn, args.seconds, args.threads):>12.0f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
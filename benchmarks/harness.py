@@ -0,0 +1,257 @@
+"""
+Shared runner for the benchmark suite (see bench_suite.py).
+
+A Case pairs a workload generator with the call under test. The generator is
+make(rng, n) -> n argument tuples; every call gets its own tuple, so results
+that cache on their inputs (proof_ref on audit traces) are never re-measured
+warm. Each case is reported with:
+
+    p50/p90/p99  per-call latency in microseconds (timer overhead included),
+                 from the timed pass with the lowest median out of --repeat
+    ops/s        calls per second over an untimed pass (best of --repeat)
+    peak KiB     tracemalloc peak while the pass runs, inputs excluded
+
+Baselines are JSON files in benchmarks/.baselines/ (git-ignored): --save NAME
+writes one, --compare NAME diffs against one and exits 1 when any case's p50
+regressed by more than --threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+BASELINE_DIR = Path(__file__).resolve().parent / ".baselines"
+WARMUP_CALLS = 50
+
+
+class Case(NamedTuple):
+    group: str
+    name: str
+    make: Callable[[random.Random, int], List[tuple]]
+    call: Callable[..., Any]
+
+    @property
+    def key(self) -> str:
+        return f"{self.group}/{self.name}"
+
+
+def _inputs(case: Case, count: int, seed: int) -> List[tuple]:
+    inputs = case.make(random.Random(f"{seed}:{case.key}"), count)
+    if len(inputs) != count:
+        raise ValueError(f"{case.key}: make() returned {len(inputs)} inputs, expected {count}")
+    return inputs
+
+
+def _percentile(ordered: Sequence[int], fraction: float) -> float:
+    """Nearest-rank percentile of sorted nanosecond samples, in microseconds."""
+    index = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered))) - 1))
+    return ordered[index] / 1000
+
+
+def _timed_pass(call: Callable[..., Any], inputs: List[tuple]) -> List[int]:
+    clock = time.perf_counter_ns
+    samples = []
+    append = samples.append
+    for args in inputs:
+        start = clock()
+        call(*args)
+        append(clock() - start)
+    samples.sort()
+    return samples
+
+
+def _throughput_pass(call: Callable[..., Any], inputs: List[tuple]) -> float:
+    start = time.perf_counter()
+    for args in inputs:
+        call(*args)
+    return len(inputs) / (time.perf_counter() - start)
+
+
+def _memory_pass(call: Callable[..., Any], inputs: List[tuple]) -> float:
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        for args in inputs:
+            call(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return (peak - base) / 1024
+
+
+def measure(case: Case, calls: int, repeat: int, seed: int) -> Dict[str, float]:
+    """Latency percentiles, throughput and peak memory for one case."""
+    for args in _inputs(case, min(WARMUP_CALLS, calls), seed + 1):
+        case.call(*args)
+
+    best: Optional[List[int]] = None
+    ops = 0.0
+    for _ in range(repeat):
+        inputs = _inputs(case, calls, seed)
+        gc.collect()
+        samples = _timed_pass(case.call, inputs)
+        if best is None or samples[len(samples) // 2] < best[len(best) // 2]:
+            best = samples
+        inputs = _inputs(case, calls, seed)
+        gc.collect()
+        ops = max(ops, _throughput_pass(case.call, inputs))
+
+    inputs = _inputs(case, calls, seed)
+    gc.collect()
+    peak = _memory_pass(case.call, inputs)
+    return {
+        "p50_us": _percentile(best, 0.50),
+        "p90_us": _percentile(best, 0.90),
+        "p99_us": _percentile(best, 0.99),
+        "ops_per_s": ops,
+        "peak_kib": peak,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASELINE_DIR.parent, capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment(args: argparse.Namespace) -> Dict[str, Any]:
+    """Where and how a run was taken, stored next to its results."""
+    from qwed_tax import __version__
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "qwed_tax": __version__,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "calls": args.calls,
+        "repeat": args.repeat,
+        "seed": args.seed,
+    }
+
+
+def baseline_path(name: str, directory: Path = BASELINE_DIR) -> Path:
+    if not name or "/" in name or "\\" in name or name.startswith("."):
+        raise ValueError(f"Invalid baseline name {name!r}")
+    return directory / f"{name}.json"
+
+
+def save_baseline(path: Path, meta: Dict[str, Any], results: Dict[str, Dict[str, float]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"meta": meta, "results": results}, indent=2, sort_keys=True) + "\n")
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    data = json.loads(path.read_text())
+    if not isinstance(data, dict) or not isinstance(data.get("results"), dict):
+        raise ValueError(f"{path} is not a benchmark baseline")
+    return data
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[tuple]:
+    """
+    (case, old p50, new p50, change, verdict) rows. The verdict is "slower"
+    or "faster" past the threshold, "new"/"gone" for unmatched cases, else "".
+    """
+    rows = []
+    for key, stats in results.items():
+        old = baseline.get(key)
+        if old is None:
+            rows.append((key, None, stats["p50_us"], None, "new"))
+            continue
+        change = stats["p50_us"] / old["p50_us"] - 1 if old["p50_us"] else 0.0
+        verdict = "slower" if change > threshold else "faster" if change < -threshold else ""
+        rows.append((key, old["p50_us"], stats["p50_us"], change, verdict))
+    rows.extend((key, old["p50_us"], None, None, "gone") for key, old in baseline.items() if key not in results)
+    return rows
+
+
+def _print_comparison(rows: List[tuple], meta: Dict[str, Any]) -> None:
+    print(f"\nvs baseline taken {meta.get('created')} at {meta.get('commit')} (python {meta.get('python')})")
+    print(f"{'case':54s} {'old p50':>9s} {'new p50':>9s} {'change':>8s}")
+    for key, old, new, change, verdict in rows:
+        old_s = f"{old:9.2f}" if old is not None else f"{'-':>9s}"
+        new_s = f"{new:9.2f}" if new is not None else f"{'-':>9s}"
+        change_s = f"{change:+8.1%}" if change is not None else f"{'':8s}"
+        print(f"{key:54s} {old_s} {new_s} {change_s}  {verdict}")
+
+
+def main(cases: Sequence[Case], description: str, argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--calls", type=int, default=2000, help="calls per timed pass")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0, help="workload generator seed")
+    parser.add_argument("-k", dest="select", action="append", default=[],
+                        help="only cases whose group/name contains this (repeatable)")
+    parser.add_argument("--list", action="store_true", help="list cases and exit")
+    parser.add_argument("--save", metavar="NAME", help="save results as baseline NAME")
+    parser.add_argument("--compare", metavar="NAME", help="compare against baseline NAME")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="p50 change counted as a regression (default 0.10 = 10%%)")
+    parser.add_argument("--baseline-dir", type=Path, default=BASELINE_DIR)
+    args = parser.parse_args(argv)
+
+    selected = [c for c in cases if not args.select or any(s in c.key for s in args.select)]
+    if args.list:
+        for case in selected:
+            print(case.key)
+        return 0
+    if not selected:
+        parser.error("no cases match -k")
+    if args.calls < 1 or args.repeat < 1:
+        parser.error("--calls and --repeat must be positive")
+
+    baseline = None
+    if args.compare:
+        path = baseline_path(args.compare, args.baseline_dir)
+        if not path.exists():
+            parser.error(f"no baseline {args.compare!r} in {args.baseline_dir} (create one with --save)")
+        baseline = load_baseline(path)
+
+    results: Dict[str, Dict[str, float]] = {}
+    print(f"{'case':54s} {'p50 us':>9s} {'p90 us':>9s} {'p99 us':>9s} {'ops/s':>10s} {'peak KiB':>9s}")
+    for case in selected:
+        stats = results[case.key] = measure(case, args.calls, args.repeat, args.seed)
+        print(
+            f"{case.key:54s} {stats['p50_us']:9.2f} {stats['p90_us']:9.2f} {stats['p99_us']:9.2f} "
+            f"{stats['ops_per_s']:10.0f} {stats['peak_kib']:9.1f}",
+            flush=True,
+        )
+
+    meta = environment(args)
+    if args.save:
+        path = baseline_path(args.save, args.baseline_dir)
+        save_baseline(path, meta, results)
+        print(f"\nsaved baseline {args.save!r} to {path}")
+
+    if baseline is not None:
+        old = baseline["results"]
+        if args.select:
+            old = {key: stats for key, stats in old.items() if key in results}
+        rows = compare(results, old, args.threshold)
+        _print_comparison(rows, baseline.get("meta", {}))
+        if any(row[4] == "slower" for row in rows):
+            print(f"\nregression: p50 slower than baseline by more than {args.threshold:.0%}", file=sys.stderr)
+            return 1
+    return 0
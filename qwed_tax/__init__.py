@@ -1,62 +1,165 @@
 __version__ = "0.2.0"
 
-from .models import (
-    PayrollEntry,
-    TaxEntry,
-    DeductionEntry,
-    DeductionType,
-    Currency,
-    State,
-    Address,
-    WorkArrangement,
-    ContractorPayment,
-    PaymentType,
-    WorkerClassificationParams,
-    VerificationResult,
-)
+import importlib
+from typing import TYPE_CHECKING
 
-# Diagnostics (v0.2.0)
-from .diagnostics import (
-    TaxDiagnosticResult,
-    TaxDiagnosticStatus,
-    TaxAdvisoryCheck,
-    compute_proof_ref,
-)
+# Public name -> defining module. Nothing below is imported by `import
+# qwed_tax` itself: each name is resolved on first attribute access (PEP 562
+# __getattr__), so a process that only needs one guard does not pay for
+# pydantic models, every other guard, or the middleware.
+_LAZY_EXPORTS = {
+    "PayrollEntry": ".models",
+    "TaxEntry": ".models",
+    "DeductionEntry": ".models",
+    "DeductionType": ".models",
+    "Currency": ".models",
+    "State": ".models",
+    "Address": ".models",
+    "WorkArrangement": ".models",
+    "ContractorPayment": ".models",
+    "PaymentType": ".models",
+    "WorkerClassificationParams": ".models",
+    "VerificationResult": ".models",
+    "PayrollOffender": ".models",
+    "PayrollRunSummary": ".models",
+    # Diagnostics (v0.2.0)
+    "TaxDiagnosticResult": ".diagnostics",
+    "TaxDiagnosticStatus": ".diagnostics",
+    "TaxAdvisoryCheck": ".diagnostics",
+    "compute_proof_ref": ".diagnostics",
+    "verify_proof_ref": ".diagnostics",
+    "ProofHasher": ".proof",
+    "merkle_batch": ".diagnostics",
+    "InclusionProof": ".merkle",
+    # Instrumentation
+    "HistogramCollector": ".instrumentation",
+    "OpenTelemetryHook": ".instrumentation",
+    "instrumented": ".instrumentation",
+    # Verdict cache, rule tables and money kernel
+    "VerdictCache": ".cache",
+    "RuleRegistry": ".rules",
+    "Money": ".money",
+    # Main entry points
+    "TaxPreFlight": ".verifier",
+    "TaxVerifier": ".verifier",
+    # US Guards
+    "PayrollGuard": ".jurisdictions.us.payroll_guard",
+    "FicaLedger": ".jurisdictions.us.fica_ledger",
+    "WithholdingGuard": ".jurisdictions.us.withholding_guard",
+    "W4Form": ".jurisdictions.us.withholding_guard",
+    "ReciprocityGuard": ".jurisdictions.us.reciprocity_guard",
+    "Form1099Guard": ".jurisdictions.us.form1099_guard",
+    "ABCClassificationGuard": ".jurisdictions.us.classification_guard",
+    "ClassificationGuard": ".guards.classification_guard",
+    # India Guards
+    "CryptoTaxGuard": ".jurisdictions.india.guards.crypto_guard",
+    "InvestmentGuard": ".jurisdictions.india.guards.investment_guard",
+    "GSTGuard": ".jurisdictions.india.guards.gst_guard",
+    "DepositRateGuard": ".jurisdictions.india.guards.deposit_guard",
+    "InterHeadAdjustmentGuard": ".jurisdictions.india.guards.setoff_guard",
+    "TaxHead": ".jurisdictions.india.guards.setoff_guard",
+    # Domain Guards
+    "TDSGuard": ".guards.tds_guard",
+    "TDSLedger": ".guards.tds_ledger",
+    "InputCreditGuard": ".guards.indirect_tax_guard",
+    "RemittanceGuard": ".guards.remittance_guard",
+    "NexusGuard": ".guards.nexus_guard",
+    "CapitalGainsGuard": ".guards.capital_gains_guard",
+    "SpeculationGuard": ".guards.speculation_guard",
+    "RelatedPartyGuard": ".guards.related_party_guard",
+    "ValuationGuard": ".guards.valuation_guard",
+    "DTAAGuard": ".guards.dtaa_guard",
+    "TransferPricingGuard": ".guards.transfer_pricing_guard",
+    "PoEMGuard": ".guards.poem_guard",
+    "AddressGuard": ".address_guard",
+    # Middleware
+    "QWEDTaxMiddleware": ".middleware.gusto_interceptor",
+    "AsyncQWEDTaxMiddleware": ".middleware.async_interceptor",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
 
-# Main entry points
-from .verifier import TaxPreFlight, TaxVerifier
 
-# US Guards
-from .jurisdictions.us.payroll_guard import PayrollGuard
-from .jurisdictions.us.withholding_guard import WithholdingGuard, W4Form
-from .jurisdictions.us.reciprocity_guard import ReciprocityGuard
-from .jurisdictions.us.form1099_guard import Form1099Guard
-from .jurisdictions.us.classification_guard import ABCClassificationGuard
-from .guards.classification_guard import ClassificationGuard
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# India Guards
-from .jurisdictions.india.guards.crypto_guard import CryptoTaxGuard
-from .jurisdictions.india.guards.investment_guard import InvestmentGuard
-from .jurisdictions.india.guards.gst_guard import GSTGuard
-from .jurisdictions.india.guards.deposit_guard import DepositRateGuard
-from .jurisdictions.india.guards.setoff_guard import InterHeadAdjustmentGuard, TaxHead
 
-# Domain Guards
-from .guards.tds_guard import TDSGuard
-from .guards.indirect_tax_guard import InputCreditGuard
-from .guards.remittance_guard import RemittanceGuard
-from .guards.nexus_guard import NexusGuard
-from .guards.capital_gains_guard import CapitalGainsGuard
-from .guards.speculation_guard import SpeculationGuard
-from .guards.related_party_guard import RelatedPartyGuard
-from .guards.valuation_guard import ValuationGuard
-from .guards.dtaa_guard import DTAAGuard
-from .guards.transfer_pricing_guard import TransferPricingGuard
-from .guards.poem_guard import PoEMGuard
-from .address_guard import AddressGuard
+if TYPE_CHECKING:  # static analysers and IDEs see the eager imports
 
-# Middleware
-from .middleware.gusto_interceptor import QWEDTaxMiddleware
+    from .models import (
+        PayrollEntry,
+        TaxEntry,
+        DeductionEntry,
+        DeductionType,
+        Currency,
+        State,
+        Address,
+        WorkArrangement,
+        ContractorPayment,
+        PaymentType,
+        WorkerClassificationParams,
+        VerificationResult,
+        PayrollOffender,
+        PayrollRunSummary,
+    )
+    from .diagnostics import (
+        TaxDiagnosticResult,
+        TaxDiagnosticStatus,
+        TaxAdvisoryCheck,
+        compute_proof_ref,
+        verify_proof_ref,
+        merkle_batch,
+    )
+    from .proof import ProofHasher
+    from .merkle import InclusionProof
+    from .instrumentation import HistogramCollector, OpenTelemetryHook, instrumented
+    from .cache import VerdictCache
+    from .rules import RuleRegistry
+    from .money import Money
+    from .verifier import (
+        TaxPreFlight,
+        TaxVerifier,
+    )
+    from .jurisdictions.us.payroll_guard import PayrollGuard
+    from .jurisdictions.us.fica_ledger import FicaLedger
+    from .jurisdictions.us.withholding_guard import (
+        WithholdingGuard,
+        W4Form,
+    )
+    from .jurisdictions.us.reciprocity_guard import ReciprocityGuard
+    from .jurisdictions.us.form1099_guard import Form1099Guard
+    from .jurisdictions.us.classification_guard import ABCClassificationGuard
+    from .guards.classification_guard import ClassificationGuard
+    from .jurisdictions.india.guards.crypto_guard import CryptoTaxGuard
+    from .jurisdictions.india.guards.investment_guard import InvestmentGuard
+    from .jurisdictions.india.guards.gst_guard import GSTGuard
+    from .jurisdictions.india.guards.deposit_guard import DepositRateGuard
+    from .jurisdictions.india.guards.setoff_guard import (
+        InterHeadAdjustmentGuard,
+        TaxHead,
+    )
+    from .guards.tds_guard import TDSGuard
+    from .guards.tds_ledger import TDSLedger
+    from .guards.indirect_tax_guard import InputCreditGuard
+    from .guards.remittance_guard import RemittanceGuard
+    from .guards.nexus_guard import NexusGuard
+    from .guards.capital_gains_guard import CapitalGainsGuard
+    from .guards.speculation_guard import SpeculationGuard
+    from .guards.related_party_guard import RelatedPartyGuard
+    from .guards.valuation_guard import ValuationGuard
+    from .guards.dtaa_guard import DTAAGuard
+    from .guards.transfer_pricing_guard import TransferPricingGuard
+    from .guards.poem_guard import PoEMGuard
+    from .address_guard import AddressGuard
+    from .middleware.gusto_interceptor import QWEDTaxMiddleware
+    from .middleware.async_interceptor import AsyncQWEDTaxMiddleware
 
 __all__ = [  # noqa: RUF022
     "__version__",
@@ -73,16 +176,31 @@ __all__ = [  # noqa: RUF022
     "PaymentType",
     "WorkerClassificationParams",
     "VerificationResult",
+    "PayrollOffender",
+    "PayrollRunSummary",
     # Diagnostics
     "TaxDiagnosticResult",
     "TaxDiagnosticStatus",
     "TaxAdvisoryCheck",
     "compute_proof_ref",
+    "verify_proof_ref",
+    "ProofHasher",
+    "merkle_batch",
+    "InclusionProof",
+    # Instrumentation
+    "HistogramCollector",
+    "OpenTelemetryHook",
+    "instrumented",
+    # Verdict cache, rule tables and money kernel
+    "VerdictCache",
+    "RuleRegistry",
+    "Money",
     # Entry points
     "TaxPreFlight",
     "TaxVerifier",
     # US
     "PayrollGuard",
+    "FicaLedger",
     "WithholdingGuard",
     "W4Form",
     "ReciprocityGuard",
@@ -98,6 +216,7 @@ __all__ = [  # noqa: RUF022
     "TaxHead",
     # Domain
     "TDSGuard",
+    "TDSLedger",
     "InputCreditGuard",
     "RemittanceGuard",
     "NexusGuard",
@@ -111,4 +230,5 @@ __all__ = [  # noqa: RUF022
     "AddressGuard",
     # Middleware
     "QWEDTaxMiddleware",
+    "AsyncQWEDTaxMiddleware",
 ]
@@ -1,4 +1,17 @@
+from types import MappingProxyType
+
 from .models import Address, State
+from .results import AddressResult
+
+# Simplified Zip Table
+_VALID_PREFIXES = MappingProxyType({
+    State.NY: ("10", "11", "12", "13", "14"),
+    State.NJ: ("07", "08"),
+    State.PA: ("15", "16", "17", "18", "19"),
+    State.CA: ("90", "91", "92", "93", "94", "95", "96"),
+    State.TX: ("75", "76", "77", "78", "79"),
+    State.FL: ("32", "33", "34"),
+})
 
 class AddressGuard:
     """
@@ -6,30 +19,23 @@ class AddressGuard:
     (Stub implementation - in production would call USPS API or similar)
     """
     
-    def verify_address(self, address: Address):
+    def verify_address(self, address: Address, compact: bool = False):
         """
         Checks if Zip Code matches State (Simplified heuristic).
+        With compact=True the result is an AddressResult instead of a dict.
         """
+        result = AddressResult if compact else dict
         zip_prefix = address.zip_code[:2]
         state = address.state
-        
-        # Simplified Zip Table
-        valid_prefixes = {
-            State.NY: ["10", "11", "12", "13", "14"],
-            State.NJ: ["07", "08"],
-            State.PA: ["15", "16", "17", "18", "19"],
-            State.CA: ["90", "91", "92", "93", "94", "95", "96"],
-            State.TX: ["75", "76", "77", "78", "79"],
-            State.FL: ["32", "33", "34"]
-        }
+        valid_prefixes = _VALID_PREFIXES
         
         if state not in valid_prefixes:
-            return {"verified": False, "message": f"State {state.value} not in validation database. Address cannot be auto-verified — manual review required."}
+            return result(verified=False, message=f"State {state.value} not in validation database. Address cannot be auto-verified — manual review required.")
             
         if zip_prefix in valid_prefixes[state]:
-            return {"verified": True, "message": "✅ Zip code matches State."}
+            return result(verified=True, message="✅ Zip code matches State.")
         else:
-            return {
-                "verified": False, 
-                "message": f"❌ MISMATCH: Zip {address.zip_code} does not belong to {state.value}."
-            }
+            return result(
+                verified=False, 
+                message=f"❌ MISMATCH: Zip {address.zip_code} does not belong to {state.value}."
+            )
@@ -9,6 +9,10 @@ This module provides a small, shared, additive structure that guards can attach
 to their results under the ``audit_trace`` key. Existing keys are never changed,
 so callers that ignore ``audit_trace`` keep working unchanged.
 
+Traces are immutable (AuditTrace, a read-only dict): they can be shared and
+hashed for proof_ref without defensive copies, and still compare, index and
+JSON-serialize exactly like the plain dicts they replace.
+
 Rule identifiers and statute strings live here as constants so that multiple
 guards (and future ones) reference the same canonical values instead of
 duplicating inline literals.
@@ -16,11 +20,13 @@ duplicating inline literals.
 
 from __future__ import annotations
 
-import copy
-import hashlib
-import json
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from decimal import Decimal
+from typing import Any, Dict, Mapping, NoReturn, Optional
+
+from . import instrumentation
+from .proof import proof_ref
 
 JURISDICTION_INDIA = "INDIA"
 JURISDICTION_US = "US"
@@ -78,6 +84,13 @@ CG_EQUITY_LTCG_112A = RuleRef(
 CG_EQUITY_STCG_111A = RuleRef(
     "CG_EQUITY_STCG_111A", "Income Tax Act, Section 111A (Equity STCG 20%)"
 )
+# Transfers before 2024-07-23 (Finance (No. 2) Act 2024 changed both rates).
+CG_EQUITY_LTCG_112A_PRE_2024 = RuleRef(
+    "CG_EQUITY_LTCG_112A_PRE_2024", "Income Tax Act, Section 112A (Equity LTCG 10%, transfers before 2024-07-23)"
+)
+CG_EQUITY_STCG_111A_PRE_2024 = RuleRef(
+    "CG_EQUITY_STCG_111A_PRE_2024", "Income Tax Act, Section 111A (Equity STCG 15%, transfers before 2024-07-23)"
+)
 CG_DEBT_FUND_50AA = RuleRef(
     "CG_DEBT_FUND_50AA", "Income Tax Act, Section 50AA (Debt Funds STCG)"
 )
@@ -151,11 +164,110 @@ SAFE_CONVERSION = RuleRef(
 )
 
 
+# Values stored as-is: immutable, and all build_trace() inputs usually are.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None), Decimal})
+
+
+def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(f"{type(self).__name__} is read-only")
+
+
+class FrozenDict(dict):
+    """
+    A read-only dict. Being a dict subclass, it compares equal to plain dicts
+    and serializes with json.dumps unchanged; copying returns the same object.
+
+    Build from arbitrary data with freeze(). The constructor itself is the
+    plain dict one and expects values that are already immutable.
+    """
+
+    __slots__ = ("_proof_ref",)
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenDict":
+        return self
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """A mutable deep copy made of plain dicts and lists."""
+        return _thaw(self)
+
+    def proof_ref(self) -> str:
+        """proof.proof_ref() of this mapping, computed once: it cannot change."""
+        try:
+            return self._proof_ref
+        except AttributeError:
+            ref = self._proof_ref = proof_ref(self)
+            return ref
+
+
+class FrozenList(list):
+    """A read-only list; see FrozenDict."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenList":
+        return self
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+
+class AuditTrace(FrozenDict):
+    """A build_trace() result: rule_id, statute, jurisdiction, outcome, inputs."""
+
+    __slots__ = ()
+
+
+_FROZEN_TYPES = _SCALAR_TYPES | {FrozenDict, FrozenList, AuditTrace}
+_NO_INPUTS = FrozenDict()
+
+
+def freeze(value: Any) -> Any:
+    """
+    value with every dict, list, tuple and set inside replaced by a read-only
+    equivalent (FrozenDict, FrozenList, tuple, frozenset). Containers are
+    copied once; scalars and already-frozen values are reused as-is.
+    """
+    if type(value) in _FROZEN_TYPES:
+        return value
+    if isinstance(value, Mapping):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList([freeze(item) for item in value])
+    if isinstance(value, tuple):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, FrozenDict):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, FrozenList):
+        return [_thaw(item) for item in value]
+    return value
+
+
 def build_trace(
     rule: RuleRef,
     outcome: str,
     inputs: Optional[Dict[str, Any]] = None,
-) -> Dict[str, Any]:
+) -> AuditTrace:
     """
     Build a structured audit-trace entry for a guard verdict.
 
@@ -164,18 +276,34 @@ def build_trace(
         outcome: short machine-readable outcome, e.g. "BLOCKED", "ALLOWED",
             "DEDUCTION_REQUIRED".
         inputs: the decision-relevant inputs (already normalised), so the
-            verdict can be reproduced/audited.
+            verdict can be reproduced/audited. They are snapshotted: flat
+            scalar inputs with one dict copy, nested containers via freeze().
 
     Returns:
-        A plain dict suitable for embedding under a result's ``audit_trace`` key.
+        A read-only dict suitable for embedding under a result's
+        ``audit_trace`` key; ``to_dict()`` gives a plain mutable copy.
     """
-    return {
-        "rule_id": rule.rule_id,
-        "statute": rule.statute,
-        "jurisdiction": rule.jurisdiction,
-        "outcome": outcome,
-        "inputs": copy.deepcopy(inputs) if inputs else {},
-    }
+    observed = instrumentation._hooks
+    if observed:
+        started_ns = time.perf_counter_ns()
+    if not inputs:
+        frozen_inputs = _NO_INPUTS
+    elif type(inputs) is FrozenDict:
+        frozen_inputs = inputs
+    elif _FROZEN_TYPES.issuperset(map(type, inputs.values())):
+        frozen_inputs = FrozenDict(inputs)
+    else:
+        frozen_inputs = freeze(inputs)
+    trace = AuditTrace(
+        rule_id=rule.rule_id,
+        statute=rule.statute,
+        jurisdiction=rule.jurisdiction,
+        outcome=outcome,
+        inputs=frozen_inputs,
+    )
+    if observed:
+        instrumentation.emit("trace", rule.rule_id, started_ns, outcome)
+    return trace
 
 
 def trace_proof_ref(trace: Dict[str, Any]) -> str:
@@ -184,18 +312,14 @@ def trace_proof_ref(trace: Dict[str, Any]) -> str:
     This binds a VERIFIED verdict to the specific audit_trace that justified it.
     If the trace changes (different rule, different inputs, different outcome),
     the hash changes — making verdict/trace drift structurally detectable.
+    A build_trace() result is hashed once and the ref cached on it.
 
     Args:
         trace: The dict returned by build_trace().
 
     Returns:
-        sha256-prefixed hex digest string, e.g. "sha256:abcdef...".
+        qc1 proof_ref string, e.g. "qc1-sha256:abcdef..." (see qwed_tax.proof).
     """
-    try:
-        payload = json.dumps(trace, sort_keys=True)
-    except (TypeError, ValueError) as exc:
-        raise ValueError(
-            f"Audit trace must be JSON-serializable for proof_ref hashing: {exc}"
-        ) from exc
-    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
-    return f"sha256:{digest}"
+    if isinstance(trace, FrozenDict):
+        return trace.proof_ref()
+    return proof_ref(trace)
@@ -0,0 +1,193 @@
+"""
+Verdict cache for TaxPreFlight.
+
+Agents retry and re-plan, so the same intent often reaches audit_transaction()
+many times within seconds. A VerdictCache passed to TaxPreFlight remembers the
+report for each distinct decision: the canonical action, the checks selected
+and the values of those checks' required fields, compared with their types
+(values that are not plain scalars are keyed by their qc1 digest, see
+proof.py). Fields no check reads do not split the cache.
+
+    cache = VerdictCache(maxsize=4096, ttl=30.0)
+    preflight = TaxPreFlight(verdict_cache=cache)
+    preflight.audit_transaction(intent)
+    cache.stats()
+
+Entries are evicted least-recently-used beyond maxsize and, with ttl set,
+expire ttl seconds after they were stored. Reports are stored as immutable
+snapshots and rebuilt into fresh dicts and lists on every hit, so neither the
+caller that filled an entry nor any caller served from it can change what the
+cache returns.
+
+Undated intents are decided under the rule tables in force today, so the key
+also holds today's date: a verdict is never served past midnight, and hence
+never across a rule boundary, even with ttl None. Otherwise a cached verdict
+is only stale if a rule table changes inside a running process (tests, a
+reloaded rate table). Call invalidate_verdict_caches() when that happens: it
+clears every live VerdictCache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+
+from .audit import freeze
+from .proof import canonical_bytes
+
+_live_caches: "weakref.WeakSet[VerdictCache]" = weakref.WeakSet()
+_live_lock = threading.Lock()
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def verdict_key(*parts: Any) -> Optional[bytes]:
+    """
+    SHA-256 digest of the qc1 encoding of parts, or None when a part is not
+    JSON data (such an intent is simply not cached).
+    """
+    try:
+        return hashlib.sha256(canonical_bytes(parts)).digest()
+    except ValueError:
+        return None
+
+
+# Report values (and list items) copied as-is: nothing a caller can mutate.
+_IMMUTABLE = frozenset({str, int, float, bool, type(None), Decimal})
+
+
+def _snapshot(report: Dict[str, Any]) -> Any:
+    """
+    An immutable copy of report. Preflight reports are flat (scalars and lists
+    of strings) and become a tuple of items; anything else is frozen whole.
+    """
+    items = []
+    for key, value in report.items():
+        if type(value) is list:
+            value = tuple(value)
+            if not _IMMUTABLE.issuperset(map(type, value)):
+                return freeze(report)
+        elif type(value) not in _IMMUTABLE:
+            return freeze(report)
+        items.append((key, value))
+    return tuple(items)
+
+
+def _restore(snapshot: Any) -> Dict[str, Any]:
+    if type(snapshot) is tuple:
+        return {key: list(value) if type(value) is tuple else value for key, value in snapshot}
+    return snapshot.to_dict()
+
+
+class VerdictCache:
+    """
+    Bounded, thread-safe LRU cache of TaxPreFlight reports.
+
+    Args:
+        maxsize: Entries kept before the least recently used is evicted.
+        ttl: Seconds an entry stays valid after it is stored; None never
+            expires entries.
+        clock: Monotonic time source in seconds (for tests).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool) or maxsize < 1:
+            raise ValueError("maxsize must be a positive integer.")
+        if ttl is not None and not ttl > 0:
+            raise ValueError("ttl must be a positive number of seconds or None.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        with _live_lock:
+            _live_caches.add(self)
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """A fresh copy of the report stored under key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, snapshot = entry
+            if self.ttl is not None and self._clock() >= expires_at:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return _restore(snapshot)
+
+    def put(self, key: Hashable, report: Dict[str, Any]) -> None:
+        """Store a copy of report under key, evicting the oldest entry if full."""
+        snapshot = _snapshot(report)
+        expires_at = self._clock() + self.ttl if self.ttl is not None else 0.0
+        with self._lock:
+            self._entries[key] = (expires_at, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self) -> None:
+        """Drop every entry (a rule table changed). Statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._invalidations += 1
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._expirations = self._invalidations = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def invalidate_verdict_caches() -> None:
+    """Invalidate every live VerdictCache; call after changing a rule table."""
+    with _live_lock:
+        caches = list(_live_caches)
+    for cache in caches:
+        cache.invalidate()
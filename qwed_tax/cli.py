@@ -0,0 +1,320 @@
+"""
+Command-line entry point.
+
+    qwed-tax verify invoices.csv -o verdicts.jsonl [--workers N]
+                    [--checkpoint run.ckpt | --resume-from run.ckpt]
+
+``verify`` streams CSV or JSONL invoice records through the Indian
+indirect-tax guards (GSTGuard, InputCreditGuard, TDSGuard) and writes one
+JSONL verdict per record, in input order, as soon as it is decided. Records
+are read, verified and written in fixed-size chunks with a bounded number in
+flight, so memory use does not grow with the input.
+
+Each record is routed to a check by its ``check`` field, by ``--check``, or
+else by the fields it carries (see CHECKS). Records that cannot be parsed or
+routed, or that a guard rejects, get a fail-closed verdict
+({"verified": false, "error": ...}); they never stop the run.
+
+Exit status: 0 if every record verified, 1 if any did not, 2 on usage or
+checkpoint errors. Throughput is reported on stderr.
+"""
+
+import argparse
+import csv
+import functools
+import importlib
+import json
+import os
+import sys
+import time
+from itertools import islice
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, TextIO, Tuple
+
+from qwed_tax.parallel import map_chunks
+
+
+class Check(NamedTuple):
+    """One guard method reachable from the CLI, with the record fields it takes."""
+
+    module: str
+    class_name: str
+    method: str
+    required: Tuple[str, ...]
+    optional: Tuple[str, ...] = ()
+
+
+# Name -> check. Records without a "check" field are routed to the first
+# entry whose required fields are all present, so more specific shapes come
+# first.
+CHECKS: Dict[str, Check] = {
+    "gst_split": Check(
+        ".jurisdictions.india.guards.gst_guard", "GSTGuard", "verify_gst_split",
+        ("supplier_state", "place_of_supply", "taxable_value", "gst_rate",
+         "claimed_cgst", "claimed_sgst", "claimed_igst"),
+    ),
+    "rcm": Check(
+        ".jurisdictions.india.guards.gst_guard", "GSTGuard", "verify_rcm_applicability",
+        ("service", "provider", "recipient"), ("claimed_is_rcm",),
+    ),
+    "tds": Check(
+        ".guards.tds_guard", "TDSGuard", "calculate_deduction",
+        ("service_type", "invoice_amount", "ytd_payment"),
+    ),
+    "itc": Check(
+        ".guards.indirect_tax_guard", "InputCreditGuard", "verify_itc_eligibility",
+        ("expense_category", "amount", "tax_paid"),
+    ),
+    "gstin": Check(
+        ".guards.indirect_tax_guard", "InputCreditGuard", "verify_gstin_format",
+        ("gstin",),
+    ),
+}
+
+# CSV cells are strings; these fields are booleans in the guard APIs.
+_BOOLEAN_FIELDS = frozenset({"claimed_is_rcm"})
+_CSV_BOOLEANS = {"true": True, "false": False}
+
+FORMATS = ("csv", "jsonl")
+CHECKPOINT_VERSION = 1
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_CHECKPOINT_EVERY = 100_000
+
+# One instance per guard class per process, built on first use.
+_guards: Dict[Tuple[str, str], Any] = {}
+
+
+def _guard_method(check: Check):
+    key = (check.module, check.class_name)
+    guard = _guards.get(key)
+    if guard is None:
+        guard_class = getattr(importlib.import_module(check.module, __package__), check.class_name)
+        guard = _guards[key] = guard_class()
+    return getattr(guard, check.method)
+
+
+def _route(record: Dict[str, Any], forced: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """(check name, error) for a parsed record."""
+    name = forced or record.get("check")
+    if name is not None:
+        if not isinstance(name, str) or name not in CHECKS:
+            return None, f"Unknown check '{name}'. Expected one of: {', '.join(CHECKS)}."
+        missing = [field for field in CHECKS[name].required if record.get(field) is None]
+        if missing:
+            return name, f"Record is missing field(s) for check '{name}': {', '.join(missing)}."
+        return name, None
+    for candidate, check in CHECKS.items():
+        if all(record.get(field) is not None for field in check.required):
+            return candidate, None
+    return None, "Record does not match any check; add a 'check' field or pass --check."
+
+
+def verify_record(record: Any, forced: Optional[str] = None) -> Dict[str, Any]:
+    """The verdict for one parsed record: {"check": name, **guard result}."""
+    if not isinstance(record, dict):
+        return {"check": None, "verified": False, "error": "Record must be a JSON object."}
+    name, error = _route(record, forced)
+    if error is not None:
+        return {"check": name, "verified": False, "error": error}
+    check = CHECKS[name]
+    kwargs = {field: record[field] for field in check.required}
+    kwargs.update((field, record[field]) for field in check.optional if record.get(field) is not None)
+    try:
+        result = _guard_method(check)(**kwargs)
+    except Exception as exc:  # fail closed per record; a bad row must not stop the run
+        return {"check": name, "verified": False, "error": f"{type(exc).__name__}: {exc}"}
+    return {"check": name, **result}
+
+
+class _InvalidRecord(NamedTuple):
+    error: str
+
+
+def _parse(raw: Any, fmt: str) -> Any:
+    """A record from a raw JSONL line or CSV row (an _InvalidRecord for bad JSON)."""
+    if fmt == "jsonl":
+        try:
+            return json.loads(raw)
+        except ValueError as exc:
+            return _InvalidRecord(f"Invalid JSON: {exc}")
+    record = {}
+    for field, value in raw.items():
+        if field is None or value is None or value == "":
+            continue  # extra cells without a header, short rows and empty cells
+        if field in _BOOLEAN_FIELDS:
+            value = _CSV_BOOLEANS.get(value.strip().lower(), value)
+        record[field] = value
+    return record
+
+
+def _verify_chunk(fmt: str, forced: Optional[str], chunk: List[Tuple[int, Any]]) -> Tuple[List[str], int]:
+    """(JSONL verdict lines, failed count) for a chunk of (index, raw record). Runs in workers."""
+    lines = []
+    failed = 0
+    for index, raw in chunk:
+        record = _parse(raw, fmt)
+        if isinstance(record, _InvalidRecord):
+            verdict = {"check": None, "verified": False, "error": record.error}
+        else:
+            verdict = verify_record(record, forced)
+        if verdict.get("verified") is not True:
+            failed += 1
+        lines.append(json.dumps({"record": index, **verdict}, default=str) + "\n")
+    return lines, failed
+
+
+def read_records(stream: TextIO, fmt: str) -> Iterator[Any]:
+    """Raw records: CSV rows as dicts, JSONL lines as strings (blank lines skipped)."""
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    else:
+        for line in stream:
+            if line.strip():
+                yield line
+
+
+def _write_checkpoint(path: str, state: Dict[str, Any]) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        json.dump(state, fh)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp_path, path)
+
+
+def _load_checkpoint(path: str, input_path: str, output_path: str) -> Dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as fh:
+            state = json.load(fh)
+    except (OSError, ValueError) as exc:
+        raise ValueError(f"cannot read checkpoint {path}: {exc}") from exc
+    if not isinstance(state, dict) or state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"{path} is not a qwed-tax verify checkpoint.")
+    for key, actual in (("input", input_path), ("output", output_path)):
+        if state.get(key) != os.path.abspath(actual):
+            raise ValueError(f"checkpoint {path} was written for {key} {state.get(key)!r}, not {actual!r}.")
+    return state
+
+
+def _detect_format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"cannot infer the format of {path!r}; pass --format csv or --format jsonl.")
+
+
+def verify_command(args: argparse.Namespace) -> int:
+    fmt = _detect_format(args.input, args.format)
+    to_file = args.output != "-"
+    checkpoint_path = args.checkpoint or args.resume_from
+    if checkpoint_path and (args.input == "-" or not to_file):
+        raise ValueError("checkpoints need a file input and a file output (-o PATH).")
+
+    done = failed = 0
+    if args.resume_from:
+        state = _load_checkpoint(args.resume_from, args.input, args.output)
+        done, failed = state["records_done"], state["failed"]
+        # Drop verdicts written after the checkpoint; they are redone.
+        with open(args.output, "r+b") as fh:
+            fh.truncate(state["output_offset"])
+
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    sink = open(args.output, "a" if args.resume_from else "w", encoding="utf-8") if to_file else sys.stdout
+    start = time.perf_counter()
+    processed = 0
+    try:
+        records = enumerate(read_records(source, fmt))
+        for _ in islice(records, done):
+            pass
+        chunks = iter(lambda: list(islice(records, args.chunk_size)), [])
+        task = functools.partial(_verify_chunk, fmt, args.check)
+        since_checkpoint = 0
+        for chunk, (lines, chunk_failed) in map_chunks(task, chunks, args.workers):
+            sink.writelines(lines)
+            processed += len(chunk)
+            failed += chunk_failed
+            since_checkpoint += len(chunk)
+            if checkpoint_path and since_checkpoint >= args.checkpoint_every:
+                _checkpoint(checkpoint_path, args, sink, done + processed, failed)
+                since_checkpoint = 0
+        if checkpoint_path:
+            _checkpoint(checkpoint_path, args, sink, done + processed, failed)
+    finally:
+        if to_file:
+            sink.close()
+        else:
+            sink.flush()
+        if source is not sys.stdin:
+            source.close()
+
+    elapsed = time.perf_counter() - start
+    rate = processed / elapsed if elapsed > 0 else 0.0
+    print(
+        f"qwed-tax verify: {done + processed:,} records ({failed:,} failed); "
+        f"{processed:,} verified this run in {elapsed:.2f} s ({rate:,.0f} rows/s)",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
+def _checkpoint(path: str, args: argparse.Namespace, sink: TextIO, records_done: int, failed: int) -> None:
+    sink.flush()
+    os.fsync(sink.fileno())
+    _write_checkpoint(path, {
+        "version": CHECKPOINT_VERSION,
+        "input": os.path.abspath(args.input),
+        "output": os.path.abspath(args.output),
+        "records_done": records_done,
+        "failed": failed,
+        "output_offset": sink.tell(),
+    })
+
+
+def _positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="qwed-tax", description="QWED-Tax verification tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    verify = commands.add_parser(
+        "verify",
+        help="verify CSV/JSONL invoice records and write JSONL verdicts",
+        description="Stream CSV or JSONL invoice records through the tax guards and write JSONL verdicts.",
+    )
+    verify.add_argument("input", help="CSV or JSONL file, or - for stdin")
+    verify.add_argument("-o", "--output", default="-", help="JSONL verdict file (default: stdout)")
+    verify.add_argument("--format", choices=FORMATS, help="input format (default: from the file extension)")
+    verify.add_argument("--check", choices=sorted(CHECKS), help="apply this check to every record")
+    verify.add_argument("--workers", type=_positive_int, default=1, help="worker processes (default: 1)")
+    verify.add_argument("--chunk-size", type=_positive_int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"records per work unit (default: {DEFAULT_CHUNK_SIZE})")
+    resume = verify.add_mutually_exclusive_group()
+    resume.add_argument("--checkpoint", metavar="PATH", help="record progress in PATH while running")
+    resume.add_argument("--resume-from", metavar="PATH",
+                        help="continue a run from its checkpoint (and keep checkpointing there)")
+    verify.add_argument("--checkpoint-every", type=_positive_int, default=DEFAULT_CHECKPOINT_EVERY,
+                        metavar="N", help=f"records between checkpoints (default: {DEFAULT_CHECKPOINT_EVERY})")
+    verify.set_defaults(handler=verify_command)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args)
+    except (OSError, ValueError) as exc:
+        print(f"qwed-tax {args.command}: error: {exc}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
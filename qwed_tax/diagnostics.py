@@ -18,7 +18,7 @@ Implements the 3-layer TaxDiagnosticResult model (Issue #39):
 
     Layer 3 — Proof Diagnostics
         proof_ref: Optional[str]
-        sha256 hash of retained proof artifact (audit_trace output).
+        qc1 SHA-256 hash of retained proof artifact (audit_trace output).
         Present only when status == VERIFIED and proof was established.
         None for UNVERIFIABLE / BLOCKED — this is the authority bit.
 
@@ -41,11 +41,13 @@ foundation.
 
 from __future__ import annotations
 
-import hashlib
-import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .audit import FrozenDict
+from .merkle import InclusionProof, MerkleBatch, parse_root_ref, verify_inclusion
+from .proof import proof_ref, verify_proof_ref
 
 
 class TaxDiagnosticStatus(str, Enum):
@@ -134,7 +136,8 @@ def compute_proof_ref(evidence: Dict[str, Any]) -> str:
     that justified it. If the evidence changes, the hash changes — making
     verdict/evidence drift structurally detectable.
 
-    For audit_trace-based guards: pass the build_trace() output as evidence.
+    For audit_trace-based guards: pass the build_trace() output as evidence;
+    it is hashed once and the ref cached on the (immutable) trace.
     For Decimal guards: pass the computed + claimed values + comparison result.
     For Z3 guards: pass the assertion stack + solver result.
 
@@ -142,19 +145,15 @@ def compute_proof_ref(evidence: Dict[str, Any]) -> str:
         evidence: The proof artifact dict (must be JSON-serializable).
 
     Returns:
-        sha256-prefixed hex digest string, e.g. "sha256:abcdef...".
+        qc1 proof_ref string, e.g. "qc1-sha256:abcdef..." (see qwed_tax.proof).
+        Refs issued as "sha256:..." still check out with verify_proof_ref().
 
     Raises:
         ValueError: If evidence is not JSON-serializable (fail-closed).
     """
-    try:
-        payload = json.dumps(evidence, sort_keys=True)
-    except (TypeError, ValueError) as exc:
-        raise ValueError(
-            f"Proof evidence must be JSON-serializable for proof_ref hashing: {exc}"
-        ) from exc
-    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
-    return f"sha256:{digest}"
+    if isinstance(evidence, FrozenDict):
+        return evidence.proof_ref()
+    return proof_ref(evidence)
 
 
 @dataclass(frozen=True)
@@ -173,9 +172,14 @@ class TaxDiagnosticResult:
         proof_ref is not None  → authoritative, admissible for control flow
         proof_ref is None      → non-authoritative, NOT admissible for control flow
 
+    In a Merkle-batched run (merkle_batch()), proof_ref is the batch root
+    and inclusion_proof ties this result's own proof to it.
+
     Constraints enforced in __post_init__:
         - status == VERIFIED  requires proof_ref is not None
         - status == UNVERIFIABLE or BLOCKED  requires proof_ref is None
+        - a batch root proof_ref requires an inclusion_proof into a batch of
+          that size, and an inclusion_proof requires a batch root proof_ref
         - agent_message must be non-empty
     """
 
@@ -183,6 +187,7 @@ class TaxDiagnosticResult:
     agent_message: str
     developer_fields: Dict[str, Any] = field(default_factory=dict)
     proof_ref: Optional[str] = None
+    inclusion_proof: Optional[InclusionProof] = None
 
     def __post_init__(self) -> None:
         if not isinstance(self.status, TaxDiagnosticStatus):
@@ -211,6 +216,21 @@ class TaxDiagnosticResult:
                 "non-VERIFIED states are non-authoritative by construction."
             )
 
+        root = parse_root_ref(self.proof_ref)
+        if self.inclusion_proof is not None:
+            if not isinstance(self.inclusion_proof, InclusionProof):
+                raise ValueError("inclusion_proof must be an InclusionProof")
+            if root is None or not 0 <= self.inclusion_proof.index < self.inclusion_proof.size == root[0]:
+                raise ValueError(
+                    "inclusion_proof requires a Merkle batch root proof_ref of the same size — "
+                    "use verify_evidence() to check the proof itself."
+                )
+        elif root is not None:
+            raise ValueError(
+                "a Merkle batch root proof_ref requires an inclusion_proof — "
+                "the root alone does not bind this result's evidence."
+            )
+
     @property
     def is_verified(self) -> bool:
         """True only when status is VERIFIED (which implies proof_ref is not None)."""
@@ -262,13 +282,19 @@ class TaxDiagnosticResult:
                 item.to_dict() if isinstance(item, TaxAdvisoryCheck) else item
                 for item in checks
             ]
-        return {
+        trace = fields.get("audit_trace")
+        if isinstance(trace, FrozenDict):
+            fields["audit_trace"] = trace.to_dict()
+        data = {
             "status": self.status.value,
             "agent_message": self.agent_message,
             "developer_fields": fields,
             "proof_ref": self.proof_ref,
             "is_authoritative": self.is_authoritative,
         }
+        if self.inclusion_proof is not None:
+            data["inclusion_proof"] = self.inclusion_proof.to_dict()
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TaxDiagnosticResult":
@@ -301,13 +327,28 @@ class TaxDiagnosticResult:
         if not isinstance(developer_fields, dict):
             raise ValueError("from_dict: 'developer_fields' must be a dict.")
 
+        inclusion_proof = data.get("inclusion_proof")
+        if inclusion_proof is not None:
+            inclusion_proof = InclusionProof.from_dict(inclusion_proof)
+
         return cls(
             status=status,
             agent_message=agent_message,
             developer_fields=developer_fields,
             proof_ref=data.get("proof_ref"),
+            inclusion_proof=inclusion_proof,
         )
 
+    def verify_evidence(self, evidence: Any) -> bool:
+        """
+        Does this result's proof bind evidence? Checks the item's own ref and,
+        for a batched result, the inclusion path to the root — O(log n).
+        Always False for non-VERIFIED results.
+        """
+        if self.inclusion_proof is not None:
+            return verify_inclusion(evidence, self.inclusion_proof, self.proof_ref)
+        return self.proof_ref is not None and verify_proof_ref(evidence, self.proof_ref)
+
     @classmethod
     def verified(
         cls,
@@ -352,9 +393,38 @@ class TaxDiagnosticResult:
         )
 
 
+def merkle_batch(
+    results: Iterable[TaxDiagnosticResult],
+) -> Tuple[Optional[str], List[TaxDiagnosticResult]]:
+    """Bind every VERIFIED result of a bulk run to one Merkle root proof_ref.
+
+    Returns (root_ref, results) where each VERIFIED result is re-issued with
+    proof_ref=root_ref and an inclusion_proof carrying its original
+    proof_ref; other results are returned unchanged, in order. root_ref is
+    None when nothing verified. The audit store keeps one root per run, and
+    any single result still checks with verify_evidence().
+
+    Raises:
+        ValueError: If a result is already batched.
+    """
+    results = list(results)
+    verified = [i for i, result in enumerate(results) if result.is_verified]
+    if not verified:
+        return None, results
+    for i in verified:
+        if results[i].inclusion_proof is not None:
+            raise ValueError(f"merkle_batch: result {i} is already part of a batch.")
+    batch = MerkleBatch([results[i].proof_ref for i in verified])
+    for position, i in enumerate(verified):
+        results[i] = replace(results[i], proof_ref=batch.root_ref, inclusion_proof=batch.proof(position))
+    return batch.root_ref, results
+
+
 __all__ = [
     "TaxDiagnosticStatus",
     "TaxDiagnosticResult",
     "TaxAdvisoryCheck",
     "compute_proof_ref",
+    "verify_proof_ref",
+    "merkle_batch",
 ]
@@ -1,14 +1,10 @@
 from datetime import datetime
-from typing import Dict, Any
-
-from qwed_tax.audit import (
-    CG_DEBT_FUND_50AA,
-    CG_EQUITY_LTCG_112A,
-    CG_EQUITY_STCG_111A,
-    CG_NO_RATE_CONFIGURED,
-    build_trace,
-)
+from typing import Any, Dict, Mapping, Union
+
+from qwed_tax import rules
+from qwed_tax.audit import CG_NO_RATE_CONFIGURED, build_trace
 from qwed_tax.diagnostics import TaxDiagnosticResult
+from qwed_tax.results import CapitalGainsResult
 
 class CapitalGainsGuard:
     """
@@ -16,10 +12,12 @@ class CapitalGainsGuard:
     Uses strict calendar logic to determine holding period.
     """
     
-    def determine_term(self, purchase_date: str, sale_date: str, asset_type: str) -> str:
+    def determine_term(self, purchase_date: str, sale_date: str, asset_type: str, as_of: rules.AsOf = None) -> str:
         """
         Calculates Holding Period in days and returns 'LTCG' or 'STCG'.
-        Raises ValueError on unparseable dates or unknown asset types.
+        Raises ValueError on unparseable dates, unknown asset types or an
+        invalid as_of. as_of (default today) selects the holding-period
+        thresholds in force then; pass the sale date for a prior-year sale.
         """
         try:
             d1 = datetime.strptime(purchase_date, "%Y-%m-%d")
@@ -30,13 +28,8 @@ class CapitalGainsGuard:
                 f"Invalid date format. Expected YYYY-MM-DD, got '{purchase_date}' and '{sale_date}'."
             ) from exc
 
-        # Deterministic Thresholds (India FY 2024-25)
-        # Source: Income Tax Act
-        thresholds = {
-            "equity": 365,       # > 1 year
-            "real_estate": 730,  # > 2 years
-            "debt": 1095
-        }
+        # Holding periods in days (rule family "capital_gains_holding").
+        thresholds = rules.table("capital_gains_holding", as_of)
 
         if not isinstance(asset_type, str) or not asset_type.strip():
             raise ValueError(f"Unknown asset type '{asset_type}'. Known types: equity, real_estate, debt, debt_fund.")
@@ -51,70 +44,79 @@ class CapitalGainsGuard:
         if asset_key not in thresholds:
             raise ValueError(f"Unknown asset type '{asset_type}'. Known types: equity, real_estate, debt, debt_fund.")
 
-        limit = thresholds[asset_key]
+        limit = thresholds[asset_key]["days"]
         return "LTCG" if days > limit else "STCG"
 
-    def verify_tax_rate(self, asset_type: str, term: str, claimed_rate: str) -> Dict[str, Any]:
+    def verify_tax_rate(
+        self, asset_type: str, term: str, claimed_rate: str, as_of: rules.AsOf = None, compact: bool = False
+    ) -> Union[Dict[str, Any], CapitalGainsResult]:
         """
         Verifies if the LLM hallucinated the tax rate.
-        hard-coded statutory rates (FY 2024-25).
+        Statutory rates come from rule family "capital_gains_rates"; as_of
+        (default today) should be the transfer date for a prior-year sale.
+        With compact=True the result is a CapitalGainsResult instead of a dict.
         """
+        result = CapitalGainsResult if compact else dict
         # Normalized Claims
         claimed_clean = claimed_rate.replace("%", "").strip()
-        
-        rates = {
-            "equity_LTCG": ("12.5", CG_EQUITY_LTCG_112A),
-            "equity_STCG": ("20", CG_EQUITY_STCG_111A),
-            "debt_LTCG": ("SLAB", CG_DEBT_FUND_50AA),
-            "debt_STCG": ("SLAB", CG_DEBT_FUND_50AA),
-        }
-        
+
+        try:
+            rates = rules.table("capital_gains_rates", as_of)
+        except ValueError as exc:
+            return result(verified=False, error=str(exc))
+
         key = f"{asset_type.lower()}_{term}"
         entry = rates.get(key)
         
         if not entry:
-             return {
-                 "verified": False,
-                 "error": f"No statutory rate configured for {key}. Cannot verify claimed rate.",
-                 "audit_trace": build_trace(
+             return result(
+                 verified=False,
+                 error=f"No statutory rate configured for {key}. Cannot verify claimed rate.",
+                 audit_trace=build_trace(
                      CG_NO_RATE_CONFIGURED, "NO_RATE", {"asset_type": asset_type, "term": term}
                  ),
-             }
+             )
 
-        expected, rule_ref = entry
+        expected, rule_ref = entry["rate"], entry["rule"]
 
         if expected == "SLAB":
-            return {
-                "verified": False,
-                "error": (
+            return result(
+                verified=False,
+                error=(
                     f"Rate for {key} is subject to slab rates — cannot deterministically "
                     f"verify claimed rate of {claimed_rate}. Taxpayer's slab band is required for verification."
                 ),
-                "audit_trace": build_trace(
+                audit_trace=build_trace(
                     rule_ref, "SLAB_RATE", {"asset_type": asset_type, "term": term, "claimed_rate": claimed_rate}
                 ),
-            }
+            )
             
         if claimed_clean != expected:
-            return {
-                "verified": False,
-                "error": f"Rate Mismatch for {key}: Statutory Rate is {expected}%, LLM claimed {claimed_rate}.",
-                "audit_trace": build_trace(
+            return result(
+                verified=False,
+                error=f"Rate Mismatch for {key}: Statutory Rate is {expected}%, LLM claimed {claimed_rate}.",
+                audit_trace=build_trace(
                     rule_ref, "RATE_MISMATCH", {"asset_type": asset_type, "term": term, "expected": expected, "claimed": claimed_clean}
                 ),
-            }
+            )
             
-        return {
-            "verified": True,
-            "audit_trace": build_trace(
+        return result(
+            verified=True,
+            audit_trace=build_trace(
                 rule_ref, "RATE_VERIFIED", {"asset_type": asset_type, "term": term, "expected": expected, "claimed": claimed_clean}
             ),
-        }
+        )
+
+    def diagnose_tax_rate(
+        self, asset_type: str, term: str, claimed_rate: str, as_of: rules.AsOf = None
+    ) -> TaxDiagnosticResult:
+        """verify_tax_rate() as a TaxDiagnosticResult, without the intermediate dict."""
+        return self.to_diagnostic(self.verify_tax_rate(asset_type, term, claimed_rate, as_of, compact=True))
 
     _UNVERIFIABLE_OUTCOMES: frozenset[str] = frozenset({"NO_RATE", "SLAB_RATE"})
 
     @staticmethod
-    def to_diagnostic(result: Dict[str, Any]) -> TaxDiagnosticResult:
+    def to_diagnostic(result: Mapping[str, Any]) -> TaxDiagnosticResult:
         """Convert a legacy verify_tax_rate() dict to TaxDiagnosticResult."""
         verified = result.get("verified", False)
         audit_trace = result.get("audit_trace")
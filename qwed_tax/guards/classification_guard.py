@@ -1,8 +1,9 @@
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Any, Dict, Mapping, Optional, Union
 
 from qwed_tax.audit import IRS_COMMON_LAW, build_trace
 from qwed_tax.diagnostics import TaxDiagnosticResult
+from qwed_tax.results import WorkerClassificationResult
 
 class WorkerType(Enum):
     EMPLOYEE = "W2"
@@ -54,10 +55,14 @@ class ClassificationGuard:
         # No employee indicators at all — contractor is safe
         return WorkerType.CONTRACTOR
 
-    def verify_classification_claim(self, llm_claim: str, facts: Dict[str, Any]) -> Dict[str, Any]:
+    def verify_classification_claim(
+        self, llm_claim: str, facts: Dict[str, Any], compact: bool = False
+    ) -> Union[Dict[str, Any], WorkerClassificationResult]:
         """
         Verifies if the LLM's classification matches the deterministic facts.
+        With compact=True the result is a WorkerClassificationResult instead of a dict.
         """
+        result = WorkerClassificationResult if compact else dict
         derived_status = self.verify_worker_status(
             facts.get("provides_tools", False), # If employer provides tools -> Behavioral Control often implied
             facts.get("reimburses_expenses", False), # Financial Control
@@ -66,26 +71,26 @@ class ClassificationGuard:
 
         # Mixed signals — cannot conclusively classify
         if derived_status is None:
-            return {
-                "verified": False,
-                "error": (
+            return result(
+                verified=False,
+                error=(
                     "Ambiguous classification: facts contain mixed employee/contractor indicators. "
                     "Cannot deterministically classify — manual review required."
                 ),
-                "audit_trace": build_trace(
+                audit_trace=build_trace(
                     IRS_COMMON_LAW, "AMBIGUOUS", {"facts": facts}
                 ),
-            }
+            )
 
         # Type guard — non-string claims must fail closed
         if not isinstance(llm_claim, str) or not llm_claim.strip():
-            return {
-                "verified": False,
-                "error": "Invalid worker classification claim. Expected a non-empty string.",
-                "audit_trace": build_trace(
+            return result(
+                verified=False,
+                error="Invalid worker classification claim. Expected a non-empty string.",
+                audit_trace=build_trace(
                     IRS_COMMON_LAW, "INVALID_CLAIM", {"facts": facts}
                 ),
-            }
+            )
 
         # Normalize claim
         claim_normalized = llm_claim.upper()
@@ -95,25 +100,29 @@ class ClassificationGuard:
             claim_normalized = "1099"
 
         if derived_status.value != claim_normalized:
-            return {
-                "verified": False,
-                "error": f"Misclassification Risk: Facts indicate {derived_status.value}, but AI claimed {llm_claim}. This creates IRS liability.",
-                "audit_trace": build_trace(
+            return result(
+                verified=False,
+                error=f"Misclassification Risk: Facts indicate {derived_status.value}, but AI claimed {llm_claim}. This creates IRS liability.",
+                audit_trace=build_trace(
                     IRS_COMMON_LAW, "MISCLASSIFICATION", {"derived": derived_status.value, "claimed": llm_claim}
                 ),
-            }
+            )
 
-        return {
-            "verified": True,
-            "audit_trace": build_trace(
+        return result(
+            verified=True,
+            audit_trace=build_trace(
                 IRS_COMMON_LAW, "CLASSIFICATION_VERIFIED", {"derived": derived_status.value, "claimed": llm_claim}
             ),
-        }
+        )
+
+    def diagnose_classification_claim(self, llm_claim: str, facts: Dict[str, Any]) -> TaxDiagnosticResult:
+        """verify_classification_claim() as a TaxDiagnosticResult, without the intermediate dict."""
+        return self.to_diagnostic(self.verify_classification_claim(llm_claim, facts, compact=True))
 
     _UNVERIFIABLE_OUTCOMES: frozenset[str] = frozenset({"AMBIGUOUS"})
 
     @staticmethod
-    def to_diagnostic(result: Dict[str, Any]) -> TaxDiagnosticResult:
+    def to_diagnostic(result: Mapping[str, Any]) -> TaxDiagnosticResult:
         """Convert a legacy verify_classification_claim() dict to TaxDiagnosticResult."""
         verified = result.get("verified", False)
         audit_trace = result.get("audit_trace")
@@ -1,7 +1,9 @@
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
+from qwed_tax.money import divide, multiply, subtract
 from qwed_tax.numeric import decimal_text, parse_decimal_input
+from qwed_tax.results import ForeignTaxCreditResult
 
 PERCENT_BASE = Decimal("100")
 
@@ -15,7 +17,8 @@ class DTAAGuard:
                                 foreign_income: Any,
                                 foreign_tax_paid: Any,
                                 home_tax_rate: Any,
-                                foreign_tax_limit_rate: Optional[Any] = None) -> Dict[str, Any]:
+                                foreign_tax_limit_rate: Optional[Any] = None,
+                                compact: bool = False) -> Union[Dict[str, Any], ForeignTaxCreditResult]:
         """
         Verify Foreign Tax Credit (FTC) availability.
         Rule: Credit is Lower of (Actual Foreign Tax Paid) OR (Tax Payable in Home Country on that income).
@@ -25,43 +28,45 @@ class DTAAGuard:
             foreign_tax_paid: Actual tax withheld/paid in source country.
             home_tax_rate: Tax rate applicable in resident country (home).
             foreign_tax_limit_rate: Max tax rate allowed under DTAA (e.g., 15% for dividends/royalty).
+            compact: Return a ForeignTaxCreditResult instead of a dict.
         """
+        result = ForeignTaxCreditResult if compact else dict
         try:
             f_income = parse_decimal_input(foreign_income, "foreign_income")
             f_tax_paid = parse_decimal_input(foreign_tax_paid, "foreign_tax_paid")
             parsed_home_tax_rate = parse_decimal_input(home_tax_rate, "home_tax_rate")
         except ValueError as exc:
-            return {
-                "verified": False,
-                "message": str(exc),
-                "allowable_credit": "0",
-                "excess_tax_lapsed": "0",
-            }
+            return result(
+                verified=False,
+                message=str(exc),
+                allowable_credit="0",
+                excess_tax_lapsed="0",
+            )
         if f_income < 0:
-            return {
-                "verified": False,
-                "message": "foreign_income must be a non-negative numeric value.",
-                "allowable_credit": "0",
-                "excess_tax_lapsed": "0",
-            }
+            return result(
+                verified=False,
+                message="foreign_income must be a non-negative numeric value.",
+                allowable_credit="0",
+                excess_tax_lapsed="0",
+            )
         if f_tax_paid < 0:
-            return {
-                "verified": False,
-                "message": "foreign_tax_paid must be a non-negative numeric value.",
-                "allowable_credit": "0",
-                "excess_tax_lapsed": "0",
-            }
+            return result(
+                verified=False,
+                message="foreign_tax_paid must be a non-negative numeric value.",
+                allowable_credit="0",
+                excess_tax_lapsed="0",
+            )
         if parsed_home_tax_rate < 0:
-            return {
-                "verified": False,
-                "message": "home_tax_rate must be a non-negative numeric value.",
-                "allowable_credit": "0",
-                "excess_tax_lapsed": "0",
-            }
-        h_rate = parsed_home_tax_rate / PERCENT_BASE
+            return result(
+                verified=False,
+                message="home_tax_rate must be a non-negative numeric value.",
+                allowable_credit="0",
+                excess_tax_lapsed="0",
+            )
+        h_rate = divide(parsed_home_tax_rate, PERCENT_BASE)
         
         # 1. Tax Payable in Home Country on foreign income
-        home_tax_payable = f_income * h_rate
+        home_tax_payable = multiply(f_income, h_rate)
         
         # 2. Allowable Credit = Min(Foreign Tax Paid, Home Tax Payable)
         allowable_credit = min(f_tax_paid, home_tax_payable)
@@ -73,21 +78,21 @@ class DTAAGuard:
                     foreign_tax_limit_rate, "foreign_tax_limit_rate"
                 )
             except ValueError as exc:
-                return {
-                    "verified": False,
-                    "message": str(exc),
-                    "allowable_credit": "0",
-                    "excess_tax_lapsed": "0",
-                }
+                return result(
+                    verified=False,
+                    message=str(exc),
+                    allowable_credit="0",
+                    excess_tax_lapsed="0",
+                )
             if parsed_limit_rate < 0:
-                return {
-                    "verified": False,
-                    "message": "foreign_tax_limit_rate must be a non-negative numeric value.",
-                    "allowable_credit": "0",
-                    "excess_tax_lapsed": "0",
-                }
-            f_limit_rate = parsed_limit_rate / PERCENT_BASE
-            treaty_limit = f_income * f_limit_rate
+                return result(
+                    verified=False,
+                    message="foreign_tax_limit_rate must be a non-negative numeric value.",
+                    allowable_credit="0",
+                    excess_tax_lapsed="0",
+                )
+            f_limit_rate = divide(parsed_limit_rate, PERCENT_BASE)
+            treaty_limit = multiply(f_income, f_limit_rate)
             allowable_credit = min(allowable_credit, treaty_limit)
         
         if allowable_credit < f_tax_paid:
@@ -98,16 +103,16 @@ class DTAAGuard:
                 f"FTC Capped. Paid {decimal_text(f_tax_paid)}, allowable credit is "
                 f"{decimal_text(allowable_credit)} ({details})."
             )
-            return {
-                "verified": True,
-                "message": msg,
-                "allowable_credit": decimal_text(allowable_credit),
-                "excess_tax_lapsed": decimal_text(f_tax_paid - allowable_credit)
-            }
+            return result(
+                verified=True,
+                message=msg,
+                allowable_credit=decimal_text(allowable_credit),
+                excess_tax_lapsed=decimal_text(subtract(f_tax_paid, allowable_credit))
+            )
             
-        return {
-            "verified": True,
-            "message": "Full Foreign Tax Credit allowed.",
-            "allowable_credit": decimal_text(allowable_credit),
-            "excess_tax_lapsed": "0"
-        }
+        return result(
+            verified=True,
+            message="Full Foreign Tax Credit allowed.",
+            allowable_credit=decimal_text(allowable_credit),
+            excess_tax_lapsed="0"
+        )
@@ -1,6 +1,6 @@
 from decimal import Decimal
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Union
 
 from qwed_tax.audit import (
     ITC_BLOCKED_17_5,
@@ -10,7 +10,48 @@ from qwed_tax.audit import (
     build_trace,
 )
 from qwed_tax.diagnostics import TaxDiagnosticResult
+from qwed_tax.guards.itc_categories import CategoryIndex
 from qwed_tax.numeric import decimal_text, parse_decimal_input
+from qwed_tax.results import GSTINResult, ITCResult
+
+
+# Format: 2-digit state code, PAN (5 letters, 4 digits, 1 letter), entity
+# number, "Z", check character. ASCII-only classes, so a match is safe to
+# encode("ascii") and index into the byte tables below.
+_GSTIN_PATTERN = re.compile(r"[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z][1-9A-Z]Z[0-9A-Z]").fullmatch
+
+# GSTIN check-digit alphabet: digits 0-9 followed by A-Z (base 36).
+_GSTIN_CODES = b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _gstin_fold_table(factor: int) -> bytes:
+    """256-entry translate() table: character byte -> folded product of its base-36 value."""
+    table = bytearray(256)
+    for value, code in enumerate(_GSTIN_CODES):
+        product = value * factor
+        table[code] = product // 36 + product % 36
+    return bytes(table)
+
+
+# Checksum (GSTN spec): map each of the first 14 characters to its base-36
+# value, multiply by 1, 2, 1, 2, ... left to right, add (product // 36) +
+# (product % 36) for each, and the check character is (36 - sum % 36) % 36.
+# The factor depends only on the position's parity, so one table per parity
+# turns each character straight into its term; each term is at most 35.
+_GSTIN_FOLDS = (_gstin_fold_table(1), _gstin_fold_table(2))
+# sum -> expected check character byte, for every reachable sum.
+_GSTIN_CHECK = bytes(_GSTIN_CODES[(36 - total % 36) % 36] for total in range(14 * 35 + 1))
+
+
+def _blocked_codes(index: CategoryIndex) -> FrozenSet[str]:
+    """Codes an index blocks outright or above the gift threshold."""
+    return frozenset(code for code, rule in index.codes.items() if rule != "personal")
+
+
+def _gstin_checksum_ok(raw: bytes) -> bool:
+    """True if the 15th byte of a format-valid GSTIN is its check character."""
+    even, odd = _GSTIN_FOLDS
+    return raw[14] == _GSTIN_CHECK[sum(raw[0:14:2].translate(even)) + sum(raw[1:14:2].translate(odd))]
 
 
 class InputCreditGuard:
@@ -19,143 +60,174 @@ class InputCreditGuard:
     Enforces Section 17(5) blocked credits and verifies GSTIN formats.
     """
 
-    def __init__(self):
-        # Categories where Input Tax Credit (ITC) is strictly blocked
-        # Source: Section 17(5) of CGST Act (India) / VAT Guidelines (UK)
-        self.blocked_categories: List[str] = [
-            "FOOD_AND_BEVERAGE",
-            "CATERING",
-            "RESTAURANT_SERVICE",
-            "CLUB_MEMBERSHIP",
-            "HEALTH_INSURANCE",  # Unless mandatory by law
-            "MOTOR_VEHICLE",  # With exceptions
-            "GIFT_TO_EMPLOYEE",  # Only blocked when amount exceeds 50,000 INR
-        ]
+    # Expense categories compiled from itc_categories.json (see
+    # qwed_tax.guards.itc_categories). Subclasses can assign
+    # CategoryIndex.load(path) to use their own mapping file.
+    category_index: CategoryIndex = CategoryIndex.load()
+
+    # Categories where Input Tax Credit (ITC) is blocked under Section 17(5) /
+    # VAT Guidelines (UK); GIFT_TO_EMPLOYEE only above INR 50,000. Always
+    # read from category_index: a subclass that overrides this set gets an
+    # index whose "blocked" categories are exactly its codes
+    # (CategoryIndex.with_blocked), and the set is then re-read from it.
+    blocked_categories: FrozenSet[str] = _blocked_codes(category_index)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "blocked_categories" in cls.__dict__:
+            cls.category_index = cls.category_index.with_blocked(cls.blocked_categories)
+        if "blocked_categories" in cls.__dict__ or "category_index" in cls.__dict__:
+            cls.blocked_categories = _blocked_codes(cls.category_index)
 
     def verify_itc_eligibility(
-        self, expense_category: str, amount: Any, tax_paid: Any
-    ) -> Dict[str, Any]:
+        self, expense_category: str, amount: Any, tax_paid: Any, compact: bool = False
+    ) -> Union[Dict[str, Any], ITCResult]:
         """
         Determines if the tax paid on an expense can be claimed as ITC.
+
+        expense_category is free-form: it is resolved through category_index
+        (codes, ERP aliases, keywords), and the trace records the canonical
+        category as category_match when it differs from the input.
+        With compact=True the result is an ITCResult instead of a dict.
+        """
+        return self._evaluate_itc(expense_category, amount, tax_paid, ITCResult if compact else dict)
+
+    def diagnose_itc_eligibility(self, expense_category: str, amount: Any, tax_paid: Any) -> TaxDiagnosticResult:
+        """verify_itc_eligibility() as a TaxDiagnosticResult, without the intermediate dict."""
+        return self.to_diagnostic(self._evaluate_itc(expense_category, amount, tax_paid, ITCResult))
+
+    def verify_itc_batch(
+        self, expenses: Iterable[Any], compact: bool = False
+    ) -> List[Union[Dict[str, Any], ITCResult]]:
+        """
+        verify_itc_eligibility() over an expense report, in input order.
+
+        Each expense is an (expense_category, amount, tax_paid) tuple or a
+        mapping with those keys. Every result is identical to the
+        corresponding single call (ITCResult objects with compact=True).
         """
+        evaluate = self._evaluate_itc
+        result = ITCResult if compact else dict
+        results = []
+        append = results.append
+        for expense in expenses:
+            if isinstance(expense, (tuple, list)):
+                append(evaluate(*expense, result=result))
+            else:
+                append(evaluate(expense.get("expense_category"), expense.get("amount"), expense.get("tax_paid"), result=result))
+        return results
+
+    def _evaluate_itc(self, expense_category: str, amount: Any, tax_paid: Any, result: Any = dict) -> Any:
         normalized_cat = expense_category.upper().replace(" ", "_")
         try:
             parsed_amount = parse_decimal_input(amount, "amount")
             parsed_tax_paid = parse_decimal_input(tax_paid, "tax_paid")
         except ValueError as exc:
-            return {"verified": False, "eligible_itc": "0", "reason": str(exc)}
+            return result(verified=False, eligible_itc="0", reason=str(exc))
+
+        match = self.category_index.classify(expense_category)
+        inputs: Dict[str, Any] = {"expense_category": normalized_cat}
+        if match is not None and match.code != normalized_cat:
+            inputs["category_match"] = match.code
+        rule = match.rule if match is not None else None
 
         # Gift threshold: gifts of 50,000 INR or less remain eligible; only amounts above that block.
-        if normalized_cat == "GIFT_TO_EMPLOYEE":
+        if rule == "gift_threshold":
+            inputs["amount"] = decimal_text(parsed_amount)
             if parsed_amount <= Decimal("50000"):
-                return {
-                    "verified": True,
-                    "eligible_itc": decimal_text(parsed_tax_paid),
-                    "note": "Gift of INR 50,000 or less; ITC allowed.",
-                    "audit_trace": build_trace(
-                        ITC_GIFT_THRESHOLD,
-                        "ALLOWED",
-                        {"expense_category": normalized_cat, "amount": decimal_text(parsed_amount)},
-                    ),
-                }
-            return {
-                "verified": False,
-                "eligible_itc": "0",
-                "reason": (
+                return result(
+                    verified=True,
+                    eligible_itc=decimal_text(parsed_tax_paid),
+                    note="Gift of INR 50,000 or less; ITC allowed.",
+                    audit_trace=build_trace(ITC_GIFT_THRESHOLD, "ALLOWED", inputs),
+                )
+            return result(
+                verified=False,
+                eligible_itc="0",
+                reason=(
                     "ITC is blocked for gifts to employees exceeding INR 50,000 "
                     "under Section 17(5)(h)."
                 ),
-                "audit_trace": build_trace(
-                    ITC_GIFT_THRESHOLD,
-                    "BLOCKED",
-                    {"expense_category": normalized_cat, "amount": decimal_text(parsed_amount)},
-                ),
-            }
+                audit_trace=build_trace(ITC_GIFT_THRESHOLD, "BLOCKED", inputs),
+            )
 
         # Blocked categories
-        if normalized_cat in self.blocked_categories:
-            return {
-                "verified": False,
-                "eligible_itc": "0",
-                "reason": (
+        if rule == "blocked":
+            return result(
+                verified=False,
+                eligible_itc="0",
+                reason=(
                     f"ITC is blocked for '{expense_category}' under Section 17(5) / VAT Rules."
                 ),
-                "audit_trace": build_trace(
-                    ITC_BLOCKED_17_5,
-                    "BLOCKED",
-                    {"expense_category": normalized_cat},
-                ),
-            }
+                audit_trace=build_trace(ITC_BLOCKED_17_5, "BLOCKED", inputs),
+            )
 
         # Personal consumption check (heuristic)
-        if "PERSONAL" in normalized_cat:
-            return {
-                "verified": False,
-                "eligible_itc": "0",
-                "reason": "ITC is blocked for personal consumption.",
-                "audit_trace": build_trace(
-                    ITC_PERSONAL_CONSUMPTION,
-                    "BLOCKED",
-                    {"expense_category": normalized_cat},
-                ),
-            }
-
-        return {
-            "verified": True,
-            "eligible_itc": decimal_text(parsed_tax_paid),
-            "note": "Expense appears eligible for Input Tax Credit.",
-            "unverified_category": True,
-            "audit_trace": build_trace(
+        if rule == "personal":
+            return result(
+                verified=False,
+                eligible_itc="0",
+                reason="ITC is blocked for personal consumption.",
+                audit_trace=build_trace(ITC_PERSONAL_CONSUMPTION, "BLOCKED", inputs),
+            )
+
+        return result(
+            verified=True,
+            eligible_itc=decimal_text(parsed_tax_paid),
+            note="Expense appears eligible for Input Tax Credit.",
+            unverified_category=True,
+            audit_trace=build_trace(
                 ITC_ELIGIBLE,
                 "ALLOWED",
                 {"expense_category": normalized_cat, "category_match": "default_allow"},
             ),
-        }
-
-    # GSTIN check-digit alphabet: digits 0-9 followed by A-Z (base 36).
-    _GSTIN_CODES = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-
-    @staticmethod
-    def _gstin_check_digit(first_14: str) -> str:
-        """
-        Compute the 15th GSTIN check character from the first 14 characters.
+        )
 
-        Algorithm (GSTN spec):
-          - Map each character to its index in [0-9A-Z] (base 36).
-          - Multiply by an alternating factor (1, 2, 1, 2, ... left to right).
-          - For each product, add (product // 36) + (product % 36) to a sum.
-          - check = (36 - (sum % 36)) % 36, mapped back to the alphabet.
-        """
-        total = 0
-        for index, char in enumerate(first_14):
-            value = InputCreditGuard._GSTIN_CODES.index(char)
-            factor = 1 if index % 2 == 0 else 2
-            product = value * factor
-            total += (product // 36) + (product % 36)
-        return InputCreditGuard._GSTIN_CODES[(36 - (total % 36)) % 36]
-
-    def verify_gstin_format(self, gstin: str) -> Dict[str, Any]:
+    def verify_gstin_format(self, gstin: str, compact: bool = False) -> Union[Dict[str, Any], GSTINResult]:
         """
         Deterministic GSTIN validation: structural format plus the 15th-digit
         checksum (base-36 GSTN algorithm).
 
         Format: 22AAAAA0000A1Z5 (15 chars). A string that matches the format but
         carries an incorrect check digit is rejected as a checksum failure.
+        With compact=True the result is a GSTINResult instead of a dict.
         """
-        pattern = r"^\d{2}[A-Z]{5}\d{4}[A-Z][1-9A-Z]Z[0-9A-Z]$"
-        if not re.match(pattern, gstin):
-            return {"verified": False, "error": "Invalid GSTIN format."}
+        result = GSTINResult if compact else dict
+        if _GSTIN_PATTERN(gstin) is None:
+            return result(verified=False, error="Invalid GSTIN format.")
 
         # Do not echo the correct check digit back to the caller: revealing it
         # would turn this validator into an oracle for fabricating GSTINs that
         # pass both format and checksum checks.
-        if gstin[14] != self._gstin_check_digit(gstin[:14]):
-            return {"verified": False, "error": "Invalid GSTIN checksum."}
+        if not _gstin_checksum_ok(gstin.encode("ascii")):
+            return result(verified=False, error="Invalid GSTIN checksum.")
 
-        return {"verified": True}
+        return result(verified=True)
+
+    def verify_gstin_batch(self, gstins: Iterable[Any]) -> List[int]:
+        """
+        Indices, in order, of the GSTINs that verify_gstin_format() rejects.
+
+        For vendor-master cleanups: no per-item dicts are built. Entries that
+        are not strings count as invalid. Like the single call, the result
+        says only which entries fail, never what the check digit should be.
+        """
+        match = _GSTIN_PATTERN
+        even, odd = _GSTIN_FOLDS
+        check = _GSTIN_CHECK
+        invalid = []
+        append = invalid.append
+        for index, gstin in enumerate(gstins):
+            if not isinstance(gstin, str) or match(gstin) is None:
+                append(index)
+                continue
+            raw = gstin.encode("ascii")
+            if raw[14] != check[sum(raw[0:14:2].translate(even)) + sum(raw[1:14:2].translate(odd))]:
+                append(index)
+        return invalid
 
     @staticmethod
-    def to_diagnostic(result: Dict[str, Any]) -> TaxDiagnosticResult:
+    def to_diagnostic(result: Mapping[str, Any]) -> TaxDiagnosticResult:
         """Convert a legacy verify_itc_eligibility() dict to TaxDiagnosticResult."""
         verified = result.get("verified", False)
         audit_trace = result.get("audit_trace")
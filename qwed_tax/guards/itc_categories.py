@@ -0,0 +1,281 @@
+"""
+Compiled expense-category index for InputCreditGuard.
+
+ERP feeds send free-form category strings ("Food & Beverage", "Team lunch -
+client", "F&B"). The index maps them to the guard's canonical categories
+using a mapping file (itc_categories.json next to this module):
+
+    {
+      "title": "...",
+      "source": "...",
+      "categories": [
+        {"code": "FOOD_AND_BEVERAGE", "rule": "blocked",
+         "aliases": ["F_B", "MEALS"], "keywords": ["LUNCH"], "substrings": []},
+        ...
+      ]
+    }
+
+A category string is normalized (upper case, every run of characters other
+than A-Z/0-9 becomes "_") and then matched in three ways:
+
+- code or alias: the whole normalized string, in a dict;
+- keyword: a whole "_"-delimited token sequence anywhere in the string
+  ("LUNCH" matches "TEAM_LUNCH_CLIENT", not "LUNCHBOX");
+- substring: anywhere in the string, across token boundaries.
+
+Exact hits win. All keywords compile into one Aho-Corasick automaton whose
+alphabet is tokens, so a lookup is one pass over the category's tokens, one
+dict step each: O(len(category)) however many categories and keywords the
+file declares. Substrings are tested with `in`, in file order; they are
+meant for a handful of legacy heuristics like PERSONAL, not for vocabulary.
+When several categories match, the one listed first in the file wins.
+Results are memoized per raw string (feeds repeat a small vocabulary), so a
+repeated category costs one dict lookup. rule
+is "blocked" (Section 17(5)), "gift_threshold" (blocked above INR 50,000)
+or "personal" (17(5)(g)).
+"""
+
+import json
+import re
+from collections import deque
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+CATEGORIES_FILE = Path(__file__).resolve().parent / "itc_categories.json"
+
+RULES = ("blocked", "gift_threshold", "personal")
+
+_TOKENS = re.compile(r"[0-9A-Z]+").findall
+_SUBSTRING = re.compile(r"[0-9A-Z_]+")
+_CATEGORY_KEYS = frozenset({"code", "rule", "aliases", "keywords", "substrings"})
+# classify() memo entries kept before the memo is emptied and refilled.
+_MEMO_SIZE = 4096
+
+
+def normalize_category(category: str) -> str:
+    """Upper-case category with every run of non-alphanumerics collapsed to "_"."""
+    return "_".join(_TOKENS(category.upper()))
+
+
+class CategoryMatch(NamedTuple):
+    """The canonical category an expense category string resolved to."""
+
+    code: str
+    rule: str
+    # How it matched: "code", "alias", "keyword" or "substring".
+    matched_by: str
+
+
+class _Automaton:
+    """
+    Aho-Corasick automaton over a fixed set of symbol sequences, completed
+    into a DFA: every state maps each pattern symbol straight to its next
+    state, and any other symbol leads back to the root. search() returns the
+    smallest label of any pattern occurring in a sequence, in one pass.
+    """
+
+    __slots__ = ("_delta", "_label")
+
+    def __init__(self, patterns: Mapping[Tuple[str, ...], int]):
+        goto: List[Dict[str, int]] = [{}]
+        label: List[int] = [-1]
+        for pattern, pattern_label in patterns.items():
+            state = 0
+            for symbol in pattern:
+                following = goto[state].get(symbol)
+                if following is None:
+                    following = goto[state][symbol] = len(goto)
+                    goto.append({})
+                    label.append(-1)
+                state = following
+            label[state] = pattern_label
+        # Breadth-first, so a state's failure target (which is shallower) is
+        # complete, labels of its own suffixes included, before it is used.
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            inherited = label[fail[state]]
+            if inherited >= 0 and (label[state] < 0 or inherited < label[state]):
+                label[state] = inherited
+            for symbol, following in goto[state].items():
+                fail[following] = delta[fail[state]].get(symbol, 0) if state else 0
+                queue.append(following)
+        self._delta = tuple(delta)
+        self._label = tuple(label)
+
+    def search(self, symbols: Iterable[str]) -> int:
+        """Smallest label found in symbols, or -1."""
+        delta, label = self._delta, self._label
+        state = 0
+        found = -1
+        for symbol in symbols:
+            state = delta[state].get(symbol, 0)
+            hit = label[state]
+            if hit >= 0 and (found < 0 or hit < found):
+                found = hit
+        return found
+
+
+def _strings(entry: Mapping[str, Any], key: str, code: str) -> List[str]:
+    values = entry.get(key, [])
+    if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+        raise ValueError(f"category {code!r}: {key} must be a list of strings")
+    return values
+
+
+class CategoryIndex:
+    """Exact codes and aliases in a dict, keywords and substrings in one automaton."""
+
+    def __init__(
+        self,
+        title: str,
+        source: str,
+        exact: Mapping[str, CategoryMatch],
+        matches: Tuple[CategoryMatch, ...],
+        automaton: _Automaton,
+        substrings: Tuple[Tuple[str, int], ...],
+        categories: Tuple[Mapping[str, Any], ...] = (),
+    ):
+        self.title = title
+        self.source = source
+        # The validated mapping-file entries, for with_blocked().
+        self._categories = categories
+        self._exact = exact
+        self._matches = matches
+        self._automaton = automaton
+        # (substring, label) in label order.
+        self._substrings = substrings
+        # Raw category string -> classify() result. Racing threads can only
+        # store the same value, and a full memo is simply emptied.
+        self._memo: Dict[str, Optional[CategoryMatch]] = {}
+        # Canonical code -> rule.
+        self.codes: Mapping[str, str] = MappingProxyType(
+            {match.code: match.rule for match in exact.values()}
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "CategoryIndex":
+        """Validate and compile a decoded mapping file. Raises ValueError."""
+        categories = data.get("categories")
+        if not isinstance(categories, list) or not categories:
+            raise ValueError("categories must be a non-empty list")
+        exact: Dict[str, CategoryMatch] = {}
+        matches: List[CategoryMatch] = []
+        keywords: Dict[Tuple[str, ...], int] = {}
+        substrings: Dict[str, int] = {}
+        for entry in categories:
+            if not isinstance(entry, dict) or not set(entry) <= _CATEGORY_KEYS:
+                raise ValueError(f"categories take only the keys {sorted(_CATEGORY_KEYS)}, got {entry!r}")
+            code, rule = entry.get("code"), entry.get("rule")
+            if not isinstance(code, str) or not code or normalize_category(code) != code:
+                raise ValueError(f"category code must be a normalized string, got {code!r}")
+            if rule not in RULES:
+                raise ValueError(f"category {code!r}: rule must be one of {RULES}, got {rule!r}")
+            names = [(code, "code")] + [
+                (normalize_category(alias), "alias") for alias in _strings(entry, "aliases", code)
+            ]
+            for name, matched_by in names:
+                if not name or name in exact:
+                    raise ValueError(f"category {code!r}: duplicate or empty code/alias {name!r}")
+                exact[name] = CategoryMatch(code, rule, matched_by)
+            # Labels follow file order, so the first category listed wins.
+            for key, matched_by in (("keywords", "keyword"), ("substrings", "substring")):
+                for text in _strings(entry, key, code):
+                    if matched_by == "keyword":
+                        pattern = normalize_category(text)
+                        if pattern:
+                            keywords.setdefault(tuple(pattern.split("_")), len(matches))
+                    else:
+                        pattern = text if _SUBSTRING.fullmatch(text) else ""
+                        if pattern:
+                            substrings.setdefault(pattern, len(matches))
+                    if not pattern:
+                        raise ValueError(f"category {code!r}: invalid {matched_by} {text!r}")
+                    matches.append(CategoryMatch(code, rule, matched_by))
+        return cls(
+            title=str(data.get("title", "")),
+            source=str(data.get("source", "")),
+            exact=exact,
+            matches=tuple(matches),
+            automaton=_Automaton(keywords),
+            substrings=tuple(substrings.items()),
+            categories=tuple(dict(entry) for entry in categories),
+        )
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> "CategoryIndex":
+        """Compile a mapping file; the shipped itc_categories.json by default."""
+        path = Path(path) if path is not None else CATEGORIES_FILE
+        try:
+            return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except ValueError as exc:
+            raise ValueError(f"{path.name}: {exc}") from exc
+
+    def with_blocked(self, codes: Iterable[str]) -> "CategoryIndex":
+        """
+        A copy of this index whose "blocked" categories are exactly codes.
+
+        Listed codes that are not categories yet are added as exact codes
+        (no aliases or keywords), and "personal" ones become "blocked".
+        "blocked" categories that are not listed are dropped together with
+        their aliases and keywords. "gift_threshold" categories are kept
+        either way, as the 50,000 INR test always applied to them.
+        """
+        blocked = set()
+        for code in codes:
+            normalized = normalize_category(code) if isinstance(code, str) else ""
+            if not normalized:
+                raise ValueError(f"blocked category must be a non-empty string, got {code!r}")
+            blocked.add(normalized)
+        categories: List[Dict[str, Any]] = []
+        for entry in self._categories:
+            if entry["rule"] == "blocked" and entry["code"] not in blocked:
+                continue
+            if entry["rule"] == "personal" and entry["code"] in blocked:
+                entry = {**entry, "rule": "blocked"}
+            categories.append(dict(entry))
+        known = {entry["code"] for entry in self._categories}
+        categories.extend({"code": code, "rule": "blocked"} for code in sorted(blocked - known))
+        return type(self).from_dict({"title": self.title, "source": self.source, "categories": categories})
+
+    def classify(self, category: str) -> Optional[CategoryMatch]:
+        """The category a free-form string resolves to, or None if nothing matches."""
+        memo = self._memo
+        try:
+            return memo[category]
+        except KeyError:
+            pass
+        match = self._classify(category)
+        if len(memo) >= _MEMO_SIZE:
+            memo.clear()
+        memo[category] = match
+        return match
+
+    def classify_many(self, categories: Iterable[str]) -> List[Optional[CategoryMatch]]:
+        """classify() over an expense report, in order."""
+        classify = self.classify
+        return [classify(category) for category in categories]
+
+    def _classify(self, category: str) -> Optional[CategoryMatch]:
+        upper = category.upper()
+        # Codes and aliases as most feeds send them need no tokenizing.
+        match = self._exact.get(upper.replace(" ", "_"))
+        if match is not None:
+            return match
+        tokens = _TOKENS(upper)
+        key = "_".join(tokens)
+        match = self._exact.get(key)
+        if match is not None:
+            return match
+        label = self._automaton.search(tokens)
+        for pattern, pattern_label in self._substrings:
+            if 0 <= label < pattern_label:
+                break
+            if pattern in key:
+                label = pattern_label
+                break
+        return self._matches[label] if label >= 0 else None
@@ -1,43 +1,50 @@
-from decimal import Decimal
-from typing import Dict, Any
+from typing import Any, Dict, Mapping, Union
 
+from qwed_tax import rules
 from qwed_tax.numeric import decimal_text, parse_decimal_input
+from qwed_tax.results import NexusResult
 
 class NexusGuard:
     """
     Deterministic Guard for Economic Nexus (Sales Tax) thresholds.
     Acts as a pre-filter for Avalara/Stripe Tax.
     """
-    def __init__(self):
-        # 2025 Economic Nexus Thresholds (Simplified High-Risk States)
-        # Source: Streamlined Sales Tax Governing Board
-        self.state_thresholds = {
-            "CA": {"amount": Decimal("500000"), "transactions": 0},
-            "NY": {"amount": Decimal("500000"), "transactions": 100},
-            "TX": {"amount": Decimal("500000"), "transactions": 0},
-            "FL": {"amount": Decimal("100000"), "transactions": 0},
-            "IL": {"amount": Decimal("100000"), "transactions": 200},
-            "PA": {"amount": Decimal("100000"), "transactions": 0},
-            "OH": {"amount": Decimal("100000"), "transactions": 200},
-            "GA": {"amount": Decimal("100000"), "transactions": 200},
-        }
+    @property
+    def state_thresholds(self) -> Mapping[str, Mapping[str, Any]]:
+        """Thresholds in force today (rule family "nexus", see qwed_tax.rules)."""
+        return rules.table("nexus")
 
-    def check_nexus_liability(self, state: str, ytd_sales: Any, transaction_count: int, llm_decision: str) -> Dict[str, Any]:
+    def check_nexus_liability(
+        self,
+        state: str,
+        ytd_sales: Any,
+        transaction_count: int,
+        llm_decision: str,
+        as_of: rules.AsOf = None,
+        compact: bool = False,
+    ) -> Union[Dict[str, Any], NexusResult]:
         """
         Verifies if the AI correctly identified that we need to pay tax in this state.
+        as_of (a date or ISO date, default today) selects the thresholds in force then.
+        With compact=True the result is a NexusResult instead of a dict.
         """
+        result = NexusResult if compact else dict
+        try:
+            thresholds = rules.table("nexus", as_of)
+        except ValueError as exc:
+            return result(verified=False, error=str(exc))
         state_code = state.upper()
-        if state_code not in self.state_thresholds:
-            return {
-                "verified": False,
-                "error": f"State {state_code} not in configured nexus threshold table. Cannot verify nexus liability — block pending rule configuration.",
-            }
+        threshold = thresholds.get(state_code)
+        if threshold is None:
+            return result(
+                verified=False,
+                error=f"State {state_code} not in configured nexus threshold table. Cannot verify nexus liability — block pending rule configuration.",
+            )
 
         try:
             parsed_sales = parse_decimal_input(ytd_sales, "ytd_sales")
         except ValueError as exc:
-            return {"verified": False, "error": str(exc)}
-        threshold = self.state_thresholds[state_code]
+            return result(verified=False, error=str(exc))
         
         # Check if threshold crossed
         amount_crossed = parsed_sales >= threshold["amount"]
@@ -56,9 +63,9 @@ class NexusGuard:
             if tx_crossed:
                 reason.append(f"Transactions {transaction_count} >= {threshold['transactions']}")
                 
-            return {
-                "verified": False,
-                "error": f"Nexus Violation: {state_code} threshold exceeded ({', '.join(reason)}). Tax collection is mandatory."
-            }
+            return result(
+                verified=False,
+                error=f"Nexus Violation: {state_code} threshold exceeded ({', '.join(reason)}). Tax collection is mandatory."
+            )
             
-        return {"verified": True}
+        return result(verified=True)
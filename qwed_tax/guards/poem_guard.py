@@ -1,9 +1,11 @@
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Union
 
 from qwed_tax.audit import POEM_CBDT_6_2017, POEM_SECTION_6_3, build_trace
 from qwed_tax.diagnostics import TaxDiagnosticResult
+from qwed_tax.money import divide, normalize, quantize
 from qwed_tax.numeric import decimal_text, parse_decimal_input
+from qwed_tax.results import ResidencyResult
 
 RATIO_SCALE = Decimal("0.0001")
 
@@ -25,9 +27,11 @@ class PoEMGuard:
                           employees_outside_india: int,
                           payroll_total: Any,
                           payroll_outside_india: Any,
-                          key_management_location: str) -> Dict[str, Any]:
+                          key_management_location: str,
+                          compact: bool = False) -> Union[Dict[str, Any], ResidencyResult]:
         """
         Determine if a foreign company is a Resident via PoEM.
+        With compact=True the result is a ResidencyResult instead of a dict.
         
         Rule (India):
         Foreign Company is Resident IF:
@@ -41,14 +45,15 @@ class PoEMGuard:
         AND
         3. Place of Effective Management is in India.
         """
+        result = ResidencyResult if compact else dict
         
         if not is_foreign_incorp:
-            return {
-                "verified": True,
-                "residency": "RESIDENT",
-                "reason": "Incorporated in India",
-                "audit_trace": build_trace(POEM_SECTION_6_3, "DOMESTIC_COMPANY", {"company_name": company_name}),
-            }
+            return result(
+                verified=True,
+                residency="RESIDENT",
+                reason="Incorporated in India",
+                audit_trace=build_trace(POEM_SECTION_6_3, "DOMESTIC_COMPANY", {"company_name": company_name}),
+            )
 
         parsed_values, error = self._parse_numeric_values(
             turnover_total,
@@ -59,17 +64,17 @@ class PoEMGuard:
             payroll_outside_india,
         )
         if error:
-            return error
+            return error if result is dict else result(**error)
 
         employee_error = self._validate_employee_counts(
             employees_total, employees_outside_india
         )
         if employee_error:
-            return employee_error
+            return employee_error if result is dict else result(**employee_error)
 
         value_error = self._validate_numeric_bounds(parsed_values)
         if value_error:
-            return value_error
+            return value_error if result is dict else result(**value_error)
 
         # ABOI Test Checks
         # Note: 'Passive Income' check requires P&L data, here we simplify to Asset/Emp ratios as critical proxy.
@@ -101,17 +106,17 @@ class PoEMGuard:
                 residency = "NON_RESIDENT" # Even if fails ABOI, if decisions taken outside, then Non-Resident.
                 reason = "Fails ABOI test BUT Key Management is Outside India."
 
-        return {
-            "verified": True,
-            "residency": residency,
-            "is_aboi": is_aboi,
-            "metrics": {
+        return result(
+            verified=True,
+            residency=residency,
+            is_aboi=is_aboi,
+            metrics={
                 "assets_outside_ratio": decimal_text(assets_ratio),
                 "employees_outside_ratio": decimal_text(emp_ratio),
                 "payroll_outside_ratio": decimal_text(payroll_ratio),
             },
-            "reason": reason,
-            "audit_trace": build_trace(
+            reason=reason,
+            audit_trace=build_trace(
                 POEM_CBDT_6_2017,
                 "RESIDENCY_DETERMINED",
                 {
@@ -123,10 +128,14 @@ class PoEMGuard:
                     "key_management_location": key_management_location,
                 },
             ),
-        }
+        )
+
+    def diagnose_residency(self, *args: Any, **kwargs: Any) -> TaxDiagnosticResult:
+        """determine_residency() as a TaxDiagnosticResult, without the intermediate dict."""
+        return self.to_diagnostic(self.determine_residency(*args, **kwargs, compact=True))
 
     @staticmethod
-    def to_diagnostic(result: Dict[str, Any]) -> TaxDiagnosticResult:
+    def to_diagnostic(result: Mapping[str, Any]) -> TaxDiagnosticResult:
         """Convert a legacy determine_residency() dict to TaxDiagnosticResult."""
         verified = result.get("verified", False)
         audit_trace = result.get("audit_trace")
@@ -225,17 +234,17 @@ class PoEMGuard:
         employees_outside_india: int,
     ) -> tuple[Decimal, Decimal, Decimal]:
         assets_ratio = (
-            values["assets_outside"] / values["assets_total"]
+            divide(values["assets_outside"], values["assets_total"])
             if values["assets_total"] > Decimal("0")
             else Decimal("0")
         )
         emp_ratio = (
-            Decimal(employees_outside_india) / Decimal(employees_total)
+            divide(Decimal(employees_outside_india), Decimal(employees_total))
             if employees_total > 0
             else Decimal("0")
         )
         payroll_ratio = (
-            values["payroll_outside"] / values["payroll_total"]
+            divide(values["payroll_outside"], values["payroll_total"])
             if values["payroll_total"] > Decimal("0")
             else Decimal("0")
         )
@@ -245,9 +254,9 @@ class PoEMGuard:
         self, assets_ratio: Decimal, emp_ratio: Decimal, payroll_ratio: Decimal
     ) -> tuple[Decimal, Decimal, Decimal]:
         return (
-            assets_ratio.quantize(RATIO_SCALE, rounding=ROUND_HALF_UP).normalize(),
-            emp_ratio.quantize(RATIO_SCALE, rounding=ROUND_HALF_UP).normalize(),
-            payroll_ratio.quantize(RATIO_SCALE, rounding=ROUND_HALF_UP).normalize(),
+            normalize(quantize(assets_ratio, RATIO_SCALE, ROUND_HALF_UP)),
+            normalize(quantize(emp_ratio, RATIO_SCALE, ROUND_HALF_UP)),
+            normalize(quantize(payroll_ratio, RATIO_SCALE, ROUND_HALF_UP)),
         )
 
     def _unverifiable(self, reason: str) -> Dict[str, Any]:
@@ -1,6 +1,7 @@
-from typing import Dict, Any
+from typing import Any, Dict, Union
 
 from qwed_tax.numeric import decimal_text, parse_decimal_input
+from qwed_tax.results import LoanComplianceResult
 
 class RelatedPartyGuard:
     """
@@ -8,10 +9,14 @@ class RelatedPartyGuard:
     Enforces Companies Act (e.g., India Sec 185, US SOX) restrictions on loans to directors.
     """
 
-    def verify_loan_compliance(self, lender_type: str, borrower_role: str, interest_rate: Any, market_rate: Any) -> Dict[str, Any]:
+    def verify_loan_compliance(
+        self, lender_type: str, borrower_role: str, interest_rate: Any, market_rate: Any, compact: bool = False
+    ) -> Union[Dict[str, Any], LoanComplianceResult]:
         """
         Deterministic verification of Loans to Directors (Section 185).
+        With compact=True the result is a LoanComplianceResult instead of a dict.
         """
+        result = LoanComplianceResult if compact else dict
         # Prohibited Roles (Companies Act 2013 Sec 185 / Generic Corporate Governance)
         prohibited_roles = ["DIRECTOR", "DIRECTOR_RELATIVE", "PARTNER", "PARTNER_OF_DIRECTOR", "HOLDING_COMPANY_DIRECTOR"]
         
@@ -21,31 +26,31 @@ class RelatedPartyGuard:
             parsed_interest_rate = parse_decimal_input(interest_rate, "interest_rate")
             parsed_market_rate = parse_decimal_input(market_rate, "market_rate")
         except ValueError as exc:
-            return {"verified": False, "risk": "INVALID_RATE_INPUT", "message": str(exc)}
+            return result(verified=False, risk="INVALID_RATE_INPUT", message=str(exc))
         
         # Rule 1: Absolute Prohibition (unless exempted)
         if any(role in borrower_clean for role in prohibited_roles):
             # Check Exemptions would go here (e.g. is_managing_director & employee_scheme)
             # For now, default to BLOCK high risk.
-            return {
-                "verified": False,
-                "risk": "SECTION_185_VIOLATION",
-                "message": (
+            return result(
+                verified=False,
+                risk="SECTION_185_VIOLATION",
+                message=(
                     f"{lender_clean} loans to {borrower_role} are prohibited under Section 185 "
                     "unless specific exemptions apply (MD/WTD + Employee Scheme)."
                 ),
-            }
+            )
             
         # Rule 2: Interest Rate Benchmarking (Section 186)
         # Corporate loans must yield at least Gov Security / Market Rate
         if parsed_interest_rate < parsed_market_rate:
-             return {
-                "verified": False,
-                "risk": "SECTION_186_VIOLATION",
-                "message": (
+             return result(
+                verified=False,
+                risk="SECTION_186_VIOLATION",
+                message=(
                     f"Interest rate {decimal_text(parsed_interest_rate)}% is below market yield "
                     f"{decimal_text(parsed_market_rate)}%. Must charge commercial rate."
                 ),
-            }
+            )
             
-        return {"verified": True, "note": "Loan compliance verified."}
+        return result(verified=True, note="Loan compliance verified.")
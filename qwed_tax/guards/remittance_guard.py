@@ -1,9 +1,12 @@
 from decimal import Decimal
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Union
 
+from qwed_tax import rules
 from qwed_tax.audit import FEMA_SCHEDULE_I, LRS_LIMIT, build_trace
 from qwed_tax.diagnostics import TaxDiagnosticResult
+from qwed_tax.money import add, multiply, subtract
 from qwed_tax.numeric import decimal_text, parse_decimal_input
+from qwed_tax.results import RemittanceResult
 
 class RemittanceGuard:
     """
@@ -11,63 +14,95 @@ class RemittanceGuard:
     Enforces Liberalised Remittance Scheme (LRS) limits and Tax Collected at Source (TCS).
     """
 
-    def verify_lrs_limit(self, amount_usd: Any, purpose: str, financial_year_usage: Any) -> Dict[str, Any]:
+    def verify_lrs_limit(
+        self,
+        amount_usd: Any,
+        purpose: str,
+        financial_year_usage: Any,
+        compact: bool = False,
+        as_of: rules.AsOf = None,
+    ) -> Union[Dict[str, Any], RemittanceResult]:
         """
         Verifies Liberalised Remittance Scheme (LRS) limits.
-        Returns a verification report dict and fails closed on invalid numeric inputs.
+        Returns a verification report dict (a RemittanceResult with
+        compact=True) and fails closed on invalid numeric inputs.
+        as_of (a date or ISO date, default today) selects the limit in force.
         Source: Audit Trace 3253e38e9d60
         """
-        limit = Decimal("250000") # $250k annual limit
+        result = RemittanceResult if compact else dict
+        try:
+            limit_rule = rules.table("lrs", as_of).get("ANNUAL_LIMIT")
+        except ValueError as exc:
+            return result(
+                verified=False,
+                error=f"BLOCKED: {exc}",
+                audit_trace=build_trace(LRS_LIMIT, "INVALID_INPUT", {"as_of": str(as_of)}),
+            )
+        if limit_rule is None:
+            return result(
+                verified=False,
+                error=f"BLOCKED: No LRS limit configured for {as_of}. Cannot verify — block pending rule configuration.",
+                audit_trace=build_trace(LRS_LIMIT, "NO_LIMIT_CONFIGURED", {"as_of": str(as_of)}),
+            )
+        limit = limit_rule["limit_usd"]
         try:
             current_txn = parse_decimal_input(amount_usd, "amount_usd")
             usage = parse_decimal_input(financial_year_usage, "financial_year_usage")
         except ValueError as exc:
-            return {
-                "verified": False,
-                "error": f"BLOCKED: {exc}",
-                "audit_trace": build_trace(LRS_LIMIT, "INVALID_INPUT", {"amount_usd": str(amount_usd), "financial_year_usage": str(financial_year_usage)}),
-            }
+            return result(
+                verified=False,
+                error=f"BLOCKED: {exc}",
+                audit_trace=build_trace(LRS_LIMIT, "INVALID_INPUT", {"amount_usd": str(amount_usd), "financial_year_usage": str(financial_year_usage)}),
+            )
 
         if current_txn < 0:
-            return {
-                "verified": False,
-                "error": "BLOCKED: Remittance amount must be non-negative.",
-                "audit_trace": build_trace(LRS_LIMIT, "NEGATIVE_AMOUNT", {"amount_usd": decimal_text(current_txn)}),
-            }
+            return result(
+                verified=False,
+                error="BLOCKED: Remittance amount must be non-negative.",
+                audit_trace=build_trace(LRS_LIMIT, "NEGATIVE_AMOUNT", {"amount_usd": decimal_text(current_txn)}),
+            )
         if usage < 0:
-            return {
-                "verified": False,
-                "error": "BLOCKED: Financial year usage must be non-negative.",
-                "audit_trace": build_trace(LRS_LIMIT, "NEGATIVE_USAGE", {"financial_year_usage": decimal_text(usage)}),
-            }
+            return result(
+                verified=False,
+                error="BLOCKED: Financial year usage must be non-negative.",
+                audit_trace=build_trace(LRS_LIMIT, "NEGATIVE_USAGE", {"financial_year_usage": decimal_text(usage)}),
+            )
         
         # 1. Prohibited Transactions Check (Schedule I)
         prohibited_purposes = ["GAMBLING", "LOTTERY", "RACING", "BANNED_MAGAZINES", "SWEEPSTAKES", "MARGIN_TRADING"]
         if any(p in purpose.upper() for p in prohibited_purposes):
-            return {
-                "verified": False,
-                "error": f"BLOCKED: Remittance for '{purpose}' is strictly prohibited under FEMA Schedule I.",
-                "audit_trace": build_trace(FEMA_SCHEDULE_I, "PROHIBITED", {"purpose": purpose}),
-            }
+            return result(
+                verified=False,
+                error=f"BLOCKED: Remittance for '{purpose}' is strictly prohibited under FEMA Schedule I.",
+                audit_trace=build_trace(FEMA_SCHEDULE_I, "PROHIBITED", {"purpose": purpose}),
+            )
 
         # 2. Limit Check
-        if (usage + current_txn) > limit:
-             return {
-                "verified": False,
-                 "error": (
-                     "BLOCKED: Transaction exceeds LRS limit ($250,000). "
-                     f"Remaining: ${decimal_text(limit - usage)}"
+        if add(usage, current_txn) > limit:
+             return result(
+                verified=False,
+                 error=(
+                     f"BLOCKED: Transaction exceeds LRS limit (${limit:,}). "
+                     f"Remaining: ${decimal_text(subtract(limit, usage))}"
                  ),
-                 "audit_trace": build_trace(LRS_LIMIT, "LIMIT_EXCEEDED", {"amount_usd": decimal_text(current_txn), "usage": decimal_text(usage), "limit": decimal_text(limit)}),
-             }
+                 audit_trace=build_trace(LRS_LIMIT, "LIMIT_EXCEEDED", {"amount_usd": decimal_text(current_txn), "usage": decimal_text(usage), "limit": decimal_text(limit)}),
+             )
             
-        return {
-            "verified": True,
-            "audit_trace": build_trace(LRS_LIMIT, "WITHIN_LIMIT", {"amount_usd": decimal_text(current_txn), "usage": decimal_text(usage), "limit": decimal_text(limit)}),
-        }
+        return result(
+            verified=True,
+            audit_trace=build_trace(LRS_LIMIT, "WITHIN_LIMIT", {"amount_usd": decimal_text(current_txn), "usage": decimal_text(usage), "limit": decimal_text(limit)}),
+        )
+
+    def diagnose_lrs_limit(
+        self, amount_usd: Any, purpose: str, financial_year_usage: Any, as_of: rules.AsOf = None
+    ) -> TaxDiagnosticResult:
+        """verify_lrs_limit() as a TaxDiagnosticResult, without the intermediate dict."""
+        return self.to_diagnostic(
+            self.verify_lrs_limit(amount_usd, purpose, financial_year_usage, compact=True, as_of=as_of)
+        )
 
     @staticmethod
-    def to_diagnostic(result: Dict[str, Any]) -> TaxDiagnosticResult:
+    def to_diagnostic(result: Mapping[str, Any]) -> TaxDiagnosticResult:
         """Convert a legacy verify_lrs_limit() dict to TaxDiagnosticResult."""
         verified = result.get("verified", False)
         audit_trace = result.get("audit_trace")
@@ -99,26 +134,32 @@ class RemittanceGuard:
             evidence=audit_trace,
         )
 
-    def calculate_tcs(self, amount_inr: Any, purpose: str, is_loan_funded: bool = False) -> Decimal:
+    def calculate_tcs(
+        self, amount_inr: Any, purpose: str, is_loan_funded: bool = False, as_of: rules.AsOf = None
+    ) -> Decimal:
         """
         Deterministically calculates Tax Collected at Source (TCS).
         Rule: Education (Loan) = 0.5%, Education (Self) = 5%, Other = 20%
-        Returns a Decimal and raises ValueError on invalid numeric input.
+        (5% before 2023-10-01), on the amount above the threshold; rates come
+        from rule family "tcs_lrs" as of as_of (default today).
+        Returns a Decimal and raises ValueError on invalid numeric input or
+        when no TCS rule is in force on as_of.
         """
         amt = parse_decimal_input(amount_inr, "amount_inr")
-        threshold = Decimal("700000") # 7 Lakhs exemption
-        
-        if amt <= threshold:
-            return Decimal("0")
-            
-        taxable_amount = amt - threshold
-        
+
         p = purpose.upper()
         if "EDUCATION" in p:
-            rate = Decimal("0.005") if is_loan_funded else Decimal("0.05")
+            key = "EDUCATION_LOAN" if is_loan_funded else "EDUCATION"
         elif "MEDICAL" in p:
-            rate = Decimal("0.05")
+            key = "MEDICAL"
         else:
-            rate = Decimal("0.20") # New 20% rule for tours/investments (Oct 1 2023)
-            
-        return taxable_amount * rate
+            key = "OTHER"
+        rule = rules.table("tcs_lrs", as_of).get(key)
+        if rule is None:
+            raise ValueError(f"No TCS rule for {key} in force on {as_of or 'today'}.")
+
+        threshold = rule["threshold"]
+        if amt <= threshold:
+            return Decimal("0")
+
+        return multiply(subtract(amt, threshold), rule["rate"])
@@ -1,8 +1,9 @@
-from typing import Dict, Any
+from typing import Any, Dict, Mapping, Union
 
 from qwed_tax.audit import SPECULATIVE_43_5, SPECULATIVE_SETOFF_73, build_trace
 from qwed_tax.diagnostics import TaxDiagnosticResult
 from qwed_tax.numeric import decimal_text, parse_decimal_input
+from qwed_tax.results import SpeculationResult
 
 class SpeculationGuard:
     """
@@ -10,92 +11,100 @@ class SpeculationGuard:
     Prevents 'Trapped Loss' errors where Speculative losses reduce Non-Speculative income.
     """
 
-    _KNOWN_SPECULATIVE = {"intraday"}
-    _KNOWN_NON_SPECULATIVE = {"f&o", "f_o", "futures", "options", "delivery", "business", "capital_gains", "capital gains"}
+    _KNOWN_SPECULATIVE = frozenset({"intraday"})
+    _KNOWN_NON_SPECULATIVE = frozenset({"f&o", "f_o", "futures", "options", "delivery", "business", "capital_gains", "capital gains"})
     _KNOWN_SOURCES = _KNOWN_SPECULATIVE | _KNOWN_NON_SPECULATIVE
 
-    def verify_setoff(self, loss_source: str, loss_amount: Any, profit_source: str) -> Dict[str, Any]:
+    def verify_setoff(
+        self, loss_source: str, loss_amount: Any, profit_source: str, compact: bool = False
+    ) -> Union[Dict[str, Any], SpeculationResult]:
         """
         Deterministic Rule: Speculative losses (Intraday) cannot be set off against 
         Non-Speculative income (F&O, Delivery).
         Intraday == Speculative.
         F&O == Non-Speculative (Business).
         Delivery == Capital Gains.
+        With compact=True the result is a SpeculationResult instead of a dict.
         """
+        result = SpeculationResult if compact else dict
         # Normalize inputs
         loss_source = loss_source.lower()
         profit_source = profit_source.lower()
         try:
             parsed_loss_amount = parse_decimal_input(loss_amount, "loss_amount")
         except ValueError as exc:
-            return {
-                "verified": False,
-                "error": str(exc),
-                "fix": "Provide a finite numeric loss amount.",
-                "audit_trace": build_trace(
+            return result(
+                verified=False,
+                error=str(exc),
+                fix="Provide a finite numeric loss amount.",
+                audit_trace=build_trace(
                     SPECULATIVE_43_5, "INVALID_INPUT", {"loss_source": loss_source, "loss_amount": str(loss_amount)}
                 ),
-            }
+            )
 
         # Classify sources against known vocabulary — reject unrecognized strings
         loss_class = self._classify_source(loss_source)
         profit_class = self._classify_source(profit_source)
 
         if loss_class == "unknown":
-            return {
-                "verified": False,
-                "error": f"Unrecognized loss source '{loss_source}'. Known sources: {', '.join(sorted(self._KNOWN_SOURCES))}.",
-                "fix": "Use one of the recognized trading source names.",
-                "audit_trace": build_trace(
+            return result(
+                verified=False,
+                error=f"Unrecognized loss source '{loss_source}'. Known sources: {', '.join(sorted(self._KNOWN_SOURCES))}.",
+                fix="Use one of the recognized trading source names.",
+                audit_trace=build_trace(
                     SPECULATIVE_43_5, "UNKNOWN_LOSS_SOURCE", {"loss_source": loss_source}
                 ),
-            }
+            )
         if profit_class == "unknown":
-            return {
-                "verified": False,
-                "error": f"Unrecognized profit source '{profit_source}'. Known sources: {', '.join(sorted(self._KNOWN_SOURCES))}.",
-                "fix": "Use one of the recognized trading source names.",
-                "audit_trace": build_trace(
+            return result(
+                verified=False,
+                error=f"Unrecognized profit source '{profit_source}'. Known sources: {', '.join(sorted(self._KNOWN_SOURCES))}.",
+                fix="Use one of the recognized trading source names.",
+                audit_trace=build_trace(
                     SPECULATIVE_43_5, "UNKNOWN_PROFIT_SOURCE", {"profit_source": profit_source}
                 ),
-            }
+            )
 
         is_speculative_loss = loss_class == "speculative"
         is_speculative_profit = profit_class == "speculative"
 
         # STRICT RULE: Intraday Loss can ONLY be set off against Intraday Profit.
         if is_speculative_loss and not is_speculative_profit:
-            return {
-                "verified": False,
-                "error": (
+            return result(
+                verified=False,
+                error=(
                     "Illegal Set-Off: Intraday (Speculative) loss of "
                     f"{decimal_text(parsed_loss_amount)} cannot reduce {profit_source}."
                 ),
-                "fix": (
+                fix=(
                     f"Loss of {decimal_text(parsed_loss_amount)} must be CARRIED FORWARD "
                     "(4 years). It cannot be consumed now."
                 ),
-                "audit_trace": build_trace(
+                audit_trace=build_trace(
                     SPECULATIVE_SETOFF_73,
                     "ILLEGAL_SETOFF",
                     {"loss_source": loss_source, "loss_amount": decimal_text(parsed_loss_amount), "profit_source": profit_source},
                 ),
-            }
+            )
 
-        return {
-            "verified": True,
-            "note": "Set-off allowed.",
-            "audit_trace": build_trace(
+        return result(
+            verified=True,
+            note="Set-off allowed.",
+            audit_trace=build_trace(
                 SPECULATIVE_43_5,
                 "SETOFF_ALLOWED",
                 {"loss_source": loss_source, "loss_amount": decimal_text(parsed_loss_amount), "profit_source": profit_source},
             ),
-        }
+        )
+
+    def diagnose_setoff(self, loss_source: str, loss_amount: Any, profit_source: str) -> TaxDiagnosticResult:
+        """verify_setoff() as a TaxDiagnosticResult, without the intermediate dict."""
+        return self.to_diagnostic(self.verify_setoff(loss_source, loss_amount, profit_source, compact=True))
 
     _UNVERIFIABLE_OUTCOMES: frozenset[str] = frozenset({"UNKNOWN_LOSS_SOURCE", "UNKNOWN_PROFIT_SOURCE"})
 
     @staticmethod
-    def to_diagnostic(result: Dict[str, Any]) -> TaxDiagnosticResult:
+    def to_diagnostic(result: Mapping[str, Any]) -> TaxDiagnosticResult:
         """Convert a legacy verify_setoff() dict to TaxDiagnosticResult."""
         verified = result.get("verified", False)
         audit_trace = result.get("audit_trace")
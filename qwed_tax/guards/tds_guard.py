@@ -1,62 +1,73 @@
-from decimal import Decimal
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Union
 
-from qwed_tax.audit import TDS_194C, TDS_194H, TDS_194I, TDS_194J, build_trace
+from qwed_tax import rules
+from qwed_tax.audit import build_trace
 from qwed_tax.diagnostics import TaxDiagnosticResult
+from qwed_tax.money import add, multiply, subtract
 from qwed_tax.numeric import decimal_text, parse_decimal_input
+from qwed_tax.results import TDSResult
 
 class TDSGuard:
     """
     Guard for Tax Deducted at Source (TDS) / Withholding Tax.
     Enforces deduction rates based on service type and thresholds.
     """
-    def __init__(self):
-        # 2025 TDS Thresholds & Rates (Simplified based on India Income Tax Act)
-        # Rates are strict Decimal to avoid float errors
-        self.tds_rules = {
-            "PROFESSIONAL_FEES": {"threshold": Decimal("30000"), "rate": Decimal("0.10"), "rule": TDS_194J},
-            "CONTRACTOR_INDIVIDUAL": {"threshold": Decimal("30000"), "rate": Decimal("0.01"), "rule": TDS_194C},
-            "CONTRACTOR_FIRM": {"threshold": Decimal("30000"), "rate": Decimal("0.02"), "rule": TDS_194C},
-            "COMMISSION": {"threshold": Decimal("15000"), "rate": Decimal("0.05"), "rule": TDS_194H},
-            "RENT_LAND": {"threshold": Decimal("240000"), "rate": Decimal("0.10"), "rule": TDS_194I},
-        }
+    @property
+    def tds_rules(self) -> Mapping[str, Mapping[str, Any]]:
+        """TDS thresholds and rates in force today (rule family "tds", see qwed_tax.rules)."""
+        return rules.table("tds")
 
-    def calculate_deduction(self, service_type: str, invoice_amount: Any, ytd_payment: Any) -> Dict[str, Any]:
+    def calculate_deduction(
+        self,
+        service_type: str,
+        invoice_amount: Any,
+        ytd_payment: Any,
+        compact: bool = False,
+        as_of: rules.AsOf = None,
+    ) -> Union[Dict[str, Any], TDSResult]:
         """
         Verifies if TDS must be deducted before paying the vendor.
+        With compact=True the result is a TDSResult instead of a dict.
+        as_of (a date or ISO date, default today) selects the rules in force
+        on that date, e.g. the invoice date when re-verifying a prior year.
         """
-        rule = self.tds_rules.get(service_type.upper().replace(" ", "_"))
+        result = TDSResult if compact else dict
+        try:
+            table = rules.table("tds", as_of)
+        except ValueError as exc:
+            return result(verified=False, error=str(exc))
+        rule = table.get(service_type.upper().replace(" ", "_"))
         if not rule:
-            return {
-                "verified": False,
-                "error": f"No TDS rule configured for service type '{service_type}'. Cannot verify — block pending rule configuration.",
-            }
+            return result(
+                verified=False,
+                error=f"No TDS rule configured for service type '{service_type}'. Cannot verify — block pending rule configuration.",
+            )
 
         try:
             inv_amt = parse_decimal_input(invoice_amount, "invoice_amount")
             ytd_amt = parse_decimal_input(ytd_payment, "ytd_payment")
         except ValueError as exc:
-            return {
-                "verified": False,
-                "error": str(exc),
-            }
+            return result(
+                verified=False,
+                error=str(exc),
+            )
         
-        total_exposure = inv_amt + ytd_amt
+        total_exposure = add(inv_amt, ytd_amt)
         threshold = rule["threshold"]
         
         # Logic: If total YTD exposure (including current invoice) crosses threshold, deduct TDS.
         # Usually TDS is on the entire amount once threshold is crossed, but for simplicity here
         # we apply to current invoice. In rigorous systems, we'd catch up previous undeducted too.
         if total_exposure > threshold:
-            deduction = inv_amt * rule["rate"]
-            return {
-                "verified": True,
-                "deduction": decimal_text(deduction),
-                "net_payable": decimal_text(inv_amt - deduction),
+            deduction = multiply(inv_amt, rule["rate"])
+            return result(
+                verified=True,
+                deduction=decimal_text(deduction),
+                net_payable=decimal_text(subtract(inv_amt, deduction)),
                 # Kept for backward compatibility; audit_trace carries the
                 # canonical statutory reference.
-                "section": service_type,
-                "audit_trace": build_trace(
+                section=service_type,
+                audit_trace=build_trace(
                     rule["rule"],
                     "DEDUCTION_REQUIRED",
                     {
@@ -65,13 +76,13 @@ class TDSGuard:
                         "threshold": decimal_text(threshold),
                     },
                 ),
-            }
+            )
 
-        return {
-            "verified": True,
-            "deduction": "0",
-            "net_payable": decimal_text(inv_amt),
-            "audit_trace": build_trace(
+        return result(
+            verified=True,
+            deduction="0",
+            net_payable=decimal_text(inv_amt),
+            audit_trace=build_trace(
                 rule["rule"],
                 "BELOW_THRESHOLD",
                 {
@@ -80,10 +91,18 @@ class TDSGuard:
                     "threshold": decimal_text(threshold),
                 },
             ),
-        }
+        )
+
+    def diagnose_deduction(
+        self, service_type: str, invoice_amount: Any, ytd_payment: Any, as_of: rules.AsOf = None
+    ) -> TaxDiagnosticResult:
+        """calculate_deduction() as a TaxDiagnosticResult, without the intermediate dict."""
+        return self.to_diagnostic(
+            self.calculate_deduction(service_type, invoice_amount, ytd_payment, compact=True, as_of=as_of)
+        )
 
     @staticmethod
-    def to_diagnostic(result: Dict[str, Any]) -> TaxDiagnosticResult:
+    def to_diagnostic(result: Mapping[str, Any]) -> TaxDiagnosticResult:
         """Convert a legacy calculate_deduction() dict to TaxDiagnosticResult.
 
         Backward-compatible migration helper. Guards that already produce
@@ -0,0 +1,351 @@
+"""
+Stateful TDS aggregation per vendor, section and financial year.
+
+TDSGuard.calculate_deduction() needs the caller to supply each vendor's
+year-to-date payments, and it deducts only on the invoice in hand. TDSLedger
+keeps those aggregates itself. Each (vendor, service type, financial year)
+gets a slot in compact array('q') columns:
+
+- amount paid, in paise;
+- TDS deducted, in millionths of a rupee (paise x a rate of up to four
+  decimal places is exact at that scale);
+- the ordinal date of the invoice that crossed the threshold, or 0.
+
+Each invoice updates its slot in O(1) with integer arithmetic. Invoices are
+matched to rules by their invoice date: the tds rule table in force that day
+supplies the threshold, rate and section, and the date also fixes the
+financial year (April to March). The result is resolved once per distinct
+(invoice date, service type), so a year of invoices compiles a few thousand
+rules at most.
+
+Deduction follows TDSGuard: nothing is deducted while the aggregate,
+including the current invoice, stays at or below the threshold. The invoice
+that takes it above the threshold is the crossing invoice. On that invoice
+the ledger also deducts TDS on the vendor's earlier, undeducted invoices of
+the year (the catch-up). After that, every invoice is taxed at its own rate.
+So for a crossing invoice, deduction - catch_up is exactly what
+calculate_deduction() returns. For any other invoice the two are equal.
+A catch-up can exceed the crossing invoice. The shortfall is then deducted
+from the next payments; this ledger only records the liability.
+
+Amounts must be whole paise and non-negative. Credit notes are out of
+scope. snapshot() / restore() persist the ledger in the compact binary
+form FicaLedger uses, so an AP service can snapshot periodically and resume
+mid-year without replaying invoices.
+"""
+
+import json
+import os
+import struct
+import sys
+from array import array
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .. import rules
+from ..audit import RuleRef
+from ..money import from_units, parse_units, units_at
+
+_SNAPSHOT_MAGIC = b"QWEDTDSL"
+_SNAPSHOT_VERSION = 1
+# magic, version, deduction exponent, key count, key table length (bytes)
+_SNAPSHOT_HEADER = struct.Struct("<8sHhQQ")
+
+_AMOUNT_EXPONENT = -2
+_RATE_EXPONENT = -4
+_DEDUCTION_EXPONENT = _AMOUNT_EXPONENT + _RATE_EXPONENT
+# Resolved (invoice date, service type) rules kept before the memo is emptied.
+_MEMO_SIZE = 4096
+
+# (service key, financial year, date ordinal, threshold paise, rate units, rule)
+_Rule = Tuple[str, int, int, int, int, RuleRef]
+
+
+class TDSDeduction(NamedTuple):
+    """The TDS due on one invoice."""
+
+    vendor: str
+    service_type: str
+    financial_year: str
+    deduction: Decimal
+    # The part of deduction on the vendor's earlier invoices of the year;
+    # non-zero only on the crossing invoice.
+    catch_up: Decimal
+    threshold_crossed: bool
+    rule: RuleRef
+
+
+class TDSPosition(NamedTuple):
+    """A vendor's aggregate for one service type and financial year."""
+
+    paid: Decimal
+    deducted: Decimal
+    crossed_on: Optional[date]
+
+
+def financial_year_label(start_year: int) -> str:
+    """The "2024-25" label of the financial year starting in April start_year."""
+    return f"{start_year}-{(start_year + 1) % 100:02d}"
+
+
+def _financial_year_start(financial_year: Union[int, str]) -> int:
+    if isinstance(financial_year, int) and not isinstance(financial_year, bool):
+        return financial_year
+    if isinstance(financial_year, str) and financial_year[:4].isdigit():
+        start = int(financial_year[:4])
+        if financial_year_label(start) == financial_year:
+            return start
+    raise ValueError(f"financial_year must be a start year or a label like '2024-25', got {financial_year!r}.")
+
+
+def _paise(value: Any) -> int:
+    paise = parse_units(value, _AMOUNT_EXPONENT, "invoice_amount")
+    if paise is None:
+        raise ValueError("invoice_amount must be a whole number of paise.")
+    if paise < 0:
+        raise ValueError("invoice_amount must not be negative.")
+    return paise
+
+
+class TDSLedger:
+    """
+    Per-vendor TDS aggregates, keyed by (vendor, service type, financial year).
+
+    Like FicaLedger, a ledger is mutable state: give each thread its own or
+    serialize access to it.
+    """
+
+    def __init__(self):
+        self._slots: Dict[Tuple[str, str, int], int] = {}
+        self._paid = array("q")
+        self._deducted = array("q")
+        self._crossed = array("q")
+        self._family: Optional[rules.RuleFamily] = None
+        self._memo: Dict[Tuple[Hashable, str], _Rule] = {}
+
+    def __len__(self) -> int:
+        return len(self._paid)
+
+    def _rules(self) -> Dict[Tuple[Hashable, str], _Rule]:
+        # Resolved rules belong to the registry they came from.
+        family = rules.default_registry().family("tds")
+        if family is not self._family:
+            self._family = family
+            self._memo = {}
+        return self._memo
+
+    def _resolve(self, invoice_date: Any, service_type: Any) -> _Rule:
+        memo = self._memo
+        key = (invoice_date, service_type)
+        try:
+            rule = memo.get(key)
+        except TypeError:
+            # Unhashable, so neither a date nor a string: rejected below.
+            rule = None
+        if rule is not None:
+            return rule
+        ordinal = rules.as_of_ordinal(invoice_date)
+        if not isinstance(service_type, str):
+            raise ValueError("service_type must be a string.")
+        service_key = service_type.upper().replace(" ", "_")
+        day = date.fromordinal(ordinal)
+        value = self._family.table(day).get(service_key)
+        if value is None:
+            raise ValueError(f"No TDS rule configured for service type '{service_type}' on {day.isoformat()}.")
+        threshold = units_at(value["threshold"], _AMOUNT_EXPONENT)
+        rate = units_at(value["rate"], _RATE_EXPONENT)
+        if threshold is None or rate is None:
+            raise ValueError(f"TDS rule for '{service_key}' is finer than paise or four-decimal rates.")
+        start_year = day.year if day.month >= 4 else day.year - 1
+        rule = (service_key, start_year, ordinal, threshold, rate, value["rule"])
+        if len(memo) >= _MEMO_SIZE:
+            memo.clear()
+        memo[key] = rule
+        return rule
+
+    def _slot(self, key: Tuple[str, str, int]) -> int:
+        if not isinstance(key[0], str) or not key[0]:
+            raise ValueError("vendor must be a non-empty string.")
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = len(self._paid)
+            self._paid.append(0)
+            self._deducted.append(0)
+            self._crossed.append(0)
+        return slot
+
+    def record(self, vendor: str, service_type: str, invoice_amount: Any, invoice_date: rules.AsOf) -> TDSDeduction:
+        """
+        Adds one invoice to the vendor's aggregate and returns the TDS due on
+        it. Raises ValueError (and records nothing) for an invalid amount,
+        date, vendor or a service type with no rule on invoice_date.
+        """
+        self._rules()
+        service_key, start_year, ordinal, threshold, rate, rule = self._resolve(invoice_date, service_type)
+        paise = _paise(invoice_amount)
+        slot = self._slot((vendor, service_key, start_year))
+        previous = self._paid[slot]
+        total = previous + paise
+        catch_up = 0
+        crossed = False
+        if self._crossed[slot]:
+            deduction = paise * rate
+        elif total > threshold:
+            catch_up = previous * rate
+            deduction = total * rate
+            crossed = True
+            self._crossed[slot] = ordinal
+        else:
+            deduction = 0
+        self._paid[slot] = total
+        self._deducted[slot] += deduction
+        return TDSDeduction(
+            vendor,
+            service_key,
+            financial_year_label(start_year),
+            from_units(deduction, _DEDUCTION_EXPONENT),
+            from_units(catch_up, _DEDUCTION_EXPONENT),
+            crossed,
+            rule,
+        )
+
+    def ingest(self, invoices: Iterable[Tuple[str, str, Any, rules.AsOf]]) -> List[Tuple[int, TDSDeduction]]:
+        """
+        Records a stream of (vendor, service_type, invoice_amount,
+        invoice_date) invoices, in order, and returns (index, TDSDeduction)
+        for the threshold-crossing invoices only, with index counting from 0
+        within this call. Other invoices are settled in integer units. Their
+        deductions accumulate in position(). Use record() when every invoice
+        needs its own TDSDeduction.
+
+        A call is applied atomically: if any invoice is invalid, ValueError
+        is raised and the ledger is unchanged. Its undo state is one entry
+        per aggregate touched, so a long stream can go in one call, though
+        a stream split into chunks (say, one per day) can be snapshotted
+        between them.
+        """
+        memo = self._rules()
+        resolve = self._resolve
+        slots = self._slots
+        paid, deducted, crossed_on = self._paid, self._deducted, self._crossed
+        known = len(paid)
+        undo: Dict[int, Tuple[int, int, int]] = {}
+        crossings: List[Tuple[int, TDSDeduction]] = []
+        try:
+            for index, (vendor, service_type, invoice_amount, invoice_date) in enumerate(invoices):
+                try:
+                    rule = memo.get((invoice_date, service_type))
+                except TypeError:
+                    rule = None
+                if rule is None:
+                    rule = resolve(invoice_date, service_type)
+                service_key, start_year, ordinal, threshold, rate, rule_ref = rule
+                paise = parse_units(invoice_amount, _AMOUNT_EXPONENT, "invoice_amount")
+                if paise is None or paise < 0:
+                    paise = _paise(invoice_amount)
+                key = (vendor, service_key, start_year)
+                try:
+                    slot = slots.get(key)
+                except TypeError:
+                    slot = None
+                if slot is None:
+                    slot = self._slot(key)
+                if slot < known and slot not in undo:
+                    undo[slot] = (paid[slot], deducted[slot], crossed_on[slot])
+                previous = paid[slot]
+                total = previous + paise
+                paid[slot] = total
+                if crossed_on[slot]:
+                    deducted[slot] += paise * rate
+                elif total > threshold:
+                    crossed_on[slot] = ordinal
+                    deducted[slot] += total * rate
+                    crossings.append((index, TDSDeduction(
+                        vendor,
+                        service_key,
+                        financial_year_label(start_year),
+                        from_units(total * rate, _DEDUCTION_EXPONENT),
+                        from_units(previous * rate, _DEDUCTION_EXPONENT),
+                        True,
+                        rule_ref,
+                    )))
+        except BaseException:
+            for slot, (was_paid, was_deducted, was_crossed) in undo.items():
+                paid[slot], deducted[slot], crossed_on[slot] = was_paid, was_deducted, was_crossed
+            if len(paid) > known:
+                del paid[known:], deducted[known:], crossed_on[known:]
+                self._slots = {k: s for k, s in slots.items() if s < known}
+            raise
+        return crossings
+
+    def position(self, vendor: str, service_type: str, financial_year: Union[int, str]) -> TDSPosition:
+        """Totals for one vendor, service type and financial year (zero if unknown)."""
+        key = (vendor, service_type.upper().replace(" ", "_"), _financial_year_start(financial_year))
+        slot = self._slots.get(key)
+        if slot is None:
+            return TDSPosition(from_units(0), from_units(0, _DEDUCTION_EXPONENT), None)
+        crossed = self._crossed[slot]
+        return TDSPosition(
+            from_units(self._paid[slot]),
+            from_units(self._deducted[slot], _DEDUCTION_EXPONENT),
+            date.fromordinal(crossed) if crossed else None,
+        )
+
+    def snapshot(self, path: "os.PathLike[str] | str") -> None:
+        """Writes the ledger to path atomically (temp file + rename)."""
+        keys: List[Optional[List[Any]]] = [None] * len(self._paid)
+        for (vendor, service_key, start_year), slot in self._slots.items():
+            keys[slot] = [vendor, service_key, start_year]
+        key_table = json.dumps(keys, ensure_ascii=False).encode("utf-8")
+        columns = [array("q", column) for column in (self._paid, self._deducted, self._crossed)]
+        if sys.byteorder != "little":
+            for column in columns:
+                column.byteswap()
+
+        tmp_path = f"{os.fspath(path)}.tmp"
+        with open(tmp_path, "wb") as fh:
+            fh.write(_SNAPSHOT_HEADER.pack(
+                _SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, _DEDUCTION_EXPONENT, len(self._paid), len(key_table)
+            ))
+            fh.write(key_table)
+            for column in columns:
+                column.tofile(fh)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def restore(cls, path: "os.PathLike[str] | str") -> "TDSLedger":
+        """
+        Loads a ledger written by snapshot(). Raises ValueError if the file is
+        not a TDSLedger snapshot or is truncated or corrupt.
+        """
+        with open(path, "rb") as fh:
+            header = fh.read(_SNAPSHOT_HEADER.size)
+            if len(header) != _SNAPSHOT_HEADER.size:
+                raise ValueError("Not a TDSLedger snapshot: file too short.")
+            magic, version, exponent, count, key_length = _SNAPSHOT_HEADER.unpack(header)
+            if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION or exponent != _DEDUCTION_EXPONENT:
+                raise ValueError("Not a TDSLedger snapshot (bad magic or unsupported version).")
+            key_table = fh.read(key_length)
+            columns = [array("q") for _ in range(3)]
+            try:
+                for column in columns:
+                    column.fromfile(fh, count)
+            except EOFError as exc:
+                raise ValueError("TDSLedger snapshot is truncated.") from exc
+            if len(key_table) != key_length or fh.read(1):
+                raise ValueError("TDSLedger snapshot is corrupt (unexpected length).")
+
+        keys = json.loads(key_table.decode("utf-8"))
+        if len(keys) != count:
+            raise ValueError("TDSLedger snapshot is corrupt (key table does not match values).")
+        if sys.byteorder != "little":
+            for column in columns:
+                column.byteswap()
+
+        ledger = cls()
+        ledger._paid, ledger._deducted, ledger._crossed = columns
+        ledger._slots = {tuple(key): slot for slot, key in enumerate(keys)}
+        return ledger
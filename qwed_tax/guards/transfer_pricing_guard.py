@@ -1,7 +1,9 @@
 from decimal import Decimal
-from typing import Any, Dict
+from typing import Any, Dict, Union
 
+from qwed_tax.money import add, divide, multiply, subtract
 from qwed_tax.numeric import decimal_text, parse_decimal_input
+from qwed_tax.results import ArmsLengthResult
 
 class TransferPricingGuard:
     """
@@ -13,7 +15,8 @@ class TransferPricingGuard:
                                transaction_price: Any, 
                                benchmark_price: Any, 
                                method: str = "CUP", 
-                               tolerance_percent: Any = Decimal("3.0")) -> Dict[str, Any]:
+                               tolerance_percent: Any = Decimal("3.0"),
+                               compact: bool = False) -> Union[Dict[str, Any], ArmsLengthResult]:
         """
         Verify if a transaction price is within the 'Arm's Length' range.
         
@@ -22,54 +25,56 @@ class TransferPricingGuard:
             benchmark_price: The Arm's Length Price (ALP) determined by analysis.
             method: Transfer Pricing Method used (e.g., CUP - Comparable Uncontrolled Price).
             tolerance_percent: Safe harbour tolerance (e.g., India allows 1% or 3%).
+            compact: Return an ArmsLengthResult instead of a dict.
         """
+        result = ArmsLengthResult if compact else dict
         try:
             tx_price = parse_decimal_input(transaction_price, "transaction_price")
             alp_price = parse_decimal_input(benchmark_price, "benchmark_price")
-            tolerance = parse_decimal_input(tolerance_percent, "tolerance_percent") / Decimal("100")
+            tolerance = divide(parse_decimal_input(tolerance_percent, "tolerance_percent"), Decimal("100"))
         except ValueError as exc:
-            return {
-                "verified": False,
-                "risk": "INVALID_NUMERIC_INPUT",
-                "message": str(exc),
-                "safe_harbour_range": [],
-                "potential_adjustment": "0",
-            }
+            return result(
+                verified=False,
+                risk="INVALID_NUMERIC_INPUT",
+                message=str(exc),
+                safe_harbour_range=[],
+                potential_adjustment="0",
+            )
         
         # Calculate Safe Harbour Range
         # Lower bound = ALP * (1 - tolerance)
         # Upper bound = ALP * (1 + tolerance)
         
-        lower_bound = alp_price * (Decimal("1") - tolerance)
-        upper_bound = alp_price * (Decimal("1") + tolerance)
+        lower_bound = multiply(alp_price, subtract(Decimal("1"), tolerance))
+        upper_bound = multiply(alp_price, add(Decimal("1"), tolerance))
         
         if lower_bound <= tx_price <= upper_bound:
-            return {
-                "verified": True,
-                "message": (
+            return result(
+                verified=True,
+                message=(
                     f"Transaction price {decimal_text(tx_price)} is within Safe Harbour range "
                     f"({decimal_text(lower_bound)} - {decimal_text(upper_bound)}) of ALP {decimal_text(alp_price)}."
                 ),
-                "safe_harbour_range": [decimal_text(lower_bound), decimal_text(upper_bound)],
-                "potential_adjustment": "0",
-            }
+                safe_harbour_range=[decimal_text(lower_bound), decimal_text(upper_bound)],
+                potential_adjustment="0",
+            )
         else:
             # Adjustment Required (Primary Adjustment)
             # Typically, tax authorities adjust TO the ALP, not the bound.
-            adjustment = alp_price - tx_price
+            adjustment = subtract(alp_price, tx_price)
             
             # Logic depends on whether it's income or expense. 
             # Assuming 'transaction_price' is Income received. 
             # If Expense paid, logic inverts. 
             # For simplicity in this guard, we flag deviation magnitude.
             
-            return {
-                "verified": False,
-                "risk": "TRANSFER_PRICING_ADJUSTMENT",
-                "message": (
+            return result(
+                verified=False,
+                risk="TRANSFER_PRICING_ADJUSTMENT",
+                message=(
                     f"Price {decimal_text(tx_price)} deviates from ALP {decimal_text(alp_price)} "
-                    f"beyond {decimal_text(tolerance * Decimal('100'))}% tolerance."
+                    f"beyond {decimal_text(multiply(tolerance, Decimal('100')))}% tolerance."
                 ),
-                "safe_harbour_range": [decimal_text(lower_bound), decimal_text(upper_bound)],
-                "potential_adjustment": decimal_text(adjustment),
-            }
+                safe_harbour_range=[decimal_text(lower_bound), decimal_text(upper_bound)],
+                potential_adjustment=decimal_text(adjustment),
+            )
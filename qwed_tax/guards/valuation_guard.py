@@ -1,8 +1,10 @@
 from decimal import Decimal, InvalidOperation, DivisionByZero
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Union
 
 from qwed_tax.audit import SAFE_CONVERSION, build_trace
 from qwed_tax.diagnostics import TaxDiagnosticResult
+from qwed_tax.money import divide, multiply, subtract
+from qwed_tax.results import ValuationResult
 
 class ValuationGuard:
     """
@@ -10,59 +12,67 @@ class ValuationGuard:
     Verifies Pre-Money vs Post-Money share price math.
     """
 
-    def verify_conversion(self, investment: str, cap: str, discount: str, next_round_price: str) -> Dict[str, Any]:
+    def verify_conversion(
+        self, investment: str, cap: str, discount: str, next_round_price: str, compact: bool = False
+    ) -> Union[Dict[str, Any], ValuationResult]:
         """
         Verifies share conversion price for startups.
         Math: Price = min(Cap_Price, Next_Round_Price * (1 - Discount))
+        With compact=True the result is a ValuationResult instead of a dict.
         """
+        result = ValuationResult if compact else dict
         try:
             d_cap = Decimal(cap)
             d_next = Decimal(next_round_price)
             d_disc = Decimal(discount)
             d_inv = Decimal(investment)
         except InvalidOperation:
-             return {
-                 "verified": False,
-                 "error": "Invalid numerical input for valuation.",
-                 "audit_trace": build_trace(SAFE_CONVERSION, "INVALID_INPUT", {"investment": investment, "cap": cap, "discount": discount, "next_round_price": next_round_price}),
-             }
+             return result(
+                 verified=False,
+                 error="Invalid numerical input for valuation.",
+                 audit_trace=build_trace(SAFE_CONVERSION, "INVALID_INPUT", {"investment": investment, "cap": cap, "discount": discount, "next_round_price": next_round_price}),
+             )
 
         if not (Decimal("0") <= d_disc < Decimal("1")):
-            return {
-                "verified": False,
-                "error": "Discount must be between 0 and 1.",
-                "audit_trace": build_trace(SAFE_CONVERSION, "INVALID_DISCOUNT", {"discount": discount}),
-            }
+            return result(
+                verified=False,
+                error="Discount must be between 0 and 1.",
+                audit_trace=build_trace(SAFE_CONVERSION, "INVALID_DISCOUNT", {"discount": discount}),
+            )
         if d_cap <= 0 or d_next <= 0 or d_inv <= 0:
-            return {
-                "verified": False,
-                "error": "Cap, next round price, and investment must be positive.",
-                "audit_trace": build_trace(SAFE_CONVERSION, "NON_POSITIVE_INPUT", {"cap": cap, "next_round_price": next_round_price, "investment": investment}),
-            }
+            return result(
+                verified=False,
+                error="Cap, next round price, and investment must be positive.",
+                audit_trace=build_trace(SAFE_CONVERSION, "NON_POSITIVE_INPUT", {"cap": cap, "next_round_price": next_round_price, "investment": investment}),
+            )
 
-        discounted_price = d_next * (1 - d_disc)
+        discounted_price = multiply(d_next, subtract(1, d_disc))
         final_price = min(d_cap, discounted_price)
         method = "CAP" if final_price == d_cap else "DISCOUNT"
 
         try:
-            shares = d_inv / final_price
+            shares = divide(d_inv, final_price)
         except (DivisionByZero, InvalidOperation):
-            return {
-                "verified": False,
-                "error": "Final price resolved to zero — cannot compute shares.",
-                "audit_trace": build_trace(SAFE_CONVERSION, "ZERO_PRICE", {"final_price": str(final_price)}),
-            }
+            return result(
+                verified=False,
+                error="Final price resolved to zero — cannot compute shares.",
+                audit_trace=build_trace(SAFE_CONVERSION, "ZERO_PRICE", {"final_price": str(final_price)}),
+            )
+
+        return result(
+            verified=True,
+            deterministic_price=str(final_price),
+            shares_issued=str(shares),
+            method=method,
+            audit_trace=build_trace(SAFE_CONVERSION, "CONVERSION_VERIFIED", {"investment": investment, "cap": cap, "discount": discount, "next_round_price": next_round_price, "final_price": str(final_price), "method": method}),
+        )
 
-        return {
-            "verified": True,
-            "deterministic_price": str(final_price),
-            "shares_issued": str(shares),
-            "method": method,
-            "audit_trace": build_trace(SAFE_CONVERSION, "CONVERSION_VERIFIED", {"investment": investment, "cap": cap, "discount": discount, "next_round_price": next_round_price, "final_price": str(final_price), "method": method}),
-        }
+    def diagnose_conversion(self, investment: str, cap: str, discount: str, next_round_price: str) -> TaxDiagnosticResult:
+        """verify_conversion() as a TaxDiagnosticResult, without the intermediate dict."""
+        return self.to_diagnostic(self.verify_conversion(investment, cap, discount, next_round_price, compact=True))
 
     @staticmethod
-    def to_diagnostic(result: Dict[str, Any]) -> TaxDiagnosticResult:
+    def to_diagnostic(result: Mapping[str, Any]) -> TaxDiagnosticResult:
         """Convert a legacy verify_conversion() dict to TaxDiagnosticResult."""
         verified = result.get("verified", False)
         audit_trace = result.get("audit_trace")
@@ -0,0 +1,282 @@
+"""
+Instrumentation hooks for the verification hot paths.
+
+A hook is any callable taking an Event. With no hook installed (the default)
+every instrumented site costs one tuple truth test. Once a hook is installed,
+events are emitted for:
+
+    kind="request"  TaxPreFlight.audit_transaction() / audit_batch() and
+                    QWEDTaxMiddleware.process_ai_payroll_request()
+    kind="guard"    each check a request runs (outcome "passed"/"blocked")
+    kind="parse"    parse_decimal_input() (name is the field)
+    kind="trace"    build_trace() (name is the rule_id, outcome the verdict)
+    kind="proof"    proof_ref hashing (cache hits on audit traces emit nothing)
+
+Events raised inside a guard check carry that check's action and name, so a
+parse or hash can be attributed to the request that caused it. A hook that
+raises is logged and otherwise ignored: instrumentation never changes a
+verdict.
+
+    collector = HistogramCollector()
+    with instrumented(collector):
+        TaxPreFlight().audit_transaction(intent)
+    collector.snapshot()
+
+Hooks are process-wide; worker processes (process-pool payroll runs, the
+async middleware with a ProcessPoolExecutor) need their own.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, Tuple
+
+_logger = logging.getLogger(__name__)
+
+
+class Event(NamedTuple):
+    kind: str
+    name: str
+    duration_ns: int
+    outcome: str
+    action: Optional[str] = None
+    check: Optional[str] = None
+
+
+Hook = Callable[[Event], None]
+
+# Installed hooks. Instrumented sites test this tuple directly; replace it
+# only through add_hook() / remove_hook().
+_hooks: Tuple[Hook, ...] = ()
+_hooks_lock = threading.Lock()
+
+_scope: ContextVar[Tuple[Optional[str], Optional[str]]] = ContextVar("qwed_tax_scope", default=(None, None))
+
+
+def add_hook(hook: Hook) -> None:
+    """Install a hook; events go to every installed hook in install order."""
+    global _hooks
+    if not callable(hook):
+        raise TypeError("hook must be callable with an Event.")
+    with _hooks_lock:
+        _hooks = (*_hooks, hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    """Uninstall a hook (one installation of it). Raises ValueError if absent."""
+    global _hooks
+    with _hooks_lock:
+        hooks = list(_hooks)
+        hooks.remove(hook)
+        _hooks = tuple(hooks)
+
+
+def enabled() -> bool:
+    return bool(_hooks)
+
+
+@contextmanager
+def instrumented(*hooks: Hook) -> Iterator[None]:
+    """Install hooks for the duration of a with block."""
+    installed = []
+    try:
+        for hook in hooks:
+            add_hook(hook)
+            installed.append(hook)
+        yield
+    finally:
+        for hook in reversed(installed):
+            remove_hook(hook)
+
+
+def enter_scope(action: Optional[str], check: Optional[str]) -> Token:
+    """Attribute events emitted from here on to action/check; undo with exit_scope()."""
+    return _scope.set((action, check))
+
+
+def exit_scope(token: Token) -> None:
+    _scope.reset(token)
+
+
+@contextmanager
+def scope(action: Optional[str], check: Optional[str]) -> Iterator[None]:
+    """Attribute events emitted inside the block to action/check."""
+    token = _scope.set((action, check))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+_clock = time.perf_counter_ns
+_new_event = tuple.__new__
+
+
+def emit(kind: str, name: str, started_ns: int, outcome: str, action: Optional[str] = None) -> None:
+    """Send an event that started at started_ns (perf_counter_ns) to every hook."""
+    duration_ns = _clock() - started_ns
+    scoped_action, check = _scope.get()
+    event = _new_event(Event, (kind, name, duration_ns, outcome, scoped_action if action is None else action, check))
+    for hook in _hooks:
+        try:
+            hook(event)
+        except Exception:
+            _logger.exception("Instrumentation hook %r failed", hook)
+
+
+def timed(kind: str, name: str, outcome: str, func: Callable[..., Any], *args: Any) -> Any:
+    """Call func(*args) and emit one event for it; outcome is "error" if it raises."""
+    started_ns = time.perf_counter_ns()
+    try:
+        result = func(*args)
+    except BaseException:
+        emit(kind, name, started_ns, "error")
+        raise
+    emit(kind, name, started_ns, outcome)
+    return result
+
+
+def _bucket(duration_ns: int) -> int:
+    """Log-linear bucket: exact below 8ns, then 4 buckets per power of two."""
+    if duration_ns < 8:
+        return max(duration_ns, 0)
+    shift = duration_ns.bit_length() - 3
+    return (shift << 2) + (duration_ns >> shift)
+
+
+def _bucket_upper(index: int) -> int:
+    if index < 8:
+        return index
+    shift, mantissa = (index >> 2) - 1, (index & 3) + 4
+    return ((mantissa + 1) << shift) - 1
+
+
+class _Histogram:
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "buckets", "outcomes")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.buckets: Dict[int, int] = {}
+        self.outcomes: Dict[str, int] = {}
+
+    def add(self, duration_ns: int, outcome: str) -> None:
+        if not self.count or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.count += 1
+        self.total_ns += duration_ns
+        bucket = _bucket(duration_ns)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+
+    def quantile(self, q: float) -> int:
+        rank = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(_bucket_upper(bucket), self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns // self.count,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "p50_ns": self.quantile(0.50),
+            "p90_ns": self.quantile(0.90),
+            "p99_ns": self.quantile(0.99),
+            "outcomes": dict(self.outcomes),
+        }
+
+
+class HistogramCollector:
+    """
+    In-process latency histograms, one per (kind, action, check, name).
+
+    Buckets are log-linear (four per power of two), so quantiles are upper
+    bounds within 25% of the true value and memory stays bounded however
+    many events are recorded. Thread-safe; install it with add_hook() or
+    instrumented().
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, Optional[str], Optional[str], str], _Histogram] = {}
+
+    def __call__(self, event: Event) -> None:
+        key = (event.kind, event.action, event.check, event.name)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram()
+            histogram.add(event.duration_ns, event.outcome)
+
+    def snapshot(self) -> Dict[Tuple[str, Optional[str], Optional[str], str], Dict[str, Any]]:
+        """{(kind, action, check, name): {count, total_ns, mean_ns, min_ns, max_ns, p50_ns, p90_ns, p99_ns, outcomes}}."""
+        with self._lock:
+            return {key: histogram.summary() for key, histogram in self._histograms.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def report(self) -> str:
+        """A plain-text table of the snapshot, slowest total first."""
+        rows = sorted(self.snapshot().items(), key=lambda item: -item[1]["total_ns"])
+        lines = [f"{'kind':8s} {'action':18s} {'check':26s} {'name':26s} {'count':>8s} {'p50 us':>9s} {'p99 us':>9s} {'total ms':>10s}"]
+        for (kind, action, check, name), stats in rows:
+            lines.append(
+                f"{kind:8s} {action or '-':18s} {check or '-':26s} {name:26s} {stats['count']:8d} "
+                f"{stats['p50_ns'] / 1e3:9.2f} {stats['p99_ns'] / 1e3:9.2f} {stats['total_ns'] / 1e6:10.2f}"
+            )
+        return "\n".join(lines)
+
+
+class OpenTelemetryHook:
+    """
+    Records events on an OpenTelemetry histogram instrument, in seconds.
+
+    Only the opentelemetry-api package is needed (pip install
+    "qwed-tax[otel]"). Without an SDK MeterProvider the API is a no-op; with
+    one, any reader works, including in-memory and console exporters, so no
+    running collector is required. Pass meter to use a specific provider;
+    otherwise opentelemetry.metrics.get_meter("qwed_tax") is used.
+
+    Attributes: qwed.kind, qwed.name, qwed.outcome and, when known,
+    qwed.action and qwed.check.
+    """
+
+    def __init__(self, meter: Any = None, name: str = "qwed_tax.duration") -> None:
+        if meter is None:
+            try:
+                from opentelemetry import metrics
+            except ImportError as exc:
+                raise ImportError(
+                    "OpenTelemetryHook requires opentelemetry-api. "
+                    'Install it with: pip install "qwed-tax[otel]"'
+                ) from exc
+            from . import __version__
+
+            meter = metrics.get_meter("qwed_tax", __version__)
+        self._histogram = meter.create_histogram(
+            name, unit="s", description="Duration of qwed_tax verification steps."
+        )
+
+    def __call__(self, event: Event) -> None:
+        attributes = {"qwed.kind": event.kind, "qwed.name": event.name, "qwed.outcome": event.outcome}
+        if event.action is not None:
+            attributes["qwed.action"] = event.action
+        if event.check is not None:
+            attributes["qwed.check"] = event.check
+        self._histogram.record(event.duration_ns / 1e9, attributes)
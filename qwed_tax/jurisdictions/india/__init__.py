@@ -1,5 +1,40 @@
-from .guards.crypto_guard import CryptoTaxGuard, AssetClass
-from .guards.investment_guard import InvestmentGuard, TransactionType
-from .guards.gst_guard import GSTGuard, EntityType, ServiceType
-from .guards.deposit_guard import DepositRateGuard
-from .guards.setoff_guard import InterHeadAdjustmentGuard, TaxHead
+import importlib
+from typing import TYPE_CHECKING
+
+# Resolved on first attribute access (PEP 562), like the qwed_tax package
+# exports: importing one India guard does not import the others.
+_LAZY_EXPORTS = {
+    "CryptoTaxGuard": ".guards.crypto_guard",
+    "AssetClass": ".guards.crypto_guard",
+    "InvestmentGuard": ".guards.investment_guard",
+    "TransactionType": ".guards.investment_guard",
+    "GSTGuard": ".guards.gst_guard",
+    "EntityType": ".guards.gst_guard",
+    "ServiceType": ".guards.gst_guard",
+    "DepositRateGuard": ".guards.deposit_guard",
+    "InterHeadAdjustmentGuard": ".guards.setoff_guard",
+    "TaxHead": ".guards.setoff_guard",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .guards.crypto_guard import CryptoTaxGuard, AssetClass
+    from .guards.investment_guard import InvestmentGuard, TransactionType
+    from .guards.gst_guard import GSTGuard, EntityType, ServiceType
+    from .guards.deposit_guard import DepositRateGuard
+    from .guards.setoff_guard import InterHeadAdjustmentGuard, TaxHead
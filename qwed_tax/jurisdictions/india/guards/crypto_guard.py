@@ -5,6 +5,7 @@ from pydantic import BaseModel
 
 from qwed_tax.audit import VDA_115BBH, VDA_SETOFF_PROHIBITION, build_trace
 from qwed_tax.diagnostics import TaxDiagnosticResult
+from qwed_tax.money import multiply, quantize
 
 class AssetClass(str, Enum):
     VDA = "VDA" # Virtual Digital Asset (Crypto/NFT)
@@ -85,8 +86,8 @@ class CryptoTaxGuard:
                 audit_trace=build_trace(VDA_115BBH, "NEGATIVE_INCOME", {"vda_income": str(vda_income)}),
             )
 
-        expected_tax = (vda_income * EXPECTED_RATE).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-        claimed_quantized = claimed_tax.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        expected_tax = quantize(multiply(vda_income, EXPECTED_RATE), Decimal("0.01"), ROUND_HALF_UP)
+        claimed_quantized = quantize(claimed_tax, Decimal("0.01"), ROUND_HALF_UP)
 
         if claimed_quantized == expected_tax:
              return TaxResult(
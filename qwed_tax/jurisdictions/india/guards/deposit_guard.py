@@ -1,6 +1,8 @@
 from decimal import Decimal
 from pydantic import BaseModel
 
+from qwed_tax.money import add
+
 class RateCheckResult(BaseModel):
     verified: bool
     expected_rate: Decimal
@@ -22,7 +24,7 @@ class DepositRateGuard:
         # Rule: Senior Citizens (60+) get extra interest
         is_senior = age >= 60
         if is_senior:
-            expected_rate += senior_premium
+            expected_rate = add(expected_rate, senior_premium)
             
         # We check for exact match because rates are strict policy
         if claimed_rate == expected_rate:
@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import Any, Callable, Dict, NamedTuple, Optional
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
 from decimal import Decimal
 
 from qwed_tax.audit import (
@@ -15,7 +16,15 @@ from qwed_tax.audit import (
     build_trace,
 )
 from qwed_tax.diagnostics import TaxDiagnosticResult
+from qwed_tax.money import absolute, divide, multiply, subtract
 from qwed_tax.numeric import decimal_text, parse_decimal_input
+from qwed_tax.results import (
+    GSTSplitErrorResult,
+    GSTSplitResult,
+    RCMCalculationResult,
+    RCMErrorResult,
+    RCMResult,
+)
 
 class EntityType(str, Enum):
     INDIVIDUAL = "INDIVIDUAL"
@@ -42,6 +51,40 @@ class RCMRule(NamedTuple):
     reason: str
     rule_ref: RuleRef
 
+
+class RCMDecision(NamedTuple):
+    """The outcome of _RCM_RULES for one service/provider/recipient combination."""
+
+    is_rcm: bool
+    reason: str
+    rule_ref: RuleRef
+
+
+# Raw value -> member. str-valued members hash and compare equal to their
+# values, so enum members hit the same entries.
+_SERVICE_TYPES: Dict[str, ServiceType] = {m.value: m for m in ServiceType}
+_ENTITY_TYPES: Dict[str, EntityType] = {m.value: m for m in EntityType}
+
+
+def _member(members: Mapping[str, Any], value: Any) -> Any:
+    """Enum member for an enum or its raw value, else None (same as _try_coerce)."""
+    return members.get(value) if isinstance(value, str) else None
+
+
+def _materialize(template: Dict[str, Any]) -> Dict[str, Any]:
+    """A caller-owned copy of a precomputed RCM response; the trace is immutable and shared."""
+    return dict(template)
+
+
+def _compact_rcm(response: Mapping[str, Any]) -> RCMResult:
+    """An RCM response as the RCMResult layout with the same key order."""
+    if "computed_only" in response:
+        return RCMCalculationResult(**response)
+    if "liability" in response:
+        return RCMResult(**response)
+    return RCMErrorResult(**response)
+
+
 class GSTGuard:
     """
     Verifies GST Liability: Forward Charge (FCM) vs Reverse Charge (RCM).
@@ -55,8 +98,9 @@ class GSTGuard:
     # services (Notification 13/2017-CT(R) etc.). Section 9(4) (unregistered
     # supplier) is intentionally out of scope; IMPORT_SERVICE here is the
     # IGST-notification reverse charge (Notification 10/2017-IT(R)), not a 9(4)
-    # path.
-    _RCM_RULES: Dict["ServiceType", RCMRule] = {
+    # path. Read-only; subclasses override it wholesale and the copy is
+    # frozen when the class is compiled.
+    _RCM_RULES: Mapping["ServiceType", RCMRule] = MappingProxyType({
         ServiceType.GTA: RCMRule(
             applies=lambda provider, recipient: recipient
             in (EntityType.BODY_CORPORATE, EntityType.PARTNERSHIP),
@@ -97,7 +141,50 @@ class GSTGuard:
             reason="Import of service: the recipient in India is liable under RCM.",
             rule_ref=RCM_IMPORT_SERVICE,
         ),
-    }
+    })
+
+    # Compiled from _RCM_RULES once per class (see _compile_rcm_matrix).
+    # _RCM_DECISIONS: (service, provider, recipient) -> RCMDecision.
+    # _RCM_MATRIX: (service, provider, recipient, claimed_is_rcm) -> response
+    # template, for claimed_is_rcm in (None, False, True).
+    _RCM_DECISIONS: ClassVar[Mapping[Tuple[ServiceType, EntityType, EntityType], RCMDecision]]
+    _RCM_MATRIX: ClassVar[Mapping[Tuple[ServiceType, EntityType, EntityType, Optional[bool]], Dict[str, Any]]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._compile_rcm_matrix()
+
+    @classmethod
+    def _compile_rcm_matrix(cls) -> None:
+        """
+        Evaluate _RCM_RULES over every service/provider/recipient combination
+        (|ServiceType| x |EntityType|^2 = 128 cells) and store the finished
+        response, audit trace included, for each claim mode. Calls then cost
+        a dict lookup and a shallow copy instead of predicate evaluation and
+        build_trace().
+        """
+        if not isinstance(cls._RCM_RULES, MappingProxyType):
+            cls._RCM_RULES = MappingProxyType(dict(cls._RCM_RULES))
+        guard = cls.__new__(cls)
+        decisions = {}
+        matrix = {}
+        for service in ServiceType:
+            rule = cls._RCM_RULES.get(service)
+            for provider in EntityType:
+                for recipient in EntityType:
+                    cell = (service, provider, recipient)
+                    if rule and rule.applies(provider, recipient):
+                        decision = RCMDecision(True, rule.reason, rule.rule_ref)
+                    else:
+                        decision = RCMDecision(False, "Forward Charge (Provider pays)", RCM_NOT_APPLICABLE)
+                    decisions[cell] = decision
+                    matrix[(*cell, None)] = guard._build_calculation_response(*decision, *cell)
+                    for claimed in (False, True):
+                        matrix[(*cell, claimed)] = guard._build_verification_response(
+                            decision.is_rcm, claimed, decision.reason, decision.rule_ref, *cell
+                        )
+        cls._RCM_DECISIONS = MappingProxyType(decisions)
+        cls._RCM_MATRIX = MappingProxyType(matrix)
 
     def verify_rcm_applicability(
         self,
@@ -105,7 +192,8 @@ class GSTGuard:
         provider: EntityType,
         recipient: EntityType,
         claimed_is_rcm: Optional[bool] = None,
-    ) -> dict:
+        compact: bool = False,
+    ) -> Union[Dict[str, Any], RCMResult]:
         """
         Determine who is liable to pay tax (forward charge vs reverse charge).
 
@@ -116,50 +204,88 @@ class GSTGuard:
         liability against the claim and returns verified=True only on exact match
         (verification mode). When omitted, returns a computed result with
         computed_only=True (calculation mode — backward compatible).
+
+        With compact=True the result is an RCMResult instead of a dict; its
+        layout subclass keeps the key order of the dict it replaces.
         """
         # Fail-closed on unknown service/entity — no silent coercion to defaults
-        service_coerced = self._try_coerce(ServiceType, service)
-        if service_coerced is None:
-            return {
-                "verified": False,
-                "error": f"Unknown service type '{service}'. Cannot determine RCM applicability.",
-                "is_rcm": None,
-            }
-        provider_coerced = self._try_coerce(EntityType, provider)
-        if provider_coerced is None:
-            return {
-                "verified": False,
-                "error": f"Unknown provider entity type '{provider}'. Cannot determine RCM applicability.",
-                "is_rcm": None,
-            }
-        recipient_coerced = self._try_coerce(EntityType, recipient)
-        if recipient_coerced is None:
-            return {
-                "verified": False,
-                "error": f"Unknown recipient entity type '{recipient}'. Cannot determine RCM applicability.",
-                "is_rcm": None,
-            }
+        service_member = _member(_SERVICE_TYPES, service)
+        provider_member = _member(_ENTITY_TYPES, provider)
+        recipient_member = _member(_ENTITY_TYPES, recipient)
+        if service_member is None or provider_member is None or recipient_member is None:
+            response = self._unknown_type_response(service, provider, recipient, service_member, provider_member)
+            return _compact_rcm(response) if compact else response
+
+        cell = (service_member, provider_member, recipient_member)
+        if claimed_is_rcm is not None and not isinstance(claimed_is_rcm, bool):
+            decision = self._RCM_DECISIONS[cell]
+            response = self._build_verification_response(
+                decision.is_rcm, claimed_is_rcm, decision.reason, decision.rule_ref, *cell
+            )
+            return _compact_rcm(response) if compact else response
 
-        service = service_coerced
-        provider = provider_coerced
-        recipient = recipient_coerced
+        template = self._RCM_MATRIX[(*cell, claimed_is_rcm)]
+        return _compact_rcm(template) if compact else _materialize(template)
 
-        rule = self._RCM_RULES.get(service)
-        is_rcm = bool(rule and rule.applies(provider, recipient))
+    def diagnose_rcm_applicability(
+        self,
+        service: ServiceType,
+        provider: EntityType,
+        recipient: EntityType,
+        claimed_is_rcm: Optional[bool] = None,
+    ) -> TaxDiagnosticResult:
+        """verify_rcm_applicability() as a TaxDiagnosticResult, without the intermediate dict."""
+        return self.to_diagnostic(
+            self.verify_rcm_applicability(service, provider, recipient, claimed_is_rcm, compact=True)
+        )
 
-        if is_rcm:
-            reason = rule.reason
-            rule_ref = rule.rule_ref
-        else:
-            reason = "Forward Charge (Provider pays)"
-            rule_ref = RCM_NOT_APPLICABLE
+    def verify_rcm_batch(
+        self, invoices: Iterable[Any], compact: bool = False
+    ) -> List[Union[Dict[str, Any], RCMResult]]:
+        """
+        verify_rcm_applicability() over an invoice ledger, in input order.
 
-        # Verification mode: compare computed RCM against claimed RCM
-        if claimed_is_rcm is not None:
-            return self._build_verification_response(is_rcm, claimed_is_rcm, reason, rule_ref, service, provider, recipient)
+        Each invoice is a (service, provider, recipient[, claimed_is_rcm])
+        tuple or a mapping with those keys (claimed_is_rcm optional). Every
+        result is identical to the corresponding single call (RCMResult
+        objects with compact=True).
+        """
+        materialize = _compact_rcm if compact else _materialize
+        matrix = self._RCM_MATRIX
+        services = _SERVICE_TYPES
+        entities = _ENTITY_TYPES
+        results = []
+        append = results.append
+        for invoice in invoices:
+            if isinstance(invoice, (tuple, list)):
+                service, provider, recipient, claimed = invoice if len(invoice) == 4 else (*invoice, None)
+            else:
+                service = invoice.get("service")
+                provider = invoice.get("provider")
+                recipient = invoice.get("recipient")
+                claimed = invoice.get("claimed_is_rcm")
+            template = None
+            # Only hashable raw values can hit the matrix; anything else takes
+            # the single-call path and gets its fail-closed response there.
+            if isinstance(service, str) and isinstance(provider, str) and isinstance(recipient, str) and (
+                claimed is None or claimed is True or claimed is False
+            ):
+                template = matrix.get((services.get(service), entities.get(provider), entities.get(recipient), claimed))
+            if template is None:
+                append(self.verify_rcm_applicability(service, provider, recipient, claimed, compact))
+            else:
+                append(materialize(template))
+        return results
 
-        # Calculation mode (backward compatible) — computed, not verified against a claim
-        return self._build_calculation_response(is_rcm, reason, rule_ref, service, provider, recipient)
+    @staticmethod
+    def _unknown_type_response(service, provider, recipient, service_member, provider_member) -> dict:
+        if service_member is None:
+            error = f"Unknown service type '{service}'. Cannot determine RCM applicability."
+        elif provider_member is None:
+            error = f"Unknown provider entity type '{provider}'. Cannot determine RCM applicability."
+        else:
+            error = f"Unknown recipient entity type '{recipient}'. Cannot determine RCM applicability."
+        return {"verified": False, "error": error, "is_rcm": None}
 
     def _build_verification_response(
         self,
@@ -230,7 +356,7 @@ class GSTGuard:
         }
 
     @staticmethod
-    def to_diagnostic(result: Dict[str, Any]) -> TaxDiagnosticResult:
+    def to_diagnostic(result: Mapping[str, Any]) -> TaxDiagnosticResult:
         """Convert a legacy verify_rcm_applicability() dict to TaxDiagnosticResult."""
         verified = result.get("verified", False)
         audit_trace = result.get("audit_trace")
@@ -323,7 +449,7 @@ class GSTGuard:
     def _expected_split(total_tax: Decimal, is_interstate: bool) -> Dict[str, Decimal]:
         if is_interstate:
             return {"cgst": Decimal("0"), "sgst": Decimal("0"), "igst": total_tax}
-        half = total_tax / Decimal("2")
+        half = divide(total_tax, Decimal("2"))
         return {"cgst": half, "sgst": half, "igst": Decimal("0")}
 
     @staticmethod
@@ -346,7 +472,7 @@ class GSTGuard:
         """
         if expected == 0:
             return claimed != 0
-        return abs(claimed - expected) > cls._SPLIT_TOLERANCE
+        return absolute(subtract(claimed, expected)) > cls._SPLIT_TOLERANCE
 
     def verify_gst_split(
         self,
@@ -357,7 +483,8 @@ class GSTGuard:
         claimed_cgst: Any,
         claimed_sgst: Any,
         claimed_igst: Any,
-    ) -> Dict[str, Any]:
+        compact: bool = False,
+    ) -> Union[Dict[str, Any], GSTSplitResult]:
         """
         Verify that a claimed CGST/SGST/IGST breakup matches the supply type.
 
@@ -369,11 +496,14 @@ class GSTGuard:
 
         This verifies the *split*, not the rate itself (rate is an input).
         Fails closed on missing states or non-finite/negative numeric inputs.
+        With compact=True the result is a GSTSplitResult instead of a dict.
         """
+        result = GSTSplitResult if compact else dict
+        failure = GSTSplitErrorResult if compact else dict
         if not isinstance(supplier_state, str) or not supplier_state.strip():
-            return {"verified": False, "error": "supplier_state is required."}
+            return failure(verified=False, error="supplier_state is required.")
         if not isinstance(place_of_supply, str) or not place_of_supply.strip():
-            return {"verified": False, "error": "place_of_supply is required."}
+            return failure(verified=False, error="place_of_supply is required.")
 
         try:
             parsed = self._parse_split_inputs(
@@ -386,9 +516,9 @@ class GSTGuard:
                 }
             )
         except ValueError as exc:
-            return {"verified": False, "error": str(exc)}
+            return failure(verified=False, error=str(exc))
 
-        total_tax = parsed["taxable_value"] * parsed["gst_rate"] / Decimal("100")
+        total_tax = divide(multiply(parsed["taxable_value"], parsed["gst_rate"]), Decimal("100"))
         is_interstate = (
             supplier_state.strip().upper() != place_of_supply.strip().upper()
         )
@@ -405,25 +535,48 @@ class GSTGuard:
             if self._leg_mismatch(claimed[leg], expected[leg])
         ]
 
-        result = {
-            "supply_type": "INTER_STATE" if is_interstate else "INTRA_STATE",
-            "expected": {leg: decimal_text(amount) for leg, amount in expected.items()},
-            "claimed": {leg: decimal_text(amount) for leg, amount in claimed.items()},
-        }
+        supply_type = "INTER_STATE" if is_interstate else "INTRA_STATE"
+        expected_text = {leg: decimal_text(amount) for leg, amount in expected.items()}
+        claimed_text = {leg: decimal_text(amount) for leg, amount in claimed.items()}
 
         if mismatches:
             reason = (
-                f"GST split mismatch on {result['supply_type']} supply "
+                f"GST split mismatch on {supply_type} supply "
                 f"({', '.join(mismatches)})."
             )
             note = self._wrong_type_note(is_interstate, claimed)
             if note:
                 reason = f"{reason} {note}."
-            result["verified"] = False
-            result["error"] = reason
-            return result
+            return result(
+                supply_type=supply_type,
+                expected=expected_text,
+                claimed=claimed_text,
+                verified=False,
+                error=reason,
+            )
+
+        return result(supply_type=supply_type, expected=expected_text, claimed=claimed_text, verified=True)
+
+    def verify_gst_split_register(self, table: Any) -> List[Dict[str, Any]]:
+        """
+        verify_gst_split() over a whole invoice register, returning only the
+        rows that fail, in row order.
+
+        table is columnar: a dict of lists/arrays, a NumPy structured array or
+        an Arrow-like table (columns with to_numpy()), with one column per
+        verify_gst_split() argument (supplier_state, place_of_supply,
+        taxable_value, gst_rate, claimed_cgst, claimed_sgst, claimed_igst).
+        Amounts are in rupees, as for verify_gst_split().
+
+        Each failing row is reported as {"row": index, **verify_gst_split(...)}
+        for that row, so reasons and expected legs are identical to the
+        single-invoice call. Legs are checked in integer paise with the same
+        0.02 tolerance; see gst_register for the exact arithmetic.
+        Requires NumPy (the ``fast`` extra).
+        """
+        from .gst_register import verify_register
 
-        result["verified"] = True
-        return result
+        return verify_register(self, table)
 
 
+GSTGuard._compile_rcm_matrix()
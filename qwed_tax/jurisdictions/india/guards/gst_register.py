@@ -0,0 +1,178 @@
+"""
+Vectorized CGST/SGST/IGST split verification for whole invoice registers.
+
+Backs GSTGuard.verify_gst_split_register(). Amounts are converted to integer
+paise and the GST rate to hundredths of a percent, so with
+T = taxable_paise * rate_hundredths the expected legs are exact rationals:
+
+    intra-state: CGST = SGST = T / 20000 paise, IGST = 0
+    inter-state: IGST = T / 10000 paise, CGST = SGST = 0
+
+and the 0.02 (2 paise) tolerance test |claimed - expected| > 2 becomes
+|20000 * claimed - T| > 40000 (or |20000 * claimed - 2T| > 40000 for IGST),
+all in int64 with no rounding. Legs that must be zero get no tolerance.
+
+Rows the integer form cannot represent exactly (sub-paise amounts, rates
+with more than two decimals, non-finite, negative or oversized values,
+missing states) are verified by verify_gst_split() itself, as are the
+mismatches found, so every reported row carries exactly the reasons the
+single-invoice call gives.
+
+Requires NumPy (pip install "qwed-tax[fast]").
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - exercised only without numpy
+    raise ImportError(
+        "GSTGuard.verify_gst_split_register requires NumPy. "
+        'Install it with: pip install "qwed-tax[fast]"'
+    ) from exc
+
+from ....numeric import decimal_to_cents, parse_decimal_input
+
+if TYPE_CHECKING:
+    from .gst_guard import GSTGuard
+
+COLUMNS = (
+    "supplier_state",
+    "place_of_supply",
+    "taxable_value",
+    "gst_rate",
+    "claimed_cgst",
+    "claimed_sgst",
+    "claimed_igst",
+)
+
+# Bounds (in hundredths) that keep every intermediate below 2**63:
+# T <= 2**62 // 40000 * 10000 and |20000 * claimed - 2T| < 2**63.
+_AMOUNT_LIMIT = 2**62 // 40000
+_RATE_LIMIT = 100_00
+
+
+def _column(table: Any, name: str) -> np.ndarray:
+    """One column as a 1-D array from a dict of sequences, structured array or Arrow-like table."""
+    try:
+        column = table[name]
+    except (KeyError, IndexError, ValueError) as exc:
+        raise ValueError(f"GST register is missing column {name!r}.") from exc
+    if hasattr(column, "to_numpy"):  # pyarrow arrays / chunked arrays, pandas series
+        try:
+            column = column.to_numpy(zero_copy_only=False)
+        except TypeError:
+            column = column.to_numpy()
+    column = np.asarray(column)
+    if column.ndim != 1:
+        raise ValueError(f"GST register column {name!r} must be one-dimensional.")
+    return column
+
+
+def _hundredths(values: np.ndarray, limit: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (values * 100 as int64, ok) where ok marks values that are exactly a
+    whole number of hundredths in [0, limit]; other rows hold 0.
+    """
+    kind = values.dtype.kind
+    if kind in "iu":
+        ok = (values >= 0) & (values <= limit // 100)
+        return np.where(ok, values, 0).astype(np.int64) * 100, ok
+    if kind == "f" and values.itemsize <= 8:
+        values = values.astype(np.float64, copy=False)
+        # For |x| well below 2**53 / 100, rint(x * 100) / 100 == x holds
+        # exactly when str(x) has at most two decimals, which is what
+        # parse_decimal_input() would see.
+        with np.errstate(invalid="ignore", over="ignore"):
+            scaled = np.rint(values * 100)
+            ok = np.isfinite(values) & (scaled >= 0) & (scaled <= limit) & (scaled / 100 == values)
+        return np.where(ok, scaled, 0).astype(np.int64), ok
+    scaled = np.zeros(len(values), dtype=np.int64)
+    ok = np.zeros(len(values), dtype=bool)
+    for i, value in enumerate(values):
+        try:
+            units = decimal_to_cents(parse_decimal_input(value, "value"))
+        except ValueError:
+            continue
+        if units is not None and 0 <= units <= limit:
+            scaled[i] = units
+            ok[i] = True
+    return scaled, ok
+
+
+def _state_codes(*columns: np.ndarray) -> List[np.ndarray]:
+    """
+    Integer codes for the normalized (strip().upper()) state of every value,
+    shared across columns; -1 for a missing, blank or non-string state.
+    """
+    codes: Dict[Any, int] = {}
+    normalized: Dict[str, int] = {}
+
+    def code(value: Any) -> int:
+        try:
+            return codes[value]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable
+            return -1
+        if isinstance(value, str) and value.strip():
+            result = normalized.setdefault(value.strip().upper(), len(normalized))
+        else:
+            result = -1
+        codes[value] = result
+        return result
+
+    result = []
+    for column in columns:
+        if column.dtype.kind in "US":
+            # Fixed-width strings: code each distinct value once.
+            uniques, inverse = np.unique(column, return_inverse=True)
+            unique_codes = np.array([code(v) for v in uniques.tolist()], dtype=np.int64)
+            result.append(unique_codes[inverse.reshape(-1)])
+        else:
+            result.append(np.fromiter((code(v) for v in column), dtype=np.int64, count=len(column)))
+    return result
+
+
+def _leg_off(claimed: np.ndarray, target: np.ndarray, zero_tax: np.ndarray) -> np.ndarray:
+    """|claimed - target / 20000| > 2 paise, or claimed != 0 when there is no tax."""
+    return np.where(zero_tax, claimed != 0, np.abs(20000 * claimed - target) > 40000)
+
+
+def verify_register(guard: "GSTGuard", table: Any) -> List[Dict[str, Any]]:
+    """See GSTGuard.verify_gst_split_register()."""
+    columns = {name: _column(table, name) for name in COLUMNS}
+    rows = len(columns["taxable_value"])
+    if any(len(column) != rows for column in columns.values()):
+        raise ValueError("GST register columns must all have the same length.")
+
+    taxable, ok = _hundredths(columns["taxable_value"], _AMOUNT_LIMIT)
+    rate, rate_ok = _hundredths(columns["gst_rate"], _RATE_LIMIT)
+    ok &= rate_ok
+    claimed = {}
+    for leg in ("cgst", "sgst", "igst"):
+        claimed[leg], leg_ok = _hundredths(columns[f"claimed_{leg}"], _AMOUNT_LIMIT)
+        ok &= leg_ok
+    supplier, place = _state_codes(columns["supplier_state"], columns["place_of_supply"])
+    ok &= (supplier >= 0) & (place >= 0)
+
+    interstate = supplier != place
+    total = taxable * rate
+    zero_tax = total == 0
+    cgst_off = np.where(interstate, claimed["cgst"] != 0, _leg_off(claimed["cgst"], total, zero_tax))
+    sgst_off = np.where(interstate, claimed["sgst"] != 0, _leg_off(claimed["sgst"], total, zero_tax))
+    igst_off = np.where(interstate, _leg_off(claimed["igst"], 2 * total, zero_tax), claimed["igst"] != 0)
+    candidates = ~ok | (cgst_off | sgst_off | igst_off)
+
+    mismatched = []
+    for index in np.flatnonzero(candidates).tolist():
+        result = guard.verify_gst_split(*(_item(columns[name][index]) for name in COLUMNS))
+        if not result["verified"]:
+            mismatched.append({"row": index, **result})
+    return mismatched
+
+
+def _item(value: Any) -> Any:
+    # NumPy scalars to Python values, so verify_gst_split() sees what a
+    # caller passing plain lists would.
+    return value.item() if isinstance(value, np.generic) else value
@@ -1,12 +1,21 @@
-from z3 import Solver, Bool, Implies, Not, And, sat, is_true
 from enum import Enum
+from typing import Any, Dict, Union
+
 from pydantic import BaseModel
 
+from qwed_tax.results import InvestmentResult
+from qwed_tax.truth_tables import TABLES
+
 class TransactionType(str, Enum):
     INTRADAY = "INTRADAY"
     DELIVERY = "DELIVERY"
     F_O = "F_O" # Futures & Options
 
+# Tax-head rules (Sec 43(5): intraday is speculative; delivery is capital
+# gains; heads are exclusive), enumerated in Z3 at build time
+# (qwed_tax.truth_tables.compiler). Inputs: is_intraday, is_delivery.
+_HEAD_TABLE = TABLES["INVESTMENT_TAX_HEAD"]
+
 class InvestmentGuard:
     """
     Verifies Classification of Stock Market Income for Indian Tax.
@@ -15,54 +24,34 @@ class InvestmentGuard:
     Source: Audit Trace 26525cd2c6b6
     """
     
-    def verify_classification(self, tx_type: TransactionType, holding_period_days: int) -> dict:
+    def verify_classification(
+        self, tx_type: TransactionType, holding_period_days: int, compact: bool = False
+    ) -> Union[Dict[str, Any], InvestmentResult]:
         """
-        Uses Z3 to determine the correct tax head.
+        Determines the correct tax head from the Z3-compiled rule table.
+        With compact=True the result is an InvestmentResult instead of a dict.
         """
-        s = Solver()
-        
-        # Variables
-        is_intraday = Bool('is_intraday')
-        is_delivery = Bool('is_delivery')
-        
-        # Outputs (Tax Heads)
-        tax_head_speculative = Bool('head_speculative_business')
-        tax_head_capital_gains = Bool('head_capital_gains')
-        
-        # Rules
-        # Rule 1: Intraday is ALWAYS Speculative Business (Sec 43(5))
-        s.add(Implies(is_intraday, tax_head_speculative))
-        
-        # Rule 2: Delivery is Capital Gains
-        s.add(Implies(is_delivery, tax_head_capital_gains))
-        
-        # Rule 3: Mutually Exclusive Heads (Simplified)
-        s.add(Not(And(tax_head_speculative, tax_head_capital_gains)))
-        
-        # Add Input Facts
-        s.add(is_intraday == (tx_type == TransactionType.INTRADAY))
-        s.add(is_delivery == (tx_type == TransactionType.DELIVERY))
-        
-        # Check
-        if s.check() == sat:
-            m = s.model()
-            is_spec = is_true(m[tax_head_speculative])
-            is_cg = is_true(m[tax_head_capital_gains])
-            
-            if is_spec:
-                return {
-                    "classification": "Speculative Business Income",
-                    "tax_treatment": "Added to Total Income (Slab Rate)",
-                    "verified": True
-                }
-            elif is_cg:
+        result = InvestmentResult if compact else dict
+        head = _HEAD_TABLE.lookup(
+            tx_type == TransactionType.INTRADAY,
+            tx_type == TransactionType.DELIVERY,
+        )
+
+        if head != "unsat":
+            if head == "speculative":
+                return result(
+                    classification="Speculative Business Income",
+                    tax_treatment="Added to Total Income (Slab Rate)",
+                    verified=True
+                )
+            elif head == "capital_gains":
                 term = "LTCG" if holding_period_days > 365 else "STCG"
-                return {
-                    "classification": f"Capital Gains ({term})",
-                    "tax_treatment": "Special Rates (10%/12.5% or 15%/20%)",
-                    "verified": True
-                }
+                return result(
+                    classification=f"Capital Gains ({term})",
+                    tax_treatment="Special Rates (10%/12.5% or 15%/20%)",
+                    verified=True
+                )
             else:
-                 return {"classification": "Unknown", "verified": False}
+                 return result(classification="Unknown", verified=False)
         else:
-             return {"classification": "Logic Error", "verified": False}
+             return result(classification="Logic Error", verified=False)
@@ -0,0 +1,285 @@
+"""
+Stateful year-to-date Social Security wage tracker.
+
+FicaLedger keeps each employee's YTD Social Security wages in cents in a
+compact array('q') store and verifies every paycheck's claimed SS tax against
+the wage base in O(1), without the caller re-aggregating YTD wages.
+A ledger belongs to one tax year: its wage base and rate come from the
+"us_fica" rules of the default registry for that year, and mismatches are
+reported by PayrollGuard.verify_fica_tax() under the same date, so verdicts
+are exactly those of verify_fica_tax(..., as_of=...) for the same YTD figures.
+Prior years can be replayed with FicaLedger(tax_year=2024).
+
+The ledger can be snapshotted to a file and restored, so long-running payroll
+services can restart mid-year without replaying every pay period.
+"""
+
+import json
+import os
+import struct
+import sys
+from array import array
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from ... import rules
+from ...models import VerificationResult
+from ...money import decimal_to_cents, from_units, parse_decimal_input, parse_units, units_at
+from .payroll_guard import PayrollGuard
+
+_SNAPSHOT_MAGIC = b"QWEDFICA"
+_SNAPSHOT_VERSION = 2
+# magic, version
+_SNAPSHOT_PREFIX = struct.Struct("<8sH")
+# tax year, wage base (cents), employee count, id table length (bytes)
+_SNAPSHOT_HEADER = struct.Struct("<HqQQ")
+# Version 1 (no tax year; taken under the rules in force when it was written).
+_SNAPSHOT_HEADER_V1 = struct.Struct("<qQQ")
+
+
+class _SocialSecurityRule(NamedTuple):
+    """A year's wage base in cents and rate as an integer fraction."""
+
+    wage_base_cents: int
+    # tax cents = taxable cents * rate_numerator / rate_denominator
+    rate_numerator: int
+    rate_denominator: int
+
+
+def _social_security_rule(as_of: rules.AsOf) -> _SocialSecurityRule:
+    """
+    The "us_fica" SOCIAL_SECURITY rule of the default registry on as_of.
+    Raises ValueError if none is configured or it is not in whole cents.
+    """
+    try:
+        value = rules.lookup("us_fica", "SOCIAL_SECURITY", as_of)
+    except KeyError:
+        raise ValueError(f"No Social Security wage base configured for {as_of}.") from None
+    wage_base = decimal_to_cents(value["wage_base"])
+    exponent = min(value["rate"].as_tuple().exponent, 0)
+    numerator = units_at(value["rate"], exponent)
+    if wage_base is None or numerator is None:
+        raise ValueError(f"Social Security rule for {as_of} is not in whole cents.")
+    return _SocialSecurityRule(wage_base, numerator, 10**-exponent)
+
+
+def _cents(value: Any, field_name: str) -> int:
+    cents = parse_units(value, -2, field_name)
+    if cents is None:
+        raise ValueError(f"{field_name} must be a whole number of cents.")
+    if cents < 0:
+        raise ValueError(f"{field_name} must not be negative.")
+    return cents
+
+
+def _dollars(cents: int) -> Decimal:
+    return from_units(cents)
+
+
+def _expected_ss_cents(previous_ytd: int, current: int, rule: _SocialSecurityRule) -> int:
+    """verify_fica_tax()'s expected tax in integer cents (quantize uses ROUND_HALF_EVEN)."""
+    wage_base, numerator, denominator = rule
+    if previous_ytd >= wage_base:
+        return 0
+    taxable = wage_base - previous_ytd if previous_ytd + current > wage_base else current
+    quotient, remainder = divmod(taxable * numerator, denominator)
+    if remainder * 2 > denominator or (remainder * 2 == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+class FicaLedger:
+    """
+    Per-employee YTD Social Security wages for one tax year.
+
+    Wages are whole cents and non-negative; YTD totals live in one
+    array('q') indexed by a slot assigned on an employee's first paycheck.
+    tax_year defaults to the current year. Its rule is looked up again
+    whenever the default registry is replaced (rules.set_default_registry()),
+    so the integer fast path and verify_fica_tax() never disagree. Raises
+    ValueError if the year has no Social Security rule.
+    Unlike the guards, a ledger is mutable state: give each thread its own
+    or serialize access to it.
+    """
+
+    def __init__(self, tax_year: Optional[int] = None):
+        if tax_year is None:
+            tax_year = date.today().year
+        if isinstance(tax_year, bool) or not isinstance(tax_year, int) or not 1 <= tax_year <= 9999:
+            raise ValueError(f"tax_year must be a year, got {tax_year!r}.")
+        self.tax_year = tax_year
+        # Pay dates of one tax year share a wage base; rules are looked up on 1 January.
+        self.as_of = date(tax_year, 1, 1)
+        self._guard = PayrollGuard()
+        self._family: Optional[rules.RuleFamily] = None
+        self._rule = self._social_security()
+        self._slots: Dict[str, int] = {}
+        self._ytd = array("q")
+
+    def _social_security(self) -> _SocialSecurityRule:
+        family = rules.default_registry().family("us_fica")
+        if family is not self._family:
+            self._rule = _social_security_rule(self.as_of)
+            self._family = family
+        return self._rule
+
+    @property
+    def wage_base(self) -> Decimal:
+        """The tax year's Social Security wage base under the current rules."""
+        return _dollars(self._social_security().wage_base_cents)
+
+    def __len__(self) -> int:
+        return len(self._ytd)
+
+    def __contains__(self, employee_id: str) -> bool:
+        return employee_id in self._slots
+
+    def ytd_wages(self, employee_id: str) -> Decimal:
+        """YTD Social Security wages recorded for employee_id (0.00 if unknown)."""
+        slot = self._slots.get(employee_id)
+        return _dollars(self._ytd[slot] if slot is not None else 0)
+
+    def _slot(self, employee_id: str) -> int:
+        slot = self._slots.get(employee_id)
+        if slot is None:
+            if not isinstance(employee_id, str) or not employee_id:
+                raise ValueError("employee_id must be a non-empty string.")
+            slot = self._slots[employee_id] = len(self._ytd)
+            self._ytd.append(0)
+        return slot
+
+    def verify_paycheck(
+        self, employee_id: str, current_gross: Any, claimed_ss_tax: Any, record: bool = True
+    ) -> VerificationResult:
+        """
+        Verifies one paycheck's SS tax against the employee's running YTD and,
+        if record is True, adds current_gross to it. Wages are recorded even
+        when the claimed tax is wrong: the wages were still paid.
+        """
+        current = _cents(current_gross, "current_gross")
+        claimed = parse_decimal_input(claimed_ss_tax, "claimed_ss_tax")
+        slot = self._slot(employee_id)
+        previous = self._ytd[slot]
+        result = self._guard.verify_fica_tax(
+            _dollars(previous + current), _dollars(current), claimed, as_of=self.as_of
+        )
+        if record:
+            self._ytd[slot] = previous + current
+        return result
+
+    def apply_period(self, paychecks: Iterable[Tuple[str, Any, Any]]) -> List[Tuple[str, VerificationResult]]:
+        """
+        Records one pay period of (employee_id, current_gross, claimed_ss_tax)
+        paychecks and returns (employee_id, VerificationResult) for the
+        mismatching ones only, in input order.
+
+        Matching paychecks are settled in integer cents; a VerificationResult
+        is built only for mismatches. The period is applied atomically: if any
+        paycheck is invalid, ValueError is raised and the ledger is unchanged.
+        """
+        mismatches = []
+        rule = self._social_security()
+        ytd = self._ytd
+        known = len(ytd)
+        undo: List[Tuple[int, int]] = []
+        try:
+            for employee_id, current_gross, claimed_ss_tax in paychecks:
+                current = _cents(current_gross, "current_gross")
+                claimed = parse_decimal_input(claimed_ss_tax, "claimed_ss_tax")
+                slot = self._slot(employee_id)
+                previous = ytd[slot]
+                if decimal_to_cents(claimed) != _expected_ss_cents(previous, current, rule):
+                    result = self._guard.verify_fica_tax(
+                        _dollars(previous + current), _dollars(current), claimed, as_of=self.as_of
+                    )
+                    if not result.verified:
+                        mismatches.append((employee_id, result))
+                undo.append((slot, previous))
+                ytd[slot] = previous + current
+        except BaseException:
+            for slot, previous in reversed(undo):
+                ytd[slot] = previous
+            if len(ytd) > known:
+                del ytd[known:]
+                self._slots = {e: s for e, s in self._slots.items() if s < known}
+            raise
+        return mismatches
+
+    def snapshot(self, path: "os.PathLike[str] | str") -> None:
+        """
+        Writes the ledger to path atomically (temp file + rename), with its
+        tax year and the wage base it was verified under.
+        """
+        ids: List[Optional[str]] = [None] * len(self._ytd)
+        for employee_id, slot in self._slots.items():
+            ids[slot] = employee_id
+        id_table = json.dumps(ids, ensure_ascii=False).encode("utf-8")
+        values = array("q", self._ytd)
+        if sys.byteorder != "little":
+            values.byteswap()
+
+        tmp_path = f"{os.fspath(path)}.tmp"
+        with open(tmp_path, "wb") as fh:
+            fh.write(_SNAPSHOT_PREFIX.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION))
+            fh.write(_SNAPSHOT_HEADER.pack(
+                self.tax_year, self._social_security().wage_base_cents, len(values), len(id_table)
+            ))
+            fh.write(id_table)
+            values.tofile(fh)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def restore(cls, path: "os.PathLike[str] | str", tax_year: Optional[int] = None) -> "FicaLedger":
+        """
+        Loads a ledger written by snapshot() for the tax year it was taken
+        in. Raises ValueError if the file is not a ledger snapshot, is
+        truncated, belongs to a tax year other than tax_year (when given), or
+        was taken under a wage base other than the one the current rules give
+        its tax year. Version 1 snapshots carry no tax year; they are restored
+        into tax_year (default the current year).
+        """
+        with open(path, "rb") as fh:
+            prefix = fh.read(_SNAPSHOT_PREFIX.size)
+            magic, version = (
+                _SNAPSHOT_PREFIX.unpack(prefix) if len(prefix) == _SNAPSHOT_PREFIX.size else (None, None)
+            )
+            if magic != _SNAPSHOT_MAGIC or version not in (1, _SNAPSHOT_VERSION):
+                raise ValueError("Not a FicaLedger snapshot (bad magic or unsupported version).")
+            header_format = _SNAPSHOT_HEADER if version == _SNAPSHOT_VERSION else _SNAPSHOT_HEADER_V1
+            header = fh.read(header_format.size)
+            if len(header) != header_format.size:
+                raise ValueError("Not a FicaLedger snapshot: file too short.")
+            if version == _SNAPSHOT_VERSION:
+                snapshot_year, wage_base, count, id_length = header_format.unpack(header)
+                if tax_year is not None and tax_year != snapshot_year:
+                    raise ValueError(f"Snapshot belongs to tax year {snapshot_year}, not {tax_year}.")
+                tax_year = snapshot_year
+            else:
+                wage_base, count, id_length = header_format.unpack(header)
+            ledger = cls(tax_year)
+            if wage_base != ledger._social_security().wage_base_cents:
+                raise ValueError(
+                    f"Snapshot wage base ${_dollars(wage_base)} does not match the {ledger.tax_year} "
+                    f"wage base ${ledger.wage_base} in the current rules; it belongs to a different tax year."
+                )
+            id_table = fh.read(id_length)
+            values = array("q")
+            try:
+                values.fromfile(fh, count)
+            except EOFError as exc:
+                raise ValueError("FicaLedger snapshot is truncated.") from exc
+            if len(id_table) != id_length or fh.read(1):
+                raise ValueError("FicaLedger snapshot is corrupt (unexpected length).")
+
+        ids = json.loads(id_table.decode("utf-8"))
+        if len(ids) != count:
+            raise ValueError("FicaLedger snapshot is corrupt (id table does not match values).")
+        if sys.byteorder != "little":
+            values.byteswap()
+
+        ledger._ytd = values
+        ledger._slots = {employee_id: slot for slot, employee_id in enumerate(ids)}
+        return ledger
@@ -1,5 +1,6 @@
 from decimal import Decimal
 from ...models import ContractorPayment, PaymentType
+from ...results import Form1099Result
 
 # Threshold table: payment_type -> (form, threshold)
 _FILING_RULES = {
@@ -15,32 +16,34 @@ class Form1099Guard:
     Determines if logic requires filing 1099-NEC or 1099-MISC.
     """
     
-    def verify_filing_requirement(self, payment: ContractorPayment):
+    def verify_filing_requirement(self, payment: ContractorPayment, compact: bool = False):
         """
         Returns which form (if any) is required based on payment type and amount.
         Reference: IRS Instructions for Forms 1099-MISC and 1099-NEC.
+        With compact=True the result is a Form1099Result instead of a dict.
         """
+        result = Form1099Result if compact else dict
         amount = payment.amount
         ptype = payment.payment_type
         
         rule = _FILING_RULES.get(ptype)
         if rule is None:
-            return {
-                "filing_required": "UNVERIFIABLE",
-                "form": None,
-                "reason": f"No filing rule configured for payment type '{ptype}'. Cannot verify filing requirement — manual determination required.",
-            }
+            return result(
+                filing_required="UNVERIFIABLE",
+                form=None,
+                reason=f"No filing rule configured for payment type '{ptype}'. Cannot verify filing requirement — manual determination required.",
+            )
 
         form_name, threshold = rule
         if amount >= threshold:
-            return {
-                "filing_required": True,
-                "form": form_name,
-                "reason": f"{ptype.value} (${amount}) >= ${threshold}"
-            }
+            return result(
+                filing_required=True,
+                form=form_name,
+                reason=f"{ptype.value} (${amount}) >= ${threshold}"
+            )
 
-        return {
-            "filing_required": False,
-            "form": None,
-            "reason": f"{ptype.value} (${amount}) below threshold (${threshold})"
-        }
+        return result(
+            filing_required=False,
+            form=None,
+            reason=f"{ptype.value} (${amount}) below threshold (${threshold})"
+        )
@@ -1,8 +1,135 @@
-from decimal import Decimal, getcontext
-from ...models import PayrollEntry, VerificationResult
+import heapq
+from decimal import Decimal
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
-# Set precision high enough for currency
-getcontext().prec = 28
+from ... import rules
+from ...models import PayrollEntry, PayrollOffender, PayrollRunSummary, VerificationResult
+from ...money import absolute, add, money_context, multiply, quantize, subtract
+from ...parallel import map_chunks
+
+# Social Security (OASDI) employee rate and wage base in force at import
+# (rule family "us_fica"), kept for reference only. verify_fica_tax() and
+# FicaLedger read the current registry for the pay date / tax year instead.
+_SOCIAL_SECURITY = rules.lookup("us_fica", "SOCIAL_SECURITY")
+SS_RATE = _SOCIAL_SECURITY["rate"]
+SS_WAGE_BASE = _SOCIAL_SECURITY["wage_base"]
+
+# Entries per process-pool task when the caller does not choose one.
+DEFAULT_CHUNK_SIZE = 1000
+
+# (gross, tax amounts, deduction amounts, net claimed) as Decimal strings: what
+# crosses the process boundary. str(Decimal) round-trips exactly and pickles
+# ~10x cheaper than Decimal, which in turn is far cheaper than a PayrollEntry.
+_PackedEntry = Tuple[str, Tuple[str, ...], Tuple[str, ...], str]
+
+
+def _check_net_pay(gross, tax_amounts, deduction_amounts, net_pay_claimed) -> Tuple[bool, Decimal, Decimal, str]:
+    """
+    Gross-to-net arithmetic shared by verify_gross_to_net() and the run workers.
+    Callers run it under money_context(), once per chunk for the workers.
+    """
+    # Calculate total tax
+    total_tax = sum(tax_amounts, Decimal("0.00"))
+
+    # Calculate total deductions
+    total_deductions = sum(deduction_amounts, Decimal("0.00"))
+
+    # Deterministic recalculation
+    calculated_net = gross - total_tax - total_deductions
+
+    # Check discrepancy
+    discrepancy = calculated_net - net_pay_claimed
+
+    if discrepancy == Decimal("0.00"):
+        return True, calculated_net, discrepancy, "✅ VERIFIED: Net Pay matches Gross - Taxes - Deductions."
+    return (
+        False,
+        calculated_net,
+        discrepancy,
+        f"❌ ERROR: Mathematical discrepancy detected. Claimed Net: {net_pay_claimed}, Calculated: {calculated_net}. Diff: {discrepancy}",
+    )
+
+
+def _fields(entry: PayrollEntry):
+    return (
+        entry.gross_pay,
+        tuple(t.amount for t in entry.taxes),
+        tuple(d.amount for d in entry.deductions),
+        entry.net_pay_claimed,
+    )
+
+
+def _pack(entry: PayrollEntry) -> _PackedEntry:
+    return (
+        str(entry.gross_pay),
+        tuple(str(t.amount) for t in entry.taxes),
+        tuple(str(d.amount) for d in entry.deductions),
+        str(entry.net_pay_claimed),
+    )
+
+
+def _check_packed(row: _PackedEntry) -> Tuple[bool, Decimal, Decimal, str]:
+    gross, taxes, deductions, net_pay_claimed = row
+    return _check_net_pay(
+        Decimal(gross),
+        map(Decimal, taxes),
+        map(Decimal, deductions),
+        Decimal(net_pay_claimed),
+    )
+
+
+def _verify_rows(rows: List[_PackedEntry]) -> List[Tuple[bool, Decimal, Decimal, str]]:
+    """Run task: full outcome for every row."""
+    with money_context():
+        return [_check_packed(row) for row in rows]
+
+
+def _failures_in_rows(rows: List[_PackedEntry]) -> List[Tuple[int, Decimal, str]]:
+    """Run task: (offset, discrepancy, message) for failing rows only."""
+    failures = []
+    with money_context():
+        for offset, row in enumerate(rows):
+            verified, _, discrepancy, message = _check_packed(row)
+            if not verified:
+                failures.append((offset, discrepancy, message))
+    return failures
+
+
+def _field_rows(chunk: List[PayrollEntry]) -> list:
+    return [_fields(e) for e in chunk]
+
+
+def _pack_rows(chunk: List[PayrollEntry]) -> List[_PackedEntry]:
+    return [_pack(e) for e in chunk]
+
+
+def _verify_chunks(
+    task: Callable[[List[_PackedEntry]], list],
+    entries: Iterable[PayrollEntry],
+    workers: int,
+    chunk_size: int,
+) -> Iterator[Tuple[List[PayrollEntry], list]]:
+    """Yields (chunk, task(rows of chunk)) in input order; see map_chunks()."""
+    it = iter(entries)
+    chunks = iter(lambda: list(islice(it, chunk_size)), [])
+    # In-process: skip the wire encoding (Decimal(Decimal) is exact too).
+    return map_chunks(task, chunks, workers, _field_rows if workers == 1 else _pack_rows)
+
+
+def _require_positive_int(value, name: str) -> None:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(f"{name} must be a positive integer.")
+
+
+def _validate_run_args(workers, chunk_size, max_failures) -> int:
+    _require_positive_int(workers, "workers")
+    if chunk_size is None:
+        chunk_size = DEFAULT_CHUNK_SIZE
+    _require_positive_int(chunk_size, "chunk_size")
+    if max_failures is not None:
+        _require_positive_int(max_failures, "max_failures")
+    return chunk_size
 
 class PayrollGuard:
     """
@@ -14,44 +141,152 @@ class PayrollGuard:
         """
         Verifies that net pay matches the sum of its parts.
         """
-        gross = entry.gross_pay
-        
-        # Calculate total tax
-        total_tax = sum((t.amount for t in entry.taxes), Decimal("0.00"))
-        
-        # Calculate total deductions
-        total_deductions = sum((d.amount for d in entry.deductions), Decimal("0.00"))
-        
-        # Deterministic recalculation
-        calculated_net = gross - total_tax - total_deductions
-        
-        # Check discrepancy
-        discrepancy = calculated_net - entry.net_pay_claimed
-        
-        if discrepancy == Decimal("0.00"):
-            return VerificationResult(
-                verified=True,
-                recalculated_net_pay=calculated_net,
-                discrepancy=discrepancy,
-                message="✅ VERIFIED: Net Pay matches Gross - Taxes - Deductions."
+        with money_context():
+            verified, calculated_net, discrepancy, message = _check_net_pay(
+                entry.gross_pay,
+                (t.amount for t in entry.taxes),
+                (d.amount for d in entry.deductions),
+                entry.net_pay_claimed,
             )
+        return VerificationResult(
+            verified=verified,
+            recalculated_net_pay=calculated_net,
+            discrepancy=discrepancy,
+            message=message,
+        )
+
+    def iter_payroll_run(
+        self,
+        entries: Iterable[PayrollEntry],
+        workers: int = 1,
+        chunk_size: Optional[int] = None,
+        max_failures: Optional[int] = None,
+    ) -> Iterator[Tuple[int, PayrollEntry, VerificationResult]]:
+        """
+        Verifies a payroll run, yielding (index, entry, result) in input order.
+
+        With workers > 1 entries are sharded in chunks of chunk_size across a
+        process pool; runs stream in bounded memory, so generators are fine.
+        Each result equals verify_gross_to_net(entry).
+
+        If max_failures is set, iteration stops after the max_failures-th
+        failing entry in input order, so output never depends on workers.
+        """
+        chunk_size = _validate_run_args(workers, chunk_size, max_failures)
+        index = 0
+        failures = 0
+        for chunk, outcomes in _verify_chunks(_verify_rows, entries, workers, chunk_size):
+            for entry, (verified, calculated_net, discrepancy, message) in zip(chunk, outcomes):
+                yield index, entry, VerificationResult(
+                    verified=verified,
+                    recalculated_net_pay=calculated_net,
+                    discrepancy=discrepancy,
+                    message=message,
+                )
+                index += 1
+                if not verified:
+                    failures += 1
+                    if failures == max_failures:
+                        return
+
+    def verify_payroll_run(
+        self,
+        entries: Iterable[PayrollEntry],
+        workers: int = 1,
+        chunk_size: Optional[int] = None,
+        max_failures: Optional[int] = None,
+        top_n: int = 10,
+    ) -> PayrollRunSummary:
+        """
+        Verifies a whole payroll run and returns counts, total discrepancy and
+        the top_n worst offenders (largest |discrepancy|, ties by input order).
+
+        Sharding and max_failures behave as in iter_payroll_run(), but workers
+        send back failing entries only. The summary is identical for any
+        worker count or chunk size. stopped_early is True only if
+        max_failures left entries unchecked.
+        """
+        chunk_size = _validate_run_args(workers, chunk_size, max_failures)
+        _require_positive_int(top_n, "top_n")
+        checked = 0
+        failed = 0
+        total_discrepancy = Decimal("0.00")
+        # Min-heap on (|discrepancy|, -index): the root ranks last among the kept.
+        worst: List[Tuple[Decimal, int, PayrollOffender]] = []
+        source = iter(entries)
+        pulled = 0
+
+        def counted() -> Iterator[PayrollEntry]:
+            nonlocal pulled
+            for entry in source:
+                pulled += 1
+                yield entry
+
+        runs = _verify_chunks(_failures_in_rows, counted(), workers, chunk_size)
+        for chunk, failures in runs:
+            for offset, discrepancy, message in failures:
+                failed += 1
+                magnitude = absolute(discrepancy)
+                total_discrepancy = add(total_discrepancy, magnitude)
+                index = checked + offset
+                if len(worst) < top_n or (magnitude, -index) > worst[0][:2]:
+                    offender = PayrollOffender(
+                        index=index,
+                        employee_id=chunk[offset].employee_id,
+                        discrepancy=discrepancy,
+                        message=message,
+                    )
+                    if len(worst) < top_n:
+                        heapq.heappush(worst, (magnitude, -index, offender))
+                    else:
+                        heapq.heapreplace(worst, (magnitude, -index, offender))
+                if failed == max_failures:
+                    checked = index + 1
+                    break
+            else:
+                checked += len(chunk)
+                continue
+            break
+
+        stopped_early = False
+        if failed == max_failures:
+            runs.close()
+            # Entries already sharded but unchecked, or any left in the input.
+            stopped_early = checked < pulled or any(True for _ in islice(source, 1))
+
+        return PayrollRunSummary(
+            entries_checked=checked,
+            verified_count=checked - failed,
+            failed_count=failed,
+            total_discrepancy=total_discrepancy,
+            worst_offenders=[offender for _, _, offender in sorted(worst, reverse=True)],
+            stopped_early=stopped_early,
+        )
+
+    def verify_fica_tax(
+        self, gross_ytd: Decimal, current_gross: Decimal, claimed_ss_tax: Decimal, as_of: rules.AsOf = None
+    ) -> VerificationResult:
+        """
+        Verifies Social Security Tax (6.2%) stops at the Wage Base Limit of
+        the pay date's year ($176,100 for 2025). as_of is the pay date
+        (default today).
+        """
+        try:
+            social_security = rules.table("us_fica", as_of).get("SOCIAL_SECURITY")
+        except ValueError as exc:
+            social_security, error = None, str(exc)
         else:
+            error = f"No Social Security wage base configured for {as_of}."
+        if social_security is None:
             return VerificationResult(
-                verified=False,
-                recalculated_net_pay=calculated_net,
-                discrepancy=discrepancy,
-                message=f"❌ ERROR: Mathematical discrepancy detected. Claimed Net: {entry.net_pay_claimed}, Calculated: {calculated_net}. Diff: {discrepancy}"
+                verified=False, recalculated_net_pay=Decimal(0), discrepancy=Decimal(0),
+                message=f"❌ FICA Error: {error} Cannot verify — block pending rule configuration."
             )
+        SS_LIMIT = social_security["wage_base"]
+        SS_RATE = social_security["rate"]
 
-    def verify_fica_tax(self, gross_ytd: Decimal, current_gross: Decimal, claimed_ss_tax: Decimal) -> VerificationResult:
-        """
-        Verifies Social Security Tax (6.2%) stops at 2025 Wage Base Limit ($176,100).
-        """
-        SS_RATE = Decimal("0.062")
-        SS_LIMIT = Decimal("176100.00")
-        
         # Calculate taxable amount for this period
-        previous_ytd = gross_ytd - current_gross
+        previous_ytd = subtract(gross_ytd, current_gross)
         
         # If already capped
         if previous_ytd >= SS_LIMIT:
@@ -60,17 +295,17 @@ class PayrollGuard:
         
         # If capping in this check
         elif gross_ytd > SS_LIMIT:
-            taxable_portion = SS_LIMIT - previous_ytd
-            expected_tax = taxable_portion * SS_RATE
+            taxable_portion = subtract(SS_LIMIT, previous_ytd)
+            expected_tax = multiply(taxable_portion, SS_RATE)
             msg_suffix = f"(Hit Limit this period. Taxable: ${taxable_portion})"
             
         # Normal
         else:
-            expected_tax = current_gross * SS_RATE
+            expected_tax = multiply(current_gross, SS_RATE)
             msg_suffix = ""
             
         # Round to 2 decimals
-        expected_tax = expected_tax.quantize(Decimal("0.01"))
+        expected_tax = quantize(expected_tax, Decimal("0.01"))
         
         if claimed_ss_tax == expected_tax:
             return VerificationResult(
@@ -78,7 +313,7 @@ class PayrollGuard:
                 message=f"✅ FICA Tax Correct: ${expected_tax} {msg_suffix}"
             )
         else:
-            diff = claimed_ss_tax - expected_tax
+            diff = subtract(claimed_ss_tax, expected_tax)
             return VerificationResult(
                 verified=False, recalculated_net_pay=Decimal(0), discrepancy=diff,
                 message=f"❌ FICA Error: Expected ${expected_tax}, Claimed ${claimed_ss_tax}. Limit logic failed? {msg_suffix}"
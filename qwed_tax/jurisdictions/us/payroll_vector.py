@@ -0,0 +1,249 @@
+"""
+Vectorized gross-to-net verification over scaled-integer (cent) arrays.
+
+Alternate engine for bulk payroll runs: every amount is held as int64 cents
+and gross - Σtaxes - Σdeductions - claimed is computed for the whole run in a
+handful of NumPy operations. VerificationResult objects are only built on
+demand, normally just for the mismatching rows.
+
+Results agree exactly with PayrollGuard.verify_gross_to_net(). Rows that cents
+cannot represent exactly (sub-cent precision, non-finite or oversized amounts)
+are never approximated: they are flagged at load time and verified on the
+Decimal path instead.
+
+Requires NumPy (pip install "qwed-tax[fast]").
+"""
+
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - exercised only without numpy
+    raise ImportError(
+        "qwed_tax.jurisdictions.us.payroll_vector requires NumPy. "
+        'Install it with: pip install "qwed-tax[fast]"'
+    ) from exc
+
+from ...models import PayrollEntry, VerificationResult
+from ...money import decimal_to_cents, from_units, money_context
+from .payroll_guard import PayrollGuard, _check_net_pay
+
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+def _int64_column(values, name: str) -> np.ndarray:
+    """
+    values as an int64 array. Anything but an integer dtype raises ValueError:
+    np.asarray(..., dtype=np.int64) would truncate 100.7 to 100 cents.
+    """
+    column = np.asarray(values)
+    if column.size == 0:
+        return column.astype(np.int64).reshape(0)
+    if not np.issubdtype(column.dtype, np.integer):
+        raise ValueError(
+            f"{name} must be integer cents, got dtype {column.dtype}; "
+            "convert amounts exactly first (e.g. qwed_tax.money.units_array())."
+        )
+    if column.dtype == np.uint64 and int(column.max()) > _INT64_MAX:
+        raise ValueError(f"{name} has values that do not fit in int64.")
+    return column.astype(np.int64, copy=False)
+
+
+def _offsets(counts: np.ndarray) -> np.ndarray:
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+def _out_of_range(amounts: np.ndarray, limit: int) -> np.ndarray:
+    # Not np.abs(): abs(INT64_MIN) wraps to a negative number.
+    return (amounts > limit) | (amounts < -limit)
+
+
+def _ragged_sum(amounts: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Per-row sums of a flattened ragged array (row i is amounts[offsets[i]:offsets[i+1]])."""
+    # Prefix sums may wrap around int64 on long runs; differences of wrapped
+    # prefixes are still exact whenever the true per-row sum fits in int64,
+    # which the per-amount bound in PayrollRunArrays guarantees.
+    prefix = np.zeros(len(amounts) + 1, dtype=np.int64)
+    with np.errstate(over="ignore"):
+        np.cumsum(amounts, out=prefix[1:])
+        return prefix[offsets[1:]] - prefix[offsets[:-1]]
+
+
+class PayrollRunArrays:
+    """
+    A payroll run in columnar cent form.
+
+    Build with from_entries() for PayrollEntry objects, or from_arrays() when
+    the run is already columnar (database export, parquet, ...). Taxes and
+    deductions are ragged: row i owns the next tax_counts[i] values of
+    tax_cents, and likewise for deductions.
+    """
+
+    def __init__(
+        self,
+        gross_cents,
+        tax_cents,
+        tax_counts,
+        deduction_cents,
+        deduction_counts,
+        claimed_cents,
+        entries: Optional[Sequence[PayrollEntry]] = None,
+        decimal_rows: Optional[np.ndarray] = None,
+    ):
+        self.gross_cents = _int64_column(gross_cents, "gross_cents")
+        self.tax_cents = _int64_column(tax_cents, "tax_cents")
+        self.deduction_cents = _int64_column(deduction_cents, "deduction_cents")
+        self.claimed_cents = _int64_column(claimed_cents, "claimed_cents")
+        tax_counts = _int64_column(tax_counts, "tax_counts")
+        deduction_counts = _int64_column(deduction_counts, "deduction_counts")
+
+        rows = len(self.gross_cents)
+        if not (len(self.claimed_cents) == len(tax_counts) == len(deduction_counts) == rows):
+            raise ValueError("gross, claimed and count arrays must have one value per row.")
+        if (tax_counts < 0).any() or (deduction_counts < 0).any():
+            raise ValueError("tax and deduction counts must be non-negative.")
+        if tax_counts.sum() != len(self.tax_cents) or deduction_counts.sum() != len(self.deduction_cents):
+            raise ValueError("tax and deduction counts must add up to the length of their amount arrays.")
+
+        self.tax_offsets = _offsets(tax_counts)
+        self.deduction_offsets = _offsets(deduction_counts)
+        self._entries = entries
+
+        # Rows whose amounts could make a per-row sum overflow int64 go to the
+        # Decimal path: |amount| <= limit keeps every row sum in range.
+        terms = 2 + (int(max(tax_counts.max(), 0) + max(deduction_counts.max(), 0)) if rows else 0)
+        limit = _INT64_MAX // terms
+        oversized = _out_of_range(self.gross_cents, limit) | _out_of_range(self.claimed_cents, limit)
+        for amounts, offsets in ((self.tax_cents, self.tax_offsets), (self.deduction_cents, self.deduction_offsets)):
+            oversized |= _ragged_sum(_out_of_range(amounts, limit).astype(np.int64), offsets) > 0
+        if decimal_rows is not None:
+            oversized |= decimal_rows
+        self.decimal_rows = oversized
+
+    def __len__(self) -> int:
+        return len(self.gross_cents)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        gross_cents,
+        tax_cents,
+        tax_counts,
+        deduction_cents,
+        deduction_counts,
+        claimed_cents,
+    ) -> "PayrollRunArrays":
+        """
+        Wraps integer cent arrays. Every array must have an integer dtype:
+        float, bool or object columns raise ValueError rather than being
+        truncated, even when their values happen to be whole.
+        """
+        return cls(gross_cents, tax_cents, tax_counts, deduction_cents, deduction_counts, claimed_cents)
+
+    @classmethod
+    def from_entries(cls, entries: Sequence[PayrollEntry]) -> "PayrollRunArrays":
+        """
+        Converts PayrollEntry objects to cents. Rows with an amount that is not
+        a whole number of cents (or would not fit in int64) are kept on the
+        Decimal path and verified exactly as verify_gross_to_net() would.
+        """
+        entries = list(entries)
+        gross: List[int] = []
+        claimed: List[int] = []
+        taxes: List[int] = []
+        tax_counts: List[int] = []
+        deductions: List[int] = []
+        deduction_counts: List[int] = []
+        decimal_rows = np.zeros(len(entries), dtype=bool)
+
+        for i, entry in enumerate(entries):
+            row_taxes = [decimal_to_cents(t.amount) for t in entry.taxes]
+            row_deductions = [decimal_to_cents(d.amount) for d in entry.deductions]
+            row_gross = decimal_to_cents(entry.gross_pay)
+            row_claimed = decimal_to_cents(entry.net_pay_claimed)
+            values = [row_gross, row_claimed, *row_taxes, *row_deductions]
+            if None in values or any(abs(v) > _INT64_MAX for v in values):
+                decimal_rows[i] = True
+                gross.append(0)
+                claimed.append(0)
+                tax_counts.append(0)
+                deduction_counts.append(0)
+                continue
+            gross.append(row_gross)
+            claimed.append(row_claimed)
+            taxes.extend(row_taxes)
+            tax_counts.append(len(row_taxes))
+            deductions.extend(row_deductions)
+            deduction_counts.append(len(row_deductions))
+
+        return cls(
+            gross, taxes, tax_counts, deductions, deduction_counts, claimed,
+            entries=entries, decimal_rows=decimal_rows,
+        )
+
+    def discrepancy_cents(self) -> np.ndarray:
+        """(gross - Σtaxes - Σdeductions) - claimed per row, in cents; 0 for decimal_rows."""
+        calculated = (
+            self.gross_cents
+            - _ragged_sum(self.tax_cents, self.tax_offsets)
+            - _ragged_sum(self.deduction_cents, self.deduction_offsets)
+        )
+        discrepancy = calculated - self.claimed_cents
+        discrepancy[self.decimal_rows] = 0
+        return discrepancy
+
+    def verify(self) -> "VectorVerification":
+        """Verifies the whole run."""
+        discrepancy = self.discrepancy_cents()
+        mismatched = discrepancy != 0
+        for i in np.flatnonzero(self.decimal_rows):
+            mismatched[i] = not self.result(int(i)).verified
+        return VectorVerification(self, discrepancy, mismatched)
+
+    def result(self, index: int) -> VerificationResult:
+        """The VerificationResult verify_gross_to_net() gives for row index."""
+        if self._entries is not None:
+            return PayrollGuard().verify_gross_to_net(self._entries[index])
+        taxes = self.tax_cents[self.tax_offsets[index]:self.tax_offsets[index + 1]]
+        deductions = self.deduction_cents[self.deduction_offsets[index]:self.deduction_offsets[index + 1]]
+        with money_context():
+            verified, calculated_net, discrepancy, message = _check_net_pay(
+                from_units(int(self.gross_cents[index])),
+                (from_units(int(v)) for v in taxes),
+                (from_units(int(v)) for v in deductions),
+                from_units(int(self.claimed_cents[index])),
+            )
+        return VerificationResult(
+            verified=verified,
+            recalculated_net_pay=calculated_net,
+            discrepancy=discrepancy,
+            message=message,
+        )
+
+
+class VectorVerification:
+    """Outcome of PayrollRunArrays.verify(): counts up front, results on demand."""
+
+    def __init__(self, run: PayrollRunArrays, discrepancy_cents: np.ndarray, mismatched: np.ndarray):
+        self.run = run
+        self.discrepancy_cents = discrepancy_cents
+        self.mismatched = mismatched
+        self.failed_indices = np.flatnonzero(mismatched)
+
+    @property
+    def failed_count(self) -> int:
+        return len(self.failed_indices)
+
+    @property
+    def verified_count(self) -> int:
+        return len(self.run) - self.failed_count
+
+    def result(self, index: int) -> VerificationResult:
+        return self.run.result(index)
+
+    def failures(self) -> Iterator[Tuple[int, VerificationResult]]:
+        """(index, VerificationResult) for each mismatching row, in input order."""
+        for index in self.failed_indices:
+            yield int(index), self.run.result(int(index))
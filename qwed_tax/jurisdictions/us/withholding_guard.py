@@ -1,12 +1,13 @@
 from decimal import Decimal
-from typing import Any, Dict
+from typing import Any, Dict, Mapping, Union
 
-from z3 import Solver, Bool, Real, RealVal, Implies, And, sat
 from pydantic import BaseModel, field_validator
 
 from qwed_tax.audit import W4_EXEMPT_PUB505, build_trace
 from qwed_tax.diagnostics import TaxDiagnosticResult
 from qwed_tax.numeric import parse_decimal_input
+from qwed_tax.results import ExemptStatusResult
+from qwed_tax.truth_tables import TABLES
 
 class W4Form(BaseModel):
     employee_id: str
@@ -19,57 +20,51 @@ class W4Form(BaseModel):
     def validate_tax_liability_last_year(cls, value):
         return parse_decimal_input(value, "tax_liability_last_year")
 
+# IRS Pub 505 exempt rule, enumerated in Z3 at build time
+# (qwed_tax.truth_tables.compiler). Inputs: claim_exempt, liability_is_zero,
+# expect_refund_this_year.
+_EXEMPT_TABLE = TABLES["W4_EXEMPT_PUB505"]
+
 class WithholdingGuard:
     """
-    Verifies W-4 Withholding Compliance using Z3 Theorem Prover.
+    Verifies W-4 Withholding Compliance against the Z3-compiled Pub 505 rule.
     """
     
-    def verify_exempt_status(self, form: W4Form) -> Dict[str, Any]:
+    def verify_exempt_status(self, form: W4Form, compact: bool = False) -> Union[Dict[str, Any], ExemptStatusResult]:
         """
         Verifies if an employee is legally allowed to claim 'Exempt' status.
         Rule: To claim exempt, you must have had no tax liability last year 
               AND expect to have no tax liability this year.
+        With compact=True the result is an ExemptStatusResult instead of a dict.
         """
-        s = Solver()
-        
-        # Define Z3 Variables
-        exempt = Bool('claim_exempt')
-        liability_last = Real('liability_last_year')
-        expect_no_liability = Bool('expect_refund_this_year') # True means they expect refund/no tax
-        
-        # 1. The Divine Rule (IRS Pub 505)
-        # If Exempt is True, THEN (LiabilityLast == 0 AND ExpectNoLiability == True)
-        # We assert the Rule must always be true for a VALID form.
-        # But here, we want to check if THIS SPECIFIC FORM is valid under the rule.
-        
-        # So we add the Rule to the solver.
-        rule = Implies(exempt, And(liability_last == 0, expect_no_liability))
-        s.add(rule)
-        
-        # 2. Add the User's Input as constraints
-        s.add(exempt == form.claim_exempt)
-        s.add(liability_last == RealVal(str(form.tax_liability_last_year)))
-        s.add(expect_no_liability == form.expect_refund_this_year)
-        
-        # 3. Check consistency
-        # If UNSAT, it means the User's Input contradicts the Rule.
-        result = s.check()
-        
-        if result == sat:
-            return {
-                "verified": True,
-                "message": "✅ W-4 Form represents a valid combination.",
-                "audit_trace": build_trace(W4_EXEMPT_PUB505, "EXEMPT_VALID", {"employee_id": form.employee_id, "claim_exempt": form.claim_exempt, "tax_liability_last_year": str(form.tax_liability_last_year), "expect_refund_this_year": form.expect_refund_this_year}),
-            }
+        result = ExemptStatusResult if compact else dict
+        # If Exempt is True, THEN (LiabilityLast == 0 AND ExpectNoLiability == True).
+        # The form is valid iff its facts are consistent with the rule.
+        valid = _EXEMPT_TABLE.lookup(
+            form.claim_exempt,
+            form.tax_liability_last_year == 0,
+            form.expect_refund_this_year,
+        )
+
+        if valid:
+            return result(
+                verified=True,
+                message="✅ W-4 Form represents a valid combination.",
+                audit_trace=build_trace(W4_EXEMPT_PUB505, "EXEMPT_VALID", {"employee_id": form.employee_id, "claim_exempt": form.claim_exempt, "tax_liability_last_year": str(form.tax_liability_last_year), "expect_refund_this_year": form.expect_refund_this_year}),
+            )
         else:
-            return {
-                "verified": False,
-                "message": "❌ IRS VIOLATION: Cannot claim 'Exempt' if you had tax liability last year or expect it this year.",
-                "audit_trace": build_trace(W4_EXEMPT_PUB505, "EXEMPT_VIOLATION", {"employee_id": form.employee_id, "claim_exempt": form.claim_exempt, "tax_liability_last_year": str(form.tax_liability_last_year), "expect_refund_this_year": form.expect_refund_this_year}),
-            }
+            return result(
+                verified=False,
+                message="❌ IRS VIOLATION: Cannot claim 'Exempt' if you had tax liability last year or expect it this year.",
+                audit_trace=build_trace(W4_EXEMPT_PUB505, "EXEMPT_VIOLATION", {"employee_id": form.employee_id, "claim_exempt": form.claim_exempt, "tax_liability_last_year": str(form.tax_liability_last_year), "expect_refund_this_year": form.expect_refund_this_year}),
+            )
+
+    def diagnose_exempt_status(self, form: W4Form) -> TaxDiagnosticResult:
+        """verify_exempt_status() as a TaxDiagnosticResult, without the intermediate dict."""
+        return self.to_diagnostic(self.verify_exempt_status(form, compact=True))
 
     @staticmethod
-    def to_diagnostic(result: Dict[str, Any]) -> TaxDiagnosticResult:
+    def to_diagnostic(result: Mapping[str, Any]) -> TaxDiagnosticResult:
         """Convert a legacy verify_exempt_status() dict to TaxDiagnosticResult."""
         verified = result.get("verified", False)
         audit_trace = result.get("audit_trace")
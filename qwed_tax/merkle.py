@@ -0,0 +1,159 @@
+"""
+Merkle-batched proof references.
+
+A bulk run can bind all of its VERIFIED items to one root proof_ref instead
+of storing one ref per item. The tree is built over the items' own proof_refs
+(RFC 6962 shape: leaves H(0x00 || ref), nodes H(0x01 || left || right), a
+lone last node is promoted unchanged), and the root ref names the batch size:
+
+    qc1-merkle-sha256:<size>:<root hex>
+
+Each item keeps an InclusionProof (its own ref, its index and the sibling
+hashes up to the root), so a single verdict is checked against the root in
+O(log n) hashes without the rest of the batch.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .proof import verify_proof_ref
+
+MERKLE_REF_PREFIX = "qc1-merkle-sha256:"
+
+_LEAF = b"\x00"
+_NODE = b"\x01"
+
+
+def _leaf(ref: str) -> bytes:
+    return hashlib.sha256(_LEAF + ref.encode("utf-8")).digest()
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE + left + right).digest()
+
+
+def parse_root_ref(ref: Any) -> Optional[Tuple[int, bytes]]:
+    """(size, root digest) of a batch root ref, or None if ref is not one."""
+    if not isinstance(ref, str) or not ref.startswith(MERKLE_REF_PREFIX):
+        return None
+    return _parse_root_ref(ref)
+
+
+@lru_cache(maxsize=64)  # every result of a batch carries the same root
+def _parse_root_ref(ref: str) -> Optional[Tuple[int, bytes]]:
+    size, _, digest = ref[len(MERKLE_REF_PREFIX):].partition(":")
+    if not size.isdigit() or len(digest) != 64:
+        return None
+    try:
+        return int(size), bytes.fromhex(digest)
+    except ValueError:
+        return None
+
+
+class InclusionProof(NamedTuple):
+    """Where one item's proof_ref sits in a batch: enough to recompute the root."""
+
+    leaf_ref: str
+    index: int
+    size: int
+    path: Tuple[str, ...]  # sibling digests (hex), leaf level first
+
+    def root(self) -> Optional[bytes]:
+        """The root digest this proof leads to, or None if it is malformed."""
+        if not 0 <= self.index < self.size:
+            return None
+        digest = _leaf(self.leaf_ref)
+        index, count, path = self.index, self.size, iter(self.path)
+        try:
+            while count > 1:
+                sibling = index ^ 1
+                if sibling < count:
+                    other = bytes.fromhex(next(path))
+                    digest = _node(other, digest) if index & 1 else _node(digest, other)
+                index, count = index >> 1, (count + 1) >> 1
+        except (StopIteration, ValueError):
+            return None
+        if next(path, None) is not None:
+            return None
+        return digest
+
+    def verify(self, root_ref: str) -> bool:
+        """Does this proof lead to root_ref? Fail-closed on any mismatch."""
+        parsed = parse_root_ref(root_ref)
+        return parsed is not None and parsed == (self.size, self.root())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"leaf_ref": self.leaf_ref, "index": self.index, "size": self.size, "path": list(self.path)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "InclusionProof":
+        try:
+            leaf_ref, index, size, path = data["leaf_ref"], data["index"], data["size"], data["path"]
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"InclusionProof.from_dict: missing field {exc}.") from None
+        if (
+            not isinstance(leaf_ref, str)
+            or type(index) is not int
+            or type(size) is not int
+            or not isinstance(path, (list, tuple))
+            or not all(isinstance(step, str) for step in path)
+        ):
+            raise ValueError("InclusionProof.from_dict: malformed inclusion proof.")
+        return cls(leaf_ref, index, size, tuple(path))
+
+
+class MerkleBatch:
+    """
+    Merkle tree over a batch of proof_refs.
+
+        batch = MerkleBatch(refs)
+        batch.root_ref              # one ref for the whole batch
+        batch.proof(i).verify(batch.root_ref)
+    """
+
+    __slots__ = ("_paths", "refs", "root_ref")
+
+    def __init__(self, refs: Sequence[str]) -> None:
+        if not refs:
+            raise ValueError("MerkleBatch needs at least one proof_ref.")
+        if not all(isinstance(ref, str) and ref for ref in refs):
+            raise ValueError("MerkleBatch proof_refs must be non-empty strings.")
+        self.refs = tuple(refs)
+        level = [_leaf(ref) for ref in self.refs]
+        levels: List[List[bytes]] = [level]
+        while len(level) > 1:
+            paired = [_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+            if len(level) & 1:
+                paired.append(level[-1])
+            level = paired
+            levels.append(level)
+        # Every node below the root in hex, the form proofs carry.
+        self._paths = [[digest.hex() for digest in level] for level in levels[:-1]]
+        self.root_ref = f"{MERKLE_REF_PREFIX}{len(self.refs)}:{level[0].hex()}"
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def proof(self, index: int) -> InclusionProof:
+        """The inclusion proof for the item at index."""
+        if not 0 <= index < len(self.refs):
+            raise IndexError(f"MerkleBatch index {index} out of range for {len(self.refs)} items.")
+        path = []
+        position = index
+        for level in self._paths:
+            sibling = position ^ 1
+            if sibling < len(level):
+                path.append(level[sibling])
+            position >>= 1
+        return InclusionProof(self.refs[index], index, len(self.refs), tuple(path))
+
+
+def verify_inclusion(evidence: Any, proof: InclusionProof, root_ref: str) -> bool:
+    """
+    Is evidence the item proof describes, and is that item in the batch
+    root_ref commits to? O(log n) hashes plus one hash of evidence.
+    """
+    return verify_proof_ref(evidence, proof.leaf_ref) and proof.verify(root_ref)
@@ -0,0 +1,77 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+from qwed_tax.middleware.gusto_interceptor import QWEDTaxMiddleware
+
+_worker_middleware: Optional[QWEDTaxMiddleware] = None
+
+
+def _process_in_worker(ai_generated_payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Process-pool entry point: one middleware per worker process, built on first use."""
+    global _worker_middleware
+    if _worker_middleware is None:
+        _worker_middleware = QWEDTaxMiddleware()
+    return _worker_middleware.process_ai_payroll_request(ai_generated_payload)
+
+
+class AsyncQWEDTaxMiddleware:
+    """
+    asyncio front end for QWEDTaxMiddleware.
+
+    Verification (PayrollEntry validation, Decimal math) runs on an executor so
+    the event loop is never blocked. Decisions are produced by the synchronous
+    QWEDTaxMiddleware and are therefore identical to the sync path.
+
+    Args:
+        executor: where verification runs. None uses the loop's default thread
+            pool; a ProcessPoolExecutor sidesteps the GIL for CPU-heavy runs.
+        max_concurrency: upper bound on in-flight verifications in process_many().
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, max_concurrency: int = 64):
+        if not isinstance(max_concurrency, int) or isinstance(max_concurrency, bool) or max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        self.middleware = QWEDTaxMiddleware()
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+
+    async def process_ai_payroll_request(self, ai_generated_payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async counterpart of QWEDTaxMiddleware.process_ai_payroll_request().
+
+        Returns the same decision dictionary the sync middleware would return.
+        """
+        loop = asyncio.get_running_loop()
+        if isinstance(self.executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(self.executor, _process_in_worker, ai_generated_payload)
+        return await loop.run_in_executor(
+            self.executor, self.middleware.process_ai_payroll_request, ai_generated_payload
+        )
+
+    async def process_many(
+        self,
+        payloads: Iterable[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Verify many payloads concurrently, at most max_concurrency at a time.
+
+        Decisions are returned in input order.
+        """
+        limit = self.max_concurrency if max_concurrency is None else max_concurrency
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+
+        batch = list(payloads)
+        results: List[Dict[str, Any]] = [{}] * len(batch)
+        # A fixed set of worker coroutines pulls from one shared cursor, so the
+        # loop never holds more than `limit` pending tasks regardless of batch size.
+        cursor = iter(range(len(batch)))
+
+        async def worker() -> None:
+            for index in cursor:
+                results[index] = await self.process_ai_payroll_request(batch[index])
+
+        await asyncio.gather(*(worker() for _ in range(min(limit, len(batch)))))
+        return results
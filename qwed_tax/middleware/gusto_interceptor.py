@@ -1,6 +1,8 @@
 import logging
+import time
 from typing import Dict, Any
 from pydantic import ValidationError
+from qwed_tax import instrumentation
 from qwed_tax.verifier import TaxVerifier
 from qwed_tax.models import PayrollEntry, VerificationResult
 
@@ -27,6 +29,16 @@ class QWEDTaxMiddleware:
         Returns:
             A decision dictionary indicating whether execution is permitted.
         """
+        if not instrumentation._hooks:
+            return self._decide(ai_generated_payload)
+        started_ns = time.perf_counter_ns()
+        decision = self._decide(ai_generated_payload)
+        instrumentation.emit(
+            "request", "process_ai_payroll_request", started_ns, decision["status"].lower(), action="payroll"
+        )
+        return decision
+
+    def _decide(self, ai_generated_payload: Dict[str, Any]) -> Dict[str, Any]:
         # Extract the core payroll entry that needs mathematical validation
         payroll_entry_data = ai_generated_payload.get("payroll_entry")
         if not payroll_entry_data:
@@ -49,7 +61,7 @@ class QWEDTaxMiddleware:
         
         # Verify deterministic logic via the QWED tax verification engine
         try:
-            result = self.tax_verifier.verify_us_payroll(entry=payroll_entry)
+            result = self._verify(payroll_entry)
             if not isinstance(result, VerificationResult):
                 return {
                     "status": "BLOCKED",
@@ -96,3 +108,22 @@ class QWEDTaxMiddleware:
             ],
             "validated_payload": payroll_entry.model_dump(mode="json"),
         }
+
+    def _verify(self, payroll_entry: PayrollEntry) -> VerificationResult:
+        if not instrumentation._hooks:
+            return self.tax_verifier.verify_us_payroll(entry=payroll_entry)
+        token = instrumentation.enter_scope("payroll", "gross_to_net_arithmetic")
+        started_ns = time.perf_counter_ns()
+        try:
+            result = self.tax_verifier.verify_us_payroll(entry=payroll_entry)
+        except BaseException:
+            instrumentation.emit("guard", "gross_to_net_arithmetic", started_ns, "error")
+            raise
+        else:
+            instrumentation.emit(
+                "guard", "gross_to_net_arithmetic", started_ns,
+                "passed" if getattr(result, "verified", False) else "blocked",
+            )
+        finally:
+            instrumentation.exit_scope(token)
+        return result
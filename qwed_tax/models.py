@@ -91,3 +91,19 @@ class VerificationResult(BaseModel):
     discrepancy: DecimalJSON
     message: str
     verification_mode: str = "SYMBOLIC"  # Always SYMBOLIC for tax (Z3-powered)
+
+class PayrollOffender(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    index: int  # Position of the entry in the submitted run
+    employee_id: str
+    discrepancy: DecimalJSON
+    message: str
+
+class PayrollRunSummary(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    entries_checked: int
+    verified_count: int
+    failed_count: int
+    total_discrepancy: DecimalJSON  # Sum of |discrepancy| over failed entries
+    worst_offenders: List[PayrollOffender]  # Largest |discrepancy| first, ties by index
+    stopped_early: bool = False  # True when entries were left unchecked
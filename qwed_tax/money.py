@@ -0,0 +1,422 @@
+"""
+Money kernel: a private Decimal context for guard arithmetic, and a compact
+fixed-point Money type for ledgers and bulk columns.
+
+Decimal operators (a + b, a * b, a.quantize(...)) round to the precision of
+the calling thread's decimal context, which belongs to the host application.
+Guards instead compute with the operations below, bound to MONEY_CONTEXT, so
+a host running at getcontext().prec = 6 gets the same verdicts as one on the
+defaults:
+
+    from qwed_tax.money import add, multiply, quantize
+
+    deduction = multiply(amount, rate)
+    net = subtract(amount, deduction)
+
+MONEY_CONTEXT equals Python's default context (28 digits, ROUND_HALF_EVEN,
+InvalidOperation, DivisionByZero and Overflow trapped), so every result is
+identical to the Decimal operators under an untouched context. qwed_tax never
+changes the global or thread-local context.
+
+Inputs are parsed by parse_decimal_input() (str and int convert directly, a
+Decimal is used as-is) or, for integer ledgers and columns, straight to
+minor units by parse_units() and units_array(), which skip Decimal for ints
+and plain "1234.50" strings.
+
+Money is an integer number of minor units and a base-10 exponent:
+Money(1250, -2) is 12.50. Its arithmetic is exact integer arithmetic with no
+precision limit; rounding happens only in quantize(). It suits ledgers that
+keep integer units; scalar guard checks keep Decimal, whose C arithmetic is
+faster than any Python-level number type.
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from decimal import (
+    MAX_EMAX,
+    MAX_PREC,
+    MIN_EMIN,
+    ROUND_05UP,
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP,
+    Context,
+    Decimal,
+    DivisionByZero,
+    InvalidOperation,
+    Overflow,
+    localcontext,
+)
+from typing import Any, Callable, ContextManager, Iterable, List, Optional, Tuple, Union
+
+from . import instrumentation
+
+MONEY_CONTEXT = Context(
+    prec=28,
+    rounding=ROUND_HALF_EVEN,
+    Emin=-999999,
+    Emax=999999,
+    capitals=1,
+    clamp=0,
+    flags=[],
+    traps=[InvalidOperation, DivisionByZero, Overflow],
+)
+
+# Unbounded context for operations that only move the exponent (scaleb), so
+# they can never round.
+_EXACT = Context(prec=MAX_PREC, Emin=MIN_EMIN, Emax=MAX_EMAX, traps=[InvalidOperation])
+
+add = MONEY_CONTEXT.add
+subtract = MONEY_CONTEXT.subtract
+multiply = MONEY_CONTEXT.multiply
+divide = MONEY_CONTEXT.divide
+absolute = MONEY_CONTEXT.abs
+
+
+def parse_decimal_input(value: Any, field_name: str) -> Decimal:
+    """
+    Parse a numeric input into a finite Decimal or raise ValueError.
+
+    str and int are converted directly and a Decimal is used as-is; anything
+    else (float, numpy scalars, ...) goes through str() first, so 0.1 parses
+    as Decimal("0.1"). bool is rejected.
+    """
+    observed = instrumentation._hooks
+    if observed:
+        started_ns = time.perf_counter_ns()
+    try:
+        kind = type(value)
+        if kind is Decimal:
+            parsed = value
+        elif kind is bool:
+            raise ValueError(f"{field_name} must be a numeric value.")
+        else:
+            try:
+                parsed = Decimal(value if kind is str or kind is int else str(value))
+            except (InvalidOperation, ValueError) as exc:
+                raise ValueError(f"{field_name} must be a numeric value.") from exc
+
+        if not parsed.is_finite():
+            raise ValueError(f"{field_name} must be a finite numeric value.")
+    except ValueError:
+        if observed:
+            instrumentation.emit("parse", field_name, started_ns, "error")
+        raise
+
+    if observed:
+        instrumentation.emit("parse", field_name, started_ns, "ok")
+    return parsed
+
+
+def decimal_text(value: Decimal) -> str:
+    """Return a stable plain-string representation for Decimal outputs."""
+    return format(value, "f")
+
+
+def _quantizer(rounding: str) -> Callable[[Decimal, Decimal], Decimal]:
+    context = MONEY_CONTEXT.copy()
+    context.rounding = rounding
+    return context.quantize
+
+
+# rounding mode -> MONEY_CONTEXT.quantize with that rounding (bound methods:
+# value.quantize(exp, rounding=..., context=...) costs 3x as much).
+_QUANTIZERS = {
+    rounding: _quantizer(rounding)
+    for rounding in (
+        ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR,
+        ROUND_HALF_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP,
+    )
+}
+_quantize_half_even = _QUANTIZERS[ROUND_HALF_EVEN]
+
+
+def quantize(value: Decimal, exp: Decimal, rounding: Optional[str] = None) -> Decimal:
+    """value.quantize(exp, rounding) in MONEY_CONTEXT (ROUND_HALF_EVEN if rounding is None)."""
+    if rounding is None:
+        return _quantize_half_even(value, exp)
+    try:
+        quantizer = _QUANTIZERS[rounding]
+    except KeyError:
+        raise ValueError(f"Unknown rounding {rounding!r}.") from None
+    return quantizer(value, exp)
+
+
+normalize = MONEY_CONTEXT.normalize
+
+
+def money_context() -> ContextManager[Context]:
+    """
+    localcontext(MONEY_CONTEXT): for hot loops that use Decimal operators,
+    entering it once is cheaper than a context method per operation.
+    """
+    return localcontext(MONEY_CONTEXT)
+
+
+def total(values: Iterable[Decimal], start: Decimal = Decimal("0")) -> Decimal:
+    """sum(values, start) in MONEY_CONTEXT."""
+    for value in values:
+        start = add(start, value)
+    return start
+
+
+def _rescale(units: int, exponent: int, to: int) -> Optional[int]:
+    shift = exponent - to
+    if shift >= 0:
+        return units * 10**shift
+    quotient, remainder = divmod(units, 10**-shift)
+    return None if remainder else quotient
+
+
+def units_at(value: Decimal, exponent: int) -> Optional[int]:
+    """
+    value as an exact integer count of 10**exponent units, or None if it is
+    not finite or has finer precision (units_at(Decimal("12.5"), -2) == 1250).
+    """
+    if not value.is_finite():
+        return None
+    scaled = value.scaleb(-exponent, _EXACT)  # only the exponent moves
+    units = int(scaled)
+    return units if scaled == units else None
+
+
+def decimal_to_cents(value: Decimal) -> Optional[int]:
+    """Exact whole cents for value, or None if it is not finite or has sub-cent precision."""
+    if not value.is_finite():
+        return None
+    scaled = value.scaleb(2, _EXACT)
+    cents = int(scaled)
+    return cents if scaled == cents else None
+
+
+def _plain(text: str) -> Optional[Tuple[int, int]]:
+    """(units, exponent) of a plain ASCII "[+-]digits[.digits]" string, else None."""
+    head, _, tail = text.partition(".")
+    digits = (head[1:] if head[:1] in ("+", "-") else head) + tail
+    if digits and digits.isascii() and digits.isdigit():
+        return int(head + tail), -len(tail)
+    return None
+
+
+def parse_units(value: Any, exponent: int = -2, field_name: str = "amount") -> Optional[int]:
+    """
+    units_at(parse_decimal_input(value, field_name), exponent), without the
+    Decimal for int and plain ASCII decimal strings: the exact count of
+    10**exponent units, None if value has finer precision. Raises ValueError
+    as parse_decimal_input() does.
+    """
+    kind = type(value)
+    if kind is str and not instrumentation._hooks:
+        head, _, tail = value.partition(".")
+        digits = (head[1:] if head[:1] in ("+", "-") else head) + tail
+        if digits and digits.isascii() and digits.isdigit():
+            shift = -len(tail) - exponent
+            if shift >= 0:
+                return int(head + tail) * 10**shift
+            return _rescale(int(head + tail), -len(tail), exponent)
+    elif kind is int and not instrumentation._hooks:
+        return _rescale(value, 0, exponent)
+    return units_at(parse_decimal_input(value, field_name), exponent)
+
+
+_set = object.__setattr__
+_ROUNDINGS = frozenset({ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_DOWN})
+
+
+class Money:
+    """
+    An exact decimal amount: units * 10**exponent.
+
+    Money values are immutable and hashable; equal amounts compare and hash
+    equal whatever their exponents (Money(1250, -2) == Money(125, -1)).
+    Negative zero is not represented.
+    """
+
+    __slots__ = ("units", "exponent")
+
+    units: int
+    exponent: int
+
+    def __init__(self, units: int, exponent: int = 0) -> None:
+        _set(self, "units", units)
+        _set(self, "exponent", exponent)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Money is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Money is immutable")
+
+    def __reduce__(self):
+        return (Money, (self.units, self.exponent))
+
+    @classmethod
+    def parse(cls, value: Any, field_name: str = "amount") -> "Money":
+        """
+        Parse value as parse_decimal_input() does (same accepted inputs, same
+        ValueError messages). int and plain ASCII decimal strings skip Decimal.
+        """
+        if not instrumentation._hooks:
+            kind = type(value)
+            if kind is int:
+                return cls(value, 0)
+            if kind is str:
+                plain = _plain(value)
+                if plain is not None:
+                    return cls(*plain)
+        return cls.from_decimal(parse_decimal_input(value, field_name))
+
+    @classmethod
+    def from_decimal(cls, value: Decimal) -> "Money":
+        """The exact Money for a finite Decimal. Raises ValueError otherwise."""
+        if not value.is_finite():
+            raise ValueError(f"Money needs a finite amount, got {value}.")
+        exponent = value.as_tuple().exponent
+        return cls(int(value.scaleb(-exponent, _EXACT)), exponent)
+
+    def to_decimal(self) -> Decimal:
+        """The exact Decimal (same digits and exponent)."""
+        return from_units(self.units, self.exponent)
+
+    def units_at(self, exponent: int) -> Optional[int]:
+        """Exact count of 10**exponent units, or None if self has finer precision."""
+        return _rescale(self.units, self.exponent, exponent)
+
+    def quantize(self, exponent: int, rounding: str = ROUND_HALF_EVEN) -> "Money":
+        """
+        Round to a multiple of 10**exponent, as Decimal.quantize() does with
+        rounding ROUND_HALF_EVEN, ROUND_HALF_UP or ROUND_DOWN.
+        """
+        if rounding not in _ROUNDINGS:
+            raise ValueError(f"Unsupported rounding {rounding!r}.")
+        shift = exponent - self.exponent
+        if shift <= 0:
+            return Money(self.units * 10**-shift, exponent)
+        step = 10**shift
+        quotient, remainder = divmod(abs(self.units), step)
+        if rounding != ROUND_DOWN:
+            twice = remainder * 2
+            if twice > step or (twice == step and (rounding == ROUND_HALF_UP or quotient % 2)):
+                quotient += 1
+        return Money(-quotient if self.units < 0 else quotient, exponent)
+
+    def _aligned(self, other: "Money"):
+        if self.exponent == other.exponent:
+            return self.units, other.units, self.exponent
+        if self.exponent < other.exponent:
+            return self.units, other.units * 10 ** (other.exponent - self.exponent), self.exponent
+        return self.units * 10 ** (self.exponent - other.exponent), other.units, other.exponent
+
+    def __add__(self, other: "Money") -> "Money":
+        if type(other) is not Money:
+            return NotImplemented
+        left, right, exponent = self._aligned(other)
+        return Money(left + right, exponent)
+
+    def __sub__(self, other: "Money") -> "Money":
+        if type(other) is not Money:
+            return NotImplemented
+        left, right, exponent = self._aligned(other)
+        return Money(left - right, exponent)
+
+    def __mul__(self, other: Union["Money", int]) -> "Money":
+        if type(other) is Money:
+            return Money(self.units * other.units, self.exponent + other.exponent)
+        if type(other) is int:
+            return Money(self.units * other, self.exponent)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Money":
+        return Money(-self.units, self.exponent)
+
+    def __abs__(self) -> "Money":
+        return Money(abs(self.units), self.exponent)
+
+    def __bool__(self) -> bool:
+        return self.units != 0
+
+    def _compare(self, other: Any):
+        if type(other) is not Money:
+            return NotImplemented
+        left, right, _ = self._aligned(other)
+        return left - right
+
+    def __eq__(self, other: Any) -> bool:
+        difference = self._compare(other)
+        return difference if difference is NotImplemented else difference == 0
+
+    def __lt__(self, other: "Money") -> bool:
+        difference = self._compare(other)
+        return difference if difference is NotImplemented else difference < 0
+
+    def __le__(self, other: "Money") -> bool:
+        difference = self._compare(other)
+        return difference if difference is NotImplemented else difference <= 0
+
+    def __gt__(self, other: "Money") -> bool:
+        difference = self._compare(other)
+        return difference if difference is NotImplemented else difference > 0
+
+    def __ge__(self, other: "Money") -> bool:
+        difference = self._compare(other)
+        return difference if difference is NotImplemented else difference >= 0
+
+    def __hash__(self) -> int:
+        units, exponent = self.units, self.exponent
+        if not units:
+            return hash((0, 0))
+        while units % 10 == 0:
+            units //= 10
+            exponent += 1
+        return hash((units, exponent))
+
+    def __str__(self) -> str:
+        return format(self.to_decimal(), "f")
+
+    def __repr__(self) -> str:
+        return f"Money('{self}')"
+
+
+def units_array(values: Iterable[Any], exponent: int = -2, field_name: str = "amount") -> "array[int]":
+    """
+    Parse a column of amounts into an array('q') of exact 10**exponent units.
+
+    Each value is parsed by parse_units(). Raises ValueError naming the
+    first value that does not parse, has finer precision than 10**exponent,
+    or does not fit in a signed 64-bit integer.
+    """
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+    try:
+        return array("q", [parse_units(value, exponent, field_name) for value in values])
+    except (ValueError, TypeError, OverflowError):
+        pass
+    # Slow path: find and name the first bad value.
+    for index, value in enumerate(values):
+        try:
+            units = parse_units(value, exponent, field_name)
+        except ValueError as exc:
+            raise ValueError(f"{field_name}[{index}]: {exc}") from None
+        if units is None:
+            raise ValueError(f"{field_name}[{index}] has more precision than 1E{exponent}.")
+        if not -(2**63) <= units < 2**63:
+            raise ValueError(f"{field_name}[{index}] does not fit in a 64-bit unit count.")
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def from_units(units: int, exponent: int = -2) -> Decimal:
+    """The exact Decimal of units * 10**exponent."""
+    return Decimal(units).scaleb(exponent, _EXACT)
+
+
+def from_units_array(column: Iterable[int], exponent: int = -2) -> List[Decimal]:
+    """The exact Decimals of a column of 10**exponent units."""
+    return [from_units(units, exponent) for units in column]
@@ -0,0 +1,54 @@
+"""
+Ordered, bounded process-pool map over chunks of a run.
+
+Bulk runs (PayrollGuard.verify_payroll_run(), ``qwed-tax verify``) shard their
+input into chunks and verify each chunk in a worker process. map_chunks()
+keeps at most 2 * workers chunks in flight, yields results in input order as
+soon as the next one is done, and cancels whatever has not started when the
+consumer stops early, so memory stays bounded for any input size.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+
+def map_chunks(
+    task: Callable[[Any], Any],
+    chunks: Iterable[Any],
+    workers: int,
+    pack: Optional[Callable[[Any], Any]] = None,
+) -> Iterator[Tuple[Any, Any]]:
+    """
+    Yields (chunk, task(pack(chunk))) in input order.
+
+    pack (default: the chunk itself) turns a chunk into the task's argument,
+    e.g. a cheaper wire form; the chunk is yielded as read. With workers == 1
+    tasks run in-process. With workers > 1 task and packed chunks must pickle;
+    at most 2 * workers chunks are in flight, and closing the generator early
+    cancels whatever has not started yet.
+    """
+    chunks = iter(chunks)
+    if workers == 1:
+        for chunk in chunks:
+            yield chunk, task(pack(chunk) if pack is not None else chunk)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = deque()
+
+        def submit(chunk):
+            pending.append((chunk, executor.submit(task, pack(chunk) if pack is not None else chunk)))
+
+        for chunk in islice(chunks, 2 * workers):
+            submit(chunk)
+        while pending:
+            chunk, future = pending.popleft()
+            output = future.result()
+            for refill in islice(chunks, 1):
+                submit(refill)
+            yield chunk, output
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,189 @@
+"""
+Canonical encoding and hashing behind proof_ref.
+
+A proof_ref is "qc1-sha256:" followed by the SHA-256 of the evidence's qc1
+encoding, a self-delimiting canonical form of JSON data:
+
+    None, True, False   N  T  F
+    int                 I<decimal>;
+    float               D<repr>;
+    str                 S<length>:<text>       (length in code points)
+    list / tuple        [<items>]
+    dict                {<key><value>...}      (keys as str, sorted)
+
+encoded as UTF-8. Unlike json.dumps(sort_keys=True) it needs no escaping and
+closes containers with a marker instead of a count, so ProofHasher can hash
+an arbitrarily long sequence item by item.
+
+Refs issued before qc1 are "sha256:" over json.dumps(evidence,
+sort_keys=True); verify_proof_ref() accepts both, and legacy_proof_ref()
+still computes the old form for systems that store it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, List
+
+from . import instrumentation
+
+PROOF_REF_PREFIX = "qc1-sha256:"
+LEGACY_PROOF_REF_PREFIX = "sha256:"
+
+# Encoded items ProofHasher buffers before feeding them to the digest.
+_FLUSH_ITEMS = 1024
+
+
+def _key(key: Any) -> str:
+    # Same coercion json.dumps applies to non-string keys.
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return float.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _encode(value: Any) -> str:
+    if type(value) is str:
+        return f"S{len(value)}:{value}"
+    if isinstance(value, dict):
+        try:
+            # Keys are unique, so sorting never compares values; a non-str
+            # key fails either the sort or str.__len__ and takes the slow path.
+            return _encode_items(sorted(value.items()))
+        except TypeError:
+            return _encode_items(sorted(((_key(key), item) for key, item in value.items()), key=_first))
+    if isinstance(value, (list, tuple)):
+        return "[%s]" % "".join([_encode(item) for item in value])
+    if value is None:
+        return "N"
+    if value is True:
+        return "T"
+    if value is False:
+        return "F"
+    if isinstance(value, str):
+        text = str.__str__(value)
+        return f"S{len(text)}:{text}"
+    if isinstance(value, int):
+        return f"I{int.__repr__(value)};"
+    if isinstance(value, float):
+        return f"D{float.__repr__(value)};"
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _encode_items(items: List[Any]) -> str:
+    return "{%s}" % "".join([
+        f"S{_str_len(key)}:{key}S{len(item)}:{item}" if type(item) is str else f"S{_str_len(key)}:{key}{_encode(item)}"
+        for key, item in items
+    ])
+
+
+_str_len = str.__len__
+
+
+def _first(item: Any) -> Any:
+    return item[0]
+
+
+def _to_bytes(text: str) -> bytes:
+    return text.encode("utf-8", "surrogatepass")
+
+
+def canonical_bytes(evidence: Any) -> bytes:
+    """
+    The qc1 encoding of evidence.
+
+    Raises:
+        ValueError: If evidence is not JSON data (fail-closed).
+    """
+    try:
+        return _to_bytes(_encode(evidence))
+    except (TypeError, RecursionError) as exc:
+        raise ValueError(f"Proof evidence must be JSON-serializable for proof_ref hashing: {exc}") from exc
+
+
+def proof_ref(evidence: Any) -> str:
+    """The qc1 proof_ref of evidence, e.g. "qc1-sha256:abcdef..."."""
+    if instrumentation._hooks:
+        return instrumentation.timed("proof", "qc1-sha256", "ok", _proof_ref, evidence)
+    return _proof_ref(evidence)
+
+
+def _proof_ref(evidence: Any) -> str:
+    return PROOF_REF_PREFIX + hashlib.sha256(canonical_bytes(evidence)).hexdigest()
+
+
+def legacy_proof_ref(evidence: Any) -> str:
+    """The pre-qc1 "sha256:" proof_ref: SHA-256 of json.dumps(evidence, sort_keys=True)."""
+    try:
+        payload = json.dumps(evidence, sort_keys=True)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(
+            f"Proof evidence must be JSON-serializable for proof_ref hashing: {exc}"
+        ) from exc
+    return LEGACY_PROOF_REF_PREFIX + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def verify_proof_ref(evidence: Any, ref: Any) -> bool:
+    """
+    Does ref bind evidence? Accepts qc1 and legacy "sha256:" refs. Fail-closed:
+    any other ref, or evidence that cannot be hashed, gives False.
+    """
+    if not isinstance(ref, str):
+        return False
+    try:
+        if ref.startswith(PROOF_REF_PREFIX):
+            return proof_ref(evidence) == ref
+        if ref.startswith(LEGACY_PROOF_REF_PREFIX):
+            return legacy_proof_ref(evidence) == ref
+    except ValueError:
+        return False
+    return False
+
+
+class ProofHasher:
+    """
+    proof_ref of a sequence built one item at a time, without holding the
+    sequence or its encoding in memory:
+
+        hasher = ProofHasher()
+        for result in results:
+            hasher.update(result)
+        hasher.proof_ref() == proof_ref(list(results))
+    """
+
+    __slots__ = ("_digest", "_parts", "count")
+
+    def __init__(self) -> None:
+        self._digest = hashlib.sha256()
+        self._parts: List[str] = ["["]
+        self.count = 0
+
+    def update(self, item: Any) -> None:
+        """
+        Append one item. Raises ValueError if it is not JSON data; the hasher
+        is then unchanged.
+        """
+        try:
+            self._parts.append(_encode(item))
+        except (TypeError, RecursionError) as exc:
+            raise ValueError(f"Proof evidence must be JSON-serializable for proof_ref hashing: {exc}") from exc
+        self.count += 1
+        if len(self._parts) >= _FLUSH_ITEMS:
+            self._digest.update(_to_bytes("".join(self._parts)))
+            self._parts.clear()
+
+    def proof_ref(self) -> str:
+        """The proof_ref of the items so far; more items may still be added."""
+        digest = self._digest.copy()
+        digest.update(_to_bytes("".join(self._parts) + "]"))
+        return PROOF_REF_PREFIX + digest.hexdigest()
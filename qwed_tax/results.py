@@ -0,0 +1,337 @@
+"""
+Compact result objects for the legacy dict returns.
+
+Guards return a fresh dict per verdict. For bulk runs the guards in each
+family can instead return a __slots__ object (pass compact=True) that reads
+like the dict it replaces: it is a Mapping (no item assignment) with the
+same keys, in the same order, present only where the dict would have them,
+and it compares equal to that dict. to_dict() gives the plain dict, e.g. for
+json.dumps. The fields are plain slots, not frozen (frozen slotted dataclasses
+break on Python < 3.12), so treat a result as a value and do not assign to it.
+
+    result = TDSGuard().calculate_deduction("PROFESSIONAL_FEES", "50000", "0", compact=True)
+    result["deduction"], result.deduction, result.get("error")   # "5000.00", "5000.00", None
+
+The guards' diagnose_*() methods build a TaxDiagnosticResult from these
+directly, with no intermediate dict.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+
+class _Absent:
+    """Marks a key the legacy dict would not have."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "ABSENT"
+
+    def __reduce__(self) -> str:
+        return "ABSENT"
+
+
+ABSENT: Any = _Absent()
+
+
+class GuardResult(Mapping):
+    """
+    Base for compact guard results: subclasses are slotted dataclasses whose
+    fields are the legacy keys, in legacy order, defaulting to ABSENT.
+
+    Where one method's legacy dicts list their keys in different orders, each
+    other order is a layout: a subclass with __slots__ = () and its own
+    _ORDER over the parent's fields.
+    """
+
+    __slots__ = ()
+
+    _KEYS: FrozenSet[str] = frozenset()
+    _ORDER: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "__annotations__" in cls.__dict__:
+            cls._ORDER = tuple(cls.__annotations__)
+            cls._KEYS = frozenset(cls._ORDER)
+        elif "_ORDER" in cls.__dict__:
+            unknown = set(cls._ORDER).difference(field.name for field in fields(cls))
+            if unknown:
+                raise TypeError(f"{cls.__name__}._ORDER names unknown fields: {sorted(unknown)}")
+            cls._KEYS = frozenset(cls._ORDER)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._KEYS:
+            value = getattr(self, key)
+            if value is not ABSENT:
+                return value
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._KEYS:
+            value = getattr(self, key)
+            if value is not ABSENT:
+                return value
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._KEYS and getattr(self, key) is not ABSENT  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self._ORDER if getattr(self, key) is not ABSENT)
+
+    def __len__(self) -> int:
+        return sum(getattr(self, key) is not ABSENT for key in self._ORDER)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The legacy dict this result stands for."""
+        return {key: value for key in self._ORDER if (value := getattr(self, key)) is not ABSENT}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class TDSResult(GuardResult):
+    """TDSGuard.calculate_deduction()."""
+
+    verified: bool
+    deduction: str = ABSENT
+    net_payable: str = ABSENT
+    section: str = ABSENT
+    error: str = ABSENT
+    audit_trace: Dict[str, Any] = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class RemittanceResult(GuardResult):
+    """RemittanceGuard.verify_lrs_limit()."""
+
+    verified: bool
+    error: str = ABSENT
+    audit_trace: Dict[str, Any] = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class ResidencyResult(GuardResult):
+    """PoEMGuard.determine_residency()."""
+
+    verified: bool
+    residency: str = ABSENT
+    is_aboi: bool = ABSENT
+    metrics: Dict[str, str] = ABSENT
+    reason: str = ABSENT
+    audit_trace: Dict[str, Any] = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class CapitalGainsResult(GuardResult):
+    """CapitalGainsGuard.verify_tax_rate()."""
+
+    verified: bool
+    error: str = ABSENT
+    audit_trace: Dict[str, Any] = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class SpeculationResult(GuardResult):
+    """SpeculationGuard.verify_setoff()."""
+
+    verified: bool
+    error: str = ABSENT
+    fix: str = ABSENT
+    note: str = ABSENT
+    audit_trace: Dict[str, Any] = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class ValuationResult(GuardResult):
+    """ValuationGuard.verify_conversion()."""
+
+    verified: bool
+    error: str = ABSENT
+    deterministic_price: str = ABSENT
+    shares_issued: str = ABSENT
+    method: str = ABSENT
+    audit_trace: Dict[str, Any] = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class ForeignTaxCreditResult(GuardResult):
+    """DTAAGuard.verify_foreign_tax_credit()."""
+
+    verified: bool
+    message: str = ABSENT
+    allowable_credit: str = ABSENT
+    excess_tax_lapsed: str = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class NexusResult(GuardResult):
+    """NexusGuard.check_nexus_liability()."""
+
+    verified: bool
+    error: str = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class LoanComplianceResult(GuardResult):
+    """RelatedPartyGuard.verify_loan_compliance()."""
+
+    verified: bool
+    risk: str = ABSENT
+    message: str = ABSENT
+    note: str = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class ArmsLengthResult(GuardResult):
+    """TransferPricingGuard.verify_arms_length_price()."""
+
+    verified: bool
+    risk: str = ABSENT
+    message: str = ABSENT
+    safe_harbour_range: List[str] = ABSENT
+    potential_adjustment: str = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class ITCResult(GuardResult):
+    """InputCreditGuard.verify_itc_eligibility()."""
+
+    verified: bool
+    eligible_itc: str = ABSENT
+    reason: str = ABSENT
+    note: str = ABSENT
+    unverified_category: bool = ABSENT
+    audit_trace: Dict[str, Any] = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class GSTINResult(GuardResult):
+    """InputCreditGuard.verify_gstin_format()."""
+
+    verified: bool
+    error: str = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class RCMResult(GuardResult):
+    """GSTGuard.verify_rcm_applicability() with a boolean claim."""
+
+    verified: bool
+    liability: str = ABSENT
+    is_rcm: Optional[bool] = ABSENT
+    claimed_is_rcm: bool = ABSENT
+    reason: str = ABSENT
+    error: Optional[str] = ABSENT
+    audit_trace: Dict[str, Any] = ABSENT
+    computed_only: bool = ABSENT
+
+
+class RCMCalculationResult(RCMResult):
+    """GSTGuard.verify_rcm_applicability() without a claim."""
+
+    __slots__ = ()
+    _ORDER = ("verified", "computed_only", "error", "liability", "is_rcm", "reason", "audit_trace")
+
+
+class RCMErrorResult(RCMResult):
+    """GSTGuard.verify_rcm_applicability() on an unknown type or a non-boolean claim."""
+
+    __slots__ = ()
+    _ORDER = ("verified", "error", "is_rcm")
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class GSTSplitResult(GuardResult):
+    """GSTGuard.verify_gst_split()."""
+
+    supply_type: str = ABSENT
+    expected: Dict[str, str] = ABSENT
+    claimed: Dict[str, str] = ABSENT
+    verified: bool = ABSENT
+    error: str = ABSENT
+
+
+class GSTSplitErrorResult(GSTSplitResult):
+    """GSTGuard.verify_gst_split() on a missing state or an invalid amount."""
+
+    __slots__ = ()
+    _ORDER = ("verified", "error")
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class SetOffResult(GuardResult):
+    """InterHeadAdjustmentGuard.verify_setoff()."""
+
+    verified: bool
+    message: str = ABSENT
+    audit_trace: Dict[str, Any] = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class InvestmentResult(GuardResult):
+    """InvestmentGuard.verify_classification()."""
+
+    classification: str
+    tax_treatment: str = ABSENT
+    verified: bool = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class WorkerClassificationResult(GuardResult):
+    """ClassificationGuard.verify_classification_claim()."""
+
+    verified: bool
+    error: str = ABSENT
+    audit_trace: Dict[str, Any] = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class ExemptStatusResult(GuardResult):
+    """WithholdingGuard.verify_exempt_status()."""
+
+    verified: bool
+    message: str = ABSENT
+    audit_trace: Dict[str, Any] = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class ReciprocityResult(GuardResult):
+    """ReciprocityGuard.verify_reciprocity() and determine_withholding_state()."""
+
+    verified: bool
+    withholding_state: Any = ABSENT
+    reason: str = ABSENT
+    message: str = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class ABCResult(GuardResult):
+    """ABCClassificationGuard.verify_classification()."""
+
+    verified: bool
+    classification: str = ABSENT
+    message: str = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class Form1099Result(GuardResult):
+    """Form1099Guard.verify_filing_requirement()."""
+
+    filing_required: Any
+    form: Optional[str] = ABSENT
+    reason: str = ABSENT
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class AddressResult(GuardResult):
+    """AddressGuard.verify_address()."""
+
+    verified: bool
+    message: str = ABSENT
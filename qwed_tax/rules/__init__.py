@@ -0,0 +1,311 @@
+"""
+Effective-dated rule tables.
+
+Thresholds and rates live in JSON data files next to this module, one file per
+rule family (tds.json, nexus.json, ...). Each key of a family holds a list of
+non-overlapping intervals with inclusive "from"/"to" ISO dates (null for an
+open end) and a value whose fields are typed by the family's "fields":
+
+    {
+      "family": "us_fica",
+      "title": "...",
+      "source": "...",
+      "fields": {"rate": "decimal", "wage_base": "decimal"},
+      "rules": {
+        "SOCIAL_SECURITY": [
+          {"from": "2024-01-01", "to": "2024-12-31", "value": {"rate": "0.062", "wage_base": "168600.00"}},
+          {"from": "2025-01-01", "to": null, "value": {"rate": "0.062", "wage_base": "176100.00"}}
+        ]
+      }
+    }
+
+Field types are "decimal", "int", "str" and "rule_ref" (the name of a RuleRef
+in qwed_tax.audit). A family is loaded and validated on first use, then
+compiled into the sorted start dates of its segments (the spans between any
+two interval boundaries) and one read-only {key: value} table per segment, so
+
+    rules.table("tds", as_of)            # every key in force on as_of
+    rules.lookup("tds", "COMMISSION", as_of)
+
+is a bisect over the boundaries: O(log n) in the number of rule changes.
+With as_of None the table in force today is returned; it is cached until the
+next boundary, so undated calls cost one clock read.
+
+as_of is a date, a datetime (its date is used) or an ISO "YYYY-MM-DD" string;
+anything else raises ValueError. A key with no interval covering as_of is
+absent from that date's table (the guards then fail closed).
+
+Replacing or reloading tables (set_default_registry(), RuleRegistry.reload())
+invalidates every VerdictCache, since cached verdicts were decided under the
+old rules.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from bisect import bisect_right
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+RULES_DIR = Path(__file__).resolve().parent
+
+AsOf = Union[date, datetime, str, None]
+
+# Clock for the cached "today" table (tests replace it).
+_time = time.time
+
+
+def _rule_ref(name: str) -> Any:
+    from .. import audit
+
+    ref = getattr(audit, name, None)
+    if not isinstance(ref, audit.RuleRef):
+        raise ValueError(f"unknown RuleRef {name!r}")
+    return ref
+
+
+def _decimal(text: str) -> Decimal:
+    if not isinstance(text, str):
+        raise ValueError(f"decimal fields are strings, got {text!r}")
+    try:
+        value = Decimal(text)
+    except InvalidOperation as exc:
+        raise ValueError(f"invalid decimal {text!r}") from exc
+    if not value.is_finite():
+        raise ValueError(f"invalid decimal {text!r}")
+    return value
+
+
+def _int(value: Any) -> int:
+    if type(value) is not int:
+        raise ValueError(f"int fields are JSON integers, got {value!r}")
+    return value
+
+
+def _str(value: Any) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"str fields are strings, got {value!r}")
+    return value
+
+
+_FIELD_TYPES: Dict[str, Callable[[Any], Any]] = {
+    "decimal": _decimal,
+    "int": _int,
+    "str": _str,
+    "rule_ref": _rule_ref,
+}
+
+
+def as_of_ordinal(as_of: Union[date, datetime, str]) -> int:
+    """The proleptic Gregorian ordinal of as_of (see module docstring)."""
+    if isinstance(as_of, datetime):
+        return as_of.date().toordinal()
+    if isinstance(as_of, date):
+        return as_of.toordinal()
+    if isinstance(as_of, str):
+        try:
+            return date.fromisoformat(as_of.strip()).toordinal()
+        except ValueError:
+            pass
+    raise ValueError(f"as_of must be a date or an ISO date (YYYY-MM-DD), got {as_of!r}.")
+
+
+def _midnight(ordinal: int) -> float:
+    return datetime.combine(date.fromordinal(ordinal), datetime.min.time()).timestamp()
+
+
+class RuleFamily:
+    """One compiled rule family: a bisectable list of dated tables."""
+
+    def __init__(self, name: str, title: str, source: str, starts: Tuple[int, ...], tables: Tuple[Mapping[str, Any], ...]):
+        self.name = name
+        self.title = title
+        self.source = source
+        # starts[0] is 0: before every boundary (no date has ordinal 0).
+        self._starts = starts
+        self._tables = tables
+        self._current: Tuple[float, float, Mapping[str, Any]] = (math.inf, -math.inf, MappingProxyType({}))
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], name: Optional[str] = None) -> "RuleFamily":
+        """Validate and compile a family from its decoded JSON. Raises ValueError."""
+        family = data.get("family")
+        if not isinstance(family, str) or (name is not None and family != name):
+            raise ValueError(f"rule file for {name!r} declares family {family!r}")
+        fields = data.get("fields")
+        if not isinstance(fields, dict) or not fields:
+            raise ValueError(f"{family}: 'fields' must map field names to types")
+        for field, kind in fields.items():
+            if kind not in _FIELD_TYPES:
+                raise ValueError(f"{family}: field {field!r} has unknown type {kind!r}")
+        rules = data.get("rules")
+        if not isinstance(rules, dict):
+            raise ValueError(f"{family}: 'rules' must map keys to interval lists")
+
+        # key -> [(first ordinal, last ordinal + 1, value)], sorted
+        intervals: Dict[str, List[Tuple[int, float, Mapping[str, Any]]]] = {}
+        for key, entries in rules.items():
+            if not isinstance(entries, list) or not entries:
+                raise ValueError(f"{family}.{key}: expected a non-empty list of intervals")
+            spans = []
+            for entry in entries:
+                spans.append(cls._compile_interval(family, key, fields, entry))
+            spans.sort(key=lambda span: span[0])
+            for (_, end, _), (start, _, _) in zip(spans, spans[1:]):
+                if start < end:
+                    raise ValueError(f"{family}.{key}: intervals overlap")
+            intervals[key] = spans
+
+        boundaries = {0}
+        for spans in intervals.values():
+            for start, end, _ in spans:
+                boundaries.add(start)
+                if end != math.inf:
+                    boundaries.add(int(end))
+        starts = tuple(sorted(boundaries))
+        tables = tuple(
+            MappingProxyType({
+                key: value
+                for key, spans in intervals.items()
+                for first, end, value in spans
+                if first <= start < end
+            })
+            for start in starts
+        )
+        return cls(family, data.get("title", ""), data.get("source", ""), starts, tables)
+
+    @staticmethod
+    def _compile_interval(
+        family: str, key: str, fields: Mapping[str, str], entry: Any
+    ) -> Tuple[int, float, Mapping[str, Any]]:
+        where = f"{family}.{key}"
+        if not isinstance(entry, dict) or set(entry) - {"from", "to", "value"}:
+            raise ValueError(f"{where}: intervals have only 'from', 'to' and 'value'")
+        try:
+            start = as_of_ordinal(entry["from"]) if entry.get("from") is not None else 0
+            end = as_of_ordinal(entry["to"]) + 1 if entry.get("to") is not None else math.inf
+        except ValueError as exc:
+            raise ValueError(f"{where}: {exc}") from exc
+        if end <= start:
+            raise ValueError(f"{where}: interval ends before it starts")
+        raw = entry.get("value")
+        if not isinstance(raw, dict) or set(raw) != set(fields):
+            raise ValueError(f"{where}: value must have exactly the fields {sorted(fields)}")
+        try:
+            value = {field: _FIELD_TYPES[fields[field]](raw[field]) for field in fields}
+        except ValueError as exc:
+            raise ValueError(f"{where}: {exc}") from exc
+        return start, end, MappingProxyType(value)
+
+    def table(self, as_of: AsOf = None) -> Mapping[str, Any]:
+        """Read-only {key: value} of every key in force on as_of (today if None)."""
+        if as_of is None:
+            valid_from, valid_until, table = self._current
+            now = _time()
+            if valid_from <= now < valid_until:
+                return table
+            return self._refresh(now)
+        return self._tables[bisect_right(self._starts, as_of_ordinal(as_of)) - 1]
+
+    def _refresh(self, now: float) -> Mapping[str, Any]:
+        index = bisect_right(self._starts, date.fromtimestamp(now).toordinal()) - 1
+        valid_from = _midnight(self._starts[index]) if index else -math.inf
+        valid_until = _midnight(self._starts[index + 1]) if index + 1 < len(self._starts) else math.inf
+        table = self._tables[index]
+        self._current = (valid_from, valid_until, table)
+        return table
+
+    def lookup(self, key: str, as_of: AsOf = None) -> Any:
+        """The value of key on as_of. Raises KeyError if no interval covers it."""
+        try:
+            return self.table(as_of)[key]
+        except KeyError:
+            raise KeyError(f"{self.name}: no rule for {key!r} in force on {as_of or 'today'}") from None
+
+    def boundaries(self) -> Tuple[date, ...]:
+        """Every date on which some key of the family changes."""
+        return tuple(date.fromordinal(start) for start in self._starts[1:])
+
+
+class RuleRegistry:
+    """
+    Rule families loaded from a directory of <family>.json files.
+
+    Families are read on first use and kept; loading is thread-safe.
+    """
+
+    def __init__(self, directory: Union[str, Path] = RULES_DIR):
+        self.directory = Path(directory)
+        self._families: Dict[str, RuleFamily] = {}
+        self._lock = threading.Lock()
+
+    def family(self, name: str) -> RuleFamily:
+        family = self._families.get(name)
+        if family is None:
+            family = self._load(name)
+        return family
+
+    def _load(self, name: str) -> RuleFamily:
+        with self._lock:
+            family = self._families.get(name)
+            if family is not None:
+                return family
+            path = self.directory / f"{name}.json"
+            if not name.isidentifier() or not path.is_file():
+                raise LookupError(f"No rule family {name!r} in {self.directory}")
+            with path.open(encoding="utf-8") as handle:
+                family = RuleFamily.from_dict(json.load(handle), name)
+            self._families[name] = family
+            return family
+
+    def families(self) -> List[str]:
+        """Names of every family file in the directory."""
+        return sorted(path.stem for path in self.directory.glob("*.json"))
+
+    def table(self, family: str, as_of: AsOf = None) -> Mapping[str, Any]:
+        return self.family(family).table(as_of)
+
+    def lookup(self, family: str, key: str, as_of: AsOf = None) -> Any:
+        return self.family(family).lookup(key, as_of)
+
+    def reload(self) -> None:
+        """Forget loaded families (re-read on next use) and invalidate verdict caches."""
+        from ..cache import invalidate_verdict_caches
+
+        with self._lock:
+            self._families = {}
+        invalidate_verdict_caches()
+
+
+_default = RuleRegistry()
+
+
+def default_registry() -> RuleRegistry:
+    return _default
+
+
+def set_default_registry(registry: RuleRegistry) -> None:
+    """Make the guards read registry's tables, and invalidate verdict caches."""
+    from ..cache import invalidate_verdict_caches
+
+    global _default
+    if not isinstance(registry, RuleRegistry):
+        raise TypeError("registry must be a RuleRegistry.")
+    _default = registry
+    invalidate_verdict_caches()
+
+
+def table(family: str, as_of: AsOf = None) -> Mapping[str, Any]:
+    """default_registry().table(family, as_of)."""
+    return _default.family(family).table(as_of)
+
+
+def lookup(family: str, key: str, as_of: AsOf = None) -> Any:
+    """default_registry().lookup(family, key, as_of)."""
+    return _default.family(family).lookup(key, as_of)
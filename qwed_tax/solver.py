@@ -0,0 +1,63 @@
+"""
+Cached, per-thread Z3 solver contexts for the Z3-backed guards.
+
+Building a z3.Solver and re-declaring the same rule on every call dominates
+latency for the small rule sets the guards check. A RuleSet builds its rules
+once per thread, in that thread's own z3.Context, and each call checks its
+facts inside push()/pop() so nothing leaks between calls.
+
+Z3 contexts are not thread-safe; giving every thread its own context (rather
+than sharing z3's global one) is what makes the guards safe in thread pools.
+"""
+
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Callable, Iterator, Tuple
+
+import z3
+
+
+class RuleSet:
+    """
+    A Z3 rule set compiled once per thread and reused across calls.
+
+    Args:
+        name: identifier used in error messages and repr.
+        build: called once per thread as build(ctx, solver). It must create
+            every symbol in ctx, add the rules to solver, and return the
+            symbols the guard needs (as a dict of name -> expression).
+
+    Usage::
+
+        with RULES.scope() as (solver, v):
+            solver.add(v.exempt == form.claim_exempt)
+            result = solver.check()
+    """
+
+    def __init__(self, name: str, build: Callable[[z3.Context, z3.Solver], dict]):
+        self.name = name
+        self._build = build
+        self._local = threading.local()
+
+    def __repr__(self) -> str:
+        return f"RuleSet({self.name!r})"
+
+    def _state(self) -> Tuple[z3.Solver, SimpleNamespace]:
+        state = getattr(self._local, "state", None)
+        if state is None:
+            ctx = z3.Context()
+            solver = z3.Solver(ctx=ctx)
+            symbols = SimpleNamespace(ctx=ctx, **self._build(ctx, solver))
+            state = self._local.state = (solver, symbols)
+        return state
+
+    @contextmanager
+    def scope(self) -> Iterator[Tuple[z3.Solver, SimpleNamespace]]:
+        """Yields (solver, symbols) with a fresh backtracking point for per-call facts."""
+        solver, symbols = self._state()
+        solver.push()
+        try:
+            yield solver, symbols
+        finally:
+            solver.pop()
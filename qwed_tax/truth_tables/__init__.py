@@ -0,0 +1,85 @@
+"""
+Precompiled truth tables for the finite-domain Z3 rules.
+
+The W-4 exempt rule (IRS Pub 505), the ABC worker-classification test and
+the intraday/delivery tax-head rule range over a handful of booleans. They
+are enumerated once in Z3 at build time (qwed_tax.truth_tables.compiler) and
+shipped as lookup tables indexed by a bit-packed input tuple, so runtime
+verification is a tuple index with no solver import.
+
+Each table's proof_ref is the compute_proof_ref() hash of its entry in
+obligations.json: the SMT-LIB queries Z3 answered for every input
+combination, with their results. verify_obligations() re-checks that binding
+without Z3.
+
+Regenerate after changing a rule:
+
+    python -m qwed_tax.truth_tables.compiler
+"""
+
+import json
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Tuple
+
+from ..diagnostics import verify_proof_ref
+from ._tables import TABLE_DATA
+
+OBLIGATIONS_PATH = Path(__file__).with_name("obligations.json")
+
+
+class TruthTable(NamedTuple):
+    """A compiled rule: outcomes[key] for key = sum(bit_i << i) over inputs."""
+
+    rule_id: str
+    inputs: Tuple[str, ...]
+    outcomes: Tuple[Any, ...]
+    proof_ref: str
+
+    def key(self, *bits: bool) -> int:
+        if len(bits) != len(self.inputs):
+            raise ValueError(f"{self.rule_id} takes {len(self.inputs)} inputs: {', '.join(self.inputs)}.")
+        key = 0
+        for position, bit in enumerate(bits):
+            if bit:
+                key |= 1 << position
+        return key
+
+    def lookup(self, *bits: bool) -> Any:
+        """Outcome for the given input bits, in the order of self.inputs."""
+        return self.outcomes[self.key(*bits)]
+
+
+TABLES: Mapping[str, TruthTable] = MappingProxyType({
+    rule_id: TruthTable(rule_id, data["inputs"], data["outcomes"], data["proof_ref"])
+    for rule_id, data in TABLE_DATA.items()
+})
+
+
+def load_obligations() -> Dict[str, Any]:
+    """The Z3 proof-obligation artifact the tables were compiled from."""
+    with OBLIGATIONS_PATH.open(encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def verify_obligations() -> Dict[str, bool]:
+    """
+    For each table: does its proof_ref hash its obligations entry, and do the
+    outcomes recorded there match the table? Fail-closed: a rule missing from
+    the artifact maps to False.
+    """
+    rules = load_obligations()["rules"]
+    checks = {}
+    for rule_id, table in TABLES.items():
+        entry = rules.get(rule_id)
+        checks[rule_id] = (
+            entry is not None
+            and verify_proof_ref(entry, table.proof_ref)
+            and tuple(_as_outcome(case["outcome"]) for case in entry["cases"]) == table.outcomes
+        )
+    return checks
+
+
+def _as_outcome(value: Any) -> Any:
+    # JSON has no tuples; composite outcomes are stored as lists.
+    return tuple(value) if isinstance(value, list) else value
@@ -0,0 +1,20 @@
+# Generated by `python -m qwed_tax.truth_tables.compiler`. Do not edit.
+# Each proof_ref is compute_proof_ref() of the rule's entry in obligations.json.
+
+TABLE_DATA = {
+    'W4_EXEMPT_PUB505': {
+        'inputs': ('claim_exempt', 'liability_is_zero', 'expect_refund_this_year'),
+        'outcomes': (True, False, True, False, True, False, True, True),
+        'proof_ref': 'qc1-sha256:b599ddfd1e7909ca7b25d5cb0fda5ea24eb2722073148bab9a9793ac73f26cd0',
+    },
+    'ABC_TEST': {
+        'inputs': ('freedom_from_control', 'work_outside_usual_business', 'customarily_engaged_independently', 'claimed_contractor'),
+        'outcomes': ((True, False), (True, False), (True, False), (True, False), (True, False), (True, False), (True, False), (False, True), (False, False), (False, False), (False, False), (False, False), (False, False), (False, False), (False, False), (True, True)),
+        'proof_ref': 'qc1-sha256:8573a87c02e7eafb90e9bae8910ca4150965f5b1c34d75561ae460e833ea1abc',
+    },
+    'INVESTMENT_TAX_HEAD': {
+        'inputs': ('is_intraday', 'is_delivery'),
+        'outcomes': ('unknown', 'speculative', 'capital_gains', 'unsat'),
+        'proof_ref': 'qc1-sha256:25da71387511600a9113f654538de71303c8edd6d2fca7d3551648f72f3200d4',
+    },
+}
@@ -0,0 +1,237 @@
+"""
+Build-time compiler: enumerates the finite-domain rules in Z3 and writes the
+lookup tables (_tables.py) plus the proof-obligation artifact
+(obligations.json) they are bound to.
+
+    python -m qwed_tax.truth_tables.compiler          # regenerate
+    python -m qwed_tax.truth_tables.compiler --check  # fail if out of date
+
+Only this module (and tests) import Z3; the guards read the generated tables.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+import z3
+from z3 import And, Bool, Implies, Not, Real, is_true, sat
+
+from ..diagnostics import compute_proof_ref
+from ..solver import RuleSet
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+TABLES_PATH = PACKAGE_DIR / "_tables.py"
+OBLIGATIONS_PATH = PACKAGE_DIR / "obligations.json"
+
+
+def _exempt_rules(ctx, s):
+    # Define Z3 Variables
+    exempt = Bool('claim_exempt', ctx)
+    liability_last = Real('liability_last_year', ctx)
+    expect_no_liability = Bool('expect_refund_this_year', ctx) # True means they expect refund/no tax
+
+    # The Divine Rule (IRS Pub 505)
+    # If Exempt is True, THEN (LiabilityLast == 0 AND ExpectNoLiability == True)
+    s.add(Implies(exempt, And(liability_last == 0, expect_no_liability)))
+    return {"exempt": exempt, "liability_last": liability_last, "expect_no_liability": expect_no_liability}
+
+
+def _abc_rules(ctx, s):
+    is_contractor = Bool('is_contractor', ctx)
+    A_control_free = Bool('A_freedom_from_control', ctx)
+    B_outside_business = Bool('B_work_outside_usual_business', ctx)
+    C_independent_trade = Bool('C_customarily_engaged_independently', ctx)
+
+    # The ABC Rule (Strict Conjunction)
+    # To be a contractor, ALL three must be true.
+    s.add(is_contractor == And(A_control_free, B_outside_business, C_independent_trade))
+    return {
+        "is_contractor": is_contractor,
+        "A_control_free": A_control_free,
+        "B_outside_business": B_outside_business,
+        "C_independent_trade": C_independent_trade,
+    }
+
+
+def _head_rules(ctx, s):
+    is_intraday = Bool('is_intraday', ctx)
+    is_delivery = Bool('is_delivery', ctx)
+    tax_head_speculative = Bool('head_speculative_business', ctx)
+    tax_head_capital_gains = Bool('head_capital_gains', ctx)
+
+    # Rule 1: Intraday is ALWAYS Speculative Business (Sec 43(5))
+    s.add(Implies(is_intraday, tax_head_speculative))
+    # Rule 2: Delivery is Capital Gains
+    s.add(Implies(is_delivery, tax_head_capital_gains))
+    # Rule 3: Mutually Exclusive Heads (Simplified)
+    s.add(Not(And(tax_head_speculative, tax_head_capital_gains)))
+    return {
+        "is_intraday": is_intraday,
+        "is_delivery": is_delivery,
+        "tax_head_speculative": tax_head_speculative,
+        "tax_head_capital_gains": tax_head_capital_gains,
+    }
+
+
+_EXEMPT_RULES = RuleSet("w4_exempt_pub505", _exempt_rules)
+_ABC_RULES = RuleSet("abc_test", _abc_rules)
+_HEAD_RULES = RuleSet("investment_tax_head", _head_rules)
+
+Queries = List[Dict[str, str]]
+
+
+def _query(s: z3.Solver, queries: Queries, *facts) -> z3.CheckSatResult:
+    """Checks the rule set plus facts and records the SMT-LIB obligation."""
+    s.push()
+    try:
+        s.add(*facts)
+        result = s.check()
+        queries.append({"smt2": s.to_smt2(), "result": str(result)})
+        return result
+    finally:
+        s.pop()
+
+
+def _decide_exempt(bits: Sequence[bool], queries: Queries) -> bool:
+    claim_exempt, liability_is_zero, expect_refund = bits
+    with _EXEMPT_RULES.scope() as (s, v):
+        # The rule mentions the real only through liability == 0, so a form's
+        # satisfiability depends on that predicate alone, not the exact value.
+        liability = v.liability_last == 0 if liability_is_zero else v.liability_last != 0
+        return _query(s, queries, v.exempt == claim_exempt, liability, v.expect_no_liability == expect_refund) == sat
+
+
+def _decide_abc(bits: Sequence[bool], queries: Queries) -> Tuple[bool, bool]:
+    """(claim verified, legally a contractor)."""
+    control_free, outside_business, independent, claimed_contractor = bits
+    with _ABC_RULES.scope() as (s, v):
+        facts = (
+            v.A_control_free == control_free,
+            v.B_outside_business == outside_business,
+            v.C_independent_trade == independent,
+        )
+        if _query(s, queries, *facts, v.is_contractor == claimed_contractor) == sat:
+            return True, claimed_contractor
+        # Contradiction: the facts alone determine what the status SHOULD be.
+        s.push()
+        s.add(*facts)
+        s.check()
+        correct = is_true(s.model()[v.is_contractor])
+        queries.append({"smt2": s.to_smt2(), "result": "sat", "model": {"is_contractor": correct}})
+        s.pop()
+        return False, correct
+
+
+def _decide_head(bits: Sequence[bool], queries: Queries) -> str:
+    """'speculative', 'capital_gains', 'unknown' (no head forced) or 'unsat'."""
+    is_intraday, is_delivery = bits
+    with _HEAD_RULES.scope() as (s, v):
+        s.push()
+        s.add(v.is_intraday == is_intraday, v.is_delivery == is_delivery)
+        result = s.check()
+        query = {"smt2": s.to_smt2(), "result": str(result)}
+        if result == sat:
+            m = s.model()
+            is_spec = is_true(m[v.tax_head_speculative])
+            is_cg = is_true(m[v.tax_head_capital_gains])
+            query["model"] = {"head_speculative_business": is_spec, "head_capital_gains": is_cg}
+        s.pop()
+        queries.append(query)
+        if result != sat:
+            return "unsat"
+        return "speculative" if is_spec else "capital_gains" if is_cg else "unknown"
+
+
+class RuleSpec(NamedTuple):
+    rule_id: str
+    inputs: Tuple[str, ...]
+    decide: Callable[[Sequence[bool], Queries], Any]
+
+
+RULES: Tuple[RuleSpec, ...] = (
+    RuleSpec("W4_EXEMPT_PUB505", ("claim_exempt", "liability_is_zero", "expect_refund_this_year"), _decide_exempt),
+    RuleSpec(
+        "ABC_TEST",
+        ("freedom_from_control", "work_outside_usual_business", "customarily_engaged_independently", "claimed_contractor"),
+        _decide_abc,
+    ),
+    RuleSpec("INVESTMENT_TAX_HEAD", ("is_intraday", "is_delivery"), _decide_head),
+)
+
+
+def _bits(key: int, width: int) -> Tuple[bool, ...]:
+    return tuple(bool(key >> position & 1) for position in range(width))
+
+
+def evaluate(rule_id: str, bits: Sequence[bool]) -> Any:
+    """Live Z3 answer for one input combination (used by the differential tests)."""
+    spec = next(spec for spec in RULES if spec.rule_id == rule_id)
+    return spec.decide(tuple(bool(b) for b in bits), [])
+
+
+def compile_rules() -> Dict[str, Dict[str, Any]]:
+    """Enumerates every rule over its full input space: rule_id -> obligations entry."""
+    compiled = {}
+    for spec in RULES:
+        cases = []
+        for key in range(1 << len(spec.inputs)):
+            bits = _bits(key, len(spec.inputs))
+            queries: Queries = []
+            outcome = spec.decide(bits, queries)
+            cases.append({
+                "key": key,
+                "facts": dict(zip(spec.inputs, bits)),
+                "queries": queries,
+                "outcome": list(outcome) if isinstance(outcome, tuple) else outcome,
+            })
+        compiled[spec.rule_id] = {"rule_id": spec.rule_id, "inputs": list(spec.inputs), "cases": cases}
+    return compiled
+
+
+def render(compiled: Dict[str, Dict[str, Any]]) -> Tuple[str, str]:
+    """(_tables.py source, obligations.json text)."""
+    lines = [
+        "# Generated by `python -m qwed_tax.truth_tables.compiler`. Do not edit.",
+        "# Each proof_ref is compute_proof_ref() of the rule's entry in obligations.json.",
+        "",
+        "TABLE_DATA = {",
+    ]
+    for rule_id, entry in compiled.items():
+        outcomes = tuple(tuple(c["outcome"]) if isinstance(c["outcome"], list) else c["outcome"] for c in entry["cases"])
+        lines += [
+            f"    {rule_id!r}: {{",
+            f"        'inputs': {tuple(entry['inputs'])!r},",
+            f"        'outcomes': {outcomes!r},",
+            f"        'proof_ref': {compute_proof_ref(entry)!r},",
+            "    },",
+        ]
+    lines += ["}", ""]
+    artifact = {"z3_version": z3.get_version_string(), "rules": compiled}
+    return "\n".join(lines), json.dumps(artifact, indent=1, sort_keys=True) + "\n"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compile finite-domain Z3 rules into lookup tables.")
+    parser.add_argument("--check", action="store_true", help="exit 1 if the generated files are out of date")
+    args = parser.parse_args(argv)
+
+    tables_src, obligations = render(compile_rules())
+    if args.check:
+        stale = [
+            path.name for path, text in ((TABLES_PATH, tables_src), (OBLIGATIONS_PATH, obligations))
+            if not path.exists() or path.read_text(encoding="utf-8") != text
+        ]
+        if stale:
+            print(f"out of date: {', '.join(stale)}", file=sys.stderr)
+            return 1
+        return 0
+    TABLES_PATH.write_text(tables_src, encoding="utf-8")
+    OBLIGATIONS_PATH.write_text(obligations, encoding="utf-8")
+    print(f"wrote {TABLES_PATH.name} and {OBLIGATIONS_PATH.name}: {', '.join(spec.rule_id for spec in RULES)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,25 +1,101 @@
-from typing import Any, ClassVar, Dict
+import importlib
+import time
+from datetime import date
+from types import MappingProxyType
+from typing import Any, Callable, ClassVar, Dict, Hashable, Iterable, Mapping, NamedTuple, Optional
 from decimal import Decimal
-from .guards.speculation_guard import SpeculationGuard
-from .guards.capital_gains_guard import CapitalGainsGuard
-from .guards.related_party_guard import RelatedPartyGuard
-from .guards.valuation_guard import ValuationGuard
-from .guards.remittance_guard import RemittanceGuard
-from .guards.indirect_tax_guard import InputCreditGuard
-from .guards.tds_guard import TDSGuard
-from .guards.classification_guard import ClassificationGuard
-from .guards.nexus_guard import NexusGuard
-from .jurisdictions.us.payroll_guard import PayrollGuard
-from .jurisdictions.india.guards.crypto_guard import CryptoTaxGuard
-from .jurisdictions.india.guards.investment_guard import InvestmentGuard
-from .jurisdictions.india.guards.gst_guard import GSTGuard
-from .jurisdictions.india.guards.deposit_guard import DepositRateGuard
+
+from . import instrumentation, rules
+from .cache import VerdictCache, verdict_key
+
+_NOTHING_RUN: frozenset[str] = frozenset()
+
+# Field value types a verdict cache key holds directly (see _verdict_key).
+# float is left to the digest: 0.0 and -0.0 compare equal but may not decide
+# the same way.
+_KEY_SCALARS: frozenset[type] = frozenset({str, int, bool, type(None)})
+
+
+class _LazyGuard:
+    """
+    Guard attribute built on first access and cached on the instance.
+
+    The guard's module is imported at the same moment, so constructing a
+    TaxPreFlight or TaxVerifier costs nothing for guards a caller never uses.
+    With jurisdiction set, the attribute only exists on verifiers for that
+    jurisdiction (AttributeError otherwise), as when guards were assigned
+    per jurisdiction in __init__. Guards are stateless, so two threads racing
+    on first access at worst build one spare instance; setdefault() makes
+    every racer return the instance that was published.
+    """
+
+    def __init__(self, module: str, class_name: str, jurisdiction: Optional[str] = None):
+        self.module = module
+        self.class_name = class_name
+        self.jurisdiction = jurisdiction
+        self.name = class_name
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        if self.jurisdiction is not None and instance.jurisdiction != self.jurisdiction:
+            raise AttributeError(
+                f"{type(instance).__name__!r} for jurisdiction {instance.jurisdiction!r} has no attribute {self.name!r}"
+            )
+        guard_class = getattr(importlib.import_module(self.module, __package__), self.class_name)
+        return instance.__dict__.setdefault(self.name, guard_class())
+
+
+class _CheckPlan(NamedTuple):
+    """One compiled _ACTION_CHECKS entry: pre-split paths and resolved callables."""
+
+    name: str
+    required: tuple[str, ...]
+    required_paths: tuple[tuple[str, ...], ...]
+    trigger_paths: tuple[tuple[str, ...], ...]
+    handler: Callable[..., None]
+    supported_if: Optional[Callable[..., bool]]
+
+
+class _ActionPlan(NamedTuple):
+    """All compiled checks for one canonical action."""
+
+    action: str
+    checks: tuple[_CheckPlan, ...]
+    missing_claim_message: str
+    # frozenset of run check names -> checks_not_run, for every subset.
+    checks_not_run: Mapping[frozenset[str], tuple[str, ...]]
+
+
+def _get_path(payload: Dict[str, Any], path: tuple[str, ...]) -> Any:
+    current: Any = payload
+    for part in path:
+        current = current[part]
+    return current
+
+
+def _has_path(payload: Dict[str, Any], path: tuple[str, ...]) -> bool:
+    current: Any = payload
+    for part in path:
+        if not isinstance(current, dict) or part not in current:
+            return False
+        current = current[part]
+    return current is not None and current != ""
+
 
 class TaxPreFlight:
     """
     The 'Swiss Cheese' Defense Layer for Agentic Finance.
     Runs generic deterministic checks (Classification, Nexus) BEFORE
     heavy payroll or logic execution.
+
+    Thread-safe: one instance can serve every worker thread. Compiled plans
+    and guard rule tables are read-only, guards keep no per-call state,
+    Decimal arithmetic runs in the money kernel's private context (see
+    qwed_tax.money), and the optional verdict cache is locked.
     """
     _ACTION_ALIASES: ClassVar[dict[str, str]] = {
         "hire_worker": "hire",
@@ -131,16 +207,83 @@ class TaxPreFlight:
         ],
     }
 
-    def __init__(self):
-        self.classifier = ClassificationGuard()
-        self.nexus = NexusGuard()
-        self.speculation = SpeculationGuard()
-        self.cg = CapitalGainsGuard()
-        self.related_party = RelatedPartyGuard()
-        self.valuation = ValuationGuard()
-        self.remittance = RemittanceGuard()
-        self.indirect_tax = InputCreditGuard()
-        self.withholding = TDSGuard()
+    # Guards are built on first use (see _LazyGuard).
+    classifier = _LazyGuard(".guards.classification_guard", "ClassificationGuard")
+    nexus = _LazyGuard(".guards.nexus_guard", "NexusGuard")
+    speculation = _LazyGuard(".guards.speculation_guard", "SpeculationGuard")
+    cg = _LazyGuard(".guards.capital_gains_guard", "CapitalGainsGuard")
+    related_party = _LazyGuard(".guards.related_party_guard", "RelatedPartyGuard")
+    valuation = _LazyGuard(".guards.valuation_guard", "ValuationGuard")
+    remittance = _LazyGuard(".guards.remittance_guard", "RemittanceGuard")
+    indirect_tax = _LazyGuard(".guards.indirect_tax_guard", "InputCreditGuard")
+    withholding = _LazyGuard(".guards.tds_guard", "TDSGuard")
+
+    # Compiled from _ACTION_CHECKS once per class (see _compile_plans).
+    _PLANS: ClassVar[Mapping[str, "_ActionPlan"]]
+
+    # Optional verdict cache (see qwed_tax.cache); None audits every intent.
+    verdict_cache: Optional[VerdictCache] = None
+
+    def __init__(self, verdict_cache: Optional[VerdictCache] = None):
+        if verdict_cache is not None:
+            self.verdict_cache = verdict_cache
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._compile_plans()
+
+    @classmethod
+    def _compile_plans(cls) -> None:
+        """
+        Compile _ACTION_CHECKS into immutable per-action plans.
+
+        Dotted field paths are split once, handler/predicate names are resolved
+        to functions, and checks_not_run is precomputed for every subset of
+        checks that can run, so audit_transaction() does no string parsing.
+        """
+        plans = {}
+        for action, checks in cls._ACTION_CHECKS.items():
+            compiled = tuple(
+                _CheckPlan(
+                    name=check["name"],
+                    required=tuple(check["required"]),
+                    required_paths=tuple(
+                        tuple(field.split(".")) for field in check["required"]
+                    ),
+                    trigger_paths=tuple(
+                        tuple(field.split("."))
+                        for field in check.get("trigger", check["required"])
+                    ),
+                    handler=getattr(cls, check["handler"]),
+                    supported_if=(
+                        getattr(cls, check["supported_if"])
+                        if check.get("supported_if")
+                        else None
+                    ),
+                )
+                for check in checks
+            )
+            names = [check.name for check in compiled]
+            gaps = cls._KNOWN_GAPS.get(action, [])
+            checks_not_run = {}
+            for mask in range(1 << len(names)):
+                run = frozenset(name for bit, name in enumerate(names) if mask >> bit & 1)
+                not_run = [name for name in names if name not in run]
+                not_run.extend(gaps)
+                checks_not_run[run] = tuple(dict.fromkeys(not_run))
+            options = "; ".join(
+                f"{check.name} ({', '.join(check.required)})" for check in compiled
+            )
+            plans[action] = _ActionPlan(
+                action=action,
+                checks=compiled,
+                missing_claim_message=(
+                    f"Action '{action}' did not include a complete verifiable claim. "
+                    f"Supported claim shapes: {options}."
+                ),
+                checks_not_run=MappingProxyType(checks_not_run),
+            )
+        cls._PLANS = MappingProxyType(plans)
 
     def audit_transaction(self, intent: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -151,21 +294,136 @@ class TaxPreFlight:
             ...
         }
         """
+        observed = instrumentation._hooks
+        if observed:
+            started_ns = time.perf_counter_ns()
+        report, plan, selected_checks = self._prepare_report(intent)
+        cache_key = None
+        if selected_checks and self.verdict_cache is not None:
+            cache_key = self._verdict_key(plan, selected_checks, intent)
+            cached = self.verdict_cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                report, selected_checks = cached, None
+        if selected_checks:
+            run_names = report["checks_run"]
+            for check in selected_checks:
+                run_names.append(check.name)
+                if observed:
+                    self._observe_check(check, intent, report)
+                else:
+                    check.handler(self, intent, report)
+            report["checks_not_run"] = list(plan.checks_not_run[frozenset(run_names)])
+            if cache_key is not None:
+                self.verdict_cache.put(cache_key, report)
+
+        if observed:
+            instrumentation.emit(
+                "request", "audit_transaction", started_ns,
+                "allowed" if report["allowed"] else "blocked", action=report["action"],
+            )
+        return report
+
+    def audit_batch(self, intents: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Audit many intents in one call.
+
+        Intents are grouped by canonical action and selected checks, so each
+        group resolves its handlers and checks_not_run once and then runs every
+        guard over the whole group. Reports are identical to calling
+        audit_transaction() on each intent and are returned in input order.
+        With a verdict_cache, cached intents skip their groups and computed
+        reports are stored.
+
+        Returns:
+            {"reports": [...], "timing": {"intents", "groups", "elapsed_ns",
+            "intents_per_second"}}
+        """
+        started_ns = time.perf_counter_ns()
+        batch = list(intents)
+        reports: list[Dict[str, Any]] = []
+        groups: dict[tuple[str, tuple[str, ...]], list[int]] = {}
+        plans: dict[tuple[str, tuple[str, ...]], tuple[_ActionPlan, list[_CheckPlan]]] = {}
+        cache = self.verdict_cache
+        cache_keys: dict[int, Hashable] = {}
+
+        for index, intent in enumerate(batch):
+            report, plan, selected_checks = self._prepare_report(intent)
+            if selected_checks and cache is not None:
+                cache_key = self._verdict_key(plan, selected_checks, intent)
+                if cache_key is not None:
+                    cached = cache.get(cache_key)
+                    if cached is not None:
+                        report, selected_checks = cached, None
+                    else:
+                        cache_keys[index] = cache_key
+            reports.append(report)
+            if not selected_checks:
+                continue
+            key = (plan.action, tuple(check.name for check in selected_checks))
+            groups.setdefault(key, []).append(index)
+            plans.setdefault(key, (plan, selected_checks))
+
+        observed = instrumentation._hooks
+        for key, indices in groups.items():
+            plan, selected_checks = plans[key]
+            for check in selected_checks:
+                handler = check.handler
+                name = check.name
+                for index in indices:
+                    reports[index]["checks_run"].append(name)
+                    if observed:
+                        self._observe_check(check, batch[index], reports[index])
+                    else:
+                        handler(self, batch[index], reports[index])
+
+            checks_not_run = plan.checks_not_run[frozenset(key[1])]
+            for index in indices:
+                reports[index]["checks_not_run"] = list(checks_not_run)
+
+        for index, cache_key in cache_keys.items():
+            cache.put(cache_key, reports[index])
+
+        elapsed_ns = time.perf_counter_ns() - started_ns
+        if observed:
+            instrumentation.emit("request", "audit_batch", started_ns, "ok")
+        return {
+            "reports": reports,
+            "timing": {
+                "intents": len(batch),
+                "groups": len(groups),
+                "elapsed_ns": elapsed_ns,
+                "intents_per_second": (
+                    len(batch) * 1_000_000_000 / elapsed_ns if elapsed_ns else 0.0
+                ),
+            },
+        }
+
+    def _prepare_report(
+        self, intent: Dict[str, Any]
+    ) -> tuple[Dict[str, Any], Optional["_ActionPlan"], list["_CheckPlan"]]:
+        """
+        Validate an intent and select its checks without running any guard.
+
+        Returns the report skeleton, the action plan and the checks to run. An
+        empty check list means the report is already final (blocked before any
+        guard ran).
+        """
         if not isinstance(intent, dict) or not intent:
             return self._blocked_report(
                 "TaxPreFlight requires a non-empty intent payload with an explicit action.",
                 action=None,
-            )
+            ), None, []
 
         requested_action = intent.get("action")
-        canonical_action = self._normalize_action(intent.get("action"))
+        canonical_action = self._normalize_action(requested_action)
         if canonical_action is None:
-            supported_actions = ", ".join(sorted(self._ACTION_CHECKS))
+            supported_actions = ", ".join(sorted(self._PLANS))
             return self._blocked_report(
                 f"TaxPreFlight requires a supported action. Supported actions: {supported_actions}.",
                 action=requested_action,
-            )
+            ), None, []
 
+        plan = self._PLANS[canonical_action]
         report = {
             "allowed": True,
             "action": canonical_action,
@@ -174,36 +432,68 @@ class TaxPreFlight:
             "checks_not_run": [],
         }
 
-        selected_checks = self._select_checks(canonical_action, intent)
+        selected_checks = self._select_checks(plan, intent)
         if not selected_checks:
             report["allowed"] = False
-            report["blocks"].append(self._format_missing_claim_message(canonical_action))
-            report["checks_not_run"] = self._compute_checks_not_run(
-                canonical_action, []
-            )
-            return report
+            report["blocks"].append(plan.missing_claim_message)
+            report["checks_not_run"] = list(plan.checks_not_run[_NOTHING_RUN])
+            return report, plan, []
 
         for check in selected_checks:
-            missing_fields = self._missing_fields(intent, check["required"])
+            missing_fields = [
+                field
+                for field, path in zip(check.required, check.required_paths)
+                if not _has_path(intent, path)
+            ]
             if missing_fields:
                 report["allowed"] = False
                 report["blocks"].append(
                     f"Action '{canonical_action}' is missing required fields for "
-                    f"{check['name']}: {', '.join(missing_fields)}."
-                )
-                report["checks_not_run"] = self._compute_checks_not_run(
-                    canonical_action, report["checks_run"]
+                    f"{check.name}: {', '.join(missing_fields)}."
                 )
-                return report
+                report["checks_not_run"] = list(plan.checks_not_run[_NOTHING_RUN])
+                return report, plan, []
 
-        for check in selected_checks:
-            report["checks_run"].append(check["name"])
-            getattr(self, check["handler"])(intent, report)
+        return report, plan, selected_checks
 
-        report["checks_not_run"] = self._compute_checks_not_run(
-            canonical_action, report["checks_run"]
-        )
-        return report
+    def _verdict_key(
+        self, plan: "_ActionPlan", selected_checks: list["_CheckPlan"], intent: Dict[str, Any]
+    ) -> Optional[Hashable]:
+        """
+        Cache key for an intent's verdict: the class, canonical action, the
+        selected checks and their required field values, which are all a
+        handler reads, plus today's date: undated intents are decided under
+        the rule tables in force today, so a verdict never outlives the day
+        (and hence no rule boundary) it was decided on, whatever the ttl.
+        Values of the plain JSON scalar types key as a tuple tagged with their
+        types (so 1, True and "1" differ); anything else is keyed by its qc1
+        digest, or not cached (None) if it is not JSON data.
+        """
+        values = tuple([_get_path(intent, path) for check in selected_checks for path in check.required_paths])
+        types = tuple(map(type, values))
+        names = tuple([check.name for check in selected_checks])
+        today = date.fromtimestamp(rules._time()).toordinal()
+        if _KEY_SCALARS.issuperset(types):
+            return (type(self), plan.action, names, values, types, today)
+        cls = type(self)
+        return verdict_key(f"{cls.__module__}.{cls.__qualname__}", plan.action, names, values, today)
+
+    def _observe_check(self, check: "_CheckPlan", intent: Dict[str, Any], report: Dict[str, Any]) -> None:
+        """Run one check with instrumentation hooks installed: one "guard" event."""
+        blocks = len(report["blocks"])
+        token = instrumentation.enter_scope(report["action"], check.name)
+        started_ns = time.perf_counter_ns()
+        try:
+            check.handler(self, intent, report)
+        except BaseException:
+            instrumentation.emit("guard", check.name, started_ns, "error")
+            raise
+        else:
+            instrumentation.emit(
+                "guard", check.name, started_ns, "blocked" if len(report["blocks"]) > blocks else "passed"
+            )
+        finally:
+            instrumentation.exit_scope(token)
 
     # ---- extracted checks (each keeps complexity flat) ----
 
@@ -212,52 +502,21 @@ class TaxPreFlight:
             return None
         normalized = action.strip().lower().replace(" ", "_")
         normalized = self._ACTION_ALIASES.get(normalized, normalized)
-        return normalized if normalized in self._ACTION_CHECKS else None
+        return normalized if normalized in self._PLANS else None
 
-    def _select_checks(self, action: str, intent: Dict[str, Any]) -> list[Dict[str, Any]]:
-        checks = self._ACTION_CHECKS[action]
-        if len(checks) == 1:
-            return checks
+    def _select_checks(self, plan: "_ActionPlan", intent: Dict[str, Any]) -> list["_CheckPlan"]:
+        if len(plan.checks) == 1:
+            return list(plan.checks)
 
         selected = []
-        for check in checks:
-            trigger_fields = check.get("trigger", check["required"])
-            if not all(self._has_field(intent, field) for field in trigger_fields):
+        for check in plan.checks:
+            if not all(_has_path(intent, path) for path in check.trigger_paths):
                 continue
-
-            predicate_name = check.get("supported_if")
-            if predicate_name and not getattr(self, predicate_name)(intent):
+            if check.supported_if is not None and not check.supported_if(self, intent):
                 continue
-
             selected.append(check)
         return selected
 
-    def _format_missing_claim_message(self, action: str) -> str:
-        options = []
-        for check in self._ACTION_CHECKS[action]:
-            options.append(f"{check['name']} ({', '.join(check['required'])})")
-        return (
-            f"Action '{action}' did not include a complete verifiable claim. "
-            f"Supported claim shapes: {'; '.join(options)}."
-        )
-
-    def _compute_checks_not_run(self, action: str, run_names: list[str]) -> list[str]:
-        all_names = [c["name"] for c in self._ACTION_CHECKS[action]]
-        not_run = [name for name in all_names if name not in run_names]
-        not_run.extend(self._KNOWN_GAPS.get(action, []))
-        return list(dict.fromkeys(not_run))
-
-    def _missing_fields(self, payload: Dict[str, Any], fields: tuple[str, ...]) -> list[str]:
-        return [field for field in fields if not self._has_field(payload, field)]
-
-    def _has_field(self, payload: Dict[str, Any], field_path: str) -> bool:
-        current: Any = payload
-        for part in field_path.split("."):
-            if not isinstance(current, dict) or part not in current:
-                return False
-            current = current[part]
-        return current is not None and current != ""
-
     def _blocked_report(self, message: str, action: Any = None) -> Dict[str, Any]:
         return {"allowed": False, "action": action, "blocks": [message], "checks_run": [], "checks_not_run": []}
 
@@ -295,13 +554,14 @@ class TaxPreFlight:
 
     def _check_capital_gains(self, intent: Dict[str, Any], report: Dict[str, Any]) -> None:
         dates = intent["dates"]
+        # Holding periods and rates are those in force on the sale date.
         try:
-            term = self.cg.determine_term(dates["buy"], dates["sell"], intent["asset_type"])
+            term = self.cg.determine_term(dates["buy"], dates["sell"], intent["asset_type"], as_of=dates["sell"])
         except ValueError as exc:
             report["allowed"] = False
             report["blocks"].append(f"Capital gains classification failed: {exc}")
             return
-        rate_check = self.cg.verify_tax_rate(intent["asset_type"], term, intent["claimed_rate"])
+        rate_check = self.cg.verify_tax_rate(intent["asset_type"], term, intent["claimed_rate"], as_of=dates["sell"])
         if not rate_check["verified"]:
             report["allowed"] = False
             report["blocks"].append(rate_check.get("error", "Capital gains verification failed."))
@@ -368,25 +628,27 @@ class TaxPreFlight:
                 f"Invoice payment requires TDS deduction of {deduction} before execution."
             )
 
+TaxPreFlight._compile_plans()
+
+
 class TaxVerifier:
     """
     The main entry point for QWED-Tax.
     Orchestrates guards based on jurisdiction.
     """
     
+    # Guards are built on first use, and only exist for their jurisdiction.
+    payroll = _LazyGuard(".jurisdictions.us.payroll_guard", "PayrollGuard", "US")
+    preflight = _LazyGuard(".verifier", "TaxPreFlight", "US")  # Include preflight for US
+    crypto = _LazyGuard(".jurisdictions.india.guards.crypto_guard", "CryptoTaxGuard", "INDIA")
+    investment = _LazyGuard(".jurisdictions.india.guards.investment_guard", "InvestmentGuard", "INDIA")
+    gst = _LazyGuard(".jurisdictions.india.guards.gst_guard", "GSTGuard", "INDIA")
+    deposit = _LazyGuard(".jurisdictions.india.guards.deposit_guard", "DepositRateGuard", "INDIA")
+
     def __init__(self, jurisdiction: str = "US"):
         self.jurisdiction = jurisdiction.upper()
-        
-        # Initialize Guards lazy-loaded or all-at-once
-        if self.jurisdiction == "US":
-            self.payroll = PayrollGuard()
-            self.preflight = TaxPreFlight() # Include preflight for US
-        elif self.jurisdiction == "INDIA":
-            self.crypto = CryptoTaxGuard()
-            self.investment = InvestmentGuard()
-            self.gst = GSTGuard()
-            self.deposit = DepositRateGuard()
-        else:
+
+        if self.jurisdiction not in ("US", "INDIA"):
             raise ValueError(f"Unsupported Jurisdiction: {jurisdiction}")
 
     def verify_us_payroll(self, **kwargs):
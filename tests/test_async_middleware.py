@@ -0,0 +1,119 @@
+"""Tests for the asyncio front end of QWEDTaxMiddleware."""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from qwed_tax.middleware.async_interceptor import AsyncQWEDTaxMiddleware
+from qwed_tax.middleware.gusto_interceptor import QWEDTaxMiddleware
+
+
+def _payload(net_pay_claimed="3390.00"):
+    return {
+        "payroll_entry": {
+            "employee_id": "E001",
+            "gross_pay": "5000.00",
+            "taxes": [
+                {"name": "Federal Income Tax", "amount": "800.00"},
+                {"name": "Social Security", "amount": "310.00"},
+            ],
+            "deductions": [
+                {"name": "401k", "amount": "500.00", "type": "PRE_TAX"},
+            ],
+            "net_pay_claimed": net_pay_claimed,
+            "currency": "USD",
+        }
+    }
+
+
+PAYLOADS = [
+    _payload(),
+    _payload("9999.00"),
+    {},
+    {"payroll_entry": {"employee_id": "E002", "gross_pay": "oops"}},
+]
+
+
+class TestAsyncMiddleware:
+    def test_decisions_identical_to_sync_path(self):
+        sync = QWEDTaxMiddleware()
+        amw = AsyncQWEDTaxMiddleware()
+        for payload in PAYLOADS:
+            expected = sync.process_ai_payroll_request(payload)
+            actual = asyncio.run(amw.process_ai_payroll_request(payload))
+            assert json.dumps(actual, sort_keys=True) == json.dumps(expected, sort_keys=True)
+
+    def test_process_many_preserves_order(self):
+        sync = QWEDTaxMiddleware()
+        amw = AsyncQWEDTaxMiddleware(max_concurrency=3)
+        payloads = PAYLOADS * 10
+        results = asyncio.run(amw.process_many(payloads))
+        assert results == [sync.process_ai_payroll_request(p) for p in payloads]
+
+    def test_custom_executor_is_used(self):
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="qwed-test") as pool:
+            amw = AsyncQWEDTaxMiddleware(executor=pool)
+            seen = []
+            original = amw.middleware.process_ai_payroll_request
+
+            def spy(payload):
+                seen.append(threading.current_thread().name)
+                return original(payload)
+
+            amw.middleware.process_ai_payroll_request = spy
+            asyncio.run(amw.process_many(PAYLOADS))
+        assert seen and all(name.startswith("qwed-test") for name in seen)
+
+    def test_process_many_bounds_concurrency(self):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            amw = AsyncQWEDTaxMiddleware(executor=pool)
+            original = amw.middleware.process_ai_payroll_request
+
+            def slow(payload):
+                nonlocal active, peak
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.002)
+                with lock:
+                    active -= 1
+                return original(payload)
+
+            amw.middleware.process_ai_payroll_request = slow
+            asyncio.run(amw.process_many([_payload()] * 40, max_concurrency=4))
+        assert 1 <= peak <= 4
+
+    def test_event_loop_stays_responsive(self):
+        async def scenario():
+            amw = AsyncQWEDTaxMiddleware()
+            ticks = 0
+            done = asyncio.Event()
+
+            async def ticker():
+                nonlocal ticks
+                while not done.is_set():
+                    ticks += 1
+                    await asyncio.sleep(0)
+
+            task = asyncio.create_task(ticker())
+            await amw.process_many([_payload()] * 50, max_concurrency=8)
+            done.set()
+            await task
+            return ticks
+
+        assert asyncio.run(scenario()) > 1
+
+    @pytest.mark.parametrize("limit", [0, -1, 1.5, True, False])
+    def test_invalid_concurrency_rejected(self, limit):
+        with pytest.raises(ValueError):
+            AsyncQWEDTaxMiddleware(max_concurrency=limit)
+        with pytest.raises(ValueError):
+            asyncio.run(AsyncQWEDTaxMiddleware().process_many([], max_concurrency=limit))
@@ -1,8 +1,21 @@
 """Tests for structured statutory audit-trace on guard verdicts."""
 
+import copy
+import json
+import pickle
+
 import pytest
 
-from qwed_tax.audit import build_trace, ITC_BLOCKED_17_5, JURISDICTION_INDIA
+from qwed_tax.audit import (
+    AuditTrace,
+    FrozenDict,
+    build_trace,
+    freeze,
+    ITC_BLOCKED_17_5,
+    JURISDICTION_INDIA,
+    trace_proof_ref,
+)
+from qwed_tax.diagnostics import TaxDiagnosticResult, TaxDiagnosticStatus
 from qwed_tax.guards.indirect_tax_guard import InputCreditGuard
 from qwed_tax.guards.tds_guard import TDSGuard
 
@@ -39,6 +52,97 @@ class TestBuildTrace:
             ITC_BLOCKED_17_5.rule_id = "tampered"
 
 
+class TestImmutableTrace:
+    NESTED = {"legs": ["cgst", {"rate": "9"}], "pair": (1, [2]), "tags": {"x"}, "ok": True}
+
+    def _plain(self):
+        return {
+            "rule_id": ITC_BLOCKED_17_5.rule_id,
+            "statute": ITC_BLOCKED_17_5.statute,
+            "jurisdiction": ITC_BLOCKED_17_5.jurisdiction,
+            "outcome": "BLOCKED",
+            "inputs": {"a": "1", "b": None},
+        }
+
+    def test_trace_is_read_only(self):
+        trace = build_trace(ITC_BLOCKED_17_5, "BLOCKED", {"a": "1"})
+        assert isinstance(trace, AuditTrace)
+        for mutate in (
+            lambda: trace.__setitem__("outcome", "ALLOWED"),
+            lambda: trace.__delitem__("outcome"),
+            lambda: trace.update(outcome="ALLOWED"),
+            lambda: trace.pop("outcome"),
+            lambda: trace.setdefault("extra", 1),
+            lambda: trace.clear(),
+            lambda: trace["inputs"].__setitem__("a", "2"),
+        ):
+            with pytest.raises(TypeError, match="read-only"):
+                mutate()
+        assert trace["outcome"] == "BLOCKED"
+        assert trace["inputs"] == {"a": "1"}
+
+    def test_nested_inputs_are_deep_frozen(self):
+        trace = build_trace(ITC_BLOCKED_17_5, "BLOCKED", self.NESTED)
+        inputs = trace["inputs"]
+        with pytest.raises(TypeError):
+            inputs["legs"].append("igst")
+        with pytest.raises(TypeError):
+            inputs["legs"][1]["rate"] = "18"
+        with pytest.raises(TypeError):
+            inputs["pair"][1].append(3)
+        assert inputs["tags"] == frozenset({"x"})
+        assert inputs == {"legs": ["cgst", {"rate": "9"}], "pair": (1, [2]), "tags": {"x"}, "ok": True}
+
+    def test_flat_inputs_share_scalars(self):
+        src = {"amount": "1000.50", "category": "CATERING"}
+        trace = build_trace(ITC_BLOCKED_17_5, "BLOCKED", src)
+        assert trace["inputs"] is not src
+        assert trace["inputs"]["amount"] is src["amount"]
+
+    def test_serializes_like_a_plain_dict(self):
+        trace = build_trace(ITC_BLOCKED_17_5, "BLOCKED", {"a": "1", "b": None})
+        plain = self._plain()
+        assert trace == plain
+        assert json.dumps(trace, sort_keys=True) == json.dumps(plain, sort_keys=True)
+        assert trace_proof_ref(trace) == trace_proof_ref(plain)
+
+    def test_to_dict_returns_plain_mutable_copy(self):
+        trace = build_trace(ITC_BLOCKED_17_5, "BLOCKED", self.NESTED)
+        thawed = trace.to_dict()
+        assert type(thawed) is dict and type(thawed["inputs"]) is dict
+        assert type(thawed["inputs"]["legs"]) is list
+        assert type(thawed["inputs"]["legs"][1]) is dict
+        thawed["inputs"]["legs"].append("igst")
+        assert trace["inputs"]["legs"] == ["cgst", {"rate": "9"}]
+
+    def test_copies_share_and_pickle_round_trips(self):
+        trace = build_trace(ITC_BLOCKED_17_5, "BLOCKED", self.NESTED)
+        assert copy.copy(trace) is trace
+        assert copy.deepcopy(trace) is trace
+        restored = pickle.loads(pickle.dumps(trace))
+        assert type(restored) is AuditTrace
+        assert restored == trace
+        with pytest.raises(TypeError):
+            restored["inputs"]["legs"].append("igst")
+
+    def test_freeze_reuses_frozen_values(self):
+        frozen = freeze({"a": [1]})
+        assert isinstance(frozen, FrozenDict)
+        assert freeze(frozen) is frozen
+        assert build_trace(ITC_BLOCKED_17_5, "BLOCKED", frozen)["inputs"] is frozen
+
+    def test_diagnostic_to_dict_emits_plain_trace(self):
+        trace = build_trace(ITC_BLOCKED_17_5, "BLOCKED", {"a": "1"})
+        result = TaxDiagnosticResult(
+            status=TaxDiagnosticStatus.BLOCKED,
+            agent_message="blocked",
+            developer_fields={"audit_trace": trace},
+        )
+        emitted = result.to_dict()["developer_fields"]["audit_trace"]
+        assert type(emitted) is dict and emitted == trace
+        assert result.audit_trace is trace
+
+
 class TestITCAuditTrace:
     def setup_method(self):
         self.guard = InputCreditGuard()
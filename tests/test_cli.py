@@ -0,0 +1,162 @@
+"""Tests for the qwed-tax verify command."""
+
+import csv
+import json
+
+import pytest
+
+from qwed_tax.cli import CHECKS, _guard_method, main, verify_record
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.jurisdictions.india.guards.gst_guard import GSTGuard
+
+RECORDS = [
+    {"check": "tds", "service_type": "PROFESSIONAL_FEES", "invoice_amount": "50000", "ytd_payment": "0"},
+    {"service": "GTA", "provider": "INDIVIDUAL", "recipient": "BODY_CORPORATE", "claimed_is_rcm": True},
+    {"service": "GTA", "provider": "INDIVIDUAL", "recipient": "BODY_CORPORATE", "claimed_is_rcm": False},
+    {"supplier_state": "KA", "place_of_supply": "KA", "taxable_value": "1000", "gst_rate": "18",
+     "claimed_cgst": "90", "claimed_sgst": "90", "claimed_igst": "0"},
+    {"expense_category": "CATERING", "amount": "5000", "tax_paid": "900"},
+    {"gstin": "27AAPFU0939F1ZV"},
+    {"gstin": "27AAPFU0939F1ZX"},
+]
+
+
+def _write_jsonl(path, records):
+    path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+
+
+def _write_csv(path, records):
+    fields = sorted({field for record in records for field in record})
+    with path.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=fields)
+        writer.writeheader()
+        for record in records:
+            writer.writerow({k: str(v).lower() if isinstance(v, bool) else v for k, v in record.items()})
+
+
+def _read_verdicts(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestVerifyRecord:
+    def test_routes_by_fields_and_matches_guards(self):
+        assert verify_record(RECORDS[1]) == {
+            "check": "rcm",
+            **GSTGuard().verify_rcm_applicability("GTA", "INDIVIDUAL", "BODY_CORPORATE", claimed_is_rcm=True),
+        }
+        assert verify_record(RECORDS[0]) == {
+            "check": "tds", **TDSGuard().calculate_deduction("PROFESSIONAL_FEES", "50000", "0")
+        }
+
+    def test_forced_check_reports_missing_fields(self):
+        verdict = verify_record({"gstin": "27AAPFU0939F1ZV"}, "tds")
+        assert verdict["check"] == "tds"
+        assert verdict["verified"] is False
+        assert "invoice_amount" in verdict["error"]
+
+    @pytest.mark.parametrize("record", [{"check": "nope"}, {"foo": 1}, [1, 2], "text"])
+    def test_unroutable_records_fail_closed(self, record):
+        verdict = verify_record(record)
+        assert verdict["verified"] is False
+        assert verdict["error"]
+
+    @pytest.mark.parametrize("check", [["x"], {"name": "tds"}])
+    def test_unhashable_check_values_fail_closed(self, check, tmp_path):
+        assert verify_record({"check": check, "gstin": "abc"}) == {
+            "check": None, "verified": False, "error": verify_record({"check": check})["error"],
+        }
+        assert verify_record({"check": check})["error"].startswith("Unknown check")
+        source, out = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+        _write_jsonl(source, [{"check": check, "gstin": "abc"}, RECORDS[5]])
+        assert main(["verify", str(source), "-o", str(out)]) == 1
+        assert [v["verified"] for v in _read_verdicts(out)] == [False, True]
+
+    def test_guard_exceptions_fail_closed(self):
+        verdict = verify_record({"expense_category": 5, "amount": 1, "tax_paid": 1})
+        assert verdict["check"] == "itc"
+        assert verdict["verified"] is False
+        assert "AttributeError" in verdict["error"]
+
+    def test_every_check_is_reachable(self):
+        for name, check in CHECKS.items():
+            assert callable(_guard_method(check)), name
+
+
+class TestVerifyCommand:
+    def test_jsonl_to_jsonl(self, tmp_path, capsys):
+        source, output = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+        _write_jsonl(source, RECORDS)
+        assert main(["verify", str(source), "-o", str(output)]) == 1
+        verdicts = _read_verdicts(output)
+        assert [v["record"] for v in verdicts] == list(range(len(RECORDS)))
+        assert [v["verified"] for v in verdicts] == [True, True, False, True, False, True, False]
+        assert verdicts == [{"record": i, **verify_record(r)} for i, r in enumerate(RECORDS)]
+        assert "rows/s" in capsys.readouterr().err
+
+    def test_csv_matches_jsonl(self, tmp_path):
+        records = RECORDS[1:3]
+        _write_csv(tmp_path / "in.csv", records)
+        _write_jsonl(tmp_path / "in.jsonl", records)
+        main(["verify", str(tmp_path / "in.csv"), "-o", str(tmp_path / "csv.jsonl")])
+        main(["verify", str(tmp_path / "in.jsonl"), "-o", str(tmp_path / "json.jsonl")])
+        assert _read_verdicts(tmp_path / "csv.jsonl") == _read_verdicts(tmp_path / "json.jsonl")
+
+    def test_exit_zero_when_everything_verifies(self, tmp_path):
+        _write_jsonl(tmp_path / "in.jsonl", [RECORDS[0], RECORDS[1]])
+        assert main(["verify", str(tmp_path / "in.jsonl"), "-o", str(tmp_path / "out.jsonl")]) == 0
+
+    def test_bad_lines_do_not_stop_the_run(self, tmp_path):
+        source = tmp_path / "in.jsonl"
+        source.write_text('{"gstin": "27AAPFU0939F1ZV"}\nnot json\n\n[1]\n{"gstin": "27AAPFU0939F1ZV"}\n')
+        main(["verify", str(source), "-o", str(tmp_path / "out.jsonl")])
+        verdicts = _read_verdicts(tmp_path / "out.jsonl")
+        assert [v["verified"] for v in verdicts] == [True, False, False, True]
+        assert verdicts[1]["error"].startswith("Invalid JSON")
+
+    def test_workers_give_identical_output(self, tmp_path):
+        _write_jsonl(tmp_path / "in.jsonl", RECORDS * 20)
+        main(["verify", str(tmp_path / "in.jsonl"), "-o", str(tmp_path / "one.jsonl")])
+        main(["verify", str(tmp_path / "in.jsonl"), "-o", str(tmp_path / "two.jsonl"),
+              "--workers", "2", "--chunk-size", "7"])
+        assert (tmp_path / "one.jsonl").read_text() == (tmp_path / "two.jsonl").read_text()
+
+    def test_resume_after_interrupted_run(self, tmp_path):
+        source, output, checkpoint = tmp_path / "in.jsonl", tmp_path / "out.jsonl", tmp_path / "run.ckpt"
+        _write_jsonl(source, RECORDS * 3)
+        main(["verify", str(source), "-o", str(output)])
+        expected = output.read_text()
+
+        # Simulate a crash: a checkpoint after 2 chunks, then a torn write.
+        main(["verify", str(source), "-o", str(output), "--checkpoint", str(checkpoint),
+              "--chunk-size", "4", "--checkpoint-every", "8"])
+        state = json.loads(checkpoint.read_text())
+        assert state["records_done"] == len(RECORDS) * 3
+        lines = expected.splitlines(keepends=True)
+        state.update(records_done=8, failed=sum(not json.loads(l)["verified"] for l in lines[:8]),
+                     output_offset=len("".join(lines[:8]).encode()))
+        checkpoint.write_text(json.dumps(state))
+        output.write_text("".join(lines[:9]) + '{"record": 9, "chec')
+
+        assert main(["verify", str(source), "-o", str(output), "--resume-from", str(checkpoint),
+                     "--chunk-size", "4"]) == 1
+        assert output.read_text() == expected
+        assert json.loads(checkpoint.read_text())["records_done"] == len(RECORDS) * 3
+
+    def test_resume_rejects_other_input(self, tmp_path, capsys):
+        _write_jsonl(tmp_path / "a.jsonl", RECORDS)
+        _write_jsonl(tmp_path / "b.jsonl", RECORDS)
+        output, checkpoint = tmp_path / "out.jsonl", tmp_path / "run.ckpt"
+        main(["verify", str(tmp_path / "a.jsonl"), "-o", str(output), "--checkpoint", str(checkpoint)])
+        assert main(["verify", str(tmp_path / "b.jsonl"), "-o", str(output), "--resume-from", str(checkpoint)]) == 2
+        assert "was written for input" in capsys.readouterr().err
+
+    def test_checkpoint_needs_file_output(self, tmp_path, capsys):
+        _write_jsonl(tmp_path / "in.jsonl", RECORDS)
+        assert main(["verify", str(tmp_path / "in.jsonl"), "--checkpoint", str(tmp_path / "c")]) == 2
+        assert "file output" in capsys.readouterr().err
+
+    def test_unknown_extension_needs_format(self, tmp_path, capsys):
+        source = tmp_path / "in.txt"
+        _write_jsonl(source, RECORDS[:1])
+        assert main(["verify", str(source)]) == 2
+        assert main(["verify", str(source), "--format", "jsonl", "-o", str(tmp_path / "o.jsonl")]) == 0
@@ -0,0 +1,321 @@
+"""Tests for compact (__slots__) guard results and the diagnose_*() methods."""
+
+import copy
+import json
+import pickle
+import sys
+
+import pytest
+
+from qwed_tax.address_guard import AddressGuard
+from qwed_tax.guards.capital_gains_guard import CapitalGainsGuard
+from qwed_tax.guards.classification_guard import ClassificationGuard
+from qwed_tax.guards.dtaa_guard import DTAAGuard
+from qwed_tax.guards.indirect_tax_guard import InputCreditGuard
+from qwed_tax.guards.nexus_guard import NexusGuard
+from qwed_tax.guards.poem_guard import PoEMGuard
+from qwed_tax.guards.related_party_guard import RelatedPartyGuard
+from qwed_tax.guards.remittance_guard import RemittanceGuard
+from qwed_tax.guards.speculation_guard import SpeculationGuard
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.guards.transfer_pricing_guard import TransferPricingGuard
+from qwed_tax.guards.valuation_guard import ValuationGuard
+from qwed_tax.jurisdictions.india.guards.gst_guard import EntityType, GSTGuard, ServiceType
+from qwed_tax.jurisdictions.india.guards.investment_guard import InvestmentGuard, TransactionType
+from qwed_tax.jurisdictions.india.guards.setoff_guard import InterHeadAdjustmentGuard, TaxHead
+from qwed_tax.jurisdictions.us.classification_guard import ABCClassificationGuard
+from qwed_tax.jurisdictions.us.form1099_guard import Form1099Guard
+from qwed_tax.jurisdictions.us.reciprocity_guard import ReciprocityGuard
+from qwed_tax.jurisdictions.us.withholding_guard import W4Form, WithholdingGuard
+from qwed_tax.models import (
+    Address,
+    ContractorPayment,
+    PaymentType,
+    State,
+    WorkArrangement,
+    WorkerClassificationParams,
+)
+from qwed_tax.results import (
+    ABSENT,
+    GuardResult,
+    RCMCalculationResult,
+    RCMErrorResult,
+    RCMResult,
+    ResidencyResult,
+    TDSResult,
+)
+
+TDS_CASES = [
+    ("PROFESSIONAL_FEES", "50000", "0"),
+    ("professional fees", "10000", "5000"),
+    ("COMMISSION", "20000", "0"),
+    ("UNKNOWN_SERVICE", "100", "0"),
+    ("RENT_LAND", "abc", "0"),
+]
+
+LRS_CASES = [
+    ("25000", "education", "100000"),
+    ("200000", "travel", "100000"),
+    ("1000", "lottery tickets", "0"),
+    ("-5", "education", "0"),
+    ("5", "education", "-1"),
+    ("x", "education", "0"),
+]
+
+
+def _poem(**overrides):
+    kwargs = dict(
+        company_name="Mauritius Shell",
+        is_foreign_incorp=True,
+        turnover_total=1000, turnover_outside_india=100,
+        assets_total=1000, assets_outside_india=10,
+        employees_total=10, employees_outside_india=1,
+        payroll_total=100, payroll_outside_india=10,
+        key_management_location="INDIA",
+    )
+    kwargs.update(overrides)
+    return kwargs
+
+
+POEM_CASES = [
+    _poem(),
+    _poem(is_foreign_incorp=False),
+    _poem(assets_outside_india=900, employees_outside_india=9, payroll_outside_india=90),
+    _poem(key_management_location="OUTSIDE"),
+    _poem(assets_total="abc"),
+    _poem(employees_outside_india=11),
+    _poem(payroll_outside_india=101),
+]
+
+
+def _w4(liability, claim_exempt=True):
+    return W4Form(
+        employee_id="E1", claim_exempt=claim_exempt,
+        tax_liability_last_year=liability, expect_refund_this_year=True,
+    )
+
+
+def _abc(a, b, c):
+    return WorkerClassificationParams(
+        worker_id="W1", freedom_from_control=a, work_outside_usual_business=b,
+        customarily_engaged_independently=c, state=State.CA,
+    )
+
+
+def _address(state, zip_code):
+    return Address(street="1 Main St", city="Anytown", state=state, zip_code=zip_code)
+
+
+def _payment(payment_type, amount):
+    return ContractorPayment(contractor_id="C1", payment_type=payment_type, amount=amount, calendar_year=2024)
+
+
+def _arrangement(residence, work):
+    return WorkArrangement(
+        employee_id="E1", residence_address=_address(residence, "00000"), work_address=_address(work, "00000"),
+    )
+
+
+# (guard, method, diagnose method or None, argument tuples) for every other
+# dict-returning guard method. Each case list covers every legacy dict shape.
+FAMILY_CASES = [
+    (CapitalGainsGuard(), "verify_tax_rate", "diagnose_tax_rate", [
+        ("equity", "LTCG", "12.5%"), ("equity", "STCG", "15%"), ("debt", "LTCG", "20%"),
+        ("gold", "LTCG", "10%"), ("equity", "LTCG", "12.5", "not-a-date"),
+    ]),
+    (SpeculationGuard(), "verify_setoff", "diagnose_setoff", [
+        ("intraday", "5000", "intraday"), ("intraday", "5000", "f&o"), ("crypto", "1", "intraday"),
+        ("intraday", "1", "crypto"), ("intraday", "abc", "intraday"),
+    ]),
+    (ValuationGuard(), "verify_conversion", "diagnose_conversion", [
+        ("100000", "5", "0.2", "10"), ("100000", "50", "0.2", "10"), ("x", "5", "0.2", "10"),
+        ("100000", "5", "1.5", "10"), ("100000", "0", "0.2", "10"),
+    ]),
+    (DTAAGuard(), "verify_foreign_tax_credit", None, [
+        ("1000", "100", "30"), ("1000", "400", "30"), ("1000", "200", "30", "15"),
+        ("abc", "100", "30"), ("-1", "100", "30"), ("1000", "100", "30", "-5"),
+    ]),
+    (NexusGuard(), "check_nexus_liability", None, [
+        ("CA", "600000", 0, "no_tax"), ("CA", "100", 0, "no_tax"), ("ZZ", "1", 0, "collect"),
+        ("CA", "abc", 0, "collect"), ("CA", "1", 0, "collect", "not-a-date"),
+    ]),
+    (RelatedPartyGuard(), "verify_loan_compliance", None, [
+        ("company", "director", "10", "8"), ("company", "vendor", "5", "8"),
+        ("company", "vendor", "9", "8"), ("company", "vendor", "x", "8"),
+    ]),
+    (TransferPricingGuard(), "verify_arms_length_price", None, [
+        ("100", "101"), ("100", "120"), ("abc", "100"), ("100", "100", "TNMM", "1"),
+    ]),
+    (InputCreditGuard(), "verify_itc_eligibility", "diagnose_itc_eligibility", [
+        ("Office Supplies", "1000", "180"), ("MOTOR_VEHICLE", "1000", "180"), ("GIFT_TO_EMPLOYEE", "40000", "100"),
+        ("GIFT_TO_EMPLOYEE", "60000", "100"), ("personal vacation", "1", "1"), ("RENT", "x", "1"),
+    ]),
+    (InputCreditGuard(), "verify_gstin_format", None, [
+        ("27AAPFU0939F1ZV",), ("27AAPFU0939F1ZX",), ("not-a-gstin",),
+    ]),
+    (GSTGuard(), "verify_rcm_applicability", "diagnose_rcm_applicability", [
+        (ServiceType.GTA, EntityType.INDIVIDUAL, EntityType.BODY_CORPORATE),
+        (ServiceType.GTA, EntityType.INDIVIDUAL, EntityType.BODY_CORPORATE, True),
+        ("LEGAL", "INDIVIDUAL", "INDIVIDUAL", True),
+        ("OTHER", "INDIVIDUAL", "INDIVIDUAL", False),
+        ("GTA", "INDIVIDUAL", "BODY_CORPORATE", "yes"),
+        ("SPACE_TRAVEL", "INDIVIDUAL", "INDIVIDUAL"),
+    ]),
+    (GSTGuard(), "verify_gst_split", None, [
+        ("MH", "MH", "1000", "18", "90", "90", "0"), ("MH", "KA", "1000", "18", "0", "0", "180"),
+        ("MH", "KA", "1000", "18", "90", "90", "0"), ("", "MH", "1", "18", "0", "0", "0"),
+        ("MH", "MH", "-1", "18", "0", "0", "0"),
+    ]),
+    (InterHeadAdjustmentGuard(), "verify_setoff", "diagnose_setoff", [
+        (TaxHead.VDA, TaxHead.SALARY), (TaxHead.BUSINESS_SPECULATIVE, TaxHead.SALARY),
+        (TaxHead.CAPITAL_GAINS_LT, TaxHead.CAPITAL_GAINS_LT), (TaxHead.SALARY, TaxHead.OTHER_SOURCES),
+    ]),
+    (InvestmentGuard(), "verify_classification", None, [
+        (TransactionType.INTRADAY, 0), (TransactionType.DELIVERY, 400), (TransactionType.F_O, 10),
+    ]),
+    (ClassificationGuard(), "verify_classification_claim", "diagnose_classification_claim", [
+        ("W-2 employee", {"provides_tools": True, "reimburses_expenses": True}),
+        ("1099 contractor", {"provides_tools": True, "reimburses_expenses": True}),
+        ("1099 contractor", {"provides_tools": True}),
+        ("", {}),
+    ]),
+    (WithholdingGuard(), "verify_exempt_status", "diagnose_exempt_status", [
+        (_w4("0"),), (_w4("1500"),), (_w4("1500", claim_exempt=False),),
+    ]),
+    (ReciprocityGuard(), "verify_reciprocity", None, [
+        ("NJ", "PA"), ("NY", "NY", True), ("NY", "NJ"), ("ZZ", "NJ"), ("NJ", "ZZ"), ("NY", "NJ", True),
+    ]),
+    (ReciprocityGuard(), "determine_withholding_state", None, [
+        (_arrangement(State.NJ, State.PA),), (_arrangement(State.NY, State.NJ),),
+    ]),
+    (ABCClassificationGuard(), "verify_classification", None, [
+        (_abc(True, True, True), True), (_abc(True, False, True), True), (_abc(False, True, True), False),
+    ]),
+    (Form1099Guard(), "verify_filing_requirement", None, [
+        (_payment(PaymentType.RENT, "600"),), (_payment(PaymentType.ROYALTIES, "5"),),
+        (_payment(PaymentType.HEALTHCARE, "5000"),),
+    ]),
+    (AddressGuard(), "verify_address", None, [
+        (_address(State.NY, "10001"),), (_address(State.NY, "90001"),), (_address(State.MD, "20601"),),
+    ]),
+]
+
+FAMILY_PARAMS = [
+    pytest.param(guard, method, diagnose, args, id=f"{type(guard).__name__}.{method}-{index}")
+    for guard, method, diagnose, cases in FAMILY_CASES
+    for index, args in enumerate(cases)
+]
+
+
+def _assert_same(compact, legacy):
+    assert isinstance(compact, GuardResult)
+    assert compact == legacy and legacy == compact
+    assert list(compact) == list(legacy)
+    assert list(compact.items()) == list(legacy.items())
+    assert len(compact) == len(legacy)
+    assert json.dumps(compact.to_dict()) == json.dumps(legacy)
+    for key in ("verified", "error", "deduction", "residency", "reason", "audit_trace", "nope", *legacy):
+        assert (key in compact) == (key in legacy)
+        assert compact.get(key) == legacy.get(key)
+
+
+class TestCompactMatchesLegacy:
+    @pytest.mark.parametrize("case", TDS_CASES)
+    def test_tds(self, case):
+        guard = TDSGuard()
+        legacy = guard.calculate_deduction(*case)
+        _assert_same(guard.calculate_deduction(*case, compact=True), legacy)
+        assert guard.diagnose_deduction(*case) == TDSGuard.to_diagnostic(legacy)
+
+    @pytest.mark.parametrize("case", LRS_CASES)
+    def test_remittance(self, case):
+        guard = RemittanceGuard()
+        legacy = guard.verify_lrs_limit(*case)
+        _assert_same(guard.verify_lrs_limit(*case, compact=True), legacy)
+        assert guard.diagnose_lrs_limit(*case) == RemittanceGuard.to_diagnostic(legacy)
+
+    @pytest.mark.parametrize("case", POEM_CASES)
+    def test_poem(self, case):
+        guard = PoEMGuard()
+        legacy = guard.determine_residency(**case)
+        compact = guard.determine_residency(**case, compact=True)
+        assert type(compact) is ResidencyResult
+        _assert_same(compact, legacy)
+        assert guard.diagnose_residency(**case) == PoEMGuard.to_diagnostic(legacy)
+
+    @pytest.mark.parametrize("guard, method, diagnose, args", FAMILY_PARAMS)
+    def test_families(self, guard, method, diagnose, args):
+        legacy = getattr(guard, method)(*args)
+        assert type(legacy) is dict
+        _assert_same(getattr(guard, method)(*args, compact=True), legacy)
+        if diagnose is not None:
+            assert getattr(guard, diagnose)(*args) == guard.to_diagnostic(legacy)
+
+    @pytest.mark.parametrize("claimed, layout", [
+        (None, RCMCalculationResult), (True, RCMResult), ("yes", RCMErrorResult),
+    ])
+    def test_rcm_layouts(self, claimed, layout):
+        result = GSTGuard().verify_rcm_applicability("GTA", "INDIVIDUAL", "BODY_CORPORATE", claimed, compact=True)
+        assert type(result) is layout
+        assert pickle.loads(pickle.dumps(result)) == result
+        assert type(GSTGuard().verify_rcm_applicability("NOPE", "INDIVIDUAL", "INDIVIDUAL", compact=True)) is RCMErrorResult
+
+    def test_batches(self):
+        invoices = [case for guard, method, _, cases in FAMILY_CASES if method == "verify_rcm_applicability" for case in cases]
+        legacy = GSTGuard().verify_rcm_batch(invoices)
+        compact = GSTGuard().verify_rcm_batch(invoices, compact=True)
+        assert len(compact) == len(legacy)
+        for got, expected in zip(compact, legacy):
+            _assert_same(got, expected)
+        expenses = [case for guard, method, _, cases in FAMILY_CASES if method == "verify_itc_eligibility" for case in cases]
+        for got, expected in zip(InputCreditGuard().verify_itc_batch(expenses, compact=True), InputCreditGuard().verify_itc_batch(expenses)):
+            _assert_same(got, expected)
+
+    def test_legacy_default_is_still_a_dict(self):
+        assert type(TDSGuard().calculate_deduction(*TDS_CASES[0])) is dict
+        assert type(RemittanceGuard().verify_lrs_limit(*LRS_CASES[0])) is dict
+        assert type(PoEMGuard().determine_residency(**POEM_CASES[0])) is dict
+
+
+class TestGuardResult:
+    def setup_method(self):
+        self.result = TDSGuard().calculate_deduction("UNKNOWN_SERVICE", "100", "0", compact=True)
+
+    def test_absent_keys(self):
+        assert self.result.deduction is ABSENT
+        with pytest.raises(KeyError):
+            self.result["deduction"]
+        with pytest.raises(KeyError):
+            self.result["to_dict"]  # methods are not keys
+        assert self.result.get("deduction", "n/a") == "n/a"
+        assert "deduction" not in self.result
+
+    def test_attribute_access(self):
+        assert self.result.verified is False
+        assert self.result.error.startswith("No TDS rule configured")
+
+    def test_read_only_mapping(self):
+        with pytest.raises(TypeError):
+            self.result["verified"] = True
+        with pytest.raises(AttributeError):
+            self.result.extra = 1
+
+    def test_pickle_and_copy(self):
+        full = TDSGuard().calculate_deduction(*TDS_CASES[0], compact=True)
+        for result in (self.result, full):
+            restored = pickle.loads(pickle.dumps(result))
+            assert type(restored) is TDSResult and restored == result
+            assert copy.deepcopy(result) == result
+        assert pickle.loads(pickle.dumps(self.result)).deduction is ABSENT
+
+    def test_repr_shows_legacy_dict(self):
+        assert repr(self.result) == f"TDSResult({self.result.to_dict()!r})"
+
+    def test_layout_order_must_name_fields(self):
+        with pytest.raises(TypeError, match="unknown fields"):
+            type("BadLayout", (RCMResult,), {"__slots__": (), "_ORDER": ("verified", "nope")})
+
+    def test_smaller_than_the_dict(self):
+        full = TDSGuard().calculate_deduction(*TDS_CASES[0], compact=True)
+        assert sys.getsizeof(full) < sys.getsizeof(full.to_dict())
+        assert not hasattr(full, "__dict__")
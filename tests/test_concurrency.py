@@ -0,0 +1,180 @@
+"""
+Stress tests for sharing one TaxPreFlight and one instance of each guard across threads.
+
+Every worker thread runs under its own hostile Decimal context and a tiny
+switch interval; all concurrent results must equal the sequential ones. The
+suite makes no assumption about the GIL, so it also runs unchanged on a
+free-threaded build (python3.13t -m pytest tests/test_concurrency.py).
+"""
+
+import json
+import random
+import sys
+import threading
+from decimal import ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_UP, Context, Decimal, setcontext
+from types import MappingProxyType
+
+import pytest
+
+from qwed_tax.cache import VerdictCache
+from qwed_tax.guards.indirect_tax_guard import InputCreditGuard
+from qwed_tax.guards.speculation_guard import SpeculationGuard
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.jurisdictions.india.guards.gst_guard import EntityType, GSTGuard, RCMRule, ServiceType
+from qwed_tax.jurisdictions.india.guards.setoff_guard import InterHeadAdjustmentGuard, TaxHead
+from qwed_tax.jurisdictions.us.payroll_guard import PayrollGuard
+from qwed_tax.jurisdictions.us.reciprocity_guard import ReciprocityGuard
+from qwed_tax.models import PayrollEntry
+from qwed_tax.verifier import TaxPreFlight, TaxVerifier
+
+THREADS = 16
+CALLS = 4000
+
+
+def _intents(rng):
+    amount = str(Decimal(rng.randint(1, 10**8)).scaleb(-2))
+    return rng.choice([
+        {"action": "pay_invoice", "service_type": "PROFESSIONAL_FEES", "amount": amount, "ytd_payment": "0"},
+        {"action": "expense_claim", "expense_category": rng.choice(["catering", "office_supplies"]),
+         "amount": amount, "tax_paid": "180"},
+        {"action": "trade_tax", "loss_head": rng.choice(["intraday", "futures"]), "loss_amount": amount,
+         "offset_head": rng.choice(["intraday", "delivery"])},
+        {"action": "economic_nexus", "state": rng.choice(["NY", "CA", "TX"]),
+         "sales_data": {"amount": amount, "transactions": rng.randint(1, 300)}, "tax_decision": "no_tax"},
+        {"action": "remit_money", "remittance_amount_usd": amount, "purpose": "education", "fy_usage": "0"},
+        {"action": "hire", "worker_type": "1099",
+         "worker_facts": {"provides_tools": rng.random() < 0.5, "indefinite_relationship": True}},
+    ])
+
+
+def _workload(seed):
+    """CALLS zero-argument calls, all on shared instances, with inputs fixed up front."""
+    rng = random.Random(seed)
+    preflight = TaxPreFlight()
+    cached = TaxPreFlight(verdict_cache=VerdictCache(maxsize=64))
+    us, india = TaxVerifier("US"), TaxVerifier("INDIA")
+    gst, tds, itc = GSTGuard(), TDSGuard(), InputCreditGuard()
+    setoff, speculation, reciprocity, payroll = (
+        InterHeadAdjustmentGuard(), SpeculationGuard(), ReciprocityGuard(), PayrollGuard()
+    )
+    amount = lambda: str(Decimal(rng.randint(1, 10**9)).scaleb(-2))  # noqa: E731
+    makers = [
+        lambda: lambda i=_intents(rng): preflight.audit_transaction(i),
+        lambda: lambda i=_intents(rng): cached.audit_transaction(i),
+        lambda: lambda c=(rng.choice(list(ServiceType)), rng.choice(list(EntityType)), rng.choice(list(EntityType)),
+                          rng.random() < 0.5): gst.verify_rcm_applicability(*c),
+        lambda: lambda a=amount(), s=rng.choice(["KA", "MH"]): gst.verify_gst_split("KA", s, a, "18", "1", "1", "0"),
+        lambda: lambda a=amount(), y=amount(): tds.calculate_deduction("PROFESSIONAL_FEES", a, y),
+        lambda: lambda c=rng.choice(["catering", "club membership", "office_supplies"]), a=amount():
+            itc.verify_itc_eligibility(c, a, "90"),
+        lambda: lambda h=(rng.choice(list(TaxHead)), rng.choice(list(TaxHead))): setoff.verify_setoff(*h),
+        lambda: lambda s=rng.choice(["intraday", "futures", "crypto"]), a=amount():
+            speculation.verify_setoff(s, a, "delivery"),
+        lambda: lambda r=rng.choice(["NJ", "PA", "MD", "NY"]), w=rng.choice(["PA", "NJ", "VA"]):
+            reciprocity.verify_reciprocity(r, w),
+        lambda: lambda e=_entry(rng): payroll.verify_gross_to_net(e),
+        lambda: lambda g=Decimal(amount()), ytd=Decimal(amount()): payroll.verify_fica_tax(ytd, g, Decimal("1234.56")),
+        lambda: lambda: us.preflight.audit_transaction({"action": "hire", "worker_type": "W2"}),
+        lambda: lambda a=Decimal(amount()), b=Decimal(amount()): india.crypto.verify_flat_tax_rate(a, b),
+    ]
+    return [rng.choice(makers)() for _ in range(CALLS)]
+
+
+def _entry(rng):
+    gross = Decimal(rng.randint(10**5, 10**8)).scaleb(-2)
+    taxes = [Decimal(rng.randint(0, 10**5)).scaleb(-2) for _ in range(3)]
+    return PayrollEntry(
+        employee_id="E1", gross_pay=gross, taxes=[{"name": "T", "amount": t} for t in taxes],
+        deductions=[{"name": "D", "amount": Decimal("123.45"), "type": "PRE_TAX"}],
+        net_pay_claimed=gross - sum(taxes) - Decimal("123.45") + rng.choice([Decimal(0), Decimal("0.01")]),
+    )
+
+
+def _plain(result):
+    if hasattr(result, "model_dump"):
+        result = result.model_dump()
+    return json.dumps(result, default=str, sort_keys=True)
+
+
+def _run_threads(target, count=THREADS):
+    """Start count threads on target(index) behind a barrier; re-raise the first failure."""
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run(index):
+        try:
+            barrier.wait()
+            target(index)
+        except BaseException as exc:  # noqa: BLE001 - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+@pytest.fixture
+def fast_switching():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+class TestSharedInstances:
+    @pytest.mark.parametrize("seed", range(2))
+    def test_concurrent_mixed_verifications_match_sequential(self, seed, fast_switching):
+        calls = _workload(seed)
+        expected = [_plain(call()) for call in calls]
+        results = [None] * len(calls)
+        roundings = [ROUND_DOWN, ROUND_HALF_UP, ROUND_FLOOR, ROUND_CEILING]
+
+        def worker(index):
+            # Each thread's own Decimal context, hostile to money arithmetic.
+            setcontext(Context(prec=2 + index % 5, rounding=roundings[index % 4]))
+            order = list(range(index, len(calls), THREADS))
+            random.Random(index).shuffle(order)
+            for position in order:
+                results[position] = _plain(calls[position]())
+
+        _run_threads(worker)
+        mismatched = [(got, want) for got, want in zip(results, expected) if got != want]
+        assert not mismatched, (len(mismatched), mismatched[:3])
+
+    def test_lazy_guard_is_published_once(self):
+        preflight, seen = TaxPreFlight(), [None] * THREADS
+
+        def worker(index):
+            seen[index] = preflight.withholding
+
+        _run_threads(worker)
+        assert all(guard is seen[0] for guard in seen)
+        assert preflight.withholding is seen[0]
+
+
+class TestReadOnlyRuleTables:
+    def test_guard_tables_reject_mutation(self):
+        with pytest.raises(TypeError):
+            GSTGuard._RCM_RULES[ServiceType.OTHER] = GSTGuard._RCM_RULES[ServiceType.GTA]
+        with pytest.raises(TypeError):
+            InterHeadAdjustmentGuard.PROHIBITED_SETOFFS[TaxHead.VDA] = ()
+        assert isinstance(InputCreditGuard.blocked_categories, frozenset)
+        assert isinstance(ReciprocityGuard.reciprocal_pairs, frozenset)
+        assert isinstance(SpeculationGuard._KNOWN_SOURCES, frozenset)
+        assert all(isinstance(heads, tuple) for heads in InterHeadAdjustmentGuard.PROHIBITED_SETOFFS.values())
+
+    def test_subclass_rule_overrides_are_frozen(self):
+        class StrictGSTGuard(GSTGuard):
+            _RCM_RULES = {
+                **GSTGuard._RCM_RULES,
+                ServiceType.OTHER: RCMRule(lambda provider, recipient: True, "Always RCM.", GSTGuard._RCM_RULES[
+                    ServiceType.GTA].rule_ref),
+            }
+
+        assert isinstance(StrictGSTGuard._RCM_RULES, MappingProxyType)
+        assert StrictGSTGuard().verify_rcm_applicability("OTHER", "INDIVIDUAL", "INDIVIDUAL", True)["verified"]
+        assert ServiceType.OTHER not in GSTGuard._RCM_RULES
@@ -70,7 +70,7 @@ class TestTaxDiagnosticResultModel:
         )
         assert result.status is TaxDiagnosticStatus.VERIFIED
         assert result.proof_ref is not None
-        assert result.proof_ref.startswith("sha256:")
+        assert result.proof_ref.startswith("qc1-sha256:")
 
     def test_unverifiable_factory(self):
         result = TaxDiagnosticResult.unverifiable(
@@ -107,7 +107,7 @@ class TestTaxDiagnosticResultModel:
         )
         d = result.to_dict()
         assert d["status"] == "VERIFIED"
-        assert d["proof_ref"].startswith("sha256:")
+        assert d["proof_ref"].startswith("qc1-sha256:")
         assert d["is_authoritative"] is True
 
         restored = TaxDiagnosticResult.from_dict(d)
@@ -181,7 +181,7 @@ class TestComputeProofRef:
         ref1 = compute_proof_ref(evidence)
         ref2 = compute_proof_ref(evidence)
         assert ref1 == ref2
-        assert ref1.startswith("sha256:")
+        assert ref1.startswith("qc1-sha256:")
 
     def test_different_evidence_different_hash(self):
         ref1 = compute_proof_ref({"rule_id": "TDS_194J"})
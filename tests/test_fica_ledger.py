@@ -0,0 +1,211 @@
+"""Tests for the stateful YTD FICA ledger."""
+
+import json
+import random
+from decimal import Decimal
+
+import pytest
+
+from qwed_tax import rules
+from qwed_tax.jurisdictions.us.fica_ledger import FicaLedger, _expected_ss_cents, _social_security_rule
+from qwed_tax.jurisdictions.us.payroll_guard import PayrollGuard
+
+
+def _ss(amount):
+    return (Decimal(amount) * Decimal("0.062")).quantize(Decimal("0.01"))
+
+
+class TestFicaLedger:
+    def setup_method(self):
+        self.ledger = FicaLedger()
+        self.guard = PayrollGuard()
+
+    def test_tracks_ytd_across_periods(self):
+        for _ in range(3):
+            result = self.ledger.verify_paycheck("E1", "5000.00", "310.00")
+            assert result.verified is True
+        assert self.ledger.ytd_wages("E1") == Decimal("15000.00")
+        assert self.ledger.ytd_wages("unknown") == Decimal("0.00")
+
+    def test_caps_at_wage_base(self):
+        self.ledger.verify_paycheck("E1", "170000.00", _ss("170000.00"))
+        capping = self.ledger.verify_paycheck("E1", "10000.00", _ss("6100.00"))
+        assert capping.verified is True
+        assert "Hit Limit" in capping.message
+        capped = self.ledger.verify_paycheck("E1", "10000.00", "0.00")
+        assert capped.verified is True
+        assert "Already hit YTD Limit" in capped.message
+
+    def test_record_false_leaves_ytd_untouched(self):
+        self.ledger.verify_paycheck("E1", "5000.00", "310.00", record=False)
+        assert self.ledger.ytd_wages("E1") == Decimal("0.00")
+
+    def test_half_even_rounding_matches_decimal_path(self):
+        # 2.50 * 0.062 = 0.155 -> 0.16; 7.50 * 0.062 = 0.465 -> 0.46
+        rule = _social_security_rule("2025-01-01")
+        assert _expected_ss_cents(0, 250, rule) == 16
+        assert _expected_ss_cents(0, 750, rule) == 46
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_apply_period_agrees_with_verify_fica_tax(self, seed):
+        rng = random.Random(seed)
+        ytd = {}
+        for _ in range(26):
+            paychecks = []
+            expected_mismatches = []
+            for e in range(30):
+                employee_id = f"E{e}"
+                gross = Decimal(rng.randint(0, 2_500_000)).scaleb(-2)
+                previous = ytd.get(employee_id, Decimal("0.00"))
+                truth = self.guard.verify_fica_tax(previous + gross, gross, Decimal("0.00"))
+                expected_tax = -truth.discrepancy
+                roll = rng.random()
+                claimed = expected_tax
+                if roll < 0.1:
+                    claimed = expected_tax + Decimal("0.01")
+                elif roll < 0.15:
+                    claimed = expected_tax + Decimal("0.001")
+                paychecks.append((employee_id, gross, claimed))
+                reference = self.guard.verify_fica_tax(previous + gross, gross, claimed)
+                if not reference.verified:
+                    expected_mismatches.append((employee_id, reference))
+                ytd[employee_id] = previous + gross
+            assert self.ledger.apply_period(paychecks) == expected_mismatches
+        for employee_id, total in ytd.items():
+            assert self.ledger.ytd_wages(employee_id) == total
+
+    def test_apply_period_is_atomic(self):
+        self.ledger.apply_period([("E1", "100.00", "6.20")])
+        with pytest.raises(ValueError):
+            self.ledger.apply_period([("E1", "100.00", "6.20"), ("E2", "50.00", "3.10"), ("E3", "10.005", "0.62")])
+        assert self.ledger.ytd_wages("E1") == Decimal("100.00")
+        assert "E2" not in self.ledger
+        assert len(self.ledger) == 1
+
+    @pytest.mark.parametrize("gross", ["10.005", "-5.00", "nan", True, "abc"])
+    def test_rejects_invalid_wages(self, gross):
+        with pytest.raises(ValueError):
+            self.ledger.verify_paycheck("E1", gross, "0.00")
+
+    def test_snapshot_round_trip(self, tmp_path):
+        self.ledger.apply_period([("E1", "5000.00", "310.00"), ("Émile", "1000.00", "62.00")])
+        path = tmp_path / "fica.snap"
+        self.ledger.snapshot(path)
+        restored = FicaLedger.restore(path)
+        assert len(restored) == 2
+        assert restored.ytd_wages("E1") == Decimal("5000.00")
+        assert restored.ytd_wages("Émile") == Decimal("1000.00")
+        assert restored.verify_paycheck("E1", "5000.00", "310.00").verified is True
+        assert restored.ytd_wages("E1") == Decimal("10000.00")
+        assert self.ledger.ytd_wages("E1") == Decimal("5000.00")
+
+    def test_restore_rejects_bad_files(self, tmp_path):
+        self.ledger.apply_period([("E1", "5000.00", "310.00")])
+        path = tmp_path / "fica.snap"
+        self.ledger.snapshot(path)
+        data = path.read_bytes()
+
+        bad_magic = tmp_path / "magic.snap"
+        bad_magic.write_bytes(b"NOTFICA!" + data[8:])
+        truncated = tmp_path / "short.snap"
+        truncated.write_bytes(data[:-4])
+        trailing = tmp_path / "long.snap"
+        trailing.write_bytes(data + b"\0")
+        for bad in (bad_magic, truncated, trailing):
+            with pytest.raises(ValueError):
+                FicaLedger.restore(bad)
+
+    def test_restore_rejects_other_wage_base(self, tmp_path):
+        path = tmp_path / "fica.snap"
+        self.ledger.snapshot(path)
+        original = rules.default_registry()
+        rules.set_default_registry(_fica_registry(tmp_path, "184500.00"))
+        try:
+            with pytest.raises(ValueError, match="different tax year"):
+                FicaLedger.restore(path)
+        finally:
+            rules.set_default_registry(original)
+
+    def test_restore_checks_tax_year(self, tmp_path):
+        path = tmp_path / "fica.snap"
+        FicaLedger(tax_year=2023).snapshot(path)
+        assert FicaLedger.restore(path).tax_year == 2023
+        with pytest.raises(ValueError, match="tax year 2023, not 2024"):
+            FicaLedger.restore(path, tax_year=2024)
+
+    def test_restores_version_1_snapshots(self, tmp_path):
+        path = tmp_path / "fica.snap"
+        ledger = FicaLedger(tax_year=2025)
+        ledger.apply_period([("E1", "5000.00", "310.00")])
+        ledger.snapshot(path)
+        data = path.read_bytes()
+        # Version 1: no tax year field after magic and version.
+        path.write_bytes(data[:8] + (1).to_bytes(2, "little") + data[12:])
+        restored = FicaLedger.restore(path, tax_year=2025)
+        assert restored.ytd_wages("E1") == Decimal("5000.00")
+        with pytest.raises(ValueError, match="different tax year"):
+            FicaLedger.restore(path, tax_year=2023)
+
+
+def _fica_registry(directory, wage_base_2026):
+    """The shipped rules with a 2026 wage base of wage_base_2026 from 2026-01-01."""
+    data = json.loads((rules.RULES_DIR / "us_fica.json").read_text())
+    intervals = data["rules"]["SOCIAL_SECURITY"]
+    intervals[-1]["to"] = "2025-12-31"
+    intervals.append({"from": "2026-01-01", "to": None, "value": {"rate": "0.062", "wage_base": wage_base_2026}})
+    (directory / "us_fica.json").write_text(json.dumps(data))
+    return rules.RuleRegistry(directory)
+
+
+class TestFicaLedgerTaxYear:
+    def setup_method(self):
+        self.original = rules.default_registry()
+        self.guard = PayrollGuard()
+
+    def teardown_method(self):
+        rules.set_default_registry(self.original)
+
+    @pytest.mark.parametrize("swap_after_construction", [False, True])
+    def test_follows_the_default_registry(self, tmp_path, swap_after_construction):
+        if not swap_after_construction:
+            rules.set_default_registry(_fica_registry(tmp_path, "184500.00"))
+        ledger = FicaLedger(tax_year=2026)
+        ledger.apply_period([("E1", "176000.00", "10912.00")])
+        if swap_after_construction:
+            rules.set_default_registry(_fica_registry(tmp_path, "184500.00"))
+        assert ledger.wage_base == Decimal("184500.00")
+        # Under 184,500 the 2,000 paycheck is fully taxable: 124.00, not 6.20.
+        under = ledger.apply_period([("E1", "2000.00", "6.20")])
+        assert [r.verified for _, r in under] == [False]
+        assert under[0][1].discrepancy == Decimal("-117.80")
+        assert ledger.apply_period([("E2", "176000.00", "10912.00"), ("E2", "2000.00", "124.00")]) == []
+        assert ledger.verify_paycheck("E3", "2000.00", "124.00").verified is True
+
+    @pytest.mark.parametrize("year, wage_base", [(2021, "142800.00"), (2024, "168600.00"), (2025, "176100.00")])
+    def test_replays_prior_years(self, year, wage_base):
+        ledger = FicaLedger(tax_year=year)
+        assert ledger.wage_base == Decimal(wage_base)
+        base = Decimal(wage_base)
+        capping = (base - Decimal("1000.00")) * Decimal("0.062")
+        assert ledger.apply_period([("E1", base - Decimal("1000.00"), capping.quantize(Decimal("0.01")))]) == []
+        assert ledger.apply_period([("E1", "5000.00", "62.00")]) == []
+        assert ledger.apply_period([("E1", "5000.00", "0.00")]) == []
+
+    def test_agrees_with_verify_fica_tax_as_of(self):
+        rng = random.Random(0)
+        for year in (2020, 2023, 2025):
+            ledger = FicaLedger(tax_year=year)
+            ytd = Decimal("0.00")
+            for _ in range(40):
+                gross = Decimal(rng.randint(0, 1_000_000)).scaleb(-2)
+                claimed = Decimal(rng.randint(0, 80_000)).scaleb(-2)
+                expected = self.guard.verify_fica_tax(ytd + gross, gross, claimed, as_of=f"{year}-06-30")
+                assert ledger.verify_paycheck("E1", gross, claimed, record=False) == expected
+                mismatches = ledger.apply_period([("E1", gross, claimed)])
+                assert mismatches == ([] if expected.verified else [("E1", expected)])
+                ytd += gross
+
+    @pytest.mark.parametrize("tax_year", [2019, "2025", True, 0])
+    def test_rejects_years_without_rules(self, tax_year):
+        with pytest.raises(ValueError):
+            FicaLedger(tax_year=tax_year)
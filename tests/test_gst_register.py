@@ -0,0 +1,160 @@
+"""Differential tests: vectorized GST register vs GSTGuard.verify_gst_split."""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from qwed_tax.jurisdictions.india.guards.gst_guard import GSTGuard  # noqa: E402
+from qwed_tax.jurisdictions.india.guards.gst_register import COLUMNS  # noqa: E402
+
+STATES = ["KA", "MH", "ka ", " TN", "DL"]
+RATES = [0, 0.25, 3, 5, 12, 18, 28]
+
+
+def _random_rows(seed, n):
+    """Invoices that are mostly right, with near-tolerance and wrong-type errors mixed in."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        supplier, place = rng.choice(STATES), rng.choice(STATES)
+        taxable = Decimal(rng.randint(0, 10_000_000)).scaleb(-2)
+        rate = Decimal(str(rng.choice(RATES)))
+        total = taxable * rate / 100
+        interstate = supplier.strip().upper() != place.strip().upper()
+        legs = [Decimal(0), Decimal(0), total] if interstate else [total / 2, total / 2, Decimal(0)]
+        legs = [leg.quantize(Decimal("0.01")) for leg in legs]
+        roll = rng.random()
+        if roll < 0.2:
+            i = rng.randrange(3)
+            legs[i] += Decimal(rng.choice([-3, -2, -1, 1, 2, 3])).scaleb(-2)
+        elif roll < 0.25:
+            legs = [legs[2], legs[2], legs[0]]
+        rows.append((supplier, place, taxable, rate, *legs))
+    return rows
+
+
+def _table(rows, convert=lambda column: column):
+    return {name: convert([row[i] for row in rows]) for i, name in enumerate(COLUMNS)}
+
+
+def _expected(guard, rows):
+    expected = []
+    for index, row in enumerate(rows):
+        result = guard.verify_gst_split(*row)
+        if not result["verified"]:
+            expected.append({"row": index, **result})
+    return expected
+
+
+class TestGSTRegisterDifferential:
+    def setup_method(self):
+        self.guard = GSTGuard()
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_decimal_columns(self, seed):
+        rows = _random_rows(seed, 400)
+        expected = _expected(self.guard, rows)
+        assert expected  # the generator does produce failures
+        assert self.guard.verify_gst_split_register(_table(rows)) == expected
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_float_columns(self, seed):
+        rows = [
+            (s, p, *(float(v) for v in values))
+            for s, p, *values in _random_rows(seed, 400)
+        ]
+        table = _table(rows, np.array)
+        assert table["taxable_value"].dtype == np.float64
+        assert self.guard.verify_gst_split_register(table) == _expected(self.guard, rows)
+
+    def test_integer_and_string_columns(self):
+        rows = [
+            ("KA", "KA", 1000, 18, 90, 90, 0),
+            ("KA", "MH", 1000, 18, 0, 0, 181),
+            ("KA", "MH", 1000, 18, "0", "0", "180.02"),
+            ("KA", "MH", 1000, 18, "0", "0", "180.03"),
+        ]
+        table = {
+            name: np.array(column) if name in ("taxable_value", "gst_rate") else column
+            for name, column in _table(rows).items()
+        }
+        assert table["taxable_value"].dtype.kind == "i"
+        result = self.guard.verify_gst_split_register(table)
+        assert [r["row"] for r in result] == [1, 3]
+        assert result == _expected(self.guard, rows)
+
+
+class TestGSTRegisterEdges:
+    def setup_method(self):
+        self.guard = GSTGuard()
+
+    def test_tolerance_boundary_in_paise(self):
+        # 18% of 1000.50 = 180.09 -> 90.045 per leg; 2 paise either way passes.
+        rows = [
+            ("KA", "KA", "1000.50", 18, "90.065", "90.025", 0),
+            ("KA", "KA", "1000.50", 18, "90.07", "90.02", 0),
+            ("KA", "KA", "1000.50", 18, "90.065", "90.0249", 0),
+        ]
+        assert [r["row"] for r in self.guard.verify_gst_split_register(_table(rows))] == [1, 2]
+
+    def test_zero_legs_get_no_tolerance(self):
+        rows = [
+            ("KA", "MH", 1000, 18, "0.01", 0, 180),
+            ("KA", "KA", 1000, 18, 90, 90, "0.01"),
+            ("KA", "KA", 1000, 0, "0.01", 0, 0),
+        ]
+        result = self.guard.verify_gst_split_register(_table(rows))
+        assert [r["row"] for r in result] == [0, 1, 2]
+        assert "IGST claimed on an intra-state supply" in result[1]["error"]
+
+    def test_invalid_rows_fail_closed_with_scalar_reasons(self):
+        rows = [
+            ("KA", "KA", 1000, 18, 90, 90, 0),
+            (None, "KA", 1000, 18, 90, 90, 0),
+            ("KA", "  ", 1000, 18, 90, 90, 0),
+            ("KA", "KA", -1000, 18, -90, -90, 0),
+            ("KA", "KA", float("nan"), 18, 90, 90, 0),
+            ("KA", "KA", True, 18, 0, 0, 0),
+            ("KA", "KA", "abc", 18, 90, 90, 0),
+            ("KA", "KA", 1000, "18.125", "90.625", "90.625", 0),
+            ("KA", "KA", 10**18, 18, 9 * 10**16, 9 * 10**16, 0),
+        ]
+        result = self.guard.verify_gst_split_register(_table(rows))
+        assert result == _expected(self.guard, rows)
+        assert [r["row"] for r in result] == [1, 2, 3, 4, 5, 6]
+
+    def test_structured_array(self):
+        rows = _random_rows(11, 200)
+        dtype = [("supplier_state", "U4"), ("place_of_supply", "U4")] + [(n, "f8") for n in COLUMNS[2:]]
+        table = np.array([(s, p, *(float(v) for v in values)) for s, p, *values in rows], dtype=dtype)
+        plain = [(s, p, *(float(v) for v in values)) for s, p, *values in rows]
+        assert self.guard.verify_gst_split_register(table) == _expected(self.guard, plain)
+
+    def test_arrow_like_columns(self):
+        class Column:
+            def __init__(self, values):
+                self.values = values
+
+            def to_numpy(self, zero_copy_only=True):
+                assert zero_copy_only is False
+                return np.array(self.values, dtype=object)
+
+        rows = _random_rows(12, 100)
+        table = {name: Column(values) for name, values in _table(rows).items()}
+        assert self.guard.verify_gst_split_register(table) == _expected(self.guard, rows)
+
+    def test_empty_register(self):
+        assert self.guard.verify_gst_split_register({name: [] for name in COLUMNS}) == []
+
+    def test_missing_or_ragged_columns(self):
+        table = _table(_random_rows(1, 3))
+        del table["claimed_igst"]
+        with pytest.raises(ValueError, match="claimed_igst"):
+            self.guard.verify_gst_split_register(table)
+        table = _table(_random_rows(1, 3))
+        table["gst_rate"] = table["gst_rate"][:2]
+        with pytest.raises(ValueError, match="same length"):
+            self.guard.verify_gst_split_register(table)
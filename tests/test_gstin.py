@@ -0,0 +1,85 @@
+"""Tests for table-driven GSTIN validation and InputCreditGuard.verify_gstin_batch."""
+
+import random
+
+import pytest
+
+from qwed_tax.guards.indirect_tax_guard import InputCreditGuard
+
+CODES = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+LETTERS = CODES[10:]
+VALID = "27AAPFU0939F1ZV"
+
+
+def _reference_check_digit(first_14):
+    """The GSTN algorithm as specified, one character at a time."""
+    total = 0
+    for index, char in enumerate(first_14):
+        product = CODES.index(char) * (1 if index % 2 == 0 else 2)
+        total += product // 36 + product % 36
+    return CODES[(36 - total % 36) % 36]
+
+
+def _random_prefix(rng):
+    return (
+        f"{rng.randint(1, 38):02d}"
+        + "".join(rng.choice(LETTERS) for _ in range(5))
+        + f"{rng.randint(0, 9999):04d}"
+        + rng.choice(LETTERS)
+        + rng.choice(CODES[1:])
+        + "Z"
+    )
+
+
+class TestGSTINChecksum:
+    def setup_method(self):
+        self.guard = InputCreditGuard()
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_exactly_the_reference_check_digit_passes(self, seed):
+        rng = random.Random(seed)
+        for _ in range(200):
+            prefix = _random_prefix(rng)
+            passing = [c for c in CODES if self.guard.verify_gstin_format(prefix + c)["verified"]]
+            assert passing == [_reference_check_digit(prefix)]
+
+    @pytest.mark.parametrize("gstin", [
+        VALID + "\n",  # re.match with "$" used to accept a trailing newline
+        "٢٧AAPFU0939F1ZV",  # non-ASCII digits are not GSTIN digits
+        "27aapfu0939f1zv",
+        "27AAPFU0939F1ZV ",
+        "",
+    ])
+    def test_malformed_input_is_a_format_error(self, gstin):
+        assert self.guard.verify_gstin_format(gstin) == {"verified": False, "error": "Invalid GSTIN format."}
+
+    def test_wrong_check_digits_are_indistinguishable(self):
+        # No oracle: every wrong check digit gets the same response, so the
+        # caller learns only that this one failed.
+        responses = {
+            repr(self.guard.verify_gstin_format(VALID[:14] + c)) for c in CODES if c != VALID[14]
+        }
+        assert responses == {repr({"verified": False, "error": "Invalid GSTIN checksum."})}
+
+
+class TestGSTINBatch:
+    def setup_method(self):
+        self.guard = InputCreditGuard()
+
+    def test_batch_matches_single_calls(self):
+        rng = random.Random(0)
+        gstins = []
+        for _ in range(2000):
+            prefix = _random_prefix(rng)
+            gstins.append(prefix + (_reference_check_digit(prefix) if rng.random() < 0.5 else rng.choice(CODES)))
+        gstins += [VALID, VALID + "\n", "INVALID", "", VALID.lower()]
+        expected = [i for i, g in enumerate(gstins) if not self.guard.verify_gstin_format(g)["verified"]]
+        assert self.guard.verify_gstin_batch(gstins) == expected
+        assert 0 < len(expected) < len(gstins)
+
+    def test_non_strings_are_invalid(self):
+        assert self.guard.verify_gstin_batch([VALID, None, 27, b"27AAPFU0939F1ZV", VALID]) == [1, 2, 3]
+
+    def test_generators_and_empty(self):
+        assert self.guard.verify_gstin_batch(iter([])) == []
+        assert self.guard.verify_gstin_batch(g for g in (VALID, "X")) == [1]
@@ -14,7 +14,7 @@ class TestCapitalGainsGuardDiagnostic:
         diag = CapitalGainsGuard.to_diagnostic(raw)
         assert diag.status is TaxDiagnosticStatus.VERIFIED
         assert diag.proof_ref is not None
-        assert diag.proof_ref.startswith("sha256:")
+        assert diag.proof_ref.startswith("qc1-sha256:")
         assert diag.developer_fields["constraint_id"] == "CG_EQUITY_LTCG_112A"
 
     def test_blocked_rate_mismatch(self):
@@ -474,7 +474,7 @@ class TestTaxPreFlightAudit:
             {
                 "action": "trade_tax",
                 "asset_type": "equity",
-                "dates": {"buy": "2022-01-01", "sell": "2024-02-01"},
+                "dates": {"buy": "2022-01-01", "sell": "2024-08-01"},
                 "claimed_rate": "10%",
             }
         )
@@ -488,7 +488,7 @@ class TestTaxPreFlightAudit:
             {
                 "action": "trade_tax",
                 "asset_type": "equity",
-                "dates": {"buy": "2022-01-01", "sell": "2024-02-01"},
+                "dates": {"buy": "2022-01-01", "sell": "2024-08-01"},
                 "claimed_rate": "10%",
                 "loss_head": "intraday loss",
             }
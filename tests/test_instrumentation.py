@@ -0,0 +1,207 @@
+"""Tests for the instrumentation hooks and collectors."""
+
+import importlib.util
+import threading
+
+import pytest
+
+from qwed_tax import instrumentation
+from qwed_tax.audit import TDS_194J, build_trace
+from qwed_tax.diagnostics import compute_proof_ref
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.instrumentation import Event, HistogramCollector, OpenTelemetryHook, instrumented
+from qwed_tax.middleware.gusto_interceptor import QWEDTaxMiddleware
+from qwed_tax.verifier import TaxPreFlight
+
+INVOICE = {"action": "pay_invoice", "service_type": "PROFESSIONAL_FEES", "amount": "20000", "ytd_payment": "0"}
+BAD_INVOICE = {**INVOICE, "amount": "fifty thousand"}
+PAYLOAD = {
+    "payroll_entry": {
+        "employee_id": "E1",
+        "gross_pay": "5000.00",
+        "taxes": [{"name": "Federal Income Tax", "amount": "800.00"}],
+        "deductions": [],
+        "net_pay_claimed": "4200.00",
+    }
+}
+
+
+class TestHooks:
+    def setup_method(self):
+        self.events = []
+
+    def test_disabled_by_default(self):
+        assert not instrumentation.enabled()
+        TaxPreFlight().audit_transaction(INVOICE)  # nothing to record into
+
+    def test_audit_transaction_events(self):
+        with instrumented(self.events.append):
+            report = TaxPreFlight().audit_transaction(INVOICE)
+        assert not instrumentation.enabled()
+        kinds = [event.kind for event in self.events]
+        assert kinds[-1] == "request" and "guard" in kinds and "parse" in kinds and "trace" in kinds
+
+        request = self.events[-1]
+        assert request.name == "audit_transaction"
+        assert request.action == "pay_invoice" and request.check is None
+        assert request.outcome == ("allowed" if report["allowed"] else "blocked")
+
+        guard = next(event for event in self.events if event.kind == "guard")
+        assert (guard.action, guard.check, guard.name) == ("pay_invoice", "invoice_tds", "invoice_tds")
+        assert guard.outcome == "passed"
+        for event in self.events[:-1]:
+            assert (event.action, event.check) == ("pay_invoice", "invoice_tds")
+            assert 0 <= event.duration_ns <= request.duration_ns
+
+    def test_blocked_check_and_parse_error(self):
+        with instrumented(self.events.append):
+            report = TaxPreFlight().audit_transaction(BAD_INVOICE)
+        assert not report["allowed"]
+        outcomes = {(event.kind, event.outcome) for event in self.events}
+        assert {("parse", "error"), ("guard", "blocked"), ("request", "blocked")} <= outcomes
+
+    def test_intent_blocked_before_any_guard(self):
+        with instrumented(self.events.append):
+            TaxPreFlight().audit_transaction({"action": "teleport"})
+        assert [(e.kind, e.outcome, e.action) for e in self.events] == [("request", "blocked", "teleport")]
+
+    def test_audit_batch_events(self):
+        intents = [INVOICE, BAD_INVOICE, {"action": "teleport"}]
+        with instrumented(self.events.append):
+            batch = TaxPreFlight().audit_batch(intents)
+        guards = [event for event in self.events if event.kind == "guard"]
+        assert [event.outcome for event in guards] == ["passed", "blocked"]
+        assert self.events[-1][:2] == ("request", "audit_batch")
+        assert batch["reports"] == TaxPreFlight().audit_batch(intents)["reports"]
+
+    def test_middleware_events(self):
+        with instrumented(self.events.append):
+            decision = QWEDTaxMiddleware().process_ai_payroll_request(PAYLOAD)
+        guard = next(event for event in self.events if event.kind == "guard")
+        assert (guard.action, guard.check, guard.outcome) == ("payroll", "gross_to_net_arithmetic", "passed")
+        assert self.events[-1][:2] == ("request", "process_ai_payroll_request")
+        assert self.events[-1].outcome == decision["status"].lower() == "arithmetic_verified"
+
+    def test_trace_and_proof_events(self):
+        with instrumented(self.events.append):
+            trace = build_trace(TDS_194J, "DEDUCTION_REQUIRED", {"amount": "50000"})
+            ref = compute_proof_ref(trace)
+            assert compute_proof_ref(trace) == ref  # cached: no second hash
+        assert [(e.kind, e.name, e.outcome) for e in self.events] == [
+            ("trace", TDS_194J.rule_id, "DEDUCTION_REQUIRED"),
+            ("proof", "qc1-sha256", "ok"),
+        ]
+
+    def test_scope_attributes_direct_guard_calls(self):
+        with instrumented(self.events.append), instrumentation.scope("bulk_import", "tds"):
+            TDSGuard().calculate_deduction("COMMISSION", "20000", "0")
+        assert self.events and {(e.action, e.check) for e in self.events} == {("bulk_import", "tds")}
+
+    def test_results_unchanged_by_hooks(self):
+        guard = TDSGuard()
+        plain = [guard.calculate_deduction("COMMISSION", str(a), "0") for a in (100, 20000, "x")]
+        with instrumented(self.events.append):
+            hooked = [guard.calculate_deduction("COMMISSION", str(a), "0") for a in (100, 20000, "x")]
+        assert hooked == plain
+
+    def test_failing_hook_is_logged_not_raised(self, caplog):
+        def broken(event):
+            raise RuntimeError("exporter down")
+
+        with instrumented(broken, self.events.append):
+            report = TaxPreFlight().audit_transaction(INVOICE)
+        assert report == TaxPreFlight().audit_transaction(INVOICE)
+        assert self.events  # later hooks still run
+        assert "exporter down" in caplog.text
+
+    def test_hooks_removed_on_error(self):
+        with pytest.raises(KeyError):
+            with instrumented(self.events.append):
+                raise KeyError("boom")
+        assert not instrumentation.enabled()
+        with pytest.raises(ValueError):
+            instrumentation.remove_hook(self.events.append)
+        with pytest.raises(TypeError):
+            instrumentation.add_hook("not callable")
+
+
+class TestHistogramCollector:
+    def setup_method(self):
+        self.collector = HistogramCollector()
+
+    def test_quantiles_are_close_upper_bounds(self):
+        for duration in range(1, 10_001):
+            self.collector(Event("guard", "x", duration * 1000, "passed"))
+        stats = self.collector.snapshot()[("guard", None, None, "x")]
+        assert stats["count"] == 10_000
+        assert stats["min_ns"] == 1000 and stats["max_ns"] == 10_000_000
+        for key, true in (("p50_ns", 5_000_000), ("p90_ns", 9_000_000), ("p99_ns", 9_900_000)):
+            assert true <= stats[key] <= min(true * 1.25, stats["max_ns"])
+        assert stats["outcomes"] == {"passed": 10_000}
+
+    def test_buckets_cover_every_duration(self):
+        buckets = [instrumentation._bucket(duration) for duration in range(5000)]
+        assert buckets == sorted(buckets)
+        for duration in [*range(5000), 2**40, 2**40 + 1, 3 * 2**50]:
+            upper = instrumentation._bucket_upper(instrumentation._bucket(duration))
+            assert duration <= upper <= max(duration * 1.25, 7)
+
+    def test_keys_split_by_kind_action_check_name(self):
+        with instrumented(self.collector):
+            TaxPreFlight().audit_batch([INVOICE] * 5 + [BAD_INVOICE])
+        snapshot = self.collector.snapshot()
+        assert snapshot[("guard", "pay_invoice", "invoice_tds", "invoice_tds")]["outcomes"] == {
+            "passed": 5, "blocked": 1,
+        }
+        assert snapshot[("parse", "pay_invoice", "invoice_tds", "invoice_amount")]["outcomes"] == {
+            "ok": 5, "error": 1,
+        }
+        assert "invoice_tds" in self.collector.report()
+        self.collector.reset()
+        assert self.collector.snapshot() == {}
+
+    def test_thread_safe(self):
+        def record():
+            for _ in range(2000):
+                self.collector(Event("parse", "amount", 500, "ok"))
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert self.collector.snapshot()[("parse", None, None, "amount")]["count"] == 16_000
+
+
+class _Meter:
+    def __init__(self):
+        self.instruments = []
+
+    def create_histogram(self, name, unit="", description=""):
+        self.instruments.append((name, unit))
+        self.records = []
+        return self
+
+    def record(self, amount, attributes=None):
+        self.records.append((amount, attributes))
+
+
+class TestOpenTelemetryHook:
+    def test_records_seconds_with_attributes(self):
+        meter = _Meter()
+        hook = OpenTelemetryHook(meter)
+        assert meter.instruments == [("qwed_tax.duration", "s")]
+        with instrumented(hook):
+            TaxPreFlight().audit_transaction(INVOICE)
+        amount, attributes = next(r for r in meter.records if r[1]["qwed.kind"] == "guard")
+        assert 0 < amount < 1
+        assert attributes == {
+            "qwed.kind": "guard", "qwed.name": "invoice_tds", "qwed.outcome": "passed",
+            "qwed.action": "pay_invoice", "qwed.check": "invoice_tds",
+        }
+        assert "qwed.check" not in meter.records[-1][1]  # the request event
+
+    @pytest.mark.skipif(importlib.util.find_spec("opentelemetry") is not None, reason="opentelemetry installed")
+    def test_default_meter_needs_opentelemetry_api(self):
+        with pytest.raises(ImportError, match=r"qwed-tax\[otel\]"):
+            OpenTelemetryHook()
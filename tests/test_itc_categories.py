@@ -0,0 +1,187 @@
+"""Tests for the compiled ITC category index and InputCreditGuard.verify_itc_batch."""
+
+import json
+import random
+
+import pytest
+
+from qwed_tax.guards import itc_categories
+from qwed_tax.guards.indirect_tax_guard import InputCreditGuard
+from qwed_tax.guards.itc_categories import CategoryIndex, _Automaton, normalize_category
+
+MAPPING = {
+    "categories": [
+        {"code": "PERSONAL_CONSUMPTION", "rule": "personal", "substrings": ["PERSONAL"]},
+        {"code": "FOOD_AND_BEVERAGE", "rule": "blocked", "aliases": ["F&B"], "keywords": ["LUNCH", "TEAM_DINNER"]},
+        {"code": "CLUB_MEMBERSHIP", "rule": "blocked", "keywords": ["CLUB"]},
+    ]
+}
+
+
+class TestCategoryIndex:
+    def setup_method(self):
+        self.index = CategoryIndex.from_dict(MAPPING)
+
+    @pytest.mark.parametrize("category, code, matched_by", [
+        ("food and beverage", "FOOD_AND_BEVERAGE", "code"),
+        ("Food-and-Beverage ", "FOOD_AND_BEVERAGE", "code"),
+        ("F&B", "FOOD_AND_BEVERAGE", "alias"),
+        ("Client lunch (Q3)", "FOOD_AND_BEVERAGE", "keyword"),
+        ("quarterly team dinner", "FOOD_AND_BEVERAGE", "keyword"),
+        ("Nonpersonal items", "PERSONAL_CONSUMPTION", "substring"),
+        # Both match; PERSONAL_CONSUMPTION is listed first.
+        ("personal lunch", "PERSONAL_CONSUMPTION", "substring"),
+        ("club lunch", "FOOD_AND_BEVERAGE", "keyword"),
+    ])
+    def test_matches(self, category, code, matched_by):
+        match = self.index.classify(category)
+        assert (match.code, match.matched_by) == (code, matched_by)
+
+    @pytest.mark.parametrize("category", ["LUNCHBOX", "team", "dinner", "office supplies", "", "--"])
+    def test_keywords_match_whole_tokens_only(self, category):
+        assert self.index.classify(category) is None
+
+    def test_normalize_category(self):
+        assert normalize_category("  Food & Beverage / Misc.  ") == "FOOD_BEVERAGE_MISC"
+
+    def test_classify_many_matches_classify(self):
+        categories = ["F&B", "club", "office", "F&B", "personal lunch"]
+        assert self.index.classify_many(categories) == [self.index.classify(c) for c in categories]
+
+    def test_memo_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(itc_categories, "_MEMO_SIZE", 2)
+        for category in ("F&B", "club", "office", "F&B"):
+            assert self.index.classify(category) == self.index._classify(category)
+        assert len(self.index._memo) <= 2
+
+    def test_codes(self):
+        assert dict(self.index.codes) == {
+            "PERSONAL_CONSUMPTION": "personal", "FOOD_AND_BEVERAGE": "blocked", "CLUB_MEMBERSHIP": "blocked",
+        }
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_automaton_matches_brute_force(self, seed):
+        rng = random.Random(seed)
+        for _ in range(500):
+            patterns = {}
+            for label in range(rng.randint(1, 8)):
+                patterns.setdefault(tuple(rng.choice("AB") for _ in range(rng.randint(1, 4))), label)
+            text = [rng.choice("ABC") for _ in range(rng.randint(0, 15))]
+            expected = min(
+                (label for pattern, label in patterns.items()
+                 if any(tuple(text[i:i + len(pattern)]) == pattern for i in range(len(text) - len(pattern) + 1))),
+                default=-1,
+            )
+            assert _Automaton(patterns).search(text) == expected, (patterns, text)
+
+    @pytest.mark.parametrize("categories, message", [
+        ([], "non-empty"),
+        ([{"code": "X", "rule": "maybe"}], "rule must be one of"),
+        ([{"code": "food", "rule": "blocked"}], "normalized"),
+        ([{"code": "X", "rule": "blocked", "aliases": ["Y"]}, {"code": "Y", "rule": "blocked"}], "duplicate"),
+        ([{"code": "X", "rule": "blocked", "keywords": ["--"]}], "invalid keyword"),
+        ([{"code": "X", "rule": "blocked", "substrings": ["lower"]}], "invalid substring"),
+        ([{"code": "X", "rule": "blocked", "aliases": "Y"}], "list of strings"),
+        ([{"code": "X", "rule": "blocked", "regex": ".*"}], "only the keys"),
+    ])
+    def test_rejects_invalid_mappings(self, categories, message):
+        with pytest.raises(ValueError, match=message):
+            CategoryIndex.from_dict({"categories": categories})
+
+    def test_load_names_the_file(self, tmp_path):
+        path = tmp_path / "bad.json"
+        path.write_text(json.dumps({"categories": []}))
+        with pytest.raises(ValueError, match="bad.json: categories"):
+            CategoryIndex.load(path)
+
+
+class TestGuardCategories:
+    def setup_method(self):
+        self.guard = InputCreditGuard()
+
+    def test_shipped_mapping_covers_blocked_categories(self):
+        assert InputCreditGuard.blocked_categories == {
+            "FOOD_AND_BEVERAGE", "CATERING", "RESTAURANT_SERVICE", "CLUB_MEMBERSHIP",
+            "HEALTH_INSURANCE", "MOTOR_VEHICLE", "GIFT_TO_EMPLOYEE",
+        }
+        for code in InputCreditGuard.blocked_categories:
+            assert InputCreditGuard.category_index.classify(code).matched_by == "code"
+
+    @pytest.mark.parametrize("category, rule_id", [
+        ("Team lunch - client", "ITC_BLOCKED_17_5"),
+        ("Gym membership 2024", "ITC_BLOCKED_17_5"),
+        ("Company car lease", "ITC_BLOCKED_17_5"),
+        ("Diwali staff gifts", "ITC_GIFT_THRESHOLD"),
+        ("personal expense", "ITC_PERSONAL_CONSUMPTION"),
+        ("Cargo freight", "ITC_ELIGIBLE"),
+    ])
+    def test_free_form_categories(self, category, rule_id):
+        res = self.guard.verify_itc_eligibility(category, "60000", "900")
+        assert res["audit_trace"]["rule_id"] == rule_id
+
+    def test_trace_names_the_canonical_category(self):
+        alias = self.guard.verify_itc_eligibility("F&B", "1000", "180")
+        assert alias["audit_trace"]["inputs"] == {"expense_category": "F&B", "category_match": "FOOD_AND_BEVERAGE"}
+        exact = self.guard.verify_itc_eligibility("catering", "1000", "180")
+        assert exact["audit_trace"]["inputs"] == {"expense_category": "CATERING"}
+
+    def test_subclass_mapping_file(self, tmp_path):
+        path = tmp_path / "categories.json"
+        path.write_text(json.dumps(MAPPING))
+
+        class ClubFriendlyGuard(InputCreditGuard):
+            category_index = CategoryIndex.load(path)
+
+        assert ClubFriendlyGuard().verify_itc_eligibility("catering", "1", "1")["verified"] is True
+        assert ClubFriendlyGuard().verify_itc_eligibility("club", "1", "1")["verified"] is False
+
+
+class TestITCBatch:
+    def setup_method(self):
+        self.guard = InputCreditGuard()
+
+    def test_batch_matches_single_calls(self):
+        rng = random.Random(0)
+        categories = ["catering", "F&B", "Team lunch", "office supplies", "gift to employee", "personal", "Car"]
+        expenses = []
+        for _ in range(200):
+            row = (rng.choice(categories), rng.choice(["1000", "60000", "pending", 5]), rng.choice(["180", "-"]))
+            expenses.append(row if rng.random() < 0.5 else dict(zip(("expense_category", "amount", "tax_paid"), row)))
+        expected = [
+            self.guard.verify_itc_eligibility(*(e if isinstance(e, tuple) else e.values())) for e in expenses
+        ]
+        assert self.guard.verify_itc_batch(expenses) == expected
+
+    def test_batch_accepts_generators_and_empty(self):
+        assert self.guard.verify_itc_batch(iter([])) == []
+        assert len(self.guard.verify_itc_batch(("catering", "1", "1") for _ in range(3))) == 3
+
+
+class TestBlockedCategoriesOverride:
+    def test_subclass_blocked_categories_are_applied(self):
+        class TravelGuard(InputCreditGuard):
+            blocked_categories = {"CATERING", "travel package", "PERSONAL_CONSUMPTION"}
+
+        guard = TravelGuard()
+        assert TravelGuard.blocked_categories == {
+            "CATERING", "TRAVEL_PACKAGE", "PERSONAL_CONSUMPTION", "GIFT_TO_EMPLOYEE",
+        }
+        assert guard.verify_itc_eligibility("Travel Package", "1", "1")["audit_trace"]["rule_id"] == "ITC_BLOCKED_17_5"
+        assert guard.verify_itc_eligibility("catering", "1", "1")["verified"] is False
+        # Dropped categories lose their aliases and keywords too.
+        for category in ("FOOD_AND_BEVERAGE", "F&B", "Team lunch", "Company car lease"):
+            assert guard.verify_itc_eligibility(category, "1", "1")["verified"] is True
+        assert guard.verify_itc_eligibility("PERSONAL_CONSUMPTION", "1", "1")["audit_trace"]["rule_id"] == "ITC_BLOCKED_17_5"
+        assert guard.verify_itc_eligibility("gift to employee", "60000", "1")["verified"] is False
+        assert InputCreditGuard().verify_itc_eligibility("F&B", "1", "1")["verified"] is False
+
+    def test_subclass_index_sets_blocked_categories(self):
+        class ClubOnlyGuard(InputCreditGuard):
+            category_index = CategoryIndex.from_dict(MAPPING)
+
+        assert ClubOnlyGuard.blocked_categories == {"FOOD_AND_BEVERAGE", "CLUB_MEMBERSHIP"}
+
+    def test_with_blocked_rejects_bad_codes(self):
+        for codes in ([""], ["--"], [None]):
+            with pytest.raises(ValueError):
+                InputCreditGuard.category_index.with_blocked(codes)
@@ -0,0 +1,91 @@
+"""Lazy public API: import qwed_tax stays cheap and guards load on first use."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import qwed_tax
+from qwed_tax import TaxPreFlight, TaxVerifier
+from qwed_tax.guards.nexus_guard import NexusGuard
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.jurisdictions.india.guards.gst_guard import GSTGuard
+
+HEAVY = ("z3", "pydantic", "numpy")
+
+
+def _loaded_after(statement):
+    """Heavy modules present in sys.modules after statement, in a fresh interpreter."""
+    probe = f"import sys, json\n{statement}\nprint(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))"
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True).stdout
+    return json.loads(out)
+
+
+class TestImportCost:
+    @pytest.mark.parametrize("statement", [
+        "import qwed_tax",
+        "from qwed_tax import GSTGuard",
+        "from qwed_tax import TDSGuard",
+        "import qwed_tax.jurisdictions.india",
+        "from qwed_tax import TaxPreFlight; TaxPreFlight().nexus",
+        "from qwed_tax import TaxVerifier; TaxVerifier('INDIA').gst",
+    ])
+    def test_no_heavy_dependencies(self, statement):
+        assert _loaded_after(statement) == []
+
+
+class TestLazyExports:
+    def test_every_public_name_resolves(self):
+        for name in qwed_tax.__all__:
+            assert getattr(qwed_tax, name) is not None, name
+
+    def test_exports_are_the_defining_objects(self):
+        assert qwed_tax.GSTGuard is GSTGuard
+        assert qwed_tax.jurisdictions.india.GSTGuard is GSTGuard
+
+    def test_dir_lists_public_names(self):
+        assert set(qwed_tax.__all__) <= set(dir(qwed_tax))
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError):
+            qwed_tax.NoSuchGuard
+        with pytest.raises(ImportError):
+            exec("from qwed_tax import NoSuchGuard", {})
+
+
+class TestLazyGuards:
+    def test_preflight_builds_guards_on_first_use(self):
+        preflight = TaxPreFlight()
+        assert "nexus" not in vars(preflight)
+        nexus = preflight.nexus
+        assert isinstance(nexus, NexusGuard)
+        assert preflight.nexus is nexus
+        assert isinstance(preflight.withholding, TDSGuard)
+
+    def test_guards_are_per_instance(self):
+        assert TaxPreFlight().nexus is not TaxPreFlight().nexus
+
+    def test_verifier_exposes_only_its_jurisdiction(self):
+        india = TaxVerifier("INDIA")
+        assert isinstance(india.gst, GSTGuard)
+        assert india.gst is india.gst
+        assert not hasattr(india, "payroll")
+
+        us = TaxVerifier("US")
+        assert isinstance(us.preflight, TaxPreFlight)
+        with pytest.raises(AttributeError):
+            us.crypto
+
+    def test_unsupported_jurisdiction(self):
+        with pytest.raises(ValueError):
+            TaxVerifier("UK")
+
+    def test_audit_uses_lazy_guards(self):
+        report = TaxPreFlight().audit_transaction({
+            "action": "economic_nexus",
+            "state": "CA",
+            "sales_data": {"amount": 600000, "transactions": 10},
+            "tax_decision": "NO_TAX",
+        })
+        assert report["allowed"] is False
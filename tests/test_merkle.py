@@ -0,0 +1,152 @@
+"""Tests for Merkle-batched proof references."""
+
+import hashlib
+
+import pytest
+
+from qwed_tax.diagnostics import (
+    TaxDiagnosticResult,
+    TaxDiagnosticStatus,
+    compute_proof_ref,
+    merkle_batch,
+)
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.merkle import MERKLE_REF_PREFIX, InclusionProof, MerkleBatch, parse_root_ref, verify_inclusion
+
+
+def _h(data):
+    return hashlib.sha256(data).digest()
+
+
+def _reference_root(refs):
+    """RFC 6962 MTH, recursively: split at the largest power of two below n."""
+    if len(refs) == 1:
+        return _h(b"\x00" + refs[0].encode())
+    split = 1
+    while split * 2 < len(refs):
+        split *= 2
+    return _h(b"\x01" + _reference_root(refs[:split]) + _reference_root(refs[split:]))
+
+
+def _refs(count):
+    return [compute_proof_ref({"item": i}) for i in range(count)]
+
+
+def _tds_results(count):
+    guard = TDSGuard()
+    amounts = ["not a number" if i % 4 == 1 else str(20000 + 1000 * i) for i in range(count)]
+    return [TDSGuard.to_diagnostic(guard.calculate_deduction("PROFESSIONAL_FEES", a, "0")) for a in amounts]
+
+
+class TestMerkleBatch:
+    @pytest.mark.parametrize("size", [1, 2, 3, 5, 8, 13, 100])
+    def test_root_matches_rfc6962_and_every_proof_verifies(self, size):
+        refs = _refs(size)
+        batch = MerkleBatch(refs)
+        assert batch.root_ref == f"{MERKLE_REF_PREFIX}{size}:{_reference_root(refs).hex()}"
+        for index in range(size):
+            proof = batch.proof(index)
+            assert proof.leaf_ref == refs[index]
+            assert len(proof.path) <= max(1, (size - 1).bit_length())
+            assert proof.verify(batch.root_ref)
+
+    def test_proof_fails_for_other_leaf_index_or_root(self):
+        refs = _refs(9)
+        batch = MerkleBatch(refs)
+        proof = batch.proof(4)
+        other_root = MerkleBatch(_refs(10)).root_ref
+        assert not proof.verify(other_root)
+        assert not proof._replace(leaf_ref=refs[5]).verify(batch.root_ref)
+        assert not proof._replace(index=5).verify(batch.root_ref)
+        assert not proof._replace(size=10).verify(batch.root_ref)
+        assert not proof._replace(path=proof.path[:-1]).verify(batch.root_ref)
+        assert not proof._replace(path=(*proof.path, proof.path[0])).verify(batch.root_ref)
+        assert not proof._replace(path=("zz",) + proof.path[1:]).verify(batch.root_ref)
+
+    def test_leaf_cannot_pose_as_node(self):
+        # Domain separation: a two-leaf root is not the leaf hash of anything.
+        batch = MerkleBatch(_refs(2))
+        assert _reference_root(_refs(2)) != _h(b"\x00" + _refs(2)[0].encode())
+        assert not InclusionProof(_refs(2)[0], 0, 1, ()).verify(batch.root_ref.replace(":2:", ":1:"))
+
+    def test_rejects_empty_or_bad_refs(self):
+        with pytest.raises(ValueError):
+            MerkleBatch([])
+        with pytest.raises(ValueError):
+            MerkleBatch(["qc1-sha256:x", ""])
+        with pytest.raises(IndexError):
+            MerkleBatch(_refs(2)).proof(2)
+
+    @pytest.mark.parametrize("ref", [None, "sha256:abc", MERKLE_REF_PREFIX + "x:" + "0" * 64, MERKLE_REF_PREFIX + "3:00"])
+    def test_parse_root_ref_fails_closed(self, ref):
+        assert parse_root_ref(ref) is None
+
+    def test_inclusion_proof_dict_round_trip(self):
+        proof = MerkleBatch(_refs(5)).proof(3)
+        assert InclusionProof.from_dict(proof.to_dict()) == proof
+        with pytest.raises(ValueError):
+            InclusionProof.from_dict({"leaf_ref": "x", "index": "0", "size": 1, "path": []})
+        with pytest.raises(ValueError):
+            InclusionProof.from_dict({"leaf_ref": "x"})
+
+
+class TestMerkleBatchedDiagnostics:
+    def test_batch_binds_verified_results_to_one_root(self):
+        results = _tds_results(40)
+        root, batched = merkle_batch(results)
+        verified = [r for r in results if r.is_verified]
+        assert 0 < len(verified) < len(results)
+        assert parse_root_ref(root)[0] == len(verified)
+        for original, result in zip(results, batched):
+            if original.is_verified:
+                assert result.proof_ref == root
+                assert result.inclusion_proof.leaf_ref == original.proof_ref
+                assert result.is_authoritative
+                assert result.verify_evidence(result.audit_trace)
+                assert verify_inclusion(original.audit_trace, result.inclusion_proof, root)
+            else:
+                assert result is original
+
+    def test_single_batched_verdict_rejects_tampered_evidence(self):
+        _, batched = merkle_batch(_tds_results(20))
+        result = next(r for r in batched if r.is_verified)
+        tampered = {**result.audit_trace, "outcome": "NO_DEDUCTION"}
+        assert not result.verify_evidence(tampered)
+
+    def test_unbatched_results_verify_evidence(self):
+        result = _tds_results(1)[0]
+        assert result.verify_evidence(result.audit_trace)
+        assert not TaxDiagnosticResult.blocked("blocked").verify_evidence({})
+
+    def test_nothing_verified(self):
+        blocked = [TaxDiagnosticResult.blocked("blocked")] * 3
+        assert merkle_batch(blocked) == (None, blocked)
+
+    def test_rebatching_is_rejected(self):
+        _, batched = merkle_batch(_tds_results(15))
+        with pytest.raises(ValueError, match="already part of a batch"):
+            merkle_batch(batched)
+
+    def test_authority_contract_holds(self):
+        root, batched = merkle_batch(_tds_results(15))
+        result = next(r for r in batched if r.is_verified)
+        with pytest.raises(ValueError, match="requires an inclusion_proof"):
+            TaxDiagnosticResult(TaxDiagnosticStatus.VERIFIED, "ok", {}, proof_ref=root)
+        with pytest.raises(ValueError, match="inclusion_proof requires"):
+            TaxDiagnosticResult(TaxDiagnosticStatus.VERIFIED, "ok", {}, "qc1-sha256:abc", result.inclusion_proof)
+        with pytest.raises(ValueError, match="requires proof_ref is None"):
+            TaxDiagnosticResult(TaxDiagnosticStatus.BLOCKED, "no", {}, root, result.inclusion_proof)
+        with pytest.raises(ValueError):
+            TaxDiagnosticResult(
+                TaxDiagnosticStatus.VERIFIED, "ok", {}, root, result.inclusion_proof._replace(size=99)
+            )
+
+    def test_serialization_round_trip(self):
+        _, batched = merkle_batch(_tds_results(15))
+        result = next(r for r in batched if r.is_verified)
+        data = result.to_dict()
+        assert data["inclusion_proof"]["leaf_ref"].startswith("qc1-sha256:")
+        restored = TaxDiagnosticResult.from_dict(data)
+        assert restored.inclusion_proof == result.inclusion_proof
+        assert restored.verify_evidence(result.audit_trace)
+        assert "inclusion_proof" not in _tds_results(1)[0].to_dict()
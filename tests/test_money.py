@@ -0,0 +1,240 @@
+"""Property tests for the money kernel: same results as Decimal, whatever the host context."""
+
+import json
+import pickle
+import random
+import subprocess
+import sys
+from decimal import ROUND_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP, Context, Decimal, localcontext
+
+import pytest
+
+from qwed_tax import money
+from qwed_tax.guards.dtaa_guard import DTAAGuard
+from qwed_tax.guards.poem_guard import PoEMGuard
+from qwed_tax.guards.remittance_guard import RemittanceGuard
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.guards.transfer_pricing_guard import TransferPricingGuard
+from qwed_tax.guards.valuation_guard import ValuationGuard
+from qwed_tax.instrumentation import HistogramCollector, instrumented
+from qwed_tax.jurisdictions.india.guards.crypto_guard import CryptoTaxGuard
+from qwed_tax.jurisdictions.india.guards.gst_guard import GSTGuard
+from qwed_tax.jurisdictions.us.fica_ledger import FicaLedger
+from qwed_tax.jurisdictions.us.payroll_guard import PayrollGuard
+from qwed_tax.models import PayrollEntry
+from qwed_tax.money import Money, parse_decimal_input, parse_units, units_array
+from qwed_tax.numeric import decimal_to_cents
+
+SEEDS = range(5)
+# Python's default context, explicitly: what Decimal operators did before.
+DEFAULT = Context()
+
+
+def _amount_text(rng):
+    digits = "".join(rng.choice("0123456789") for _ in range(rng.randint(1, 24)))
+    point = rng.randint(0, len(digits))
+    text = digits[:point] + ("." + digits[point:] if point < len(digits) else "")
+    return rng.choice(["", "", "-", "+"]) + (text if not text.startswith(".") or rng.random() < 0.5 else "0" + text)
+
+
+def _amounts(seed, count=300):
+    rng = random.Random(seed)
+    return [Decimal(_amount_text(rng)) for _ in range(count)]
+
+
+class TestParsing:
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_matches_decimal_of_str(self, seed):
+        rng = random.Random(seed)
+        values = [_amount_text(rng) for _ in range(200)]
+        values += [rng.randint(-10**30, 10**30) for _ in range(100)]
+        values += [rng.uniform(-1e6, 1e6) for _ in range(100)]
+        values += [Decimal(text) for text in values[:100]]
+        for value in values:
+            expected = Decimal(str(value))
+            parsed = parse_decimal_input(value, "x")
+            assert parsed == expected and parsed.as_tuple() == expected.as_tuple(), value
+
+    @pytest.mark.parametrize("value, message", [
+        (True, "numeric value"), ("abc", "numeric value"), ("", "numeric value"), (None, "numeric value"),
+        ("NaN", "finite"), ("-Infinity", "finite"), (Decimal("sNaN"), "finite"), (float("inf"), "finite"),
+    ])
+    def test_rejects(self, value, message):
+        with pytest.raises(ValueError, match=message):
+            parse_decimal_input(value, "x")
+        with pytest.raises(ValueError, match=message):
+            parse_units(value, -2, "x")
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_parse_units_matches_decimal_path(self, seed):
+        rng = random.Random(seed)
+        values = [_amount_text(rng) for _ in range(300)]
+        values += [" 12.50 ", "1_000.25", "1e3", "-.5", "5.", "+0.10", "٣.٥", 42, -7, Decimal("1.5E+2")]
+        for value in values:
+            for exponent in (-4, -2, 0, 2):
+                assert parse_units(value, exponent, "x") == money.units_at(Decimal(str(value)), exponent), value
+                if not isinstance(value, Decimal):
+                    assert Money.parse(value).to_decimal() == Decimal(str(value))
+
+    def test_fast_paths_still_report_to_hooks(self):
+        collector = HistogramCollector()
+        with instrumented(collector):
+            assert parse_units("12.50", -2, "amount") == 1250
+            assert Money.parse("12.5") == Money(125, -1)
+        assert collector.snapshot()[("parse", None, None, "amount")]["count"] == 2
+
+
+class TestContextOperations:
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_identical_to_operators_under_default_context(self, seed):
+        values = _amounts(seed)
+        pairs = list(zip(values, reversed(values)))
+        with localcontext(DEFAULT):
+            expected = [(a + b, a - b, a * b, abs(a), a / b if b else None) for a, b in pairs]
+            sums = sum(values, Decimal("0.00"))
+            quantized = [a.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP).normalize() for a in values[:50]
+                         if a.adjusted() < 20]
+        with localcontext() as hostile:
+            hostile.prec, hostile.rounding, hostile.traps[money.InvalidOperation] = 3, ROUND_DOWN, False
+            actual = [
+                (money.add(a, b), money.subtract(a, b), money.multiply(a, b), money.absolute(a),
+                 money.divide(a, b) if b else None)
+                for a, b in pairs
+            ]
+            assert money.total(values, Decimal("0.00")) == sums
+            assert [money.normalize(money.quantize(a, Decimal("0.01"), ROUND_HALF_UP)) for a in values[:50]
+                    if a.adjusted() < 20] == quantized
+        for got, want in zip(actual, expected):
+            assert [str(x) for x in got] == [str(x) for x in want]
+
+    def test_context_is_the_default_context(self):
+        default = Context()
+        assert (money.MONEY_CONTEXT.prec, money.MONEY_CONTEXT.rounding) == (default.prec, default.rounding)
+        assert (money.MONEY_CONTEXT.Emin, money.MONEY_CONTEXT.Emax) == (default.Emin, default.Emax)
+        assert money.MONEY_CONTEXT.traps == default.traps
+
+    def test_decimal_to_cents_is_exact_under_any_context(self):
+        with localcontext() as hostile:
+            hostile.prec = 5
+            assert decimal_to_cents(Decimal("123456.78")) == 12345678
+            assert decimal_to_cents(Decimal("0.005")) is None
+            assert money.from_units(12345678) == Decimal("123456.78")
+
+    def test_importing_qwed_tax_leaves_the_global_context_alone(self):
+        code = (
+            "import decimal, json\n"
+            "decimal.getcontext().prec = 9\n"
+            "from qwed_tax.jurisdictions.us.payroll_guard import PayrollGuard\n"
+            "import qwed_tax.jurisdictions.us.fica_ledger\n"
+            "print(json.dumps(decimal.getcontext().prec))\n"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert json.loads(out.stdout) == 9
+
+
+def _guard_calls(seed):
+    rng = random.Random(seed)
+    amount = lambda: str(Decimal(rng.randint(1, 10**9)).scaleb(-2))  # noqa: E731
+    rate = lambda: str(Decimal(rng.randint(1, 3000)).scaleb(-2))  # noqa: E731
+    payroll, fica = PayrollGuard(), FicaLedger()
+    calls = []
+    for _ in range(30):
+        gross = Decimal(amount())
+        taxes = [Decimal(rng.randint(0, 10**6)).scaleb(-2) for _ in range(3)]
+        entry = PayrollEntry(
+            employee_id="E1", gross_pay=gross, taxes=[{"name": "T", "amount": t} for t in taxes],
+            deductions=[{"name": "D", "amount": Decimal("123.45"), "type": "PRE_TAX"}],
+            net_pay_claimed=gross - sum(taxes) - Decimal("123.45") + rng.choice([Decimal(0), Decimal("0.01")]),
+        )
+        calls += [
+            lambda a=amount(), y=amount(): TDSGuard().calculate_deduction("PROFESSIONAL_FEES", a, y),
+            lambda a=amount(), r=rate(), s=rng.choice(["KA", "MH"]): GSTGuard().verify_gst_split("KA", s, a, r, "1", "1", "0"),
+            lambda a=amount(), p=amount(), r=rate(), t=rate(): DTAAGuard().verify_foreign_tax_credit(a, p, r, t),
+            lambda a=amount(), b=amount(): TransferPricingGuard().verify_arms_length_price(a, b),
+            lambda a=amount(), b=amount(): RemittanceGuard().verify_lrs_limit(a, "EDUCATION", b),
+            lambda a=amount(): RemittanceGuard().calculate_tcs(a, "tour"),
+            lambda a=amount(), b=amount(): CryptoTaxGuard().verify_flat_tax_rate(Decimal(a), Decimal(b)),
+            lambda a=amount(), b=amount(): ValuationGuard().verify_conversion(a, b, "0.2", "3.7"),
+            lambda e=entry: payroll.verify_gross_to_net(e),
+            lambda g=gross, ytd=gross + Decimal("150000.00"): payroll.verify_fica_tax(ytd, g, Decimal("1234.56")),
+            lambda g=amount(): fica.verify_paycheck("E1", g, "100.00", record=False),
+            lambda a=amount(), b=amount(), where=rng.choice(["INDIA", "SINGAPORE"]): PoEMGuard().determine_residency(
+                "Acme", True, b, a, b, a, 7, 3, b, a, where,
+            ),
+        ]
+    return calls
+
+
+def _plain(result):
+    if hasattr(result, "model_dump"):
+        result = result.model_dump()
+    return json.dumps(result, default=str, sort_keys=True)
+
+
+class TestGuardsIgnoreHostContext:
+    @pytest.mark.parametrize("seed", SEEDS)
+    @pytest.mark.parametrize("rounding", [ROUND_DOWN, ROUND_HALF_UP])
+    def test_same_verdicts_at_low_precision(self, seed, rounding):
+        calls = _guard_calls(seed)
+        with localcontext(DEFAULT):
+            expected = [_plain(call()) for call in calls]
+        with localcontext() as hostile:
+            hostile.prec, hostile.rounding = 4, rounding
+            assert [_plain(call()) for call in calls] == expected
+
+
+class TestMoney:
+    @pytest.mark.parametrize("seed", SEEDS)
+    def test_exact_arithmetic(self, seed):
+        values = _amounts(seed, 200)
+        exact = Context(prec=200)
+        for a, b in zip(values, reversed(values)):
+            x, y = Money.from_decimal(a), Money.from_decimal(b)
+            assert (x + y).to_decimal() == exact.add(a, b)
+            assert (x - y).to_decimal() == exact.subtract(a, b)
+            assert (x * y).to_decimal() == exact.multiply(a, b)
+            assert (x < y) == (a < b) and (x == y) == (a == b) and (x >= y) == (a >= b)
+            assert (-x).to_decimal() == -a and abs(x).to_decimal() == abs(a)
+
+    @pytest.mark.parametrize("seed", SEEDS)
+    @pytest.mark.parametrize("rounding", [ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_DOWN])
+    def test_quantize_matches_decimal(self, seed, rounding):
+        with localcontext(Context(prec=60)):
+            for a in _amounts(seed, 200):
+                for exponent in (-3, -2, 0, 1):
+                    expected = a.quantize(Decimal(1).scaleb(exponent), rounding=rounding)
+                    assert Money.from_decimal(a).quantize(exponent, rounding).to_decimal() == expected
+
+    def test_value_semantics(self):
+        a = Money(1250, -2)
+        assert a == Money(125, -1) and hash(a) == hash(Money(125, -1)) and hash(Money(0, 3)) == hash(Money(0, -2))
+        assert str(a) == "12.50" and repr(a) == "Money('12.50')" and str(Money(5, 2)) == "500"
+        assert a * 3 == 3 * a == Money(3750, -2)
+        assert a.units_at(-3) == 12500 and a.units_at(-1) == 125 and a.units_at(0) is None
+        assert pickle.loads(pickle.dumps(a)) == a
+        assert a != Decimal("12.50") and not Money(0, -2)
+        with pytest.raises(AttributeError):
+            a.units = 1
+        with pytest.raises(TypeError):
+            a + Decimal("1")
+        with pytest.raises(ValueError, match="rounding"):
+            a.quantize(0, "ROUND_CEILING")
+        with pytest.raises(ValueError, match="finite"):
+            Money.from_decimal(Decimal("NaN"))
+
+
+class TestArrays:
+    def test_units_array_round_trip(self):
+        column = units_array(["12.50", 3, Decimal("0.07"), "-1.1", 2.25])
+        assert column.typecode == "q" and list(column) == [1250, 300, 7, -110, 225]
+        assert money.from_units_array(column) == [Decimal(v) for v in ("12.50", "3.00", "0.07", "-1.10", "2.25")]
+        assert list(units_array(["1.234"], exponent=-3)) == [1234]
+
+    @pytest.mark.parametrize("values, message", [
+        (["1.00", "0.005"], r"amount\[1\] has more precision than 1E-2"),
+        (["1", "ten"], r"amount\[1\]: amount must be a numeric value"),
+        ([10**17], r"amount\[0\] does not fit in a 64-bit unit count"),
+    ])
+    def test_units_array_errors_name_the_row(self, values, message):
+        with pytest.raises(ValueError, match=message):
+            units_array(values)
@@ -0,0 +1,45 @@
+"""Tests for the ordered, bounded process-pool map shared by bulk runs."""
+
+import pytest
+
+from qwed_tax.parallel import map_chunks
+
+CHUNKS = [list(range(start, start + 5)) for start in range(0, 50, 5)]
+
+
+def _total(chunk):
+    return sum(chunk)
+
+
+def _negate(chunk):
+    return [-value for value in chunk]
+
+
+class TestMapChunks:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_results_in_input_order(self, workers):
+        results = list(map_chunks(_total, iter(CHUNKS), workers))
+        assert results == [(chunk, sum(chunk)) for chunk in CHUNKS]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_pack_feeds_the_task_and_chunks_are_yielded_as_read(self, workers):
+        results = list(map_chunks(_total, CHUNKS, workers, pack=_negate))
+        assert results == [(chunk, -sum(chunk)) for chunk in CHUNKS]
+
+    def test_bounded_in_flight(self):
+        read = []
+
+        def chunks():
+            for chunk in CHUNKS:
+                read.append(chunk)
+                yield chunk
+
+        run = map_chunks(_total, chunks(), 2)
+        assert next(run) == (CHUNKS[0], sum(CHUNKS[0]))
+        # 2 * workers submitted up front, one refill per result.
+        assert len(read) == 5
+        run.close()
+        assert len(read) == 5
+
+    def test_empty(self):
+        assert list(map_chunks(_total, [], 2)) == []
@@ -0,0 +1,107 @@
+"""Tests for PayrollGuard.verify_payroll_run / iter_payroll_run."""
+
+from decimal import Decimal
+
+import pytest
+
+from qwed_tax.jurisdictions.us.payroll_guard import PayrollGuard
+from qwed_tax.models import DeductionEntry, DeductionType, PayrollEntry, TaxEntry
+
+
+def _entry(i, net_error="0.00"):
+    gross = Decimal("4000.00") + i
+    net = gross - Decimal("700.00") - Decimal("250.00") + Decimal(net_error)
+    return PayrollEntry(
+        employee_id=f"E{i:05d}",
+        gross_pay=gross,
+        taxes=[
+            TaxEntry(name="Federal Income Tax", amount=Decimal("500.00")),
+            TaxEntry(name="Social Security", amount=Decimal("200.00")),
+        ],
+        deductions=[DeductionEntry(name="401k", amount=Decimal("250.00"), type=DeductionType.PRE_TAX)],
+        net_pay_claimed=net,
+    )
+
+
+# Every 7th entry is off by i cents, so errors are distinct and ordered by size.
+RUN = [_entry(i, f"0.{i % 100:02d}" if i % 7 == 3 else "0.00") for i in range(200)]
+
+
+class TestPayrollRun:
+    def setup_method(self):
+        self.guard = PayrollGuard()
+
+    def test_results_match_serial_verification_in_order(self):
+        streamed = list(self.guard.iter_payroll_run(RUN, chunk_size=16))
+        assert [i for i, _, _ in streamed] == list(range(len(RUN)))
+        for (_, entry, result), original in zip(streamed, RUN):
+            assert entry is original
+            assert result == self.guard.verify_gross_to_net(original)
+
+    def test_summary_counts_and_total(self):
+        summary = self.guard.verify_payroll_run(RUN)
+        failures = [i for i in range(len(RUN)) if i % 7 == 3]
+        assert summary.entries_checked == len(RUN)
+        assert summary.failed_count == len(failures)
+        assert summary.verified_count == len(RUN) - len(failures)
+        assert summary.total_discrepancy == sum(Decimal(f"0.{i % 100:02d}") for i in failures)
+        assert summary.stopped_early is False
+
+    def test_worst_offenders_ranked_by_magnitude_then_index(self):
+        summary = self.guard.verify_payroll_run(RUN, top_n=3)
+        # Failing entries are off by i % 100 cents: 0.99 (199), 0.94 (94), 0.92 (192)
+        assert [o.index for o in summary.worst_offenders] == [199, 94, 192]
+        assert summary.worst_offenders[0].employee_id == "E00199"
+        assert summary.worst_offenders[0].discrepancy == Decimal("-0.99")
+
+    def test_worst_offender_ties_keep_input_order(self):
+        run = [_entry(0, "5.00"), _entry(1, "-5.00"), _entry(2, "1.00"), _entry(3, "5.00")]
+        summary = self.guard.verify_payroll_run(run, top_n=2)
+        assert [o.index for o in summary.worst_offenders] == [0, 1]
+
+    def test_stops_after_max_failures(self):
+        summary = self.guard.verify_payroll_run(RUN, max_failures=2)
+        assert summary.failed_count == 2
+        assert summary.entries_checked == 11  # failures at 3 and 10
+        assert summary.stopped_early is True
+
+    @pytest.mark.parametrize("workers, chunk_size", [(1, None), (1, 1), (2, 1)])
+    def test_limit_on_last_entry_is_not_an_early_stop(self, workers, chunk_size):
+        run = [_entry(0), _entry(1, "1.00")]
+        for entries in (run, iter(run)):
+            summary = self.guard.verify_payroll_run(entries, workers=workers, chunk_size=chunk_size, max_failures=1)
+            assert (summary.entries_checked, summary.failed_count) == (2, 1)
+            assert summary.stopped_early is False
+
+    def test_limit_at_a_chunk_boundary_with_entries_left(self):
+        run = [_entry(0, "1.00"), _entry(1)]
+        summary = self.guard.verify_payroll_run(iter(run), chunk_size=1, max_failures=1)
+        assert summary.entries_checked == 1
+        assert summary.stopped_early is True
+
+    def test_process_pool_is_deterministic(self):
+        serial = self.guard.verify_payroll_run(RUN, max_failures=20, top_n=5)
+        for workers, chunk_size in [(2, 7), (3, 64)]:
+            parallel = self.guard.verify_payroll_run(
+                iter(RUN), workers=workers, chunk_size=chunk_size, max_failures=20, top_n=5
+            )
+            assert parallel == serial
+
+    def test_process_pool_streams_identical_results(self):
+        serial = [r for _, _, r in self.guard.iter_payroll_run(RUN)]
+        parallel = [r for _, _, r in self.guard.iter_payroll_run(RUN, workers=2, chunk_size=25)]
+        assert parallel == serial
+
+    def test_empty_run(self):
+        summary = self.guard.verify_payroll_run([])
+        assert summary.entries_checked == 0
+        assert summary.worst_offenders == []
+        assert summary.total_discrepancy == Decimal("0.00")
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"workers": 0}, {"chunk_size": 0}, {"max_failures": 0}, {"top_n": 0}, {"workers": True}],
+    )
+    def test_invalid_arguments_rejected(self, kwargs):
+        with pytest.raises(ValueError):
+            self.guard.verify_payroll_run(RUN, **kwargs)
@@ -0,0 +1,163 @@
+"""Differential tests: vectorized cent engine vs PayrollGuard.verify_gross_to_net."""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from qwed_tax.jurisdictions.us.payroll_guard import PayrollGuard  # noqa: E402
+from qwed_tax.jurisdictions.us.payroll_vector import PayrollRunArrays  # noqa: E402
+from qwed_tax.models import DeductionEntry, DeductionType, PayrollEntry, TaxEntry  # noqa: E402
+
+
+def _entry(gross, taxes, deductions, claimed):
+    return PayrollEntry(
+        employee_id="E1",
+        gross_pay=Decimal(gross),
+        taxes=[TaxEntry(name=f"T{i}", amount=Decimal(a)) for i, a in enumerate(taxes)],
+        deductions=[
+            DeductionEntry(name=f"D{i}", amount=Decimal(a), type=DeductionType.PRE_TAX)
+            for i, a in enumerate(deductions)
+        ],
+        net_pay_claimed=Decimal(claimed),
+    )
+
+
+def _random_run(seed, n):
+    rng = random.Random(seed)
+
+    def cents():
+        return Decimal(rng.randint(0, 500_000)).scaleb(-2)
+
+    run = []
+    for _ in range(n):
+        gross = Decimal(rng.randint(100_000, 2_000_000)).scaleb(-2)
+        taxes = [cents() for _ in range(rng.randint(0, 4))]
+        deductions = [cents() for _ in range(rng.randint(0, 3))]
+        net = gross - sum(taxes, Decimal("0.00")) - sum(deductions, Decimal("0.00"))
+        roll = rng.random()
+        if roll < 0.1:
+            net += Decimal(rng.choice([-1, 1]) * rng.randint(1, 5000)).scaleb(-2)
+        elif roll < 0.15:
+            net += Decimal("0.001")  # sub-cent claim: always a mismatch on the Decimal path
+        elif roll < 0.2:
+            taxes.append(Decimal("0.005"))  # sub-cent tax that the claim accounts for
+            net -= Decimal("0.005")
+        run.append(_entry(str(gross), [str(t) for t in taxes], [str(d) for d in deductions], str(net)))
+    return run
+
+
+class TestVectorEngine:
+    def setup_method(self):
+        self.guard = PayrollGuard()
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_agrees_with_decimal_path(self, seed):
+        run = _random_run(seed, 400)
+        outcome = PayrollRunArrays.from_entries(run).verify()
+        expected = [self.guard.verify_gross_to_net(e) for e in run]
+        assert list(outcome.mismatched) == [not r.verified for r in expected]
+        assert outcome.failed_count == sum(not r.verified for r in expected)
+        for index, result in outcome.failures():
+            assert result == expected[index]
+
+    def test_sub_cent_rows_use_decimal_path(self):
+        run = [
+            _entry("100.00", ["10.005"], [], "89.995"),  # exact in Decimal: verified
+            _entry("100.00", ["10.00"], [], "89.999"),  # sub-cent mismatch
+            _entry("100.000", ["10.0000"], [], "90.00"),  # extra zeros are still whole cents
+        ]
+        arrays = PayrollRunArrays.from_entries(run)
+        assert list(arrays.decimal_rows) == [True, True, False]
+        outcome = arrays.verify()
+        assert list(outcome.mismatched) == [False, True, False]
+        assert outcome.result(1) == self.guard.verify_gross_to_net(run[1])
+
+    def test_from_arrays_materializes_decimal_equivalent_results(self):
+        arrays = PayrollRunArrays.from_arrays(
+            gross_cents=[500000, 500000, 100],
+            tax_cents=[80000, 31000, 50],
+            tax_counts=[2, 0, 1],
+            deduction_cents=[50000, 1],
+            deduction_counts=[1, 1, 0],
+            claimed_cents=[339000, 499999, 51],
+        )
+        outcome = arrays.verify()
+        assert list(outcome.failed_indices) == [2]
+        expected = self.guard.verify_gross_to_net(_entry("1.00", ["0.50"], [], "0.51"))
+        assert outcome.result(2) == expected
+        assert outcome.result(2).message == expected.message
+
+    def test_oversized_amounts_are_not_wrapped(self):
+        big = np.iinfo(np.int64).max // 2
+        arrays = PayrollRunArrays.from_arrays(
+            gross_cents=[big, 1000],
+            tax_cents=[-big, -big, 0],
+            tax_counts=[2, 1],
+            deduction_cents=[],
+            deduction_counts=[0, 0],
+            claimed_cents=[0, 1000],
+        )
+        assert list(arrays.decimal_rows) == [True, False]
+        outcome = arrays.verify()
+        # 3 * big overflows int64; the Decimal path sees the true mismatch.
+        assert list(outcome.mismatched) == [True, False]
+
+    def test_long_runs_wrap_prefix_sums_safely(self):
+        n = 40
+        amount = np.iinfo(np.int64).max // 4
+        arrays = PayrollRunArrays.from_arrays(
+            gross_cents=[amount] * n,
+            tax_cents=[amount] * n,
+            tax_counts=[1] * n,
+            deduction_cents=[],
+            deduction_counts=[0] * n,
+            claimed_cents=[0] * n,
+        )
+        assert not arrays.decimal_rows.any()
+        assert arrays.verify().failed_count == 0
+
+    def test_mismatched_array_lengths_rejected(self):
+        with pytest.raises(ValueError):
+            PayrollRunArrays.from_arrays([1, 2], [], [0], [], [0, 0], [1, 2])
+        with pytest.raises(ValueError):
+            PayrollRunArrays.from_arrays([1], [5], [2], [], [0], [1])
+
+    @pytest.mark.parametrize("gross", [
+        [100.7],
+        [100.0],  # whole-valued floats are rejected too: the dtype decides
+        np.array([100.7]),
+        np.array([10070], dtype=object),
+        np.array([Decimal("100.70")], dtype=object),
+        [10070, 2**63],
+        np.array([True]),
+    ])
+    def test_non_integer_columns_rejected(self, gross):
+        with pytest.raises(ValueError, match="gross_cents"):
+            PayrollRunArrays.from_arrays(gross, [], [0] * len(gross), [], [0] * len(gross), [100] * len(gross))
+
+    @pytest.mark.parametrize("column", ["tax_cents", "deduction_cents", "claimed_cents", "tax_counts"])
+    def test_every_column_must_be_integer(self, column):
+        kwargs = dict(
+            gross_cents=[1000], tax_cents=[100], tax_counts=[1],
+            deduction_cents=[50], deduction_counts=[1], claimed_cents=[850],
+        )
+        assert PayrollRunArrays.from_arrays(**kwargs).verify().failed_count == 0
+        kwargs[column] = np.asarray(kwargs[column], dtype=np.float64)
+        with pytest.raises(ValueError, match=column):
+            PayrollRunArrays.from_arrays(**kwargs)
+
+    def test_integer_dtypes_accepted(self):
+        arrays = PayrollRunArrays.from_arrays(
+            np.array([1000], dtype=np.int32), np.array([100], dtype=np.uint16), [1],
+            np.array([], dtype=np.float64), [0], np.array([900], dtype=np.uint64),
+        )
+        assert arrays.gross_cents.dtype == np.int64
+        assert arrays.verify().failed_count == 0
+
+    def test_empty_run(self):
+        outcome = PayrollRunArrays.from_entries([]).verify()
+        assert outcome.failed_count == 0
+        assert outcome.verified_count == 0
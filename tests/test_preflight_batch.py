@@ -0,0 +1,130 @@
+"""Tests for TaxPreFlight.audit_batch (grouped, columnar dispatch)."""
+
+import copy
+
+from qwed_tax.verifier import TaxPreFlight
+
+
+MIXED_INTENTS = [
+    {
+        "action": "hire",
+        "worker_type": "1099",
+        "worker_facts": {
+            "provides_tools": True,
+            "reimburses_expenses": True,
+            "indefinite_relationship": True,
+        },
+    },
+    {
+        "action": "expense_claim",
+        "expense_category": "office_supplies",
+        "amount": 1000,
+        "tax_paid": 180,
+    },
+    {
+        "action": "pay_invoice",
+        "service_type": "professional_fees",
+        "amount": 50000,
+        "ytd_payment": 0,
+    },
+    {
+        "action": "trade_tax",
+        "loss_head": "intraday",
+        "loss_amount": 2500,
+        "offset_head": "futures",
+    },
+    {
+        "action": "trade_tax",
+        "asset_type": "equity",
+        "dates": {"buy": "2022-01-01", "sell": "2024-02-01"},
+        "claimed_rate": "12.5%",
+        "loss_head": "intraday",
+        "offset_head": "intraday",
+        "loss_amount": 100,
+    },
+    {
+        "action": "economic_nexus",
+        "state": "NY",
+        "sales_data": {"amount": 500001, "transactions": 10},
+        "tax_decision": "no_tax",
+    },
+    {
+        "action": "Sales Tax Check",
+        "state": "CA",
+        "sales_data": {"amount": 10, "transactions": 1},
+        "tax_decision": "no_tax",
+    },
+    {
+        "action": "remit_money",
+        "remittance_amount_usd": "pending",
+        "purpose": "education",
+        "fy_usage": "unknown",
+    },
+    {
+        "action": "corporate_action",
+        "investment_round": "convertible_note",
+        "investment_amount": "100000",
+        "cap_price": "8",
+        "discount": "0.2",
+        "next_round_price": "10",
+    },
+    {"action": "hire", "worker_type": "W2"},
+    {"action": "magic_tax_mode"},
+    {},
+    None,
+    {
+        "action": "expense_claim",
+        "expense_category": "FOOD_AND_BEVERAGE",
+        "amount": 5000,
+        "tax_paid": 900,
+    },
+]
+
+
+class TestAuditBatch:
+    def setup_method(self):
+        self.pf = TaxPreFlight()
+
+    def test_reports_identical_to_per_intent_path(self):
+        expected = [self.pf.audit_transaction(copy.deepcopy(i)) for i in MIXED_INTENTS]
+        result = self.pf.audit_batch(copy.deepcopy(MIXED_INTENTS))
+        assert result["reports"] == expected
+
+    def test_reports_preserve_input_order(self):
+        result = self.pf.audit_batch(MIXED_INTENTS)
+        actions = [r["action"] for r in result["reports"]]
+        assert actions[:3] == ["hire", "expense_claim", "pay_invoice"]
+        assert actions[-1] == "expense_claim"
+
+    def test_accepts_generators(self):
+        result = self.pf.audit_batch(i for i in MIXED_INTENTS[:2])
+        assert len(result["reports"]) == 2
+
+    def test_timing_is_reported(self):
+        result = self.pf.audit_batch(MIXED_INTENTS)
+        timing = result["timing"]
+        assert timing["intents"] == len(MIXED_INTENTS)
+        assert timing["elapsed_ns"] > 0
+        assert timing["intents_per_second"] > 0
+        # Blocked-before-dispatch intents do not form groups.
+        assert 0 < timing["groups"] < len(MIXED_INTENTS)
+
+    def test_empty_batch(self):
+        result = self.pf.audit_batch([])
+        assert result["reports"] == []
+        assert result["timing"]["intents"] == 0
+        assert result["timing"]["groups"] == 0
+
+    def test_reports_do_not_share_mutable_lists(self):
+        intents = [MIXED_INTENTS[1], MIXED_INTENTS[1]]
+        reports = self.pf.audit_batch(intents)["reports"]
+        reports[0]["checks_not_run"].append("tampered")
+        reports[0]["blocks"].append("tampered")
+        assert "tampered" not in reports[1]["checks_not_run"]
+        assert "tampered" not in reports[1]["blocks"]
+
+    def test_blocked_batch_entries_stay_fail_closed(self):
+        reports = self.pf.audit_batch([None, {}, {"action": "unknown"}])["reports"]
+        for report in reports:
+            assert report["allowed"] is False
+            assert report["checks_run"] == []
@@ -0,0 +1,61 @@
+"""Tests for TaxPreFlight compiled check plans."""
+
+import pytest
+
+from qwed_tax.verifier import TaxPreFlight
+
+
+class TestCompiledPlans:
+    def test_every_action_is_compiled(self):
+        assert set(TaxPreFlight._PLANS) == set(TaxPreFlight._ACTION_CHECKS)
+
+    def test_paths_are_pre_split(self):
+        hire = TaxPreFlight._PLANS["hire"].checks[0]
+        assert hire.required_paths[1] == ("worker_facts", "provides_tools")
+        assert hire.required[1] == "worker_facts.provides_tools"
+
+    def test_handlers_are_resolved(self):
+        check = TaxPreFlight._PLANS["pay_invoice"].checks[0]
+        assert check.handler is TaxPreFlight._check_invoice_tds
+
+    def test_checks_not_run_precomputed_for_every_subset(self):
+        plan = TaxPreFlight._PLANS["trade_tax"]
+        assert len(plan.checks_not_run) == 4
+        assert plan.checks_not_run[frozenset({"capital_gains"})] == ("trader_setoff",)
+        assert plan.checks_not_run[frozenset()] == ("trader_setoff", "capital_gains")
+
+    def test_known_gaps_are_appended(self):
+        plan = TaxPreFlight._PLANS["pay_invoice"]
+        assert plan.checks_not_run[frozenset({"invoice_tds"})] == (
+            "itc_eligibility",
+            "gst_split",
+            "rcm_applicability",
+        )
+
+    def test_plans_are_immutable(self):
+        with pytest.raises(TypeError):
+            TaxPreFlight._PLANS["hire"] = None
+        with pytest.raises(TypeError):
+            TaxPreFlight._PLANS["hire"].checks_not_run[frozenset()] = ()
+        with pytest.raises(AttributeError):
+            TaxPreFlight._PLANS["hire"].checks[0].name = "tampered"
+
+    def test_subclass_tables_are_recompiled(self):
+        class NarrowPreFlight(TaxPreFlight):
+            _ACTION_CHECKS = {
+                "expense_claim": TaxPreFlight._ACTION_CHECKS["expense_claim"],
+            }
+
+        assert set(NarrowPreFlight._PLANS) == {"expense_claim"}
+        assert "hire" in TaxPreFlight._PLANS
+        report = NarrowPreFlight().audit_transaction({"action": "hire", "worker_type": "W2"})
+        assert report["allowed"] is False
+        assert "Supported actions: expense_claim." in report["blocks"][0]
+
+    def test_report_lists_are_fresh_per_call(self):
+        pf = TaxPreFlight()
+        intent = {"action": "pay_invoice", "service_type": "professional_fees", "amount": 10, "ytd_payment": 0}
+        first = pf.audit_transaction(intent)
+        first["checks_not_run"].append("tampered")
+        second = pf.audit_transaction(intent)
+        assert "tampered" not in second["checks_not_run"]
@@ -0,0 +1,157 @@
+"""Tests for canonical proof_ref hashing (qwed_tax.proof)."""
+
+import hashlib
+import json
+
+import pytest
+
+import qwed_tax.audit as audit
+from qwed_tax.audit import TDS_194J, build_trace, trace_proof_ref
+from qwed_tax.diagnostics import compute_proof_ref
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.proof import (
+    LEGACY_PROOF_REF_PREFIX,
+    PROOF_REF_PREFIX,
+    ProofHasher,
+    canonical_bytes,
+    legacy_proof_ref,
+    proof_ref,
+    verify_proof_ref,
+)
+
+
+class TestCanonicalEncoding:
+    def test_golden_encoding(self):
+        evidence = {"b": [1, 2.5, None, True, False], "a": "é", 3: {}}
+        assert canonical_bytes(evidence) == "{S1:3{}S1:aS1:éS1:b[I1;D2.5;NTF]}".encode("utf-8")
+
+    def test_golden_trace_ref(self):
+        # Pinned: changing the encoding invalidates every issued qc1 ref.
+        trace = build_trace(TDS_194J, "DEDUCTION_REQUIRED", {"amount": "50000"})
+        expected = hashlib.sha256(
+            b"{S6:inputs{S6:amountS5:50000}S12:jurisdictionS5:INDIAS7:outcomeS18:DEDUCTION_REQUIRED"
+            b"S7:rule_idS8:TDS_194JS7:statuteS28:Income Tax Act, Section 194J}"
+        ).hexdigest()
+        assert proof_ref(trace) == PROOF_REF_PREFIX + expected
+
+    def test_key_order_and_container_type_do_not_matter(self):
+        assert proof_ref({"a": 1, "b": (1, 2)}) == proof_ref({"b": [1, 2], "a": 1})
+
+    @pytest.mark.parametrize("left, right", [
+        (1, "1"),
+        (1, 1.0),
+        (1, True),
+        (0, False),
+        (None, "null"),
+        (["ab"], ["a", "b"]),
+        ({"a": "b:c"}, {"a:b": "c"}),
+        ([[]], [[], []]),
+    ])
+    def test_distinct_values_distinct_refs(self, left, right):
+        assert proof_ref(left) != proof_ref(right)
+
+    @pytest.mark.parametrize("evidence", [
+        {"x": object()},
+        {"x": {1, 2}},
+        {(1, 2): "tuple key"},
+        [b"bytes"],
+    ])
+    def test_non_json_evidence_fails_closed(self, evidence):
+        with pytest.raises(ValueError, match="JSON-serializable"):
+            proof_ref(evidence)
+
+    def test_circular_evidence_fails_closed(self):
+        evidence = {}
+        evidence["self"] = evidence
+        with pytest.raises(ValueError):
+            proof_ref(evidence)
+
+
+class TestVerifyProofRef:
+    EVIDENCE = {"rule_id": "TDS_194J", "inputs": {"amount": "50000"}}
+
+    def test_accepts_current_and_legacy_refs(self):
+        assert verify_proof_ref(self.EVIDENCE, proof_ref(self.EVIDENCE))
+        assert verify_proof_ref(self.EVIDENCE, legacy_proof_ref(self.EVIDENCE))
+
+    def test_legacy_ref_is_the_pre_qc1_hash(self):
+        payload = json.dumps(self.EVIDENCE, sort_keys=True).encode("utf-8")
+        expected = LEGACY_PROOF_REF_PREFIX + hashlib.sha256(payload).hexdigest()
+        assert legacy_proof_ref(self.EVIDENCE) == expected
+
+    @pytest.mark.parametrize("ref", [
+        None,
+        "",
+        "md5:abc",
+        "qc1-sha256:" + "0" * 64,
+        "sha256:" + "0" * 64,
+    ])
+    def test_rejects_other_refs(self, ref):
+        assert verify_proof_ref(self.EVIDENCE, ref) is False
+
+    def test_tampered_evidence_rejected(self):
+        ref = proof_ref(self.EVIDENCE)
+        assert verify_proof_ref({**self.EVIDENCE, "rule_id": "TDS_194C"}, ref) is False
+
+    def test_unhashable_evidence_rejected(self):
+        assert verify_proof_ref({"x": object()}, proof_ref({})) is False
+
+
+class TestCachedTraceRef:
+    def test_trace_hashed_once(self, monkeypatch):
+        calls = []
+        original = audit.proof_ref
+        monkeypatch.setattr(audit, "proof_ref", lambda value: calls.append(value) or original(value))
+        result = TDSGuard().calculate_deduction("PROFESSIONAL_FEES", "50000", "0")
+        trace = result["audit_trace"]
+        refs = {
+            trace_proof_ref(trace),
+            compute_proof_ref(trace),
+            TDSGuard.to_diagnostic(result).proof_ref,
+            TDSGuard.to_diagnostic(result).proof_ref,
+        }
+        assert refs == {proof_ref(trace.to_dict())}
+        assert len(calls) == 1
+
+    def test_cache_does_not_leak_into_equality_or_pickle(self):
+        import pickle
+
+        trace = build_trace(TDS_194J, "DEDUCTION_REQUIRED", {"amount": "50000"})
+        ref = trace.proof_ref()
+        restored = pickle.loads(pickle.dumps(trace))
+        assert restored == trace
+        assert restored.proof_ref() == ref
+        assert json.loads(json.dumps(trace)) == trace
+
+    def test_plain_dict_evidence_is_not_cached(self):
+        evidence = {"amount": "1"}
+        first = compute_proof_ref(evidence)
+        evidence["amount"] = "2"
+        assert compute_proof_ref(evidence) != first
+
+
+class TestProofHasher:
+    def test_matches_proof_ref_of_the_list(self):
+        items = [{"row": i, "name": "é" * (i % 7), "ok": i % 3 == 0} for i in range(5000)]
+        hasher = ProofHasher()
+        for item in items:
+            hasher.update(item)
+        assert hasher.count == len(items)
+        assert hasher.proof_ref() == proof_ref(items)
+
+    def test_empty_and_incremental(self):
+        hasher = ProofHasher()
+        assert hasher.proof_ref() == proof_ref([])
+        hasher.update("a")
+        assert hasher.proof_ref() == proof_ref(["a"])
+        hasher.update({"b": 1})
+        assert hasher.proof_ref() == proof_ref(["a", {"b": 1}])
+
+    def test_bad_item_leaves_hasher_unchanged(self):
+        hasher = ProofHasher()
+        hasher.update(1)
+        with pytest.raises(ValueError):
+            hasher.update({"x": object()})
+        hasher.update(2)
+        assert hasher.count == 2
+        assert hasher.proof_ref() == proof_ref([1, 2])
@@ -1,8 +1,15 @@
 """Tests for GST Reverse Charge Mechanism (RCM) applicability."""
 
+import copy
+import itertools
+
+import pytest
+
+from qwed_tax.audit import RCM_GTA, RCM_NOT_APPLICABLE, build_trace
 from qwed_tax.jurisdictions.india.guards.gst_guard import (
     EntityType,
     GSTGuard,
+    RCMRule,
     ServiceType,
 )
 
@@ -191,3 +198,140 @@ class TestRCMApplicability:
         assert res.get("computed_only") is True
         assert res["is_rcm"] is True
         assert "claimed_is_rcm" not in res
+
+
+def _reference(service, provider, recipient, claimed):
+    """verify_rcm_applicability() as a direct evaluation of _RCM_RULES."""
+    rule = GSTGuard._RCM_RULES.get(service)
+    is_rcm = bool(rule and rule.applies(provider, recipient))
+    reason = rule.reason if is_rcm else "Forward Charge (Provider pays)"
+    rule_ref = rule.rule_ref if is_rcm else RCM_NOT_APPLICABLE
+    liability = "RECIPIENT (RCM)" if is_rcm else "PROVIDER (FCM)"
+    inputs = {"service": service.value, "provider": provider.value, "recipient": recipient.value}
+    outcome = "REVERSE_CHARGE" if is_rcm else "FORWARD_CHARGE"
+    if claimed is None:
+        return {
+            "verified": False,
+            "computed_only": True,
+            "error": "Computed RCM only. Provide claimed_is_rcm for deterministic verification.",
+            "liability": liability,
+            "is_rcm": is_rcm,
+            "reason": reason,
+            "audit_trace": build_trace(rule_ref, outcome, inputs),
+        }
+    verified = claimed is is_rcm
+    return {
+        "verified": verified,
+        "liability": liability,
+        "is_rcm": is_rcm,
+        "claimed_is_rcm": claimed,
+        "reason": reason,
+        "error": None if verified else f"RCM mismatch: computed is_rcm={is_rcm}, claimed is_rcm={claimed}. {reason}",
+        "audit_trace": build_trace(rule_ref, outcome, {**inputs, "claimed_is_rcm": claimed}),
+    }
+
+
+ALL_CASES = list(itertools.product(ServiceType, EntityType, EntityType, (None, False, True)))
+
+
+class TestRCMDecisionMatrix:
+    def setup_method(self):
+        self.guard = GSTGuard()
+
+    def test_matrix_covers_every_combination(self):
+        assert len(GSTGuard._RCM_DECISIONS) == len(ServiceType) * len(EntityType) ** 2 == 128
+        assert len(GSTGuard._RCM_MATRIX) == 128 * 3
+
+    @pytest.mark.parametrize("service,provider,recipient,claimed", ALL_CASES)
+    def test_matches_rule_evaluation(self, service, provider, recipient, claimed):
+        expected = _reference(service, provider, recipient, claimed)
+        assert self.guard.verify_rcm_applicability(service, provider, recipient, claimed) == expected
+        raw = self.guard.verify_rcm_applicability(service.value, provider.value, recipient.value, claimed)
+        assert raw == expected
+
+    def test_results_are_caller_owned(self):
+        first = self.guard.verify_rcm_applicability("GTA", "INDIVIDUAL", "BODY_CORPORATE", True)
+        first["verified"] = False
+        with pytest.raises(TypeError):
+            first["audit_trace"]["inputs"]["service"] = "TAMPERED"
+        second = self.guard.verify_rcm_applicability("GTA", "INDIVIDUAL", "BODY_CORPORATE", True)
+        assert second["verified"] is True
+        assert second["audit_trace"]["inputs"]["service"] == "GTA"
+
+    def test_no_deep_copies_or_exceptions_per_call(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("unexpected call")
+
+        monkeypatch.setattr(copy, "deepcopy", fail)
+        monkeypatch.setattr(GSTGuard, "_try_coerce", staticmethod(fail))
+        res = self.guard.verify_rcm_applicability("LEGAL", "INDIVIDUAL", "PARTNERSHIP", True)
+        assert res["verified"] is True
+
+    def test_non_bool_claim_fails_closed(self):
+        res = self.guard.verify_rcm_applicability("GTA", "INDIVIDUAL", "BODY_CORPORATE", 1)
+        assert res["verified"] is False
+        assert res["is_rcm"] is True
+        assert "Invalid claimed_is_rcm" in res["error"]
+
+    @pytest.mark.parametrize("value", [None, 7, ("GTA",), {"service": "GTA"}, b"GTA", "gta"])
+    def test_unusable_values_fail_closed(self, value):
+        for args in ((value, "INDIVIDUAL", "INDIVIDUAL"), ("GTA", value, "INDIVIDUAL"), ("GTA", "INDIVIDUAL", value)):
+            res = self.guard.verify_rcm_applicability(*args)
+            assert res["verified"] is False
+            assert res["is_rcm"] is None
+            assert "Unknown" in res["error"]
+
+    def test_subclass_rules_are_recompiled(self):
+        class StrictGSTGuard(GSTGuard):
+            _RCM_RULES = {
+                **GSTGuard._RCM_RULES,
+                ServiceType.GTA: RCMRule(lambda provider, recipient: True, "GTA always RCM.", RCM_GTA),
+            }
+
+        res = StrictGSTGuard().verify_rcm_applicability("GTA", "INDIVIDUAL", "INDIVIDUAL", True)
+        assert res["verified"] is True
+        assert res["reason"] == "GTA always RCM."
+        assert self.guard.verify_rcm_applicability("GTA", "INDIVIDUAL", "INDIVIDUAL", True)["verified"] is False
+
+
+class TestRCMBatch:
+    def setup_method(self):
+        self.guard = GSTGuard()
+
+    def test_matches_single_calls(self):
+        invoices = [
+            ("GTA", "INDIVIDUAL", "BODY_CORPORATE", True),
+            ("OTHER", "INDIVIDUAL", "INDIVIDUAL"),
+            (ServiceType.SECURITY, EntityType.BODY_CORPORATE, EntityType.BODY_CORPORATE, True),
+            ["IMPORT_SERVICE", "INDIVIDUAL", "GOVERNMENT", False],
+            {"service": "DIRECTOR", "provider": "INDIVIDUAL", "recipient": "BODY_CORPORATE", "claimed_is_rcm": True},
+            {"service": "LEGAL", "provider": "INDIVIDUAL", "recipient": "PARTNERSHIP"},
+            ("MYSTERY", "INDIVIDUAL", "INDIVIDUAL", True),
+            ("GTA", ["INDIVIDUAL"], "INDIVIDUAL", True),
+            ("GTA", "INDIVIDUAL", "BODY_CORPORATE", "yes"),
+            {"service": "GTA"},
+        ]
+        expected = [
+            self.guard.verify_rcm_applicability(*invoice)
+            if not isinstance(invoice, dict)
+            else self.guard.verify_rcm_applicability(
+                invoice.get("service"), invoice.get("provider"), invoice.get("recipient"), invoice.get("claimed_is_rcm")
+            )
+            for invoice in invoices
+        ]
+        assert self.guard.verify_rcm_batch(invoices) == expected
+
+    def test_every_combination(self):
+        invoices = [(s.value, p.value, r.value, c) for s, p, r, c in ALL_CASES]
+        assert self.guard.verify_rcm_batch(invoices) == [_reference(*case) for case in ALL_CASES]
+
+    def test_accepts_generators_and_returns_independent_results(self):
+        results = self.guard.verify_rcm_batch(("GTA", "INDIVIDUAL", "BODY_CORPORATE", True) for _ in range(3))
+        assert len(results) == 3
+        assert results[0] is not results[1]
+        with pytest.raises(TypeError):  # traces are shared, so they must be read-only
+            results[0]["audit_trace"]["outcome"] = "TAMPERED"
+
+    def test_malformed_row_raises(self):
+        with pytest.raises(ValueError):
+            self.guard.verify_rcm_batch([("GTA", "INDIVIDUAL")])
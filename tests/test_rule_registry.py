@@ -0,0 +1,211 @@
+"""Tests for the effective-dated rule registry and the guards' as_of lookups."""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from qwed_tax import rules
+from qwed_tax.cache import VerdictCache
+from qwed_tax.guards.capital_gains_guard import CapitalGainsGuard
+from qwed_tax.guards.nexus_guard import NexusGuard
+from qwed_tax.guards.remittance_guard import RemittanceGuard
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.jurisdictions.us.payroll_guard import SS_WAGE_BASE, PayrollGuard
+from qwed_tax.rules import RuleFamily, RuleRegistry
+from qwed_tax.verifier import TaxPreFlight
+
+
+def _family(entries, fields=None):
+    return {
+        "family": "demo",
+        "fields": fields or {"rate": "decimal"},
+        "rules": {"X": entries},
+    }
+
+
+RATES = _family([
+    {"from": "2020-01-01", "to": "2020-12-31", "value": {"rate": "0.1"}},
+    {"from": "2022-01-01", "to": None, "value": {"rate": "0.2"}},
+])
+
+
+class TestRuleFamily:
+    def setup_method(self):
+        self.family = RuleFamily.from_dict(RATES)
+
+    def test_interval_boundaries_are_inclusive(self):
+        assert "X" not in self.family.table("2019-12-31")
+        assert self.family.lookup("X", "2020-01-01")["rate"] == Decimal("0.1")
+        assert self.family.lookup("X", date(2020, 12, 31))["rate"] == Decimal("0.1")
+        assert "X" not in self.family.table(datetime(2021, 6, 1, 12, 0))  # gap
+        assert self.family.lookup("X", "2022-01-01")["rate"] == Decimal("0.2")
+        assert self.family.lookup("X", "9999-12-31")["rate"] == Decimal("0.2")
+        assert self.family.boundaries() == (date(2020, 1, 1), date(2021, 1, 1), date(2022, 1, 1))
+
+    def test_missing_key_raises_key_error(self):
+        with pytest.raises(KeyError, match="no rule for 'X'"):
+            self.family.lookup("X", "2021-01-01")
+
+    def test_tables_are_read_only(self):
+        table = self.family.table("2022-06-01")
+        with pytest.raises(TypeError):
+            table["X"] = {}
+        with pytest.raises(TypeError):
+            table["X"]["rate"] = Decimal("1")
+
+    @pytest.mark.parametrize("as_of", ["2022-13-01", "yesterday", 20220101, True])
+    def test_invalid_as_of(self, as_of):
+        with pytest.raises(ValueError, match="as_of"):
+            self.family.table(as_of)
+
+    def test_today_table_is_cached_until_next_boundary(self, monkeypatch):
+        boundary = datetime(2022, 1, 1).timestamp()
+        monkeypatch.setattr(rules, "_time", lambda: boundary - 1)
+        assert self.family.table() == {}
+        monkeypatch.setattr(rules, "_time", lambda: boundary)
+        assert self.family.table()["X"]["rate"] == Decimal("0.2")
+        assert self.family._current[1] == float("inf")
+
+    @pytest.mark.parametrize("data, message", [
+        (_family([{"from": "2020-01-01", "to": None, "value": {"rate": "0.1"}},
+                  {"from": "2021-01-01", "to": None, "value": {"rate": "0.2"}}]), "overlap"),
+        (_family([{"from": "2021-01-01", "to": "2020-01-01", "value": {"rate": "0.1"}}]), "ends before"),
+        (_family([{"value": {"rate": "ten"}}]), "invalid decimal"),
+        (_family([{"value": {"rate": 0.1}}]), "decimal fields are strings"),
+        (_family([{"value": {}}]), "exactly the fields"),
+        (_family([{"value": {"rate": "0.1"}, "until": None}]), "only 'from'"),
+        (_family([{"from": "01/01/2020", "value": {"rate": "0.1"}}]), "as_of"),
+        (_family([{"value": {"rule": "NOT_A_RULE"}}], {"rule": "rule_ref"}), "unknown RuleRef"),
+        (_family([{"value": {"rate": "1"}}], {"rate": "float"}), "unknown type"),
+        (_family([]), "non-empty"),
+    ])
+    def test_rejects_invalid_data(self, data, message):
+        with pytest.raises(ValueError, match=message):
+            RuleFamily.from_dict(data)
+
+
+class TestRuleRegistry:
+    def setup_method(self):
+        self.original = rules.default_registry()
+
+    def teardown_method(self):
+        rules.set_default_registry(self.original)
+
+    def test_shipped_families_load(self):
+        registry = RuleRegistry()
+        assert registry.families() == [
+            "capital_gains_holding", "capital_gains_rates", "lrs", "nexus", "tcs_lrs", "tds", "us_fica",
+        ]
+        for name in registry.families():
+            assert registry.table(name), name
+        with pytest.raises(LookupError):
+            registry.family("vat")
+        with pytest.raises(LookupError):
+            registry.family("../tds")
+
+    def test_custom_directory_replaces_default_and_invalidates_caches(self, tmp_path):
+        data = json.loads((rules.RULES_DIR / "tds.json").read_text())
+        data["rules"]["COMMISSION"][0]["value"]["threshold"] = "1000000"
+        (tmp_path / "tds.json").write_text(json.dumps(data))
+        cache = VerdictCache()
+        cache.put(b"k", {"allowed": True})
+
+        rules.set_default_registry(RuleRegistry(tmp_path))
+        assert len(cache) == 0
+        assert TDSGuard().calculate_deduction("COMMISSION", "500000", "0")["deduction"] == "0"
+        rules.set_default_registry(self.original)
+        assert TDSGuard().calculate_deduction("COMMISSION", "500000", "0")["deduction"] != "0"
+
+    def test_reload_rereads_files(self, tmp_path):
+        (tmp_path / "demo.json").write_text(json.dumps(RATES))
+        registry = RuleRegistry(tmp_path)
+        assert registry.lookup("demo", "X", "2020-06-01")["rate"] == Decimal("0.1")
+        changed = json.loads(json.dumps(RATES))
+        changed["rules"]["X"][0]["value"]["rate"] = "0.15"
+        (tmp_path / "demo.json").write_text(json.dumps(changed))
+        assert registry.lookup("demo", "X", "2020-06-01")["rate"] == Decimal("0.1")
+        registry.reload()
+        assert registry.lookup("demo", "X", "2020-06-01")["rate"] == Decimal("0.15")
+
+    def test_family_name_must_match_file(self, tmp_path):
+        (tmp_path / "other.json").write_text(json.dumps(RATES))
+        with pytest.raises(ValueError, match="declares family 'demo'"):
+            RuleRegistry(tmp_path).family("other")
+
+
+class TestGuardsAsOf:
+    def test_fica_wage_base_by_pay_date(self):
+        guard = PayrollGuard()
+        # $170,000 YTD, $10,000 this check: capped at the year's wage base.
+        for as_of, base in (("2023-12-29", "160200"), ("2024-12-27", "168600"), (None, "176100")):
+            taxable = max(Decimal(0), min(Decimal(170000), Decimal(base)) - Decimal(160000))
+            expected = (taxable * Decimal("0.062")).quantize(Decimal("0.01"))
+            result = guard.verify_fica_tax(Decimal(170000), Decimal(10000), expected, as_of=as_of)
+            assert result.verified, (as_of, result.message)
+        assert SS_WAGE_BASE == Decimal("176100.00")
+
+    def test_fica_fails_closed_without_rules(self):
+        guard = PayrollGuard()
+        for as_of in ("2019-06-01", "not a date"):
+            result = guard.verify_fica_tax(Decimal(1000), Decimal(1000), Decimal("62.00"), as_of=as_of)
+            assert not result.verified and "FICA Error" in result.message
+
+    def test_tcs_rate_change(self):
+        guard = RemittanceGuard()
+        assert guard.calculate_tcs("800000", "tour", as_of="2023-09-30") == Decimal("5000.00")
+        assert guard.calculate_tcs("800000", "tour", as_of="2023-10-01") == Decimal("20000.00")
+        assert guard.calculate_tcs("800000", "tour") == Decimal("20000.00")
+        assert guard.calculate_tcs("800000", "education", is_loan_funded=True, as_of="2021-01-01") == Decimal("500.000")
+        with pytest.raises(ValueError, match="No TCS rule"):
+            guard.calculate_tcs("800000", "tour", as_of="2020-09-30")
+
+    def test_lrs_limit_as_of(self):
+        guard = RemittanceGuard()
+        assert guard.verify_lrs_limit("1000", "EDUCATION", "0", as_of="2016-01-01")["verified"]
+        result = guard.verify_lrs_limit("300000", "EDUCATION", "0", as_of=date(2024, 1, 1))
+        assert "LRS limit ($250,000)" in result["error"]
+        bad = guard.verify_lrs_limit("1000", "EDUCATION", "0", as_of="soon")
+        assert not bad["verified"] and bad["audit_trace"]["outcome"] == "INVALID_INPUT"
+
+    def test_capital_gains_rates_before_finance_act_2024(self):
+        guard = CapitalGainsGuard()
+        old = guard.verify_tax_rate("equity", "LTCG", "10%", as_of="2024-07-22")
+        assert old["verified"] and old["audit_trace"]["rule_id"] == "CG_EQUITY_LTCG_112A_PRE_2024"
+        assert not guard.verify_tax_rate("equity", "LTCG", "10%", as_of="2024-07-23")["verified"]
+        assert guard.verify_tax_rate("equity", "STCG", "15", as_of="2023-03-31")["verified"]
+        assert guard.verify_tax_rate("equity", "LTCG", "12.5%")["verified"]
+        before_112a = guard.verify_tax_rate("equity", "LTCG", "10%", as_of="2017-06-01")
+        assert before_112a["audit_trace"]["outcome"] == "NO_RATE"
+        assert guard.determine_term("2023-01-01", "2024-01-02", "equity", as_of="2024-01-02") == "LTCG"
+        with pytest.raises(ValueError):
+            guard.determine_term("2023-01-01", "2024-01-02", "equity", as_of="2024/01/02")
+
+    @pytest.mark.parametrize("sell, claimed, allowed", [
+        ("2024-01-15", "10%", True),
+        ("2024-07-22", "10%", True),
+        ("2024-07-23", "10%", False),
+        ("2024-07-23", "12.5%", True),
+    ])
+    def test_preflight_capital_gains_use_the_sale_date(self, sell, claimed, allowed):
+        report = TaxPreFlight().audit_transaction({
+            "action": "trade_tax",
+            "asset_type": "equity",
+            "dates": {"buy": "2020-01-01", "sell": sell},
+            "claimed_rate": claimed,
+        })
+        assert report["allowed"] is allowed, report["blocks"]
+
+    def test_tds_and_nexus_accept_as_of(self):
+        tds = TDSGuard()
+        assert tds.calculate_deduction("COMMISSION", "20000", "0", as_of="2023-05-01") == tds.calculate_deduction(
+            "COMMISSION", "20000", "0"
+        )
+        assert "as_of" in tds.calculate_deduction("COMMISSION", "20000", "0", as_of="May 2023")["error"]
+        assert tds.tds_rules["COMMISSION"]["rate"] == Decimal("0.05")
+
+        nexus = NexusGuard()
+        assert not nexus.check_nexus_liability("CA", "600000", 10, "no_tax", as_of="2024-12-31")["verified"]
+        assert "as_of" in nexus.check_nexus_liability("CA", "1", 1, "no_tax", as_of="x")["error"]
+        assert nexus.state_thresholds["NY"]["transactions"] == 100
@@ -0,0 +1,126 @@
+"""Tests for cached per-thread Z3 rule sets and the guards that use them."""
+
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from z3 import Bool, Not, sat, unsat
+
+from qwed_tax.jurisdictions.india.guards.investment_guard import InvestmentGuard, TransactionType
+from qwed_tax.jurisdictions.us.classification_guard import ABCClassificationGuard
+from qwed_tax.jurisdictions.us.withholding_guard import W4Form, WithholdingGuard
+from qwed_tax.models import State, WorkerClassificationParams
+from qwed_tax.solver import RuleSet
+
+
+def _counting_rules():
+    builds = []
+
+    def build(ctx, s):
+        builds.append(threading.get_ident())
+        x = Bool("x", ctx)
+        s.add(x)
+        return {"x": x}
+
+    return RuleSet("test", build), builds
+
+
+class TestRuleSet:
+    def test_rules_built_once_per_thread(self):
+        rules, builds = _counting_rules()
+        for _ in range(5):
+            with rules.scope():
+                pass
+        assert len(builds) == 1
+
+        def use():
+            with rules.scope():
+                pass
+
+        worker = threading.Thread(target=use)
+        worker.start()
+        worker.join()
+        assert len(builds) == 2
+
+    def test_per_call_facts_do_not_leak(self):
+        rules, _ = _counting_rules()
+        with rules.scope() as (s, v):
+            s.add(Not(v.x))
+            assert s.check() == unsat
+        with rules.scope() as (s, v):
+            assert s.check() == sat
+
+    def test_facts_popped_on_exception(self):
+        rules, _ = _counting_rules()
+        try:
+            with rules.scope() as (s, v):
+                s.add(Not(v.x))
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        with rules.scope() as (s, _):
+            assert s.check() == sat
+
+    def test_each_thread_gets_its_own_context(self):
+        rules, _ = _counting_rules()
+        contexts = []
+
+        def grab():
+            with rules.scope() as (_, v):
+                contexts.append(v.ctx)
+
+        threads = [threading.Thread(target=grab) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len({id(c) for c in contexts}) == 3
+
+
+def _guard_calls():
+    w4, abc, inv = WithholdingGuard(), ABCClassificationGuard(), InvestmentGuard()
+    calls = []
+    for liability in ("0", "500"):
+        for exempt in (True, False):
+            form = W4Form(employee_id="E", claim_exempt=exempt,
+                          tax_liability_last_year=Decimal(liability), expect_refund_this_year=True)
+            calls.append(lambda f=form: w4.verify_exempt_status(f))
+    for facts in ((True, True, True), (False, True, True), (False, False, False)):
+        params = WorkerClassificationParams(worker_id="W", freedom_from_control=facts[0],
+                                            work_outside_usual_business=facts[1],
+                                            customarily_engaged_independently=facts[2], state=State.CA)
+        for claim in (True, False):
+            calls.append(lambda p=params, c=claim: abc.verify_classification(p, c))
+    for tx_type in TransactionType:
+        calls.append(lambda t=tx_type: inv.verify_classification(t, 400))
+    return calls
+
+
+class TestCachedGuards:
+    def test_abc_reports_correct_status_on_misclassification(self):
+        params = WorkerClassificationParams(worker_id="W", freedom_from_control=False,
+                                            work_outside_usual_business=True,
+                                            customarily_engaged_independently=True, state=State.CA)
+        result = ABCClassificationGuard().verify_classification(params, True)
+        assert result["verified"] is False
+        assert result["classification"] == "Employee (W-2)"
+        again = ABCClassificationGuard().verify_classification(params, False)
+        assert again["verified"] is True
+
+    def test_results_independent_of_call_order(self):
+        calls = _guard_calls()
+        expected = [call() for call in calls]
+        rng = random.Random(0)
+        for _ in range(300):
+            i = rng.randrange(len(calls))
+            assert calls[i]() == expected[i]
+
+    def test_thread_pool_matches_sequential_results(self):
+        calls = _guard_calls()
+        expected = [call() for call in calls]
+        work = list(range(len(calls))) * 20
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: (i, calls[i]()), work))
+        for i, result in results:
+            assert result == expected[i]
@@ -0,0 +1,187 @@
+"""Tests for the per-vendor TDS aggregation ledger."""
+
+import json
+import random
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from qwed_tax import rules
+from qwed_tax.audit import TDS_194C, TDS_194J
+from qwed_tax.guards.tds_guard import TDSGuard
+from qwed_tax.guards.tds_ledger import TDSLedger, TDSPosition, financial_year_label
+
+SERVICE_TYPES = ["PROFESSIONAL_FEES", "CONTRACTOR_INDIVIDUAL", "CONTRACTOR_FIRM", "COMMISSION", "RENT_LAND"]
+
+
+def _stream(rng, count, vendors=8):
+    start = date(2024, 1, 1).toordinal()
+    invoices = []
+    for _ in range(count):
+        invoices.append((
+            f"V{rng.randrange(vendors)}",
+            rng.choice(SERVICE_TYPES),
+            Decimal(rng.randint(0, 2_000_000)).scaleb(-2),
+            date.fromordinal(start + rng.randrange(730)).isoformat(),
+        ))
+    return invoices
+
+
+class TestTDSLedger:
+    def setup_method(self):
+        self.ledger = TDSLedger()
+
+    def test_crossing_invoice_catches_up(self):
+        below = [self.ledger.record("V1", "professional fees", "12000", "2024-05-01") for _ in range(2)]
+        assert [d.deduction for d in below] == [0, 0]
+        crossing = self.ledger.record("V1", "professional fees", "10000", "2024-06-01")
+        assert crossing.threshold_crossed is True
+        assert crossing.deduction == Decimal("3400")  # 10% of 34,000
+        assert crossing.catch_up == Decimal("2400")
+        assert (crossing.rule, crossing.service_type, crossing.financial_year) == (
+            TDS_194J, "PROFESSIONAL_FEES", "2024-25",
+        )
+        after = self.ledger.record("V1", "professional fees", "500", "2024-07-01")
+        assert (after.deduction, after.catch_up, after.threshold_crossed) == (Decimal("50"), 0, False)
+        assert self.ledger.position("V1", "PROFESSIONAL_FEES", "2024-25") == TDSPosition(
+            Decimal("34500"), Decimal("3450"), date(2024, 6, 1),
+        )
+
+    def test_threshold_is_exclusive(self):
+        assert self.ledger.record("V1", "COMMISSION", "15000.00", "2024-05-01").deduction == 0
+        assert self.ledger.record("V1", "COMMISSION", "0.01", "2024-05-01").deduction == Decimal("750.0005")
+
+    def test_keys_are_separate(self):
+        self.ledger.record("V1", "CONTRACTOR_FIRM", "20000", "2025-03-31")
+        # 1 April starts a new financial year; other vendors and sections are separate.
+        for vendor, service_type, day in [
+            ("V1", "CONTRACTOR_FIRM", "2025-04-01"),
+            ("V2", "CONTRACTOR_FIRM", "2025-03-31"),
+            ("V1", "COMMISSION", "2025-03-31"),
+        ]:
+            assert self.ledger.record(vendor, service_type, "12000", day).threshold_crossed is False
+        crossing = self.ledger.record("V1", "CONTRACTOR_FIRM", "12000", date(2025, 1, 15))
+        assert (crossing.rule, crossing.financial_year, crossing.catch_up) == (TDS_194C, "2024-25", Decimal("400"))
+        assert len(self.ledger) == 4
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_agrees_with_tds_guard(self, seed):
+        rng = random.Random(seed)
+        guard = TDSGuard()
+        ytd = {}
+        for vendor, service_type, amount, day in _stream(rng, 2000):
+            start_year = int(day[:4]) if day[5:7] >= "04" else int(day[:4]) - 1
+            key = (vendor, service_type, start_year)
+            previous = ytd.get(key, Decimal(0))
+            expected = guard.calculate_deduction(service_type, amount, previous, as_of=day)
+            result = self.ledger.record(vendor, service_type, amount, day)
+            assert result.deduction - result.catch_up == Decimal(expected["deduction"])
+            assert result.threshold_crossed is (
+                previous <= rules.lookup("tds", service_type, day)["threshold"] < previous + amount
+            )
+            if result.threshold_crossed:
+                assert result.catch_up == previous * rules.lookup("tds", service_type, day)["rate"]
+            ytd[key] = previous + amount
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_ingest_matches_record(self, seed):
+        invoices = _stream(random.Random(seed), 3000)
+        reference = TDSLedger()
+        expected = []
+        for index, invoice in enumerate(invoices):
+            result = reference.record(*invoice)
+            if result.threshold_crossed:
+                expected.append((index, result))
+        chunks = [invoices[:1000], iter(invoices[1000:])]
+        crossings = [(i + 1000 * n, d) for n, chunk in enumerate(chunks) for i, d in self.ledger.ingest(chunk)]
+        assert crossings == expected
+        assert len(self.ledger) == len(reference)
+        for vendor, service_type, _, day in invoices:
+            fy = financial_year_label(int(day[:4]) if day[5:7] >= "04" else int(day[:4]) - 1)
+            assert self.ledger.position(vendor, service_type, fy) == reference.position(vendor, service_type, fy)
+
+    def test_ingest_is_atomic(self):
+        self.ledger.ingest([("V1", "COMMISSION", "10000", "2024-05-01")])
+        with pytest.raises(ValueError):
+            self.ledger.ingest([
+                ("V1", "COMMISSION", "10000", "2024-05-02"),
+                ("V2", "COMMISSION", "50000", "2024-05-02"),
+                ("V3", "COMMISSION", "1.005", "2024-05-02"),
+            ])
+        assert self.ledger.position("V1", "COMMISSION", 2024) == TDSPosition(Decimal("10000"), 0, None)
+        assert self.ledger.position("V2", "COMMISSION", 2024).paid == 0
+        assert len(self.ledger) == 1
+
+    @pytest.mark.parametrize("invoice", [
+        ("V1", "COMMISSION", "1.005", "2024-05-01"),
+        ("V1", "COMMISSION", "-5", "2024-05-01"),
+        ("V1", "COMMISSION", "nan", "2024-05-01"),
+        ("V1", "COMMISSION", True, "2024-05-01"),
+        ("V1", "COMMISSION", "100", "01/05/2024"),
+        ("V1", "CONSULTING", "100", "2024-05-01"),
+        ("", "COMMISSION", "100", "2024-05-01"),
+        (None, "COMMISSION", "100", "2024-05-01"),
+        (["V1"], "COMMISSION", "100", "2024-05-01"),
+        ("V1", ["COMMISSION"], "100", "2024-05-01"),
+        ("V1", "COMMISSION", "100", ["2024-05-01"]),
+        ("V1", "COMMISSION", "100", {"date": "2024-05-01"}),
+    ])
+    def test_rejects_invalid_invoices(self, invoice):
+        with pytest.raises(ValueError):
+            self.ledger.record(*invoice)
+        with pytest.raises(ValueError):
+            self.ledger.ingest([invoice])
+        assert len(self.ledger) == 0
+
+    def test_rules_follow_the_default_registry(self, tmp_path):
+        data = json.loads((rules.RULES_DIR / "tds.json").read_text())
+        data["rules"]["COMMISSION"][0]["value"]["threshold"] = "100"
+        (tmp_path / "tds.json").write_text(json.dumps(data))
+        self.ledger.record("V1", "COMMISSION", "200", "2024-05-01")
+        previous = rules.default_registry()
+        rules.set_default_registry(rules.RuleRegistry(tmp_path))
+        try:
+            assert self.ledger.record("V2", "COMMISSION", "200", "2024-05-01").deduction == Decimal("10")
+        finally:
+            rules.set_default_registry(previous)
+        assert self.ledger.position("V1", "COMMISSION", "2024-25").deducted == 0
+
+    @pytest.mark.parametrize("financial_year", ["2024-26", "2024", "FY24", True])
+    def test_position_rejects_bad_financial_years(self, financial_year):
+        with pytest.raises(ValueError):
+            self.ledger.position("V1", "COMMISSION", financial_year)
+
+
+class TestTDSLedgerSnapshot:
+    def setup_method(self):
+        self.ledger = TDSLedger()
+        self.ledger.ingest([
+            ("V1", "PROFESSIONAL_FEES", "40000", "2024-05-01"),
+            ("Vendor ₹", "COMMISSION", "1000", "2024-05-01"),
+        ])
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "tds.snap"
+        self.ledger.snapshot(path)
+        restored = TDSLedger.restore(path)
+        assert len(restored) == 2
+        for vendor, service_type in [("V1", "PROFESSIONAL_FEES"), ("Vendor ₹", "COMMISSION")]:
+            assert restored.position(vendor, service_type, 2024) == self.ledger.position(vendor, service_type, 2024)
+        assert restored.record("Vendor ₹", "COMMISSION", "14001", "2024-06-01").catch_up == Decimal("50")
+        assert self.ledger.position("Vendor ₹", "COMMISSION", 2024).paid == Decimal("1000")
+
+    def test_restore_rejects_bad_files(self, tmp_path):
+        path = tmp_path / "tds.snap"
+        self.ledger.snapshot(path)
+        data = path.read_bytes()
+        for name, content in [
+            ("magic", b"NOTTDS!!" + data[8:]),
+            ("short", data[:-4]),
+            ("long", data + b"\0"),
+            ("header", data[:10]),
+        ]:
+            bad = tmp_path / f"{name}.snap"
+            bad.write_bytes(content)
+            with pytest.raises(ValueError):
+                TDSLedger.restore(bad)
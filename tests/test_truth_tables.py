@@ -0,0 +1,102 @@
+"""Differential and integrity tests for the Z3-compiled truth tables."""
+
+import json
+import subprocess
+import sys
+from decimal import Decimal
+
+import pytest
+import z3
+
+from qwed_tax.jurisdictions.india.guards.investment_guard import InvestmentGuard, TransactionType
+from qwed_tax.jurisdictions.us.classification_guard import ABCClassificationGuard
+from qwed_tax.jurisdictions.us.withholding_guard import W4Form, WithholdingGuard
+from qwed_tax.models import State, WorkerClassificationParams
+from qwed_tax.truth_tables import TABLES, TruthTable, load_obligations, verify_obligations
+from qwed_tax.truth_tables import compiler
+
+
+class TestTablesAgainstLiveSolver:
+    @pytest.mark.parametrize("spec", compiler.RULES, ids=lambda spec: spec.rule_id)
+    def test_every_input_combination(self, spec):
+        table = TABLES[spec.rule_id]
+        assert table.inputs == spec.inputs
+        assert len(table.outcomes) == 1 << len(spec.inputs)
+        for key in range(len(table.outcomes)):
+            bits = tuple(bool(key >> i & 1) for i in range(len(spec.inputs)))
+            assert table.lookup(*bits) == compiler.evaluate(spec.rule_id, bits), bits
+
+    def test_generated_files_are_current(self):
+        if load_obligations()["z3_version"] != z3.get_version_string():
+            pytest.skip("obligations were generated with a different z3 version")
+        assert compiler.main(["--check"]) == 0
+
+
+class TestObligations:
+    def test_proof_refs_bind_obligations(self):
+        assert verify_obligations() == {rule_id: True for rule_id in TABLES}
+
+    def test_tampered_obligation_is_detected(self, monkeypatch):
+        artifact = load_obligations()
+        artifact["rules"]["ABC_TEST"]["cases"][0]["outcome"] = [False, True]
+        monkeypatch.setattr("qwed_tax.truth_tables.load_obligations", lambda: artifact)
+        checks = verify_obligations()
+        assert checks["ABC_TEST"] is False
+        assert checks["W4_EXEMPT_PUB505"] is True
+
+    def test_every_case_records_smt2_queries(self):
+        for entry in load_obligations()["rules"].values():
+            for case in entry["cases"]:
+                assert case["queries"]
+                assert all("(check-sat)" in q["smt2"] for q in case["queries"])
+
+    def test_missing_rule_fails_closed(self, monkeypatch):
+        monkeypatch.setattr("qwed_tax.truth_tables.load_obligations", lambda: {"rules": {}})
+        assert set(verify_obligations().values()) == {False}
+
+
+class TestTruthTable:
+    def test_key_is_bit_packed_in_input_order(self):
+        table = TruthTable("T", ("a", "b", "c"), tuple(range(8)), "sha256:x")
+        assert table.lookup(True, False, False) == 1
+        assert table.lookup(False, False, True) == 4
+        assert table.lookup(True, True, True) == 7
+
+    def test_wrong_arity_rejected(self):
+        with pytest.raises(ValueError):
+            TABLES["ABC_TEST"].lookup(True, True)
+
+
+class TestGuardsUseTables:
+    def test_w4_real_liability_reduces_to_zero_predicate(self):
+        guard = WithholdingGuard()
+        for liability, expected in (("0", True), ("0.00", True), ("-0", True), ("1E-9", False), ("-5", False)):
+            form = W4Form(employee_id="E", claim_exempt=True,
+                          tax_liability_last_year=Decimal(liability), expect_refund_this_year=True)
+            assert guard.verify_exempt_status(form)["verified"] is expected, liability
+
+    def test_abc_and_investment_results(self):
+        params = WorkerClassificationParams(worker_id="W", freedom_from_control=True,
+                                            work_outside_usual_business=False,
+                                            customarily_engaged_independently=True, state=State.NJ)
+        result = ABCClassificationGuard().verify_classification(params, True)
+        assert result["verified"] is False
+        assert result["classification"] == "Employee (W-2)"
+        assert "Failed B" in result["message"]
+        guard = InvestmentGuard()
+        assert guard.verify_classification(TransactionType.INTRADAY, 0)["classification"] == "Speculative Business Income"
+        assert guard.verify_classification(TransactionType.DELIVERY, 400)["classification"] == "Capital Gains (LTCG)"
+        assert guard.verify_classification(TransactionType.F_O, 10) == {"classification": "Unknown", "verified": False}
+
+    def test_hot_path_does_not_import_z3(self):
+        code = (
+            "import sys, json\n"
+            "from decimal import Decimal\n"
+            "import qwed_tax\n"
+            "from qwed_tax import WithholdingGuard, W4Form, ABCClassificationGuard, InvestmentGuard\n"
+            "WithholdingGuard().verify_exempt_status(W4Form(employee_id='E', claim_exempt=False,"
+            " tax_liability_last_year=Decimal('1'), expect_refund_this_year=False))\n"
+            "print(json.dumps('z3' in sys.modules))\n"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert json.loads(out.stdout) is False
@@ -0,0 +1,186 @@
+"""Tests for the TaxPreFlight verdict cache."""
+
+import threading
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from qwed_tax import rules
+from qwed_tax.cache import VerdictCache, invalidate_verdict_caches, verdict_key
+from qwed_tax.verifier import TaxPreFlight
+
+INVOICE = {"action": "pay_invoice", "service_type": "PROFESSIONAL_FEES", "amount": "20000", "ytd_payment": "0"}
+BIG_INVOICE = {**INVOICE, "amount": "50000"}
+TRADE = {
+    "action": "trade_tax",
+    "loss_head": "SPECULATIVE",
+    "loss_amount": "1000",
+    "offset_head": "BUSINESS",
+}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPreFlightCache:
+    def setup_method(self):
+        self.cache = VerdictCache(maxsize=8)
+        self.preflight = TaxPreFlight(verdict_cache=self.cache)
+        self.plain = TaxPreFlight()
+
+    def test_hits_return_the_uncached_report(self):
+        for intent in (INVOICE, BIG_INVOICE, TRADE):
+            first = self.preflight.audit_transaction(intent)
+            second = self.preflight.audit_transaction(dict(intent))
+            assert first == second == self.plain.audit_transaction(intent)
+        stats = self.cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (3, 3, 3)
+        assert stats.hit_rate == 0.5
+
+    def test_key_ignores_fields_no_check_reads(self):
+        self.preflight.audit_transaction(INVOICE)
+        noisy = {**INVOICE, "action": "  Pay Invoice ", "memo": "retry #3", "trace_id": "abc"}
+        assert self.preflight.audit_transaction(noisy) == self.plain.audit_transaction(INVOICE)
+        assert self.cache.stats().hits == 1
+
+    def test_key_splits_on_decision_fields(self):
+        self.preflight.audit_transaction(INVOICE)
+        report = self.preflight.audit_transaction(BIG_INVOICE)
+        assert not report["allowed"] and self.cache.stats().hits == 0
+        assert self.preflight.audit_transaction({**INVOICE, "amount": 20000}) == self.plain.audit_transaction(
+            {**INVOICE, "amount": 20000}
+        )
+        assert self.cache.stats().hits == 0  # "20000" and 20000 are different inputs
+
+    def test_reports_are_defensive_copies(self):
+        report = self.preflight.audit_transaction(BIG_INVOICE)
+        expected = self.plain.audit_transaction(BIG_INVOICE)
+        report["allowed"] = True
+        report["blocks"].clear()
+        served = self.preflight.audit_transaction(BIG_INVOICE)
+        assert served == expected
+        served["advisories"].append("tampered")
+        assert self.preflight.audit_transaction(BIG_INVOICE) == expected
+
+    def test_blocked_before_guards_is_not_cached(self):
+        for intent in ({"action": "teleport"}, {"action": "pay_invoice", "amount": "1"}, {}):
+            self.preflight.audit_transaction(intent)
+        assert self.cache.stats() == (0, 0, 0, 0, 0, 0, 8)
+
+    def test_non_json_values_bypass_the_cache(self):
+        intent = {**INVOICE, "amount": Decimal("20000")}
+        assert self.preflight.audit_transaction(intent) == self.plain.audit_transaction(intent)
+        assert len(self.cache) == 0
+
+    def test_guard_errors_are_not_cached(self):
+        intent = {**INVOICE, "amount": "not a number"}
+        assert self.preflight.audit_transaction(intent) == self.plain.audit_transaction(intent)
+        assert self.cache.stats().misses == 1
+
+    def test_audit_batch_uses_and_fills_the_cache(self):
+        self.preflight.audit_transaction(INVOICE)
+        intents = [INVOICE, BIG_INVOICE, TRADE, {"action": "teleport"}, INVOICE]
+        batch = self.preflight.audit_batch(intents)
+        assert batch["reports"] == self.plain.audit_batch(intents)["reports"]
+        assert batch["timing"]["groups"] == 2  # INVOICE came from the cache
+        assert self.cache.stats().hits == 2
+        again = self.preflight.audit_batch(intents)
+        assert again["reports"] == batch["reports"] and again["timing"]["groups"] == 0
+
+    def test_subclass_keys_do_not_collide(self):
+        class Strict(TaxPreFlight):
+            def _check_invoice_tds(self, intent, report):
+                report["allowed"] = False
+                report["blocks"].append("strict")
+
+        Strict(verdict_cache=self.cache).audit_transaction(INVOICE)
+        assert self.preflight.audit_transaction(INVOICE)["allowed"]
+
+    def test_verdicts_do_not_outlive_the_day(self, monkeypatch):
+        # TDS thresholds are today's for an undated invoice: a verdict cached
+        # the day before a rule change must not be served after it.
+        day = datetime(2025, 3, 31, 12).timestamp()
+        monkeypatch.setattr(rules, "_time", lambda: day)
+        self.preflight.audit_transaction(INVOICE)
+        self.preflight.audit_transaction(INVOICE)
+        monkeypatch.setattr(rules, "_time", lambda: day + 86400)
+        self.preflight.audit_transaction(INVOICE)
+        stats = self.cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+
+    def test_default_is_uncached(self):
+        assert TaxPreFlight().verdict_cache is None
+
+
+class TestVerdictCache:
+    def setup_method(self):
+        self.clock = _Clock()
+        self.cache = VerdictCache(maxsize=2, ttl=10.0, clock=self.clock)
+        self.report = {"allowed": True, "blocks": [], "checks_run": ["x"]}
+
+    def test_lru_eviction(self):
+        self.cache.put(b"a", self.report)
+        self.cache.put(b"b", self.report)
+        assert self.cache.get(b"a") == self.report  # b is now least recent
+        self.cache.put(b"c", self.report)
+        assert self.cache.get(b"b") is None
+        assert self.cache.get(b"a") is not None and self.cache.get(b"c") is not None
+        assert self.cache.stats().evictions == 1
+
+    def test_ttl_expiry(self):
+        self.cache.put(b"a", self.report)
+        self.clock.now = 9.9
+        assert self.cache.get(b"a") == self.report
+        self.clock.now = 10.0
+        assert self.cache.get(b"a") is None
+        stats = self.cache.stats()
+        assert (stats.hits, stats.misses, stats.expirations, stats.size) == (1, 1, 1, 0)
+
+    def test_invalidation_hook_clears_every_cache(self):
+        other = VerdictCache()
+        self.cache.put(b"a", self.report)
+        other.put(b"a", self.report)
+        invalidate_verdict_caches()
+        assert len(self.cache) == len(other) == 0
+        assert self.cache.stats().invalidations == other.stats().invalidations == 1
+        self.cache.reset_stats()
+        assert self.cache.stats() == (0, 0, 0, 0, 0, 0, 2)
+
+    def test_verdict_key(self):
+        assert verdict_key("a", [1, "2"]) == verdict_key("a", [1, "2"])
+        assert verdict_key("a", [1]) != verdict_key("a", ["1"])
+        assert len(verdict_key("a")) == 32
+        assert verdict_key(Decimal("1")) is None
+
+    @pytest.mark.parametrize("kwargs", [{"maxsize": 0}, {"maxsize": True}, {"ttl": 0}, {"ttl": -1.0}])
+    def test_rejects_bad_bounds(self, kwargs):
+        with pytest.raises(ValueError):
+            VerdictCache(**kwargs)
+
+    def test_thread_safe(self):
+        cache = VerdictCache(maxsize=16)
+        preflight = TaxPreFlight(verdict_cache=cache)
+        expected = TaxPreFlight().audit_transaction(BIG_INVOICE)
+        failures = []
+
+        def run():
+            for amount in range(200):
+                intent = {**BIG_INVOICE, "ytd_payment": str(amount % 24)}
+                if amount % 24 == 0 and preflight.audit_transaction(intent) != expected:
+                    failures.append(amount)
+                preflight.audit_transaction(intent)
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = cache.stats()
+        assert not failures
+        assert stats.hits + stats.misses == 8 * (200 + 9) and stats.size <= 16